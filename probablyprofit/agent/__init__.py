@@ -4,6 +4,7 @@ from probablyprofit.agent.anthropic_agent import AnthropicAgent
 from probablyprofit.agent.base import BaseAgent
 from probablyprofit.agent.ensemble import EnsembleAgent, VotingStrategy
 from probablyprofit.agent.fallback import FallbackAgent, FallbackConfig, create_fallback_agent
+from probablyprofit.agent.triggers import MarketTrigger
 
 # Optional AI providers
 try:
@@ -33,4 +34,6 @@ __all__ = [
     "FallbackAgent",
     "create_fallback_agent",
     "FallbackConfig",
+    # Event-driven mode
+    "MarketTrigger",
 ]
@@ -16,6 +16,7 @@ from probablyprofit.api.client import PolymarketClient
 from probablyprofit.api.exceptions import AgentException, NetworkException, ValidationException
 from probablyprofit.risk.manager import RiskManager
 from probablyprofit.utils.ai_rate_limiter import AIRateLimiter, anthropic_rate_limited
+from probablyprofit.utils.latency import mark_stage
 from probablyprofit.utils.resilience import retry
 from probablyprofit.utils.validators import (
     validate_confidence,
@@ -226,6 +227,7 @@ class AnthropicAgent(BaseAgent):
             # Run synchronous API call in thread pool to avoid blocking
             import asyncio
 
+            mark_stage("llm_request")
             response = await asyncio.to_thread(
                 self.anthropic.messages.create,
                 model=self.model,
@@ -233,6 +235,7 @@ class AnthropicAgent(BaseAgent):
                 temperature=self.temperature,
                 messages=messages,
             )
+            mark_stage("llm_response")
 
             # Record successful request and token usage
             self._rate_limiter.record_success()
@@ -10,24 +10,29 @@ Core agent framework implementing the observe-decide-act loop.
 """
 
 import asyncio
+import time
 from abc import ABC, abstractmethod
 from collections import deque
 from datetime import datetime
 
 # Note: Type checking import to avoid circular dependency if needed, but BaseStrategy doesn't import BaseAgent
-from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
 
 from loguru import logger
 from pydantic import BaseModel, ConfigDict
 
 from probablyprofit.alerts.telegram import get_alerter
 from probablyprofit.api.client import Market, Order, PolymarketClient, Position
+from probablyprofit.api.market_delta import MarketDeltaTracker
 from probablyprofit.config import get_config
 from probablyprofit.risk.manager import RiskManager
 from probablyprofit.utils.killswitch import KillSwitchError, get_kill_switch, is_kill_switch_active
+from probablyprofit.utils.latency import LatencyTrace
+from probablyprofit.utils.metrics import record_observe_stage
 
 if TYPE_CHECKING:
     from probablyprofit.agent.strategy import BaseStrategy
+    from probablyprofit.agent.triggers import MarketTrigger
 
 
 class Observation(BaseModel):
@@ -291,10 +296,25 @@ class BaseAgent(ABC):
 
         # Track open positions to avoid duplicates
         self._open_positions: set[str] = set()  # Set of market_id:outcome
+        # Positions act() opened/closed: key -> (time.monotonic(), now open).
+        # observe() reapplies those newer than its positions read.
+        self._position_changes: Dict[str, Tuple[float, bool]] = {}
 
         # Cache market names for better logging
         self._market_names: dict[str, str] = {}  # market_id -> question
 
+        # Track what changed between observations
+        self.market_tracker = MarketDeltaTracker()
+
+        # Last good (result, time.monotonic()) per observe() stage, used when a
+        # stage is slow or fails
+        self._last_observed: Dict[str, Tuple[Any, float]] = {}
+        self._observe_seconds = 0.0  # Duration of the last full observe()
+        self._observe_span = (0.0, 0.0)  # time.monotonic() start/end of the last observe()
+
+        # Event-driven mode: cycles start on market triggers instead of a timer
+        self.event_trigger: Optional["MarketTrigger"] = None
+
         # Setup database persistence if enabled
         if enable_persistence:
             try:
@@ -313,6 +333,19 @@ class BaseAgent(ABC):
         mode_str = " [DRY RUN MODE]" if dry_run else ""
         logger.info(f"Agent '{name}' initialized{mode_str}")
 
+    def enable_event_driven(self, trigger: "MarketTrigger") -> None:
+        """
+        Run cycles when `trigger` fires instead of every loop_interval.
+
+        Each observation's markets are (re)subscribed on the trigger's
+        WebSocket, so only the markets the strategy kept can wake the agent.
+        """
+        self.event_trigger = trigger
+        logger.info(
+            f"[{self.name}] Event-driven mode (max idle {trigger.max_idle:g}s, "
+            f"min interval {trigger.min_interval:g}s)"
+        )
+
     @property
     def running(self) -> bool:
         """Check if agent is running (thread-safe)."""
@@ -343,6 +376,13 @@ class BaseAgent(ABC):
         """Record that we have a position in this market."""
         key = f"{market_id}:{outcome}"
         self._open_positions.add(key)
+        self._position_changes[key] = (time.monotonic(), True)
+
+    def _forget_position(self, market_id: str, outcome: str) -> None:
+        """Record that we no longer have a position in this market."""
+        key = f"{market_id}:{outcome}"
+        self._open_positions.discard(key)
+        self._position_changes[key] = (time.monotonic(), False)
 
     async def observe(self) -> Observation:
         """
@@ -353,11 +393,52 @@ class BaseAgent(ABC):
         """
         logger.debug(f"[{self.name}] Observing market state...")
 
-        # Fetch current data
-        markets = await self.client.get_markets(active=True, limit=50)
+        # Fetch markets, positions and balance concurrently
+        cfg = get_config().agent
+        read_at = time.monotonic()
+        tasks = [
+            asyncio.ensure_future(
+                self._observe_stage(
+                    "markets",
+                    lambda: self.client.get_markets(active=True, limit=50),
+                    cfg.observe_markets_timeout,
+                    cfg.observe_markets_max_age,
+                )
+            ),
+            asyncio.ensure_future(
+                self._observe_stage(
+                    "positions",
+                    self.client.get_positions,
+                    cfg.observe_positions_timeout,
+                    cfg.observe_positions_max_age,
+                )
+            ),
+            asyncio.ensure_future(
+                self._observe_stage(
+                    "balance",
+                    self.client.get_balance,
+                    cfg.observe_balance_timeout,
+                    cfg.observe_balance_max_age,
+                )
+            ),
+        ]
+        try:
+            stages = await asyncio.gather(*tasks)
+        except BaseException:
+            # A stage failed with nothing to fall back to: stop its siblings
+            for task in tasks:
+                task.cancel()
+            raise
+        (markets, _, _), (positions, _, _), (balance, _, _) = stages
+        stage_names = ("markets", "positions", "balance")
+        stage_timings = {
+            name: round(elapsed * 1000, 1) for name, (_, elapsed, _) in zip(stage_names, stages)
+        }
+        stale_stages = [name for name, (_, _, stale) in zip(stage_names, stages) if stale]
 
-        # Cache market names for better logging
-        for market in markets:
+        # Diff against the previous observation; only new markets need their names cached
+        delta = self.market_tracker.update(markets)
+        for market in delta.added:
             self._market_names[market.condition_id] = market.question
 
         # Apply Strategy Filtering if present
@@ -368,8 +449,6 @@ class BaseAgent(ABC):
                 f"[{self.name}] Strategy '{self.strategy.name}' filtered markets: {original_count} -> {len(markets)}"
             )
 
-        positions = await self.client.get_positions()
-
         # Sync tracked positions with actual positions
         # In dry run mode, keep our local tracking (API returns nothing)
         # In live mode, sync with actual positions from API
@@ -387,13 +466,26 @@ class BaseAgent(ABC):
                 # Dry run: add any API positions but keep our local ones too
                 self._open_positions.update(api_positions)
 
-        balance = await self.client.get_balance()
+        # A pipelined prefetch can read positions before the previous act()
+        # traded; keep what act() changed since then
+        for key, (changed_at, is_open) in list(self._position_changes.items()):
+            if changed_at < read_at:
+                del self._position_changes[key]
+            elif is_open:
+                self._open_positions.add(key)
+            else:
+                self._open_positions.discard(key)
 
         observation = Observation(
             timestamp=datetime.now(),
             markets=markets,
             positions=positions,
             balance=balance,
+            metadata={
+                "market_changes": delta.to_dict(),
+                "stage_timings_ms": stage_timings,
+                "stale_stages": stale_stages,
+            },
         )
 
         await self.memory.add_observation(observation)
@@ -401,6 +493,123 @@ class BaseAgent(ABC):
 
         return observation
 
+    async def _observe_stage(
+        self,
+        stage: str,
+        fetch: Callable[[], Awaitable[Any]],
+        timeout: float,
+        max_age: float,
+    ) -> Tuple[Any, float, bool]:
+        """
+        Run one observe() stage under a timeout.
+
+        A stage that times out or fails falls back to its last good value if
+        that is at most max_age seconds old; otherwise the error propagates.
+
+        Returns:
+            (value, seconds taken, whether the value is a stale fallback)
+        """
+        start = time.perf_counter()
+        try:
+            value = await asyncio.wait_for(fetch(), timeout=timeout)
+        except KillSwitchError:
+            raise
+        except Exception as e:
+            elapsed = time.perf_counter() - start
+            timed_out = isinstance(e, asyncio.TimeoutError)
+            record_observe_stage(stage, elapsed, "timeout" if timed_out else "error")
+            last = self._last_observed.get(stage)
+            if last is None or time.monotonic() - last[1] > max_age:
+                raise
+            reason = f"timed out after {timeout:.1f}s" if timed_out else f"failed: {e}"
+            logger.warning(
+                f"[{self.name}] Observe stage '{stage}' {reason}; using value from "
+                f"{time.monotonic() - last[1]:.0f}s ago"
+            )
+            return last[0], elapsed, True
+
+        elapsed = time.perf_counter() - start
+        record_observe_stage(stage, elapsed, "ok")
+        self._last_observed[stage] = (value, time.monotonic())
+        return value, elapsed, False
+
+    async def _timed_observe(self) -> Observation:
+        """observe(), remembering how long it took (used to time pipelined prefetches)."""
+        start = time.monotonic()
+        observation = await self.observe()
+        end = time.monotonic()
+        self._observe_seconds = end - start
+        self._observe_span = (start, end)
+        return observation
+
+    async def _observe_after(self, delay: float) -> Observation:
+        """Wait `delay` seconds, then observe (pipelined loop prefetch)."""
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return await self._timed_observe()
+
+    @staticmethod
+    def _outcome_price(market: Optional[Market], outcome: str) -> Optional[float]:
+        if market is None or outcome not in market.outcomes:
+            return None
+        index = market.outcomes.index(outcome)
+        if index >= len(market.outcome_prices):
+            return None
+        return float(market.outcome_prices[index])
+
+    async def _current_price(self, market_id: str, outcome: str) -> Optional[float]:
+        """Live outcome price: orderbook mid, else the market's quoted price."""
+        book = await self.client.get_orderbook(market_id, outcome)
+        bids = [float(level["price"]) for level in book.get("bids", [])]
+        asks = [float(level["price"]) for level in book.get("asks", [])]
+        if bids and asks:
+            return (max(bids) + min(asks)) / 2
+        return self._outcome_price(await self.client.get_market(market_id), outcome)
+
+    async def _revalidate_decision(self, decision: Decision, observation: Observation) -> Decision:
+        """
+        Re-price a trade decided on an old observation.
+
+        If the observation is older than agent.observation_max_age and the
+        outcome price has since moved more than agent.max_price_drift (or
+        cannot be checked), the trade is replaced with a hold.
+        """
+        if decision.action not in ("buy", "sell") or not decision.market_id or not decision.outcome:
+            return decision
+
+        cfg = get_config().agent
+        age = (datetime.now() - observation.timestamp).total_seconds()
+        if age <= cfg.observation_max_age:
+            return decision
+
+        market = next(
+            (m for m in observation.markets if m.condition_id == decision.market_id), None
+        )
+        observed = self._outcome_price(market, decision.outcome)
+        try:
+            current = await self._current_price(decision.market_id, decision.outcome)
+            error = ""
+        except Exception as e:
+            current, error = None, f": {e}"
+
+        if observed is None or current is None:
+            reason = f"could not re-price {decision.outcome} on {decision.market_id}{error}"
+        elif abs(current - observed) > cfg.max_price_drift:
+            reason = f"price moved {observed:.3f} -> {current:.3f}"
+        else:
+            return decision
+
+        logger.warning(
+            f"[{self.name}] Dropping {decision.action} decided on a {age:.1f}s-old observation: "
+            f"{reason}"
+        )
+        return Decision(
+            action="hold",
+            market_id=decision.market_id,
+            outcome=decision.outcome,
+            reasoning=f"Stale {decision.action} skipped: {reason}",
+        )
+
     @abstractmethod
     async def decide(self, observation: Observation) -> Decision:
         """
@@ -530,8 +739,7 @@ class BaseAgent(ABC):
                 )
                 logger.info(f"[{self.name}] 📊 Market: {market_name}")
                 # Remove from tracked positions
-                key = f"{decision.market_id}:{decision.outcome}"
-                self._open_positions.discard(key)
+                self._forget_position(decision.market_id, decision.outcome)
                 return True
 
             # Place sell order
@@ -547,8 +755,7 @@ class BaseAgent(ABC):
                 await self.memory.add_trade(order)
                 self.risk_manager.record_trade(-order.size, order.price)
                 # Remove from tracked positions
-                key = f"{decision.market_id}:{decision.outcome}"
-                self._open_positions.discard(key)
+                self._forget_position(decision.market_id, decision.outcome)
                 logger.info(
                     f"[{self.name}] ✅ SELL order placed: ${decision.size:.2f} on '{market_name}'"
                 )
@@ -579,6 +786,19 @@ class BaseAgent(ABC):
 
         Runs continuously until stopped. Includes error recovery
         with exponential backoff on repeated failures.
+
+        With agent.pipelined_loop enabled, the next observation is fetched in
+        the background while the current decision and order are in flight,
+        timed to be ready one loop_interval after the previous one. Trades
+        decided on an observation older than agent.observation_max_age are
+        re-priced before acting.
+
+        With an event trigger enabled (see enable_event_driven), each cycle
+        waits for the trigger instead of loop_interval; pipelining is off.
+
+        Each iteration's latency breakdown (trigger data -> observe -> LLM ->
+        order ack) is exported as pp_latency_seconds and, with
+        agent.log_latency_breakdown, logged at DEBUG.
         """
         logger.info(f"[{self.name}] Starting agent loop (interval: {self.loop_interval}s)")
         self.running = True
@@ -606,6 +826,12 @@ class BaseAgent(ABC):
         self._base_backoff = cfg.agent.base_backoff
         self._max_backoff = cfg.agent.max_backoff
 
+        # Pipelined mode: background fetch of the next observation
+        trigger = self.event_trigger
+        pipelined = cfg.agent.pipelined_loop and trigger is None
+        prefetch: Optional["asyncio.Task[Observation]"] = None
+        prefetch_at = 0.0
+
         # Try to get recovery manager
         recovery_manager = None
         try:
@@ -634,14 +860,44 @@ class BaseAgent(ABC):
                     break
 
                 try:
-                    # Observe
-                    observation = await self.observe()
+                    trace = LatencyTrace()
+                    if trigger is not None and trigger.fired_at is not None:
+                        trace.mark("data_received", trigger.fired_at)
+
+                    # Observe (or collect the observation prefetched last iteration)
+                    if prefetch is not None:
+                        task, prefetch = prefetch, None
+                        observation = await task
+                    else:
+                        observation = await self._timed_observe()
+                    trace.mark("observe_start", self._observe_span[0])
+                    trace.mark("observe_end", self._observe_span[1])
+
+                    if trigger is not None:
+                        # Triggers now measure moves from what this cycle saw
+                        trigger.mark_cycle()
+                        await trigger.track(m.condition_id for m in observation.markets)
 
-                    # Decide
-                    decision = await self.decide(observation)
+                    if pipelined:
+                        # Start N+1's observation so it completes one interval from now
+                        delay = max(0.0, self.loop_interval - self._observe_seconds)
+                        prefetch_at = time.monotonic() + delay
+                        prefetch = asyncio.create_task(self._observe_after(delay))
 
-                    # Act
-                    success = await self.act(decision)
+                    with trace.activate():
+                        # Decide
+                        decision = await self.decide(observation)
+                        trace.mark("decide_end")
+
+                        if pipelined:
+                            decision = await self._revalidate_decision(decision, observation)
+
+                        # Act
+                        success = await self.act(decision)
+
+                    trace.record()
+                    if cfg.agent.log_latency_breakdown:
+                        logger.debug(f"[{self.name}] Latency: {trace.format()}")
 
                     if success:
                         logger.info(
@@ -708,9 +964,23 @@ class BaseAgent(ABC):
                     await asyncio.sleep(backoff)
                     continue  # Skip normal sleep, we already waited
 
-                # Wait before next iteration, but check for stop signal
+                if trigger is not None:
+                    reasons = await trigger.wait(self._stop_event)
+                    if reasons is None:
+                        logger.info(f"[{self.name}] Stop signal received")
+                        break
+                    logger.info(f"[{self.name}] Triggered: {'; '.join(reasons[:3])}")
+                    continue
+
+                # Wait before next iteration, but check for stop signal.
+                # Pipelined: only until the prefetch starts; awaiting it covers the rest.
+                wait = (
+                    max(0.0, prefetch_at - time.monotonic())
+                    if prefetch is not None
+                    else self.loop_interval
+                )
                 try:
-                    await asyncio.wait_for(self._stop_event.wait(), timeout=self.loop_interval)
+                    await asyncio.wait_for(self._stop_event.wait(), timeout=wait)
                     # If we get here, stop was requested
                     logger.info(f"[{self.name}] Stop signal received")
                     break
@@ -721,6 +991,9 @@ class BaseAgent(ABC):
         except asyncio.CancelledError:
             logger.info(f"[{self.name}] Agent loop cancelled")
         finally:
+            if prefetch is not None and not prefetch.done():
+                prefetch.cancel()
+
             # Graceful shutdown cleanup
             await self._cleanup()
             self._running = False
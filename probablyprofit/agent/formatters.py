@@ -74,6 +74,44 @@ class ObservationFormatter:
 
         return "\n".join(positions_info)
 
+    @staticmethod
+    def format_market_changes(observation: Observation, limit: int = 10) -> str:
+        """
+        Format what changed since the previous observation.
+
+        Args:
+            observation: Observation carrying a "market_changes" summary in metadata
+            limit: Maximum number of repriced markets to list
+
+        Returns:
+            Formatted change summary, or an empty string on the first observation
+        """
+        changes = observation.metadata.get("market_changes")
+        if not changes:
+            return ""
+
+        repriced = changes.get("repriced", {})
+        carried_over = repriced or changes.get("unchanged")
+        # Nothing to compare against on the first observation
+        if not carried_over and not changes.get("removed"):
+            return ""
+
+        lines = [
+            f"{len(changes.get('added', []))} new, {len(changes.get('removed', []))} removed, "
+            f"{len(repriced)} repriced, {changes.get('unchanged', 0)} unchanged"
+        ]
+        if not carried_over:
+            lines.append("  Every market was replaced since the last observation")
+
+        # Only list moves for markets that made it into this observation
+        questions = {m.condition_id: m.question for m in observation.markets}
+        moves = [(cid, move) for cid, move in repriced.items() if cid in questions]
+        moves.sort(key=lambda item: abs(item[1]), reverse=True)
+        for condition_id, move in moves[:limit]:
+            lines.append(f"  {questions[condition_id]}: {move:+.2%}")
+
+        return "\n".join(lines)
+
     @staticmethod
     def format_full_observation(
         observation: Observation,
@@ -107,6 +145,10 @@ Top Markets ({min(len(observation.markets), max_markets)}):
 Recent Trading History:
 {memory.get_recent_history(include_history)}"""]
 
+        changes = ObservationFormatter.format_market_changes(observation)
+        if changes:
+            sections.append(f"\nChanges Since Last Observation:\n{changes}")
+
         # Add intelligence context if available
         if observation.news_context:
             sections.append(f"\n{observation.news_context}")
@@ -16,6 +16,7 @@ from probablyprofit.agent.formatters import ObservationFormatter, get_decision_s
 from probablyprofit.api.client import PolymarketClient
 from probablyprofit.api.exceptions import AgentException, NetworkException, ValidationException
 from probablyprofit.risk.manager import RiskManager
+from probablyprofit.utils.latency import mark_stage
 from probablyprofit.utils.resilience import retry
 from probablyprofit.utils.validators import (
     validate_confidence,
@@ -110,6 +111,7 @@ class GeminiAgent(BaseAgent):
             AgentException: On non-retryable errors
         """
         try:
+            mark_stage("llm_request")
             if NEW_SDK:
                 response = await asyncio.to_thread(
                     self.genai_client.models.generate_content,
@@ -119,9 +121,11 @@ class GeminiAgent(BaseAgent):
                         response_mime_type="application/json",
                     ),
                 )
+                mark_stage("llm_response")
                 return response.text
             else:
                 response = await asyncio.to_thread(self.model.generate_content, prompt)
+                mark_stage("llm_response")
                 if not response or not response.text:
                     raise AgentException("Empty response from Gemini")
                 return response.text
@@ -16,6 +16,7 @@ from probablyprofit.agent.formatters import ObservationFormatter, get_decision_s
 from probablyprofit.api.client import PolymarketClient
 from probablyprofit.api.exceptions import AgentException, NetworkException, ValidationException
 from probablyprofit.risk.manager import RiskManager
+from probablyprofit.utils.latency import mark_stage
 from probablyprofit.utils.resilience import retry
 from probablyprofit.utils.validators import (
     validate_confidence,
@@ -86,7 +87,9 @@ class OpenAIAgent(BaseAgent):
             AgentException: On non-retryable errors
         """
         try:
+            mark_stage("llm_request")
             response = await asyncio.to_thread(self.openai.chat.completions.create, **api_kwargs)
+            mark_stage("llm_response")
 
             if not response.choices or len(response.choices) == 0:
                 raise AgentException("No response choices from OpenAI")
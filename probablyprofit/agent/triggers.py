@@ -0,0 +1,257 @@
+"""
+Event Triggers
+
+Wakes an agent when its markets actually move instead of every
+loop_interval seconds. A MarketTrigger listens to WebSocketClient price and
+orderbook updates for the markets the agent is watching and fires when:
+
+- a price moves more than `price_move` from where it was at the last decision
+- a spread widens or narrows by more than `spread_change`
+- an update's volume is `volume_spike` times the recent average
+- nothing has fired for `max_idle` seconds
+
+Bursts of updates are debounced into one cycle, and decide cycles (LLM
+calls) are never started less than `min_interval` seconds apart.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from loguru import logger
+
+from probablyprofit.config import get_config
+
+TriggerKey = Tuple[str, str]  # (market_id, outcome)
+
+# Volume updates needed before the running average is trusted for spikes
+_VOLUME_WARMUP = 5
+_VOLUME_ALPHA = 0.2  # EWMA weight of the newest update
+
+# Pending reasons kept between cycles (the rest are only counted)
+_MAX_REASONS = 20
+
+
+class MarketTrigger:
+    """
+    Decides when an event-driven agent should run its next cycle.
+
+    Usage:
+        trigger = MarketTrigger(ws_client)
+        agent.enable_event_driven(trigger)
+
+        # run_loop() then subscribes the trigger to each observation's markets
+        # and waits on trigger.wait() instead of sleeping loop_interval.
+    """
+
+    def __init__(
+        self,
+        ws_client: Any,
+        price_move: Optional[float] = None,
+        spread_change: Optional[float] = None,
+        volume_spike: Optional[float] = None,
+        max_idle: Optional[float] = None,
+        debounce: Optional[float] = None,
+        min_interval: Optional[float] = None,
+    ):
+        """
+        Initialize trigger (unset thresholds default to config.agent.trigger_*).
+
+        Args:
+            ws_client: WebSocketClient delivering price/orderbook updates
+            price_move: Absolute price move that fires (0 disables)
+            spread_change: Absolute spread change that fires (0 disables)
+            volume_spike: Multiple of average update volume that fires (0 disables)
+            max_idle: Seconds without a trigger before a cycle runs anyway
+            debounce: Seconds to collect further updates after the first trigger
+            min_interval: Minimum seconds between cycle starts (LLM rate limit)
+        """
+        cfg = get_config().agent
+        self.ws_client = ws_client
+        self.price_move = price_move if price_move is not None else cfg.trigger_price_move
+        self.spread_change = (
+            spread_change if spread_change is not None else cfg.trigger_spread_change
+        )
+        self.volume_spike = volume_spike if volume_spike is not None else cfg.trigger_volume_spike
+        self.max_idle = max_idle if max_idle is not None else cfg.trigger_max_idle
+        self.debounce = debounce if debounce is not None else cfg.trigger_debounce
+        self.min_interval = min_interval if min_interval is not None else cfg.trigger_min_interval
+
+        self._markets: Set[str] = set()
+
+        # Latest values seen, and the values at the last cycle they are compared to
+        self._prices: Dict[TriggerKey, float] = {}
+        self._price_refs: Dict[TriggerKey, float] = {}
+        self._spreads: Dict[TriggerKey, float] = {}
+        self._spread_refs: Dict[TriggerKey, float] = {}
+        self._volume_avg: Dict[TriggerKey, float] = {}
+        self._volume_samples: Dict[TriggerKey, int] = {}
+
+        self._reasons: List[str] = []
+        self._fired = asyncio.Event()
+        # time.monotonic() receipt of the first update that fired since the last cycle
+        self.fired_at: Optional[float] = None
+        self._last_cycle = time.monotonic()
+
+        # Statistics
+        self._fires: Dict[str, int] = {"price_move": 0, "spread_change": 0, "volume_spike": 0}
+        self._cycles = 0
+        self._idle_cycles = 0
+        self._updates = 0
+
+        ws_client.on_price_update(self.on_price_update)
+        ws_client.on_orderbook_update(self.on_orderbook_update)
+
+    # =========================================================================
+    # Market set
+    # =========================================================================
+
+    async def track(self, market_ids: Iterable[str]) -> None:
+        """Watch exactly these markets, (un)subscribing the WebSocket as needed."""
+        wanted = set(market_ids)
+        added = wanted - self._markets
+        removed = self._markets - wanted
+        self._markets = wanted
+
+        if removed:
+            await self.ws_client.unsubscribe(list(removed))
+            for state in (
+                self._prices,
+                self._price_refs,
+                self._spreads,
+                self._spread_refs,
+                self._volume_avg,
+                self._volume_samples,
+            ):
+                for key in [k for k in state if k[0] in removed]:
+                    del state[key]
+        if added:
+            await self.ws_client.subscribe(list(added))
+            logger.debug(f"[MarketTrigger] Watching {len(wanted)} market(s) (+{len(added)})")
+
+    # =========================================================================
+    # WebSocket callbacks
+    # =========================================================================
+
+    def on_price_update(self, update: Any) -> None:
+        if update.market_id not in self._markets:
+            return
+        self._updates += 1
+        key = (update.market_id, update.outcome)
+
+        self._prices[key] = update.price
+        ref = self._price_refs.setdefault(key, update.price)
+        if self.price_move > 0 and abs(update.price - ref) >= self.price_move:
+            self._fire(
+                "price_move",
+                f"{update.market_id}:{update.outcome} {ref:.3f}->{update.price:.3f}",
+                update,
+            )
+
+        if update.volume > 0:
+            samples = self._volume_samples.get(key, 0)
+            avg = self._volume_avg.get(key, update.volume)
+            if (
+                self.volume_spike > 0
+                and samples >= _VOLUME_WARMUP
+                and update.volume >= self.volume_spike * avg
+            ):
+                self._fire(
+                    "volume_spike",
+                    f"{update.market_id}:{update.outcome} {update.volume:g} vs avg {avg:g}",
+                    update,
+                )
+            self._volume_avg[key] = avg + _VOLUME_ALPHA * (update.volume - avg)
+            self._volume_samples[key] = samples + 1
+
+    def on_orderbook_update(self, update: Any) -> None:
+        if update.market_id not in self._markets:
+            return
+        best_bid, best_ask = update.best_bid, update.best_ask
+        if best_bid is None or best_ask is None:
+            return
+        self._updates += 1
+        key = (update.market_id, update.outcome)
+
+        spread = best_ask - best_bid
+
+        self._spreads[key] = spread
+        ref = self._spread_refs.setdefault(key, spread)
+        if self.spread_change > 0 and abs(spread - ref) >= self.spread_change:
+            self._fire(
+                "spread_change",
+                f"{update.market_id}:{update.outcome} {ref:.3f}->{spread:.3f}",
+                update,
+            )
+
+    def _fire(self, kind: str, detail: str, update: Any) -> None:
+        if self.fired_at is None:
+            # Lean ticks carry their frame's receipt time; others are stamped now
+            self.fired_at = getattr(update, "received", None) or time.monotonic()
+        self._fires[kind] += 1
+        if len(self._reasons) < _MAX_REASONS:
+            self._reasons.append(f"{kind} {detail}")
+        self._fired.set()
+
+    # =========================================================================
+    # Cycle control
+    # =========================================================================
+
+    def mark_cycle(self) -> None:
+        """
+        Start a new cycle: current prices and spreads become the references
+        the next triggers are measured against.
+        """
+        self._price_refs.update(self._prices)
+        self._spread_refs.update(self._spreads)
+        self._reasons.clear()
+        self._fired.clear()
+        self.fired_at = None
+        self._last_cycle = time.monotonic()
+        self._cycles += 1
+
+    async def wait(self, stop_event: asyncio.Event) -> Optional[List[str]]:
+        """
+        Wait until the next cycle should start.
+
+        Returns:
+            Reasons the cycle was triggered, or None if stop_event was set
+        """
+        idle_left = self._last_cycle + self.max_idle - time.monotonic()
+        if not await self._wait_event(self._fired, stop_event, idle_left):
+            if stop_event.is_set():
+                return None
+            self._idle_cycles += 1
+            return [f"max_idle {self.max_idle:g}s"]
+
+        # Let the burst settle, and keep LLM calls at least min_interval apart
+        hold = max(self.debounce, self._last_cycle + self.min_interval - time.monotonic())
+        if hold > 0 and await self._wait_event(stop_event, stop_event, hold):
+            return None
+        return list(self._reasons)
+
+    @staticmethod
+    async def _wait_event(event: asyncio.Event, stop_event: asyncio.Event, timeout: float) -> bool:
+        """Wait for `event` or `stop_event`; False on timeout or stop without `event`."""
+        if event.is_set():
+            return True
+        waiters = {asyncio.ensure_future(event.wait()), asyncio.ensure_future(stop_event.wait())}
+        try:
+            await asyncio.wait(
+                waiters, timeout=max(0.0, timeout), return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+        return event.is_set()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Get trigger statistics."""
+        return {
+            "markets": len(self._markets),
+            "updates": self._updates,
+            "fires": dict(self._fires),
+            "cycles": self._cycles,
+            "idle_cycles": self._idle_cycles,
+        }
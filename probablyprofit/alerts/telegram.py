@@ -20,6 +20,7 @@ import httpx
 from loguru import logger
 
 from probablyprofit.config import get_config
+from probablyprofit.utils.http_pool import get_http_pool
 
 
 class AlertLevel(str, Enum):
@@ -113,7 +114,7 @@ class TelegramAlerter:
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=30.0)
+            self._client = get_http_pool("external").client(timeout=30.0)
         return self._client
 
     async def close(self) -> None:
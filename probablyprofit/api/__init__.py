@@ -23,10 +23,50 @@ def __getattr__(name):
         from probablyprofit.api.websocket import WebSocketClient
 
         return WebSocketClient
+    elif name == "ShardedWebSocketClient":
+        from probablyprofit.api.ws_shards import ShardedWebSocketClient
+
+        return ShardedWebSocketClient
+    elif name == "FrameRecorder":
+        from probablyprofit.api.ws_recorder import FrameRecorder
+
+        return FrameRecorder
+    elif name == "FrameReplayer":
+        from probablyprofit.api.ws_recorder import FrameReplayer
+
+        return FrameReplayer
     elif name == "OrderManager":
         from probablyprofit.api.order_manager import OrderManager
 
         return OrderManager
+    elif name == "OrderEventStream":
+        from probablyprofit.api.order_stream import OrderEventStream
+
+        return OrderEventStream
+    elif name == "OrderJournal":
+        from probablyprofit.api.order_journal import OrderJournal
+
+        return OrderJournal
+    elif name == "OrderEventBus":
+        from probablyprofit.api.order_events import OrderEventBus
+
+        return OrderEventBus
+    elif name == "MarketDeltaTracker":
+        from probablyprofit.api.market_delta import MarketDeltaTracker
+
+        return MarketDeltaTracker
+    elif name == "MarketDelta":
+        from probablyprofit.api.market_delta import MarketDelta
+
+        return MarketDelta
+    elif name == "OrderbookStore":
+        from probablyprofit.api.orderbook_store import OrderbookStore
+
+        return OrderbookStore
+    elif name == "PortfolioState":
+        from probablyprofit.api.portfolio_state import PortfolioState
+
+        return PortfolioState
     elif name == "WalletSigner":
         from probablyprofit.api.signer import WalletSigner
 
@@ -40,6 +80,16 @@ __all__ = [
     "Order",
     "Position",
     "WebSocketClient",
+    "ShardedWebSocketClient",
+    "FrameRecorder",
+    "FrameReplayer",
     "OrderManager",
+    "OrderEventStream",
+    "OrderJournal",
+    "OrderEventBus",
+    "MarketDeltaTracker",
+    "MarketDelta",
+    "OrderbookStore",
+    "PortfolioState",
     "WalletSigner",
 ]
@@ -16,6 +16,9 @@ T = TypeVar("T")
 # Thread pool for running sync operations
 _executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="sync-wrapper")
 
+# Separate pool for order signing so signing never queues behind network calls
+_signing_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="order-signer")
+
 
 async def run_sync(func: Callable[..., T], *args, **kwargs) -> T:
     """
@@ -50,6 +53,17 @@ async def run_sync(func: Callable[..., T], *args, **kwargs) -> T:
     return result
 
 
+async def run_signing(func: Callable[..., T], *args) -> T:
+    """
+    Run a synchronous order-signing function in the signing thread pool.
+
+    Usage:
+        signed = await run_signing(sync_client.create_order, order_args)
+    """
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(_signing_executor, func, *args)
+
+
 def async_wrap(func: Callable[..., T]) -> Callable[..., T]:
     """
     Decorator to wrap a synchronous function for async use.
@@ -210,4 +224,5 @@ async def gather_with_concurrency(
 def shutdown_executor():
     """Shutdown the thread pool executor."""
     _executor.shutdown(wait=True)
+    _signing_executor.shutdown(wait=True)
     logger.info("[AsyncWrapper] Thread pool executor shutdown")
@@ -12,30 +12,85 @@ Includes retry logic and circuit breakers for resilience.
 """
 
 import asyncio
+import functools
 import json
-from collections import OrderedDict
+import time
+from collections import OrderedDict, deque
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, Callable, Coroutine, Dict, List, Optional, TypeVar
-
-T = TypeVar("T")
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 import httpx
 from loguru import logger
 from pydantic import BaseModel, Field
 
+from probablyprofit.api.async_wrapper import AsyncClientWrapper, run_signing, run_sync
+from probablyprofit.api.clob_async import AsyncClobClient
+from probablyprofit.api.exceptions import (
+    APIException,
+    NetworkException,
+    OrderException,
+    RateLimitException,
+    ValidationException,
+)
+from probablyprofit.config import get_config
+from probablyprofit.utils.cache import AsyncTTLCache, SingleFlight, market_cache, price_cache
+from probablyprofit.utils.http_pool import get_http_pool
+from probablyprofit.utils.latency import mark_stage
+from probablyprofit.utils.metrics import record_latency
+from probablyprofit.utils.resilience import (
+    AdaptiveRateLimiter,
+    CircuitBreaker,
+    RateLimiter,
+    RequestHedger,
+    retry,
+)
+from probablyprofit.utils.scheduler import PriorityScheduler, RequestPriority, request_priority
+from probablyprofit.utils.validators import (
+    validate_non_negative,
+    validate_positive,
+    validate_price,
+    validate_side,
+)
+
+T = TypeVar("T")
+
 try:
     from py_clob_client.client import ClobClient
     from py_clob_client.clob_types import ApiCreds, OrderArgs, OrderType
+    from py_clob_client.exceptions import PolyApiException
 
     params_avail = True
 except ImportError:
     ClobClient = None
     OrderArgs = None
     OrderType = None
+    PolyApiException = APIException  # Nothing else raises it
     params_avail = False
     logger.warning("py-clob-client not installed. Trading functionality will be limited.")
 
+# Optional faster JSON backend for the high-throughput market decoder
+try:
+    import orjson
+
+    _fast_json_loads = orjson.loads
+    orjson_avail = True
+except ImportError:
+    orjson = None
+    _fast_json_loads = json.loads
+    orjson_avail = False
+
 # Import eth-account for wallet operations when py-clob-client unavailable
 try:
     from eth_account import Account
@@ -45,24 +100,6 @@ except ImportError:
     Account = None
     eth_account_avail = False
 
-from probablyprofit.api.async_wrapper import AsyncClientWrapper, run_sync
-from probablyprofit.api.exceptions import (
-    APIException,
-    NetworkException,
-    OrderException,
-    RateLimitException,
-    ValidationException,
-)
-from probablyprofit.config import get_config
-from probablyprofit.utils.cache import AsyncTTLCache, market_cache, price_cache
-from probablyprofit.utils.resilience import CircuitBreaker, RateLimiter, retry
-from probablyprofit.utils.validators import (
-    validate_non_negative,
-    validate_positive,
-    validate_price,
-    validate_side,
-)
-
 
 def _get_circuit_breakers() -> Dict[str, CircuitBreaker]:
     """Get circuit breakers with config values (lazy initialization)."""
@@ -91,9 +128,14 @@ def _get_rate_limiter() -> RateLimiter:
     )
 
 
-# Lazy-initialized circuit breakers and rate limiter
+# Lazy-initialized circuit breakers and rate limiters
 _circuit_breakers = None
 _api_rate_limiter = None
+_endpoint_rate_limiters: Dict[str, AdaptiveRateLimiter] = {}
+_request_schedulers: Dict[str, PriorityScheduler] = {}
+
+# Endpoint classes with their own bucket in adaptive rate-limit mode
+ENDPOINT_CLASSES = ("gamma", "clob_read", "clob_write")
 
 
 def get_gamma_circuit() -> CircuitBreaker:
@@ -112,14 +154,110 @@ def get_clob_circuit() -> CircuitBreaker:
     return _circuit_breakers["clob"]
 
 
-def get_rate_limiter() -> RateLimiter:
-    """Get API rate limiter."""
+def get_rate_limiter(endpoint_class: Optional[str] = None) -> RateLimiter:
+    """
+    Get API rate limiter.
+
+    With api.adaptive_rate_limit enabled, each endpoint class ("gamma",
+    "clob_read", "clob_write") gets its own AdaptiveRateLimiter; otherwise
+    every call shares one fixed bucket.
+    """
     global _api_rate_limiter
+    if endpoint_class is not None:
+        cfg = get_config()
+        if cfg.api.adaptive_rate_limit:
+            limiter = _endpoint_rate_limiters.get(endpoint_class)
+            if limiter is None:
+                initial_rate = (
+                    cfg.api.polymarket_rate_limit_calls / cfg.api.polymarket_rate_limit_period
+                )
+                limiter = AdaptiveRateLimiter(
+                    f"polymarket-{endpoint_class}",
+                    calls=cfg.api.polymarket_rate_limit_calls,
+                    period=cfg.api.polymarket_rate_limit_period,
+                    max_rate=initial_rate * cfg.api.rate_limit_max_multiplier,
+                    latency_threshold=cfg.api.rate_limit_latency_threshold,
+                )
+                _endpoint_rate_limiters[endpoint_class] = limiter
+            return limiter
     if _api_rate_limiter is None:
         _api_rate_limiter = _get_rate_limiter()
     return _api_rate_limiter
 
 
+def get_request_scheduler(endpoint_class: Optional[str] = None) -> PriorityScheduler:
+    """
+    Get the priority scheduler in front of an endpoint class's rate limiter.
+
+    When callers have to wait for capacity, critical requests (stop-losses,
+    cancels) are released first, then normal trading, then background scans.
+    """
+    limiter = get_rate_limiter(endpoint_class)
+    scheduler = _request_schedulers.get(limiter.name)
+    if scheduler is None or scheduler.limiter is not limiter:
+        scheduler = PriorityScheduler(
+            limiter, starvation_timeout=get_config().api.request_starvation_timeout
+        )
+        _request_schedulers[limiter.name] = scheduler
+    return scheduler
+
+
+def _endpoint_class(request: httpx.Request) -> Optional[str]:
+    """Classify a Polymarket request for rate limiting (None for other hosts)."""
+    host = request.url.host
+    if host.startswith("gamma-api."):
+        return "gamma"
+    if host.startswith("clob."):
+        return "clob_read" if request.method in ("GET", "HEAD") else "clob_write"
+    return None
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After in seconds (HTTP-date values are ignored)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+async def _mark_request_start(request: httpx.Request) -> None:
+    request.extensions["pp_started"] = time.perf_counter()
+
+
+async def _feed_rate_limiter(response: httpx.Response) -> None:
+    """Report each response's status and latency to its adaptive limiter."""
+    endpoint_class = _endpoint_class(response.request)
+    if endpoint_class is None:
+        return
+    limiter = get_rate_limiter(endpoint_class)
+    if not isinstance(limiter, AdaptiveRateLimiter):
+        return
+
+    if response.status_code == 429:
+        limiter.record_rate_limit_error(_parse_retry_after(response.headers.get("Retry-After")))
+    elif response.status_code < 500:
+        started = response.request.extensions.get("pp_started")
+        limiter.record_success(time.perf_counter() - started if started else None)
+
+
+# httpx event hooks installed on the CLOB and Gamma clients
+RATE_LIMIT_HOOKS = {"request": [_mark_request_start], "response": [_feed_rate_limiter]}
+
+
+def _parse_end_date(value: Any) -> datetime:
+    """Parse a Gamma ISO-8601 end date, falling back to now() like the validated path."""
+    if not value:
+        return datetime.now()
+    try:
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        return datetime.fromisoformat(value)
+    except (ValueError, TypeError, AttributeError):
+        return datetime.now()
+
+
 class LRUCache(OrderedDict):
     """Simple LRU cache with max size limit using O(1) OrderedDict operations."""
 
@@ -208,6 +346,10 @@ async def batch_fetch(
     return results
 
 
+# Polygon JSON-RPC endpoint used for on-chain balance queries
+POLYGON_RPC_URL = "https://polygon-rpc.com"
+
+
 class Market(BaseModel):
     """Represents a Polymarket market."""
 
@@ -238,6 +380,35 @@ class Order(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.now)
 
 
+class BatchOrderResult(BaseModel):
+    """Outcome of one order in a place_orders_batch call."""
+
+    index: int  # Position in the request list
+    order: Optional[Order] = None
+    error: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        return self.order is not None and self.error is None
+
+
+class BulkCancelResult(BaseModel):
+    """Outcome of a cancel_orders_bulk call."""
+
+    # order_id -> None if cancelled, otherwise why it was not
+    outcomes: Dict[str, Optional[str]] = Field(default_factory=dict)
+    method: str = "none"  # cancel_all / cancel_market / cancel_batch / concurrent
+    seconds: float = 0.0  # Wall-clock time until every cancel was answered
+
+    @property
+    def cancelled(self) -> List[str]:
+        return [order_id for order_id, error in self.outcomes.items() if error is None]
+
+    @property
+    def failed(self) -> Dict[str, str]:
+        return {order_id: error for order_id, error in self.outcomes.items() if error is not None}
+
+
 class Position(BaseModel):
     """Represents a position in a market."""
 
@@ -310,6 +481,7 @@ class PolymarketClient:
         # SECURITY: Always verify SSL certificates by default
         # Set POLYMARKET_VERIFY_SSL=false only for debugging (never in production)
         import os
+
         verify_ssl = os.getenv("POLYMARKET_VERIFY_SSL", "true").lower() != "false"
 
         if not verify_ssl:
@@ -319,21 +491,27 @@ class PolymarketClient:
                 "Set POLYMARKET_VERIFY_SSL=true or remove the environment variable."
             )
 
+        # PERFORMANCE OPTIMIZATION: CLOB, Gamma and RPC clients share one pool of
+        # warm keep-alive (HTTP/2 when available) connections
+        # SECURITY: Explicit SSL verification is configured on the pool
+        self._pool = get_http_pool("polymarket", verify=verify_ssl)
+
         # HTTP client for CLOB endpoints (orders, prices)
         host = "https://clob.polymarket.com" if not testnet else "https://clob-test.polymarket.com"
-        self.http_client = httpx.AsyncClient(
-            base_url=host,
-            timeout=cfg.api.http_timeout,
-            verify=verify_ssl,  # SECURITY: Explicit SSL verification
+        self.http_client = self._pool.client(
+            base_url=host, timeout=cfg.api.http_timeout, event_hooks=RATE_LIMIT_HOOKS
         )
 
         # HTTP client for Gamma API (market metadata, volume, descriptions)
-        self.gamma_client = httpx.AsyncClient(
+        self.gamma_client = self._pool.client(
             base_url="https://gamma-api.polymarket.com",
             timeout=cfg.api.http_timeout,
-            verify=verify_ssl,  # SECURITY: Explicit SSL verification
+            event_hooks=RATE_LIMIT_HOOKS,
         )
 
+        # HTTP client for Polygon RPC (on-chain balance)
+        self.rpc_client = self._pool.client(timeout=10.0)
+
         # Cache for market data (now using TTL cache with config values)
         self._market_cache: AsyncTTLCache[Market] = AsyncTTLCache(
             ttl=cfg.api.market_cache_ttl,
@@ -348,11 +526,35 @@ class PolymarketClient:
         # This eliminates the need to fetch token IDs during order placement
         self._token_id_cache: LRUCache = LRUCache(max_size=cfg.api.market_cache_max_size * 2)
 
+        # Coalesce concurrent identical reads into a single upstream request
+        self._market_flight = SingleFlight("market")
+        self._orderbook_flight = SingleFlight("orderbook")
+        self._token_id_flight = SingleFlight("token_id")
+
+        # Hedged reads: re-issue slow market/orderbook/order reads after their p95
+        self._hedger: Optional[RequestHedger] = (
+            RequestHedger("polymarket", budget=cfg.api.hedge_budget)
+            if cfg.api.hedged_reads
+            else None
+        )
+
+        # Optional local orderbook replica (see attach_orderbook_store)
+        self.orderbook_store: Optional[Any] = None
+
+        # Optional in-memory positions/balance (see attach_portfolio_state)
+        self.portfolio_state: Optional[Any] = None
+
+        # High-throughput market decoding (faster JSON backend, no per-row validation)
+        self.fast_decode = cfg.api.fast_market_decode
+
         # Wrap sync client for async use if available
         self._async_clob = (
             AsyncClientWrapper(self.client, timeout=cfg.api.http_timeout) if self.client else None
         )
 
+        # Native async CLOB client on the shared connection pool (preferred for orders)
+        self._native_clob: Optional[AsyncClobClient] = self._build_native_clob()
+
     def _init_clob_client_sync(self, private_key: str) -> None:
         """Initialize CLOB client synchronously (may block event loop)."""
         try:
@@ -407,10 +609,20 @@ class PolymarketClient:
             if self.client:
                 cfg = get_config()
                 self._async_clob = AsyncClientWrapper(self.client, timeout=cfg.api.http_timeout)
+                self._native_clob = self._build_native_clob()
 
         self._initialized = True
         logger.info("PolymarketClient async initialization complete")
 
+    def _build_native_clob(self) -> Optional[AsyncClobClient]:
+        """Create the native async CLOB client if enabled and credentials exist."""
+        if not self.client or not get_config().api.native_clob:
+            return None
+        native = AsyncClobClient.from_sync(self.client, self.http_client)
+        if native is None:
+            logger.debug("Native CLOB client unavailable - using thread-wrapped py-clob-client")
+        return native
+
     def _get_auth_headers(self) -> Dict[str, str]:
         """Get authentication headers for API requests."""
         headers = {}
@@ -423,6 +635,11 @@ class PolymarketClient:
                 headers["X-Api-Passphrase"] = self._api_creds.api_passphrase
         return headers
 
+    @property
+    def api_creds(self) -> Any:
+        """L2 API credentials (api_key/api_secret/api_passphrase), or None."""
+        return self._api_creds
+
     async def get_markets(
         self,
         active: bool = True,
@@ -449,150 +666,341 @@ class PolymarketClient:
         offset: int,
     ) -> List[Market]:
         """Internal method with retry and circuit breaker."""
-        # Get config for retry settings
-        cfg = get_config()
-
         # Rate limit
-        await get_rate_limiter().acquire()
+        await get_request_scheduler("gamma").acquire(RequestPriority.BACKGROUND)
 
         # Apply circuit breaker
         circuit = get_gamma_circuit()
         if circuit.is_open:
             raise NetworkException("Circuit breaker open for Gamma API")
 
+        # Fetch extra to filter out low-volume
+        data = await self._request_gamma_page(limit * 2, offset)
+
+        try:
+            markets = self._decode_markets(data)
+        except (ValueError, TypeError) as e:
+            logger.error(f"Data parsing error fetching markets: {e}")
+            raise APIException(f"Failed to parse market data: {e}")
+
+        logger.info(f"Fetched {len(markets)} markets from Gamma API")
+        return markets
+
+    async def iter_markets(
+        self,
+        page_size: Optional[int] = None,
+        prefetch: Optional[int] = None,
+        offset: int = 0,
+    ) -> AsyncIterator[Market]:
+        """
+        Stream every open market from the Gamma API, page by page.
+
+        Up to ``prefetch`` pages are requested concurrently ahead of the
+        consumer, each one under the shared rate limiter and the gamma
+        circuit breaker. Markets are yielded in page order as soon as their
+        page lands, so callers can start filtering before the scan finishes.
+
+        Args:
+            page_size: Raw Gamma rows per request (defaults to config)
+            prefetch: Number of pages kept in flight (defaults to config)
+            offset: Pagination offset to start from
+
+        Yields:
+            Market objects that pass the same filters as get_markets()
+
+        Usage:
+            async for market in client.iter_markets():
+                if market.volume > 10_000:
+                    ...
+        """
+        cfg = get_config()
+        page_size = page_size or cfg.api.market_scan_page_size
+        prefetch = max(1, prefetch or cfg.api.market_scan_prefetch)
+
+        pending: Deque[asyncio.Task] = deque()
+        next_offset = offset
+        exhausted = False
+        pages = 0
+        yielded = 0
+
+        try:
+            while True:
+                # Keep the prefetch window full until the last page is seen
+                while not exhausted and len(pending) < prefetch:
+                    pending.append(
+                        asyncio.create_task(self._fetch_gamma_page(page_size, next_offset))
+                    )
+                    next_offset += page_size
+
+                if not pending:
+                    break
+
+                rows = await pending.popleft()
+                pages += 1
+
+                # A short page is the end of the universe; anything queued after it is empty
+                if len(rows) < page_size:
+                    exhausted = True
+                    await self._cancel_tasks(pending)
+
+                for market in self._decode_markets(rows):
+                    yielded += 1
+                    yield market
+        finally:
+            await self._cancel_tasks(pending)
+
+        logger.info(f"Streamed {yielded} markets from {pages} Gamma page(s)")
+
+    @staticmethod
+    async def _cancel_tasks(tasks: Deque[asyncio.Task]) -> None:
+        """Cancel and drain outstanding tasks so none are left dangling."""
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        tasks.clear()
+
+    async def _fetch_gamma_page(self, limit: int, offset: int) -> List[Dict[str, Any]]:
+        """Fetch one raw Gamma page under the rate limiter and gamma circuit breaker."""
+        await get_request_scheduler("gamma").acquire(RequestPriority.BACKGROUND)
+
+        circuit = get_gamma_circuit()
+        if circuit.is_open:
+            raise NetworkException("Circuit breaker open for Gamma API")
+
+        return await circuit(self._request_gamma_page)(limit, offset)
+
+    async def _request_gamma_page(self, limit: int, offset: int) -> List[Dict[str, Any]]:
+        """Request one page of open markets from Gamma and return the raw rows."""
         try:
             # Use Gamma API for market metadata (better data than CLOB /markets)
             response = await self.gamma_client.get(
                 "/markets",
                 params={
                     "closed": "false",  # ONLY open markets (most important filter)
-                    "limit": limit * 2,  # Fetch extra to filter out low-volume
+                    "limit": limit,
                     "offset": offset,
                 },
             )
             response.raise_for_status()
-            data = response.json()
+            data = _fast_json_loads(response.content) if self.fast_decode else response.json()
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 429:
+                raise RateLimitException(f"Rate limited by Polymarket: {e}")
+            raise NetworkException(f"HTTP error fetching markets: {e}")
+        except httpx.RequestError as e:
+            raise NetworkException(f"Network error fetching markets: {e}")
+        except json.JSONDecodeError as e:
+            logger.error(f"Invalid JSON response from markets API: {e}")
+            raise APIException(f"Invalid JSON response: {e}")
 
-            # Gamma API returns a list directly
-            if not isinstance(data, list):
-                logger.warning(f"Expected list of markets, got {type(data)}")
-                return []
+        # Gamma API returns a list directly
+        if not isinstance(data, list):
+            logger.warning(f"Expected list of markets, got {type(data)}")
+            return []
 
-            markets = []
-            parse_failures = []  # Track markets that fail to parse
-            for market_data in data:
-                try:
-                    # STRICT FILTER: Skip closed markets
-                    if market_data.get("closed", False) == True:
-                        continue
-
-                    # STRICT FILTER: Must have real volume (> $100)
-                    volume = float(market_data.get("volumeNum", market_data.get("volume", 0)))
-                    if volume < 100:
-                        continue
-
-                    condition_id = market_data.get("conditionId", "")
-                    question = market_data.get("question", "Unknown")
-                    description = market_data.get("description")
-
-                    # Parse end date safely
-                    end_date_str = market_data.get("endDate", "")
-                    try:
-                        end_date = (
-                            datetime.fromisoformat(end_date_str.replace("Z", "+00:00"))
-                            if end_date_str
-                            else datetime.now()
-                        )
-                    except ValueError:
-                        end_date = datetime.now()
+        return data
 
-                    # Parse outcomes - Gamma returns JSON string like '["Yes", "No"]'
-                    outcomes_raw = market_data.get("outcomes", '["Yes", "No"]')
-                    if isinstance(outcomes_raw, str):
-                        outcomes = json.loads(outcomes_raw)
-                    else:
-                        outcomes = outcomes_raw
-
-                    # Parse outcome prices - Gamma returns JSON string like '["0.21", "0.79"]'
-                    prices_raw = market_data.get("outcomePrices", "[0.5, 0.5]")
-                    if isinstance(prices_raw, str):
-                        prices_parsed = json.loads(prices_raw)
-                        outcome_prices = [float(p) for p in prices_parsed]
-                    elif isinstance(prices_raw, list):
-                        outcome_prices = [float(p) for p in prices_raw]
-                    else:
-                        outcome_prices = [0.5] * len(outcomes)
+    def _decode_markets(self, data: List[Dict[str, Any]]) -> List[Market]:
+        """Parse raw Gamma rows with the decoder selected by ``fast_decode``."""
+        if self.fast_decode:
+            return self._parse_gamma_markets_fast(data)
+        return self._parse_gamma_markets(data)
 
-                    # Use volumeNum for numeric volume (Gamma provides this)
-                    volume = float(market_data.get("volumeNum", market_data.get("volume", 0)))
-                    liquidity = float(
-                        market_data.get("liquidityNum", market_data.get("liquidity", 0))
-                    )
-                    is_active = market_data.get("active", True) and not market_data.get(
-                        "closed", False
-                    )
+    def _parse_gamma_markets(self, data: List[Dict[str, Any]]) -> List[Market]:
+        """Parse raw Gamma rows into markets, warming the market and token ID caches."""
+        markets = []
+        parse_failures = []  # Track markets that fail to parse
+        for market_data in data:
+            try:
+                # STRICT FILTER: Skip closed markets
+                if market_data.get("closed", False) == True:
+                    continue
 
-                    market = Market(
-                        condition_id=condition_id,
-                        question=question,
-                        description=description,
-                        end_date=end_date,
-                        outcomes=outcomes,
-                        outcome_prices=outcome_prices,
-                        volume=volume,
-                        liquidity=liquidity,
-                        active=is_active,
-                        metadata=market_data,
-                    )
-                    markets.append(market)
-                    # Use TTL cache instead of dict
-                    self._market_cache.set(market.condition_id, market)
-
-                    # PERFORMANCE OPTIMIZATION: Pre-cache token IDs during market fetch
-                    # This eliminates redundant API calls when placing orders
-                    clob_ids = market_data.get("clobTokenIds")
-                    if clob_ids:
-                        if isinstance(clob_ids, str):
-                            clob_ids = json.loads(clob_ids)
-                        if isinstance(clob_ids, list):
-                            for idx, outcome_name in enumerate(outcomes):
-                                if idx < len(clob_ids):
-                                    cache_key = f"{condition_id}:{outcome_name}"
-                                    self._token_id_cache.set(cache_key, clob_ids[idx])
-                except Exception as parse_error:
-                    market_question = market_data.get("question", "Unknown")[:50]
-                    market_id = market_data.get("conditionId", "unknown")
-                    parse_failures.append(
-                        {"question": market_question, "id": market_id, "error": str(parse_error)}
-                    )
-                    logger.warning(
-                        f"Failed to parse market '{market_question}' (id={market_id}): {parse_error}"
-                    )
+                # STRICT FILTER: Must have real volume (> $100)
+                volume = float(market_data.get("volumeNum", market_data.get("volume", 0)))
+                if volume < 100:
                     continue
 
-            # Surface parse failures to user if any occurred
-            if parse_failures:
+                condition_id = market_data.get("conditionId", "")
+                question = market_data.get("question", "Unknown")
+                description = market_data.get("description")
+
+                # Parse end date safely
+                end_date_str = market_data.get("endDate", "")
+                try:
+                    end_date = (
+                        datetime.fromisoformat(end_date_str.replace("Z", "+00:00"))
+                        if end_date_str
+                        else datetime.now()
+                    )
+                except ValueError:
+                    end_date = datetime.now()
+
+                # Parse outcomes - Gamma returns JSON string like '["Yes", "No"]'
+                outcomes_raw = market_data.get("outcomes", '["Yes", "No"]')
+                if isinstance(outcomes_raw, str):
+                    outcomes = json.loads(outcomes_raw)
+                else:
+                    outcomes = outcomes_raw
+
+                # Parse outcome prices - Gamma returns JSON string like '["0.21", "0.79"]'
+                prices_raw = market_data.get("outcomePrices", "[0.5, 0.5]")
+                if isinstance(prices_raw, str):
+                    prices_parsed = json.loads(prices_raw)
+                    outcome_prices = [float(p) for p in prices_parsed]
+                elif isinstance(prices_raw, list):
+                    outcome_prices = [float(p) for p in prices_raw]
+                else:
+                    outcome_prices = [0.5] * len(outcomes)
+
+                # Use volumeNum for numeric volume (Gamma provides this)
+                volume = float(market_data.get("volumeNum", market_data.get("volume", 0)))
+                liquidity = float(market_data.get("liquidityNum", market_data.get("liquidity", 0)))
+                is_active = market_data.get("active", True) and not market_data.get(
+                    "closed", False
+                )
+
+                market = Market(
+                    condition_id=condition_id,
+                    question=question,
+                    description=description,
+                    end_date=end_date,
+                    outcomes=outcomes,
+                    outcome_prices=outcome_prices,
+                    volume=volume,
+                    liquidity=liquidity,
+                    active=is_active,
+                    metadata=market_data,
+                )
+                markets.append(market)
+                # Use TTL cache instead of dict
+                self._market_cache.set(market.condition_id, market)
+
+                # PERFORMANCE OPTIMIZATION: Pre-cache token IDs during market fetch
+                # This eliminates redundant API calls when placing orders
+                clob_ids = market_data.get("clobTokenIds")
+                if clob_ids:
+                    if isinstance(clob_ids, str):
+                        clob_ids = json.loads(clob_ids)
+                    if isinstance(clob_ids, list):
+                        for idx, outcome_name in enumerate(outcomes):
+                            if idx < len(clob_ids):
+                                cache_key = f"{condition_id}:{outcome_name}"
+                                self._token_id_cache.set(cache_key, clob_ids[idx])
+            except Exception as parse_error:
+                market_question = str(market_data.get("question", "Unknown"))[:50]
+                market_id = market_data.get("conditionId", "unknown")
+                parse_failures.append(
+                    {"question": market_question, "id": market_id, "error": str(parse_error)}
+                )
                 logger.warning(
-                    f"Failed to parse {len(parse_failures)} market(s). "
-                    f"These markets will not be available for trading. "
-                    f"First failure: {parse_failures[0]['question']} - {parse_failures[0]['error']}"
+                    f"Failed to parse market '{market_question}' (id={market_id}): {parse_error}"
                 )
+                continue
 
-            logger.info(f"Fetched {len(markets)} markets from Gamma API")
-            return markets
+        # Surface parse failures to user if any occurred
+        if parse_failures:
+            logger.warning(
+                f"Failed to parse {len(parse_failures)} market(s). "
+                f"These markets will not be available for trading. "
+                f"First failure: {parse_failures[0]['question']} - {parse_failures[0]['error']}"
+            )
 
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 429:
-                raise RateLimitException(f"Rate limited by Polymarket: {e}")
-            raise NetworkException(f"HTTP error fetching markets: {e}")
-        except httpx.RequestError as e:
-            raise NetworkException(f"Network error fetching markets: {e}")
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON response from markets API: {e}")
-            raise APIException(f"Invalid JSON response: {e}")
-        except (ValueError, TypeError) as e:
-            logger.error(f"Data parsing error fetching markets: {e}")
-            raise APIException(f"Failed to parse market data: {e}")
+        return markets
+
+    def _parse_gamma_markets_fast(self, data: List[Dict[str, Any]]) -> List[Market]:
+        """
+        High-throughput variant of _parse_gamma_markets.
+
+        Applies the same filters and cache warming, but decodes the embedded
+        JSON fields with the fastest available backend and builds Market
+        objects directly, skipping pydantic validation for rows that have
+        already been normalised here.
+        """
+        loads = _fast_json_loads
+        cache_market = self._market_cache.set
+        cache_token = self._token_id_cache.set
+
+        markets = []
+        parse_failures = []
+        for market_data in data:
+            try:
+                get = market_data.get
+                if get("closed", False) == True:
+                    continue
+
+                volume = float(get("volumeNum", get("volume", 0)))
+                if volume < 100:
+                    continue
+
+                outcomes = get("outcomes", '["Yes", "No"]')
+                if isinstance(outcomes, str):
+                    outcomes = loads(outcomes)
+                if not isinstance(outcomes, list):
+                    raise TypeError(f"outcomes must be a list, got {type(outcomes).__name__}")
+
+                prices = get("outcomePrices", "[0.5, 0.5]")
+                if isinstance(prices, str):
+                    prices = loads(prices)
+                if isinstance(prices, list):
+                    outcome_prices = [float(p) for p in prices]
+                else:
+                    outcome_prices = [0.5] * len(outcomes)
+
+                # Cheap stand-ins for the checks pydantic would run on the raw fields
+                condition_id = get("conditionId", "")
+                if not isinstance(condition_id, str):
+                    raise TypeError(f"conditionId must be a string, got {condition_id!r}")
+                question = get("question", "Unknown")
+                if not isinstance(question, str):
+                    raise TypeError(f"question must be a string, got {question!r}")
+                description = get("description")
+                if description is not None and not isinstance(description, str):
+                    raise TypeError(f"description must be a string, got {description!r}")
+                active = get("active", True)
+                if not isinstance(active, bool):
+                    raise TypeError(f"active must be a bool, got {active!r}")
+
+                # Values are normalised and checked above, so skip pydantic validation
+                market = Market.model_construct(
+                    condition_id=condition_id,
+                    question=question,
+                    description=description,
+                    end_date=_parse_end_date(get("endDate")),
+                    outcomes=outcomes,
+                    outcome_prices=outcome_prices,
+                    volume=volume,
+                    liquidity=float(get("liquidityNum", get("liquidity", 0))),
+                    active=active,
+                    metadata=market_data,
+                )
+                markets.append(market)
+                cache_market(condition_id, market)
+
+                clob_ids = get("clobTokenIds")
+                if clob_ids:
+                    if isinstance(clob_ids, str):
+                        clob_ids = loads(clob_ids)
+                    if isinstance(clob_ids, list):
+                        for outcome_name, token_id in zip(outcomes, clob_ids):
+                            cache_token(f"{condition_id}:{outcome_name}", token_id)
+            except Exception as parse_error:
+                parse_failures.append(
+                    {
+                        "question": str(market_data.get("question", "Unknown"))[:50],
+                        "id": market_data.get("conditionId", "unknown"),
+                        "error": str(parse_error),
+                    }
+                )
+
+        if parse_failures:
+            logger.warning(
+                f"Failed to parse {len(parse_failures)} market(s). "
+                f"These markets will not be available for trading. "
+                f"First failure: {parse_failures[0]['question']} - {parse_failures[0]['error']}"
+            )
+
+        return markets
 
     async def get_market(self, condition_id: str) -> Optional[Market]:
         """
@@ -609,8 +1017,25 @@ class PolymarketClient:
         if cached is not None:
             return cached
 
+        return await self._market_flight.do(condition_id, lambda: self._fetch_market(condition_id))
+
+    async def _hedged(self, endpoint: str, factory: Callable[[], Coroutine[Any, Any, T]]) -> T:
+        """Run an idempotent read, hedged when api.hedged_reads is enabled."""
+        if self._hedger is None:
+            return await factory()
+        # The hedge is extra load, so it waits for a background-priority token
+        return await self._hedger.run(
+            endpoint,
+            factory,
+            acquire=lambda: get_request_scheduler("clob_read").acquire(RequestPriority.BACKGROUND),
+        )
+
+    async def _fetch_market(self, condition_id: str) -> Optional[Market]:
+        """Fetch a single market and populate the TTL cache."""
         try:
-            response = await self.http_client.get(f"/markets/{condition_id}")
+            response = await self._hedged(
+                "market", lambda: self.http_client.get(f"/markets/{condition_id}")
+            )
             response.raise_for_status()
             market_data = response.json()
 
@@ -659,10 +1084,29 @@ class PolymarketClient:
         Returns:
             Orderbook data with bids and asks
         """
+        # Serve from the local replica when it is fresh
+        if self.orderbook_store is not None:
+            book = self.orderbook_store.get_fresh(condition_id, outcome)
+            if book is not None:
+                return book.to_dict()
+
+        return await self._get_orderbook_remote(condition_id, outcome)
+
+    async def _get_orderbook_remote(self, condition_id: str, outcome: str) -> Dict[str, Any]:
+        """Fetch an orderbook over REST, coalescing concurrent identical requests."""
+        return await self._orderbook_flight.do(
+            (condition_id, outcome), lambda: self._fetch_orderbook(condition_id, outcome)
+        )
+
+    async def _fetch_orderbook(self, condition_id: str, outcome: str) -> Dict[str, Any]:
+        """Fetch a single orderbook from the API."""
         try:
-            response = await self.http_client.get(f"/orderbook/{condition_id}/{outcome}")
+            response = await self._hedged(
+                "orderbook",
+                lambda: self.http_client.get(f"/orderbook/{condition_id}/{outcome}"),
+            )
             response.raise_for_status()
-            return response.json()
+            data = response.json()
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error fetching orderbook: {e}")
             return {"bids": [], "asks": []}
@@ -673,6 +1117,37 @@ class PolymarketClient:
             logger.error(f"Invalid JSON in orderbook response: {e}")
             return {"bids": [], "asks": []}
 
+        # Resync the local replica from the REST snapshot
+        if self.orderbook_store is not None:
+            try:
+                self.orderbook_store.load_snapshot(condition_id, outcome, data)
+            except (ValueError, TypeError, KeyError, IndexError) as e:
+                logger.warning(f"Could not load orderbook snapshot into replica: {e}")
+
+        return data
+
+    def attach_orderbook_store(self, store: Any) -> None:
+        """
+        Serve get_orderbook/get_orderbooks_batch from a local replica when fresh.
+
+        Args:
+            store: OrderbookStore fed by the WebSocket orderbook channel
+        """
+        self.orderbook_store = store
+        if store.client is None:
+            store.client = self
+
+    def attach_portfolio_state(self, state: Any) -> None:
+        """
+        Serve get_positions/get_balance from an in-memory PortfolioState.
+
+        Args:
+            state: PortfolioState that applies fills locally and reconciles in the background
+        """
+        self.portfolio_state = state
+        if state.client is None:
+            state.client = self
+
     # =========================================================================
     # PERFORMANCE OPTIMIZATION: Batch fetch methods
     # =========================================================================
@@ -740,10 +1215,28 @@ class PolymarketClient:
         if not market_outcomes:
             return []
 
-        return await gather_with_concurrency(
-            concurrency,
-            *(self.get_orderbook(cid, outcome) for cid, outcome in market_outcomes)
-        )
+        # Serve fresh books from the local replica, fetch the rest
+        results: Dict[tuple, Dict[str, Any]] = {}
+        to_fetch: List[tuple[str, str]] = []
+
+        for key in market_outcomes:
+            book = self.orderbook_store.get_fresh(*key) if self.orderbook_store else None
+            if book is not None:
+                results[key] = book.to_dict()
+            elif key not in results:
+                results[key] = {}
+                to_fetch.append(key)
+
+        if to_fetch:
+            fetched = await gather_with_concurrency(
+                concurrency,
+                *(self._get_orderbook_remote(cid, outcome) for cid, outcome in to_fetch)
+            )
+            for key, orderbook in zip(to_fetch, fetched):
+                results[key] = orderbook
+
+        # Return in original order
+        return [results[key] for key in market_outcomes]
 
     async def refresh_market_prices_batch(
         self,
@@ -770,6 +1263,63 @@ class PolymarketClient:
             if m is not None
         }
 
+    async def _resolve_token_id(self, market_id: str, outcome: str) -> str:
+        """
+        Resolve an outcome name to its CLOB token ID.
+
+        PERFORMANCE OPTIMIZATION: Uses pre-cached token IDs instead of fetching,
+        and concurrent lookups for the same outcome share a single market fetch.
+
+        Args:
+            market_id: Market condition ID
+            outcome: Outcome name (or a token ID, which is returned unchanged)
+
+        Returns:
+            Token ID, or the outcome itself if it cannot be resolved
+        """
+        # Heuristic: names are short, token IDs are long hashes
+        if len(outcome) >= 10:
+            return outcome
+
+        # Try to resolve token ID from cache first (O(1) lookup)
+        cache_key = f"{market_id}:{outcome}"
+        cached_token_id = self._token_id_cache.get(cache_key)
+        if cached_token_id:
+            logger.debug(f"Using cached token ID for '{outcome}': {cached_token_id}")
+            return cached_token_id
+
+        return await self._token_id_flight.do(
+            cache_key, lambda: self._fetch_token_id(market_id, outcome, cache_key)
+        )
+
+    async def _fetch_token_id(self, market_id: str, outcome: str, cache_key: str) -> str:
+        """Fallback: fetch token ID from market if not in cache."""
+        market = await self.get_market(market_id)
+        if not market:
+            return outcome
+
+        try:
+            # Find index of outcome name
+            idx = market.outcomes.index(outcome)
+        except ValueError:
+            # Outcome name not found in list, assume it might be valid or fail later
+            return outcome
+
+        # Get token IDs from metadata
+        clob_ids = market.metadata.get("clobTokenIds")
+        if clob_ids:
+            if isinstance(clob_ids, str):
+                clob_ids = json.loads(clob_ids)
+
+            if isinstance(clob_ids, list) and idx < len(clob_ids):
+                token_id = clob_ids[idx]
+                # Cache for future orders
+                self._token_id_cache.set(cache_key, token_id)
+                logger.debug(f"Resolved and cached outcome '{outcome}' to token ID {token_id}")
+                return token_id
+
+        return outcome
+
     async def place_order(
         self,
         market_id: str,
@@ -816,45 +1366,12 @@ class PolymarketClient:
             raise ValidationException("outcome cannot be empty")
 
         # Rate limit orders
-        await get_rate_limiter().acquire()
+        await get_request_scheduler("clob_write").acquire(RequestPriority.NORMAL)
 
         try:
             logger.info(f"Placing {side} order: {size} shares @ ${price} on {outcome}")
 
-            # PERFORMANCE OPTIMIZATION: Use pre-cached token IDs instead of fetching
-            # This eliminates redundant API calls during order placement
-            token_id = outcome
-
-            # Try to resolve token ID from cache first (O(1) lookup)
-            if len(outcome) < 10:  # Heuristic: names are short, token IDs are long hashes
-                cache_key = f"{market_id}:{outcome}"
-                cached_token_id = self._token_id_cache.get(cache_key)
-
-                if cached_token_id:
-                    token_id = cached_token_id
-                    logger.debug(f"Using cached token ID for '{outcome}': {token_id}")
-                else:
-                    # Fallback: fetch from market if not in cache
-                    market = await self.get_market(market_id)
-                    if market:
-                        try:
-                            # Find index of outcome name
-                            idx = market.outcomes.index(outcome)
-
-                            # Get token IDs from metadata
-                            clob_ids = market.metadata.get("clobTokenIds")
-                            if clob_ids:
-                                if isinstance(clob_ids, str):
-                                    clob_ids = json.loads(clob_ids)
-
-                                if isinstance(clob_ids, list) and idx < len(clob_ids):
-                                    token_id = clob_ids[idx]
-                                    # Cache for future orders
-                                    self._token_id_cache.set(cache_key, token_id)
-                                    logger.debug(f"Resolved and cached outcome '{outcome}' to token ID {token_id}")
-                        except ValueError:
-                            # Outcome name not found in list, assume it might be valid or fail later
-                            pass
+            token_id = await self._resolve_token_id(market_id, outcome)
 
             # Create order using CLOB client (sync method wrapped for async)
             order_args = OrderArgs(
@@ -864,8 +1381,13 @@ class PolymarketClient:
                 token_id=token_id,
             )
 
+            mark_stage("order_submit")
+            if self._native_clob:
+                resp = await self._native_clob.create_and_post_order(
+                    order_args, self._clob_order_type({"order_type": order_type})
+                )
             # Use async wrapper to safely call sync method
-            if self._async_clob:
+            elif self._async_clob:
                 resp = await self._async_clob.create_order(order_args)
             else:
                 # Fallback: run in executor
@@ -873,6 +1395,9 @@ class PolymarketClient:
 
             if not resp:
                 raise OrderException("Empty response from order API")
+            if isinstance(resp, dict) and resp.get("success") is False:
+                raise OrderException(resp.get("errorMsg") or "Order rejected")
+            mark_stage("order_ack")
 
             # Get market question from cache for searchable trade history
             market_question = None
@@ -894,12 +1419,17 @@ class PolymarketClient:
             )
 
             logger.info(f"Order placed successfully: {order.order_id}")
+            # Fills for this order may land before the next fill event; reconcile soon
+            if self.portfolio_state is not None:
+                self.portfolio_state.mark_stale()
             return order
 
         except ValidationException:
             raise
         except OrderException:
             raise
+        except APIException:
+            raise
         except httpx.HTTPError as e:
             logger.error(f"Network error placing order: {e}")
             raise NetworkException(f"Network error: {e}")
@@ -907,6 +1437,141 @@ class PolymarketClient:
             logger.error(f"Error placing order: {e}")
             raise OrderException(f"Order placement failed: {e}")
 
+    async def place_orders_batch(
+        self,
+        orders: List[Dict[str, Any]],
+        submit_concurrency: int = 4,
+    ) -> List[BatchOrderResult]:
+        """
+        Place many orders, overlapping signing with submission.
+
+        Token IDs for every (market, outcome) pair are resolved up front in
+        one concurrent pass. Each order is then signed in the signing thread
+        pool and posted as soon as it is signed, so later orders are signed
+        while earlier ones are in flight. Submissions respect the shared rate
+        limiter. A failing order does not abort the rest of the batch.
+
+        Args:
+            orders: Order dicts with market_id, outcome, side, size, price
+                and optional order_type
+            submit_concurrency: Max orders posted to the exchange at once
+
+        Returns:
+            One BatchOrderResult per input order, in input order
+
+        Raises:
+            OrderException: If no API credentials are configured
+        """
+        if not self.client:
+            raise OrderException("Cannot place orders - no API credentials provided")
+        if not orders:
+            return []
+
+        results: List[Optional[BatchOrderResult]] = [None] * len(orders)
+        valid: List[int] = []
+
+        # Validate inputs BEFORE any API calls
+        for idx, spec in enumerate(orders):
+            try:
+                validate_side(spec.get("side", ""))
+                validate_positive(spec.get("size", 0), "size")
+                validate_price(spec.get("price", -1), "price")
+                if not spec.get("market_id"):
+                    raise ValidationException("market_id cannot be empty")
+                if not spec.get("outcome"):
+                    raise ValidationException("outcome cannot be empty")
+                valid.append(idx)
+            except ValidationException as e:
+                results[idx] = BatchOrderResult(index=idx, error=f"Invalid order parameters: {e}")
+
+        # Resolve token IDs in bulk (one market fetch per uncached market)
+        async def resolve(market_id: str, outcome: str) -> Any:
+            try:
+                return await self._resolve_token_id(market_id, outcome)
+            except Exception as e:
+                return e
+
+        pairs = list(dict.fromkeys((orders[i]["market_id"], orders[i]["outcome"]) for i in valid))
+        token_ids = dict(
+            zip(pairs, await gather_with_concurrency(10, *(resolve(m, o) for m, o in pairs)))
+        )
+
+        submit_semaphore = asyncio.Semaphore(submit_concurrency)
+
+        async def place(idx: int) -> BatchOrderResult:
+            spec = orders[idx]
+            market_id, outcome = spec["market_id"], spec["outcome"]
+            try:
+                token_id = token_ids[(market_id, outcome)]
+                if isinstance(token_id, Exception):
+                    raise token_id
+
+                order_args = OrderArgs(
+                    price=spec["price"],
+                    size=spec["size"],
+                    side=spec["side"],
+                    token_id=token_id,
+                )
+                clob_order_type = self._clob_order_type(spec)
+                if self._native_clob:
+                    signed = await self._native_clob.sign_order(order_args)
+                else:
+                    signed = await run_signing(self.client.create_order, order_args)
+
+                async with submit_semaphore:
+                    await get_request_scheduler("clob_write").acquire(RequestPriority.NORMAL)
+                    if self._native_clob:
+                        resp = await self._native_clob.post_order(signed, clob_order_type)
+                    else:
+                        resp = await run_sync(self.client.post_order, signed, clob_order_type)
+
+                if not resp:
+                    raise OrderException("Empty response from order API")
+                if resp.get("success") is False:
+                    raise OrderException(resp.get("errorMsg") or "Order rejected")
+
+                cached_market = self._market_cache.get(market_id)
+                order = Order(
+                    order_id=resp.get("orderID"),
+                    market_id=market_id,
+                    market_question=cached_market.question if cached_market else None,
+                    outcome=outcome,
+                    side=spec["side"],
+                    size=spec["size"],
+                    price=spec["price"],
+                    status="submitted",
+                    timestamp=datetime.now(),
+                )
+                return BatchOrderResult(index=idx, order=order)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(
+                    f"Batch order {idx} ({spec['side']} {outcome} on {market_id}) failed: {e}"
+                )
+                return BatchOrderResult(index=idx, error=str(e))
+
+        logger.info(f"Placing batch of {len(valid)} order(s) ({len(orders) - len(valid)} invalid)")
+        for result in await asyncio.gather(*(place(idx) for idx in valid)):
+            results[result.index] = result
+
+        placed = sum(1 for r in results if r.success)
+        if placed and self.portfolio_state is not None:
+            self.portfolio_state.mark_stale()
+        logger.info(f"Batch placed {placed}/{len(orders)} order(s)")
+        return results  # type: ignore[return-value]
+
+    @staticmethod
+    def _clob_order_type(spec: Dict[str, Any]) -> Any:
+        """Map our order_type names onto the CLOB's time-in-force values."""
+        order_type = str(spec.get("order_type", "LIMIT")).upper()
+        if order_type in ("MARKET", "FOK"):
+            return OrderType.FOK
+        if order_type == "IOC":
+            return OrderType.FAK
+        return OrderType.GTC
+
     async def cancel_order(self, order_id: str) -> bool:
         """
         Cancel an open order.
@@ -915,29 +1580,51 @@ class PolymarketClient:
             order_id: Order ID to cancel
 
         Returns:
-            True if successful
+            True if the exchange confirmed the cancellation
+        """
+        return await self._cancel_one(order_id) is None
+
+    async def _cancel_one(self, order_id: str) -> Optional[str]:
+        """
+        Cancel one order.
+
+        Returns:
+            None if the exchange listed the order as canceled, otherwise the reason
         """
         if not self.client:
             logger.error("Cannot cancel order - no API credentials provided")
-            return False
+            return "no API credentials"
 
         try:
             logger.info(f"Cancelling order {order_id}")
+            await get_request_scheduler("clob_write").acquire(RequestPriority.CRITICAL)
+            if self._native_clob:
+                resp = await self._native_clob.cancel(order_id)
             # Use async wrapper for sync method
-            if self._async_clob:
+            elif self._async_clob:
                 resp = await self._async_clob.cancel(order_id)
             else:
                 resp = await run_sync(self.client.cancel, order_id)
-            return True
+        except (APIException, PolyApiException) as e:
+            logger.error(f"API error cancelling order {order_id}: {e}")
+            return str(e)
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error cancelling order {order_id}: {e}")
-            return False
+            return str(e)
         except httpx.RequestError as e:
             logger.error(f"Network error cancelling order {order_id}: {e}")
-            return False
+            return str(e)
         except (ValueError, AttributeError) as e:
             logger.error(f"Client error cancelling order {order_id}: {e}")
-            return False
+            return str(e)
+
+        if not isinstance(resp, dict):
+            return None  # No cancel report to check
+        # {canceled: [...], not_canceled: {order_id: reason}}
+        reason = self._cancel_outcomes(resp).get(order_id, "missing from cancel response")
+        if reason is not None:
+            logger.warning(f"Order {order_id} not cancelled: {reason}")
+        return reason
 
     async def cancel_all_orders(self, market_id: Optional[str] = None) -> int:
         """
@@ -953,23 +1640,117 @@ class PolymarketClient:
             logger.error("Cannot cancel orders - no API credentials provided")
             return 0
 
-        try:
-            orders = await self.get_open_orders(market_id)
-            cancelled = 0
-            for order in orders:
-                order_id = order.get("order_id") or order.get("id")
-                if order_id:
-                    success = await self.cancel_order(order_id)
-                    if success:
-                        cancelled += 1
-            logger.info(f"Cancelled {cancelled} orders")
-            return cancelled
-        except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error cancelling orders: {e}")
-            return 0
-        except httpx.RequestError as e:
-            logger.error(f"Network error cancelling orders: {e}")
-            return 0
+        result = await self.cancel_orders_bulk(market_id=market_id)
+        return len(result.cancelled)
+
+    async def cancel_orders_bulk(
+        self,
+        market_id: Optional[str] = None,
+        order_ids: Optional[List[str]] = None,
+        concurrency: int = 10,
+    ) -> BulkCancelResult:
+        """
+        Cancel many orders as fast as the exchange allows.
+
+        Uses one server-side request when possible: cancel-all (no filter),
+        cancel-market-orders (market_id) or the batch cancel (order_ids).
+        If that endpoint fails or is unavailable, the orders are cancelled
+        individually, `concurrency` at a time. Every request runs in the
+        CRITICAL priority lane, ahead of queued reads and new orders.
+
+        Args:
+            market_id: Only cancel orders in this market
+            order_ids: Cancel exactly these orders (overrides market_id)
+            concurrency: Max individual cancels in flight on the fallback path
+
+        Returns:
+            Per-order outcomes, the method used and wall-clock time to flat
+        """
+        result = BulkCancelResult()
+        if not self.client:
+            logger.error("Cannot cancel orders - no API credentials provided")
+            return result
+        if order_ids is not None and not order_ids:
+            return result
+
+        start = time.monotonic()
+        with request_priority(RequestPriority.CRITICAL):
+            try:
+                result.method, resp = await self._cancel_server_side(market_id, order_ids)
+                result.outcomes = self._cancel_outcomes(resp)
+            except (
+                APIException,
+                PolyApiException,
+                httpx.HTTPError,
+                AttributeError,
+                ValueError,
+            ) as e:
+                logger.warning(f"Bulk cancel endpoint failed ({e}) - cancelling individually")
+                result.method = "concurrent"
+                result.outcomes = await self._cancel_concurrently(
+                    market_id, order_ids, concurrency
+                )
+
+        result.seconds = time.monotonic() - start
+        record_latency("bulk_cancel", result.seconds)
+        logger.info(
+            f"Cancelled {len(result.cancelled)}/{len(result.outcomes)} orders via "
+            f"{result.method} in {result.seconds * 1000:.0f}ms"
+        )
+        for order_id, error in result.failed.items():
+            logger.warning(f"Order {order_id} not cancelled: {error}")
+        return result
+
+    async def _cancel_server_side(
+        self, market_id: Optional[str], order_ids: Optional[List[str]]
+    ) -> Tuple[str, Any]:
+        """Send the single bulk-cancel request that covers the selection."""
+        await get_request_scheduler("clob_write").acquire(RequestPriority.CRITICAL)
+        clob: Any = self._native_clob
+        if order_ids is not None:
+            if clob is None:
+                return "cancel_batch", await run_sync(self.client.cancel_orders, order_ids)
+            return "cancel_batch", await clob.cancel_orders(order_ids)
+        if market_id:
+            if clob is None:
+                resp = await run_sync(self.client.cancel_market_orders, market=market_id)
+                return "cancel_market", resp
+            return "cancel_market", await clob.cancel_market_orders(market=market_id)
+        if clob is None:
+            return "cancel_all", await run_sync(self.client.cancel_all)
+        return "cancel_all", await clob.cancel_all()
+
+    @staticmethod
+    def _cancel_outcomes(resp: Any) -> Dict[str, Optional[str]]:
+        """Map a CLOB cancel response ({canceled: [...], not_canceled: {...}}) to outcomes."""
+        if not isinstance(resp, dict):
+            raise ValueError(f"Unexpected cancel response: {resp!r}")
+        outcomes: Dict[str, Optional[str]] = {
+            order_id: None for order_id in resp.get("canceled") or []
+        }
+        for order_id, reason in (resp.get("not_canceled") or {}).items():
+            outcomes[order_id] = str(reason)
+        return outcomes
+
+    async def _cancel_concurrently(
+        self, market_id: Optional[str], order_ids: Optional[List[str]], concurrency: int
+    ) -> Dict[str, Optional[str]]:
+        """Cancel orders one request each, `concurrency` at a time."""
+        if order_ids is None:
+            order_ids = [
+                order_id
+                for order in await self.get_open_orders(market_id)
+                if (order_id := order.get("id") or order.get("order_id"))
+            ]
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def cancel(order_id: str) -> Optional[str]:
+            async with semaphore:
+                return await self._cancel_one(order_id)
+
+        errors = await asyncio.gather(*(cancel(order_id) for order_id in order_ids))
+        return dict(zip(order_ids, errors))
 
     async def get_open_orders(self, market_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -985,8 +1766,18 @@ class PolymarketClient:
             logger.warning("Cannot fetch orders - no API credentials")
             return []
 
+        if self._native_clob:
+            try:
+                await get_request_scheduler("clob_read").acquire(RequestPriority.NORMAL)
+                orders = await self._native_clob.get_orders(market=market_id)
+                logger.debug(f"Fetched {len(orders)} open orders")
+                return orders
+            except APIException as e:
+                logger.error(f"Error fetching open orders: {e}")
+                return []
+
         try:
-            await get_rate_limiter().acquire()
+            await get_request_scheduler("clob_read").acquire(RequestPriority.NORMAL)
 
             params: Dict[str, Any] = {}
             if market_id:
@@ -1028,12 +1819,24 @@ class PolymarketClient:
             logger.warning("Cannot fetch order - no API credentials")
             return None
 
+        if self._native_clob:
+            try:
+                await get_request_scheduler("clob_read").acquire(RequestPriority.NORMAL)
+                native_clob = self._native_clob
+                return await self._hedged("order", lambda: native_clob.get_order(order_id)) or None
+            except APIException as e:
+                logger.error(f"Error fetching order {order_id}: {e}")
+                return None
+
         try:
-            await get_rate_limiter().acquire()
+            await get_request_scheduler("clob_read").acquire(RequestPriority.NORMAL)
 
-            response = await self.http_client.get(
-                f"/orders/{order_id}",
-                headers=self._get_auth_headers(),
+            response = await self._hedged(
+                "order",
+                lambda: self.http_client.get(
+                    f"/orders/{order_id}",
+                    headers=self._get_auth_headers(),
+                ),
             )
             response.raise_for_status()
             return response.json()
@@ -1056,6 +1859,7 @@ class PolymarketClient:
         order_id: Optional[str] = None,
         market_id: Optional[str] = None,
         limit: int = 100,
+        since: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
         Get trade fills/executions.
@@ -1064,6 +1868,7 @@ class PolymarketClient:
             order_id: Optional order ID to filter by
             market_id: Optional market to filter by
             limit: Maximum number of fills to return
+            since: Optional unix timestamp; only fills after it are returned
 
         Returns:
             List of fills
@@ -1072,14 +1877,40 @@ class PolymarketClient:
             logger.warning("Cannot fetch fills - no API credentials")
             return []
 
+        if self._native_clob:
+            try:
+                asset_id = None
+                keep = None
+                if order_id:
+                    # The trades endpoint has no order filter: narrow the listing to the
+                    # order's token and lifetime server-side, then match legs locally
+                    await get_request_scheduler("clob_read").acquire(RequestPriority.NORMAL)
+                    order = await self._native_clob.get_order(order_id) or {}
+                    asset_id = order.get("asset_id")
+                    market_id = market_id or order.get("market")
+                    if order.get("created_at"):
+                        since = max(since or 0, int(order["created_at"]))
+                    keep = functools.partial(self._fill_matches_order, order_id=order_id)
+                await get_request_scheduler("clob_read").acquire(RequestPriority.NORMAL)
+                fills = await self._native_clob.get_trades(
+                    market=market_id, asset_id=asset_id, after=since, limit=limit, keep=keep
+                )
+                logger.debug(f"Fetched {len(fills)} fills")
+                return fills
+            except APIException as e:
+                logger.error(f"Error fetching fills: {e}")
+                return []
+
         try:
-            await get_rate_limiter().acquire()
+            await get_request_scheduler("clob_read").acquire(RequestPriority.NORMAL)
 
             params: Dict[str, Any] = {"limit": limit}
             if order_id:
                 params["order_id"] = order_id
             if market_id:
                 params["market"] = market_id
+            if since is not None:
+                params["after"] = since
 
             response = await self.http_client.get(
                 "/fills",
@@ -1103,22 +1934,55 @@ class PolymarketClient:
             logger.error(f"Invalid JSON in fills response: {e}")
             return []
 
+    @staticmethod
+    def _fill_matches_order(fill: Dict[str, Any], order_id: str) -> bool:
+        """True if a CLOB trade involved the given order (as taker or maker)."""
+        if order_id in (fill.get("order_id"), fill.get("taker_order_id")):
+            return True
+        return any(m.get("order_id") == order_id for m in fill.get("maker_orders") or [])
+
     async def get_positions(self) -> List[Position]:
+        """
+        Get current positions.
+
+        Served from the attached PortfolioState when there is one,
+        otherwise fetched from the exchange.
+
+        Returns:
+            List of Position objects
+        """
+        if self.portfolio_state is not None:
+            return await self.portfolio_state.get_positions()
+        return await self.fetch_positions()
+
+    async def fetch_positions(self, strict: bool = False) -> List[Position]:
         """
         Get current positions from the CLOB API.
 
+        Args:
+            strict: Raise APIException when the exchange cannot be read,
+                instead of returning the cached (possibly stale) positions
+
         Returns:
             List of Position objects
         """
+
+        def fallback(reason: str) -> List[Position]:
+            if strict:
+                raise APIException(f"Could not fetch positions: {reason}")
+            return list(self._positions_cache.values())
+
         if not self.client:
             logger.warning("Cannot fetch positions - no API credentials")
+            if strict:
+                raise APIException("Could not fetch positions: no API credentials")
             return []
 
         try:
             import asyncio
 
             # Rate limit
-            await get_rate_limiter().acquire()
+            await get_request_scheduler("clob_read").acquire(RequestPriority.NORMAL)
 
             # Fetch positions using the REST API with timeout
             # The CLOB API provides /positions endpoint for authenticated users
@@ -1131,15 +1995,15 @@ class PolymarketClient:
                 )
             except asyncio.TimeoutError:
                 logger.warning("Positions fetch timed out - using cached data")
-                return list(self._positions_cache.values())
+                return fallback("timed out")
 
             if response.status_code == 401:
                 logger.warning("Unauthorized to fetch positions - check API credentials")
-                return list(self._positions_cache.values())
+                return fallback("unauthorized")
 
             if response.status_code == 404:
                 # No positions - return empty or cached
-                return list(self._positions_cache.values())
+                return fallback("not found")
 
             response.raise_for_status()
             positions_data = response.json()
@@ -1191,30 +2055,48 @@ class PolymarketClient:
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
                 # No positions endpoint or no positions - return cached
-                return list(self._positions_cache.values())
+                return fallback("not found")
             logger.error(f"HTTP error fetching positions: {e}")
-            return list(self._positions_cache.values())
+            return fallback(str(e))
         except httpx.RequestError as e:
             logger.error(f"Network error fetching positions: {e}")
-            return list(self._positions_cache.values())
+            return fallback(str(e))
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON in positions response: {e}")
-            return list(self._positions_cache.values())
+            return fallback(str(e))
         except (ValueError, TypeError) as e:
             logger.error(f"Data parsing error in positions: {e}")
-            return list(self._positions_cache.values())
+            return fallback(str(e))
 
     async def get_balance(self) -> float:
         """
         Get account balance in USDC.
 
+        Served from the attached PortfolioState when there is one,
+        otherwise fetched from the exchange.
+
+        Returns:
+            Balance in USDC
+        """
+        if self.portfolio_state is not None:
+            return await self.portfolio_state.get_balance()
+        return await self.fetch_balance()
+
+    async def fetch_balance(self, strict: bool = False) -> float:
+        """
+        Get account balance in USDC from the exchange or chain.
+
+        Args:
+            strict: Raise APIException when no source can be read, instead
+                of returning 0.0
+
         Returns:
             Balance in USDC
         """
         # Method 0: If we have py-clob-client, use it
         if self.client:
             try:
-                await get_rate_limiter().acquire()
+                await get_request_scheduler("clob_read").acquire(RequestPriority.NORMAL)
                 if hasattr(self.client, "get_balance"):
                     import asyncio
 
@@ -1248,7 +2130,7 @@ class PolymarketClient:
                 data = f"0x70a08231{padded_address}"
 
                 # Query Polygon RPC
-                rpc_url = "https://polygon-rpc.com"
+                rpc_url = POLYGON_RPC_URL
                 payload = {
                     "jsonrpc": "2.0",
                     "method": "eth_call",
@@ -1256,18 +2138,17 @@ class PolymarketClient:
                     "id": 1,
                 }
 
-                async with httpx.AsyncClient(timeout=10.0) as rpc_client:
-                    response = await rpc_client.post(rpc_url, json=payload)
-                    if response.status_code == 200:
-                        result = response.json()
-                        if "result" in result and result["result"] != "0x":
-                            # USDC has 6 decimals
-                            balance_wei = int(result["result"], 16)
-                            balance_usdc = balance_wei / 1_000_000
-                            logger.info(
-                                f"💰 Fetched USDC balance from Polygon: ${balance_usdc:.2f}"
-                            )
-                            return balance_usdc
+                response = await self.rpc_client.post(rpc_url, json=payload)
+                if response.status_code == 200:
+                    result = response.json()
+                    if "result" in result and result["result"] != "0x":
+                        # USDC has 6 decimals
+                        balance_wei = int(result["result"], 16)
+                        balance_usdc = balance_wei / 1_000_000
+                        logger.info(
+                            f"💰 Fetched USDC balance from Polygon: ${balance_usdc:.2f}"
+                        )
+                        return balance_usdc
             except httpx.RequestError as e:
                 logger.debug(f"Blockchain balance query network error: {e}")
             except httpx.HTTPStatusError as e:
@@ -1280,7 +2161,7 @@ class PolymarketClient:
             try:
                 import asyncio
 
-                await get_rate_limiter().acquire()
+                await get_request_scheduler("clob_read").acquire(RequestPriority.NORMAL)
                 response = await asyncio.wait_for(
                     self.http_client.get(
                         "/balances", headers=self._get_auth_headers(), timeout=5.0
@@ -1311,12 +2192,27 @@ class PolymarketClient:
             logger.warning("Cannot fetch balance - no private key configured")
         else:
             logger.warning("Could not fetch balance from any source")
+        if strict:
+            raise APIException("Could not fetch balance from any source")
         return 0.0
 
+    async def warm_up(self) -> Dict[str, Optional[float]]:
+        """
+        Pre-connect to the CLOB and Gamma hosts so the first trade skips TCP/TLS setup.
+
+        Returns:
+            Mapping of origin -> seconds taken, or None if unreachable
+        """
+        urls = [str(self.http_client.base_url), str(self.gamma_client.base_url)]
+        if self._private_key:
+            urls.append(POLYGON_RPC_URL)
+        return await self._pool.warm_up(urls, connections_per_host=2)
+
     async def close(self) -> None:
-        """Close HTTP clients."""
+        """Close HTTP clients (pooled connections stay available to other clients)."""
         await self.http_client.aclose()
         await self.gamma_client.aclose()
+        await self.rpc_client.aclose()
 
     async def __aenter__(self) -> "PolymarketClient":
         """Async context manager entry."""
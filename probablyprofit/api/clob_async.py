@@ -0,0 +1,368 @@
+"""
+Native Async CLOB Client
+
+httpx-based implementation of the Polymarket CLOB endpoints the bot uses
+(order create, cancel, open orders, order status and trade fills).
+
+The sync py-clob-client performs every request on the calling thread, so
+wrapping it with run_sync ties each in-flight call to an executor thread.
+This client issues the same authenticated requests directly on the event
+loop over PolymarketClient's shared connection pool. Order signing stays
+in-process using the py-clob-client order builder; only the CPU-bound
+EIP-712 signature runs on the signing pool.
+"""
+
+import asyncio
+import json
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+
+from probablyprofit.api.async_wrapper import run_signing
+from probablyprofit.api.exceptions import (
+    APIException,
+    AuthenticationException,
+    NetworkException,
+    OrderException,
+    RateLimitException,
+)
+from probablyprofit.utils.cache import SingleFlight
+
+try:
+    from py_clob_client.clob_types import CreateOrderOptions, OrderType, RequestArgs
+    from py_clob_client.headers.headers import create_level_2_headers
+    from py_clob_client.utilities import order_to_json, price_valid
+
+    clob_avail = True
+except ImportError:
+    clob_avail = False
+
+# CLOB REST paths (mirrors py_clob_client.endpoints)
+POST_ORDER = "/order"
+CANCEL = "/order"
+CANCEL_ORDERS = "/orders"
+CANCEL_ALL = "/cancel-all"
+CANCEL_MARKET_ORDERS = "/cancel-market-orders"
+ORDERS = "/data/orders"
+GET_ORDER = "/data/order/"
+TRADES = "/data/trades"
+TICK_SIZE = "/tick-size"
+NEG_RISK = "/neg-risk"
+FEE_RATE = "/fee-rate"
+
+# Pagination cursors
+START_CURSOR = "MA=="
+END_CURSOR = "LTE="
+
+
+class AsyncClobClient:
+    """
+    Async CLOB REST client with L2 (HMAC) authentication.
+
+    Usage:
+        clob = AsyncClobClient.from_sync(sync_clob_client, http_client)
+
+        signed = await clob.sign_order(OrderArgs(token_id=..., price=0.5, size=10, side="BUY"))
+        resp = await clob.post_order(signed)
+        await clob.cancel(resp["orderID"])
+    """
+
+    def __init__(
+        self,
+        http_client: httpx.AsyncClient,
+        signer: Any,
+        creds: Any,
+        builder: Any,
+    ):
+        """
+        Initialize client.
+
+        Args:
+            http_client: Shared AsyncClient whose base_url is the CLOB host
+            signer: py-clob-client Signer (wallet key)
+            creds: L2 API credentials (ApiCreds)
+            builder: py-clob-client OrderBuilder used for signing
+        """
+        if not clob_avail:
+            raise ImportError("py-clob-client required. Install with: pip install py-clob-client")
+
+        self.http_client = http_client
+        self.signer = signer
+        self.creds = creds
+        self.builder = builder
+
+        # Per-token market parameters needed to build orders
+        self._tick_sizes: Dict[str, str] = {}
+        self._neg_risk: Dict[str, bool] = {}
+        self._fee_rates: Dict[str, int] = {}
+        self._params_flight = SingleFlight("clob_params")
+
+    @classmethod
+    def from_sync(
+        cls, clob_client: Any, http_client: httpx.AsyncClient
+    ) -> Optional["AsyncClobClient"]:
+        """
+        Build from an initialized sync ClobClient, reusing its signer and credentials.
+
+        Returns:
+            AsyncClobClient, or None if the sync client has no L2 credentials
+        """
+        if not clob_avail or clob_client is None:
+            return None
+        signer = getattr(clob_client, "signer", None)
+        creds = getattr(clob_client, "creds", None)
+        builder = getattr(clob_client, "builder", None)
+        if signer is None or creds is None or builder is None:
+            return None
+        return cls(http_client, signer, creds, builder)
+
+    # =========================================================================
+    # Transport
+    # =========================================================================
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        body: Any = None,
+        params: Optional[Dict[str, Any]] = None,
+        auth: bool = True,
+    ) -> Any:
+        """
+        Send a CLOB request and return the decoded JSON body.
+
+        The body is serialized once so the HMAC signature covers exactly the
+        bytes that are sent.
+
+        Raises:
+            RateLimitException: HTTP 429
+            AuthenticationException: HTTP 401/403
+            APIException: Other HTTP errors or invalid JSON
+            NetworkException: Transport errors
+        """
+        serialized = (
+            json.dumps(body, separators=(",", ":"), ensure_ascii=False)
+            if body is not None
+            else None
+        )
+        headers = {}
+        if auth:
+            # Signing the serialized string as the body works on every py-clob-client
+            # release (RequestArgs.serialized_body only exists in newer ones)
+            request_args = RequestArgs(method=method, request_path=path, body=serialized)
+            headers = create_level_2_headers(self.signer, self.creds, request_args)
+        if serialized is not None:
+            headers["Content-Type"] = "application/json"
+
+        try:
+            response = await self.http_client.request(
+                method, path, content=serialized, headers=headers, params=params
+            )
+        except httpx.RequestError as e:
+            raise NetworkException(f"CLOB {method} {path} failed: {e}") from e
+
+        if response.status_code == 429:
+            retry_after = response.headers.get("Retry-After")
+            raise RateLimitException(
+                f"CLOB rate limit exceeded on {path}"
+                + (f" (retry after {retry_after}s)" if retry_after else "")
+            )
+        if response.status_code in (401, 403):
+            raise AuthenticationException(f"CLOB rejected credentials for {method} {path}")
+        if response.status_code >= 400:
+            raise APIException(
+                f"CLOB {method} {path} returned HTTP {response.status_code}: {response.text[:200]}"
+            )
+
+        try:
+            return response.json()
+        except json.JSONDecodeError as e:
+            raise APIException(f"Invalid JSON from CLOB {path}: {e}") from e
+
+    async def _paginate(
+        self,
+        path: str,
+        params: Dict[str, Any],
+        limit: Optional[int] = None,
+        keep: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Follow next_cursor through a paginated listing.
+
+        Args:
+            path: Listing endpoint
+            params: Query filters
+            limit: Stop requesting pages once this many rows are collected
+            keep: Only collect rows for which this returns True
+        """
+        results: List[Dict[str, Any]] = []
+        cursor = START_CURSOR
+        while cursor != END_CURSOR:
+            page = await self._request("GET", path, params={**params, "next_cursor": cursor})
+            rows = page.get("data", [])
+            results.extend(rows if keep is None else filter(keep, rows))
+            if limit is not None and len(results) >= limit:
+                return results[:limit]
+            cursor = page.get("next_cursor") or END_CURSOR
+        return results
+
+    # =========================================================================
+    # Order construction
+    # =========================================================================
+
+    async def _get_param(self, path: str, token_id: str) -> Dict[str, Any]:
+        """Fetch a public per-token parameter, coalescing concurrent lookups."""
+        return await self._params_flight.do(
+            (path, token_id),
+            lambda: self._request("GET", path, params={"token_id": token_id}, auth=False),
+        )
+
+    async def get_tick_size(self, token_id: str) -> str:
+        """Minimum tick size for a token (cached)."""
+        if token_id not in self._tick_sizes:
+            data = await self._get_param(TICK_SIZE, token_id)
+            self._tick_sizes[token_id] = str(data["minimum_tick_size"])
+        return self._tick_sizes[token_id]
+
+    async def get_neg_risk(self, token_id: str) -> bool:
+        """Whether a token trades on the neg-risk exchange (cached)."""
+        if token_id not in self._neg_risk:
+            data = await self._get_param(NEG_RISK, token_id)
+            self._neg_risk[token_id] = bool(data["neg_risk"])
+        return self._neg_risk[token_id]
+
+    async def get_fee_rate_bps(self, token_id: str) -> int:
+        """Base fee rate for a token in basis points (cached)."""
+        if token_id not in self._fee_rates:
+            data = await self._get_param(FEE_RATE, token_id)
+            self._fee_rates[token_id] = int(data.get("base_fee") or 0)
+        return self._fee_rates[token_id]
+
+    async def sign_order(self, order_args: Any) -> Any:
+        """
+        Build and sign an order.
+
+        Tick size, neg-risk flag and fee rate are fetched concurrently (and
+        cached per token); the EIP-712 signature itself runs on the signing pool.
+
+        Returns:
+            SignedOrder ready for post_order()
+        """
+        token_id = order_args.token_id
+        tick_size, neg_risk, fee_rate_bps = await asyncio.gather(
+            self.get_tick_size(token_id),
+            self.get_neg_risk(token_id),
+            self.get_fee_rate_bps(token_id),
+        )
+
+        if not price_valid(order_args.price, tick_size):
+            raise OrderException(
+                f"price ({order_args.price}), min: {tick_size} - max: {1 - float(tick_size)}"
+            )
+        if order_args.fee_rate_bps and fee_rate_bps and order_args.fee_rate_bps != fee_rate_bps:
+            raise OrderException(
+                f"invalid fee rate ({order_args.fee_rate_bps}), market requires {fee_rate_bps}"
+            )
+        order_args.fee_rate_bps = fee_rate_bps
+
+        return await run_signing(
+            self.builder.create_order,
+            order_args,
+            CreateOrderOptions(tick_size=tick_size, neg_risk=neg_risk),
+        )
+
+    # =========================================================================
+    # Endpoints
+    # =========================================================================
+
+    async def post_order(
+        self, signed_order: Any, order_type: Any = None, post_only: bool = False
+    ) -> Dict[str, Any]:
+        """Submit a signed order."""
+        order_type = order_type or OrderType.GTC
+        body = order_to_json(signed_order, self.creds.api_key, order_type, post_only)
+        return await self._request("POST", POST_ORDER, body=body)
+
+    async def create_and_post_order(
+        self, order_args: Any, order_type: Any = None
+    ) -> Dict[str, Any]:
+        """Sign and submit an order."""
+        signed = await self.sign_order(order_args)
+        return await self.post_order(signed, order_type)
+
+    async def cancel(self, order_id: str) -> Dict[str, Any]:
+        """Cancel a single order."""
+        return await self._request("DELETE", CANCEL, body={"orderID": order_id})
+
+    async def cancel_orders(self, order_ids: List[str]) -> Dict[str, Any]:
+        """Cancel several orders in one request."""
+        return await self._request("DELETE", CANCEL_ORDERS, body=list(order_ids))
+
+    async def cancel_all(self) -> Dict[str, Any]:
+        """Cancel every open order of the account in one request."""
+        return await self._request("DELETE", CANCEL_ALL)
+
+    async def cancel_market_orders(
+        self, market: Optional[str] = None, asset_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Cancel every open order in a market (or for one token) in one request."""
+        return await self._request(
+            "DELETE",
+            CANCEL_MARKET_ORDERS,
+            body={"market": market or "", "asset_id": asset_id or ""},
+        )
+
+    async def get_orders(
+        self, market: Optional[str] = None, asset_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """List open orders, optionally filtered by market or token."""
+        params: Dict[str, Any] = {}
+        if market:
+            params["market"] = market
+        if asset_id:
+            params["asset_id"] = asset_id
+        return await self._paginate(ORDERS, params)
+
+    async def get_order(self, order_id: str) -> Dict[str, Any]:
+        """Fetch a single order's status."""
+        return await self._request("GET", f"{GET_ORDER}{order_id}")
+
+    async def get_trades(
+        self,
+        market: Optional[str] = None,
+        asset_id: Optional[str] = None,
+        trade_id: Optional[str] = None,
+        after: Optional[int] = None,
+        limit: Optional[int] = None,
+        keep: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        List the account's trades (fills).
+
+        Args:
+            market: Optional market condition ID
+            asset_id: Optional token ID
+            trade_id: Optional trade ID
+            after: Optional unix timestamp; only trades after it are returned
+            limit: Stop paging once this many trades are collected
+            keep: Client-side filter for criteria the endpoint does not support
+        """
+        params: Dict[str, Any] = {}
+        if market:
+            params["market"] = market
+        if asset_id:
+            params["asset_id"] = asset_id
+        if trade_id:
+            params["id"] = trade_id
+        if after is not None:
+            params["after"] = after
+        return await self._paginate(TRADES, params, limit=limit, keep=keep)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Get client statistics."""
+        return {
+            "cached_tick_sizes": len(self._tick_sizes),
+            "cached_neg_risk": len(self._neg_risk),
+            "cached_fee_rates": len(self._fee_rates),
+        }
@@ -0,0 +1,179 @@
+"""
+Incremental Market Delta Feed
+
+Keeps the last known state of every market between observe() cycles and
+reports only what changed (added, removed and repriced markets), so
+downstream code can skip the markets that have not moved.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set
+
+from loguru import logger
+
+from probablyprofit.api.client import Market
+from probablyprofit.config import get_config
+
+
+@dataclass
+class MarketDelta:
+    """What changed in the market universe since the previous snapshot."""
+
+    added: List[Market] = field(default_factory=list)
+    removed: List[Market] = field(default_factory=list)  # Last known state
+    repriced: List[Market] = field(default_factory=list)
+    price_moves: Dict[str, float] = field(default_factory=dict)  # condition_id -> signed move
+    unchanged: int = 0
+    timestamp: datetime = field(default_factory=datetime.now)
+
+    @property
+    def has_changes(self) -> bool:
+        """True if anything was added, removed or repriced."""
+        return bool(self.added or self.removed or self.repriced)
+
+    @property
+    def changed_ids(self) -> Set[str]:
+        """Condition IDs of every market that changed."""
+        return {m.condition_id for m in self.added + self.removed + self.repriced}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Compact summary suitable for observation metadata and persistence."""
+        return {
+            "added": [m.condition_id for m in self.added],
+            "removed": [m.condition_id for m in self.removed],
+            "repriced": {cid: round(move, 4) for cid, move in self.price_moves.items()},
+            "unchanged": self.unchanged,
+            "timestamp": self.timestamp.isoformat(),
+        }
+
+
+class MarketDeltaTracker:
+    """
+    Tracks market state per condition_id and computes deltas between snapshots.
+
+    A market counts as repriced when any outcome price moved by at least
+    ``price_threshold`` (absolute, in 0-1 price units) since the last time
+    it was reported. Smaller moves accumulate against the last reported
+    price, so slow drifts are still surfaced once they cross the threshold.
+
+    Usage:
+        tracker = MarketDeltaTracker(client, price_threshold=0.01)
+
+        delta = await tracker.refresh(limit=50)
+        for market in delta.added + delta.repriced:
+            ...
+    """
+
+    def __init__(
+        self,
+        client: Any = None,
+        price_threshold: Optional[float] = None,
+    ):
+        """
+        Initialize tracker.
+
+        Args:
+            client: Optional PolymarketClient used by refresh()
+            price_threshold: Minimum absolute price move to report (defaults to config)
+        """
+        self.client = client
+        self.price_threshold = (
+            price_threshold
+            if price_threshold is not None
+            else get_config().agent.market_delta_threshold
+        )
+
+        # Last reported state per condition_id
+        self._known: Dict[str, Market] = {}
+        self._updates = 0
+
+    def update(self, markets: List[Market]) -> MarketDelta:
+        """
+        Diff a fresh snapshot against the last known state.
+
+        Args:
+            markets: Current market snapshot
+
+        Returns:
+            MarketDelta describing the changes
+        """
+        delta = MarketDelta()
+        current: Dict[str, Market] = {}
+
+        for market in markets:
+            cid = market.condition_id
+            current[cid] = market
+            previous = self._known.get(cid)
+
+            if previous is None:
+                delta.added.append(market)
+                self._known[cid] = market
+                continue
+
+            move = self._largest_move(previous.outcome_prices, market.outcome_prices)
+            if move is None or abs(move) >= self.price_threshold:
+                delta.repriced.append(market)
+                delta.price_moves[cid] = move if move is not None else 0.0
+                self._known[cid] = market
+            else:
+                delta.unchanged += 1
+
+        for cid in list(self._known):
+            if cid not in current:
+                delta.removed.append(self._known.pop(cid))
+
+        self._updates += 1
+        if delta.has_changes:
+            logger.debug(
+                f"[MarketDelta] +{len(delta.added)} -{len(delta.removed)} "
+                f"~{len(delta.repriced)} ({delta.unchanged} unchanged)"
+            )
+
+        return delta
+
+    async def refresh(self, limit: int = 50) -> MarketDelta:
+        """
+        Fetch the current markets from the client and diff them.
+
+        Args:
+            limit: Number of markets to request
+
+        Returns:
+            MarketDelta describing the changes
+        """
+        if not self.client:
+            raise ValueError("MarketDeltaTracker.refresh() requires a client")
+
+        markets = await self.client.get_markets(active=True, limit=limit)
+        return self.update(markets)
+
+    def reset(self) -> None:
+        """Forget all known state; the next update reports every market as added."""
+        self._known.clear()
+
+    @staticmethod
+    def _largest_move(old: List[float], new: List[float]) -> Optional[float]:
+        """Signed largest per-outcome price move, or None if outcomes changed shape."""
+        if len(old) != len(new):
+            return None
+        largest = 0.0
+        for before, after in zip(old, new):
+            move = after - before
+            if abs(move) > abs(largest):
+                largest = move
+        return largest
+
+    @property
+    def markets(self) -> Dict[str, Market]:
+        """Last reported state per condition_id."""
+        return dict(self._known)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Get tracker statistics."""
+        return {
+            "tracked_markets": len(self._known),
+            "updates": self._updates,
+            "price_threshold": self.price_threshold,
+        }
@@ -0,0 +1,300 @@
+"""
+Order Event Bus
+
+Decouples OrderManager from the listeners of its fill, status-change,
+completion and partial-fill-timeout events. Each subscriber gets a FIFO
+queue drained by its own task, so a slow alert or database callback lags
+only itself: publishing never awaits a subscriber (except under the opt-in
+"block" policy for status events), and order-state mutation continues at
+full speed.
+
+Ordering: a subscriber sees its events in publish order, so all events for
+one order_id arrive in the order they happened. The overflow policy applies
+to status events only, and only ever removes events, never reorders them:
+
+- drop_oldest: evict the oldest queued event (default; keeps the freshest)
+- drop_newest: discard the incoming event
+- block: make the publisher wait for space (for consumers that must see
+  every event and can accept back-pressure)
+
+Fill, complete and partial_fill_timeout events are never dropped or
+blocked on: their queues are unbounded, and a subscriber whose backlog
+passes max_queue logs a warning and counts a backlog alarm. Passing an
+overflow policy for these kinds is rejected.
+
+Events carry a snapshot of the ManagedOrder taken when they were published,
+so a delayed subscriber sees the order as it was at the time of the event.
+
+Subscribers registered inline=True run synchronously inside publish(), as
+before the bus existed; use it only for cheap state updates that must be
+visible as soon as the triggering call returns (e.g. PortfolioState).
+
+Queue wait and handler time per subscriber, dropped events by policy and
+backlog alarms are published to the metrics registry.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from probablyprofit.api.ws_dispatch import callback_name
+from probablyprofit.utils.metrics import (
+    record_order_event_backlog,
+    record_order_event_dropped,
+    record_order_event_handled,
+)
+
+EVENT_KINDS = ("fill", "status", "complete", "partial_fill_timeout")
+OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "block")
+
+# Only these kinds have a bounded queue with an overflow policy; the others
+# are queued without limit
+LOSSY_KINDS = ("status",)
+
+
+class OrderSubscriber:
+    """One callback fed from a FIFO queue, drained by its own task."""
+
+    def __init__(
+        self,
+        kind: str,
+        callback: Callable[..., Any],
+        max_queue: int = 1000,
+        overflow: Optional[str] = None,
+    ):
+        """
+        Initialize subscriber.
+
+        Args:
+            kind: Event kind this subscriber receives
+            callback: Sync or async callable invoked with the event arguments
+            max_queue: Max undelivered status events; for other kinds, the
+                backlog that raises an alarm
+            overflow: drop_oldest (default), drop_newest or block; status
+                events only
+        """
+        if kind in LOSSY_KINDS:
+            overflow = overflow or "drop_oldest"
+            if overflow not in OVERFLOW_POLICIES:
+                raise ValueError(f"Unknown overflow policy: {overflow}")
+        elif overflow is not None:
+            raise ValueError(f"{kind} events are never dropped; overflow applies to status only")
+        self.kind = kind
+        self.callback = callback
+        self.name = f"{kind}:{callback_name(callback)}"
+        self.max_queue = max_queue
+        self.overflow = overflow  # None: unbounded
+
+        # (event arguments, time.monotonic() when published)
+        self._queue: Deque[Tuple[Tuple[Any, ...], float]] = deque()
+        self._ready = asyncio.Event()
+        self._space = asyncio.Event()
+        self._space.set()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._task: Optional["asyncio.Task[None]"] = None
+
+        # Statistics
+        self._delivered = 0
+        self._dropped = 0
+        self._errors = 0
+        self._max_lag = 0.0
+        self._backlogged = False
+        self._backlog_alarms = 0
+
+    async def put(self, args: Tuple[Any, ...]) -> None:
+        """Queue an event, applying the overflow policy when full."""
+        if self.overflow is None:
+            if len(self._queue) >= self.max_queue and not self._backlogged:
+                self._backlogged = True  # Re-armed once the queue drains
+                self._backlog_alarms += 1
+                record_order_event_backlog(self.name)
+                logger.warning(
+                    f"[OrderEvents] Subscriber '{self.name}' is {len(self._queue)} events behind"
+                )
+        else:
+            while len(self._queue) >= self.max_queue:
+                if self.overflow == "block":
+                    self._space.clear()
+                    await self._space.wait()
+                    continue
+                self._dropped += 1
+                record_order_event_dropped(self.name, self.overflow)
+                if self.overflow == "drop_newest":
+                    return
+                self._queue.popleft()
+
+        self._queue.append((args, time.monotonic()))
+        self._ready.set()
+        self._idle.clear()
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await self._ready.wait()
+            while self._queue:
+                args, published = self._queue.popleft()
+                self._space.set()
+                start = time.monotonic()
+                lag = start - published
+                self._max_lag = max(self._max_lag, lag)
+                await self._invoke(args)
+                record_order_event_handled(self.name, lag, time.monotonic() - start)
+            self._backlogged = False
+            self._ready.clear()
+            self._idle.set()
+
+    async def _invoke(self, args: Tuple[Any, ...]) -> None:
+        try:
+            result = self.callback(*args)
+            if asyncio.iscoroutine(result):
+                await result
+            self._delivered += 1
+        except asyncio.CancelledError:
+            raise  # Don't suppress cancellation
+        except Exception as e:
+            self._errors += 1
+            logger.warning(f"[OrderEvents] Callback '{self.name}' failed: {e}")
+
+    async def join(self) -> None:
+        """Wait until every queued event has been delivered."""
+        await self._idle.wait()
+
+    async def close(self) -> None:
+        """Stop the drain task, discarding undelivered events."""
+        self._queue.clear()
+        self._space.set()
+        self._idle.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Get subscriber statistics."""
+        return {
+            "queued": len(self._queue),
+            "delivered": self._delivered,
+            "dropped": self._dropped,
+            "backlog_alarms": self._backlog_alarms,
+            "errors": self._errors,
+            "max_lag_ms": self._max_lag * 1000,
+        }
+
+
+class OrderEventBus:
+    """
+    Fans order events out to per-subscriber queues.
+
+    Usage:
+        bus = OrderEventBus(max_queue=1000)
+        bus.subscribe("fill", send_fill_alert)
+        bus.subscribe("fill", portfolio.on_fill, inline=True)
+        await bus.publish("fill", order, fill)
+        ...
+        await bus.close()
+    """
+
+    def __init__(self, max_queue: int = 1000, overflow: str = "drop_oldest"):
+        """
+        Initialize bus.
+
+        Args:
+            max_queue: Default per-subscriber queue bound
+            overflow: Default overflow policy for status subscribers (drop_oldest,
+                drop_newest, block)
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        self.max_queue = max_queue
+        self.overflow = overflow
+        self._inline: Dict[str, List[Callable[..., Any]]] = {kind: [] for kind in EVENT_KINDS}
+        self._subscribers: Dict[str, List[OrderSubscriber]] = {kind: [] for kind in EVENT_KINDS}
+
+    def subscribe(
+        self,
+        kind: str,
+        callback: Callable[..., Any],
+        inline: bool = False,
+        max_queue: Optional[int] = None,
+        overflow: Optional[str] = None,
+    ) -> Optional[OrderSubscriber]:
+        """
+        Register a callback for one event kind.
+
+        Args:
+            kind: fill (called with order, fill) or status, complete,
+                partial_fill_timeout (called with order)
+            callback: Sync or async callable
+            inline: Run synchronously inside publish() instead of queueing
+            max_queue: Queue bound (status) or backlog alarm threshold (other
+                kinds) for this subscriber (defaults to the bus's)
+            overflow: Overflow policy for a status subscriber (defaults to the
+                bus's); rejected for other kinds
+
+        Returns:
+            The queued subscriber, or None for inline callbacks
+        """
+        if kind not in EVENT_KINDS:
+            raise ValueError(f"Unknown order event kind: {kind}")
+        if inline:
+            self._inline[kind].append(callback)
+            return None
+        subscriber = OrderSubscriber(
+            kind,
+            callback,
+            max_queue=max_queue if max_queue is not None else self.max_queue,
+            overflow=(overflow or self.overflow) if kind in LOSSY_KINDS else overflow,
+        )
+        self._subscribers[kind].append(subscriber)
+        return subscriber
+
+    async def publish(self, kind: str, *args: Any) -> None:
+        """Run inline callbacks, then queue the event for every other subscriber."""
+        for callback in self._inline[kind]:
+            try:
+                result = callback(*args)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                logger.warning(f"[OrderEvents] Inline {kind} callback error: {e}")
+        for subscriber in self._subscribers[kind]:
+            await subscriber.put(args)
+
+    async def drain(self) -> None:
+        """Wait until every subscriber has delivered its queued events."""
+        for subscribers in self._subscribers.values():
+            for subscriber in subscribers:
+                await subscriber.join()
+
+    async def close(self, timeout: float = 5.0) -> None:
+        """
+        Deliver queued events, then stop every subscriber task.
+
+        Args:
+            timeout: Max seconds to wait for delivery before discarding the rest
+        """
+        try:
+            await asyncio.wait_for(self.drain(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"[OrderEvents] Undelivered events discarded after {timeout}s")
+        for subscribers in self._subscribers.values():
+            for subscriber in subscribers:
+                await subscriber.close()
+
+    @property
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Statistics per queued subscriber, keyed by kind:callback name."""
+        return {
+            subscriber.name: subscriber.stats
+            for subscribers in self._subscribers.values()
+            for subscriber in subscribers
+        }
@@ -0,0 +1,388 @@
+"""
+Order Journal
+
+Append-only, crash-safe record of OrderBook state so a restart can rebuild
+the in-memory order store from disk instead of re-deriving it from the
+exchange (which also loses client-side context such as partial-fill timers,
+status messages and metadata).
+
+Layout (one directory per OrderManager):
+- snapshot.json: every order in the book at generation g
+- journal.<g>.jsonl: one JSON line per order state change since that snapshot,
+  holding the order's state plus only the fills not yet journaled
+
+Group commit: OrderBook only marks orders dirty (a dict insert on the hot
+path). A flush, scheduled flush_interval after the first change, serializes
+every dirty order once and issues a single write + fsync for all of them, so
+a burst of fills and transitions costs one disk sync. flush() can be awaited
+where durability matters; a crash loses at most the last flush_interval of
+changes, which reconciliation against the exchange then picks up.
+
+Once snapshot_every lines are in the current journal the book is written to
+a new snapshot (tmp file + fsync + rename) and journaling moves to the next
+generation, bounding replay time.
+
+Usage:
+    journal = OrderJournal(".probablyprofit/orders/polymarket")
+    manager = OrderManager(client, journal=journal)
+    await manager.recover()  # Replay snapshot + tail (start_polling also does this)
+    ...
+    await journal.close()
+"""
+
+import asyncio
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+from pydantic_core import PydanticSerializationError
+
+from probablyprofit.api.order_manager import ManagedOrder
+
+SNAPSHOT_FILE = "snapshot.json"
+
+# Returns OrderJournal.capture() of every order, taken with the book locked
+SnapshotSource = Callable[[], Awaitable[Dict[str, Any]]]
+
+
+def _encode(order: ManagedOrder, fills_from: int = 0) -> Dict[str, Any]:
+    """Order state without fills, plus the fills from index `fills_from` on."""
+    try:
+        state = order.model_dump(mode="json", exclude={"fills"})
+    except PydanticSerializationError:
+        # Non-JSON metadata values: stringified by json.dumps(default=str)
+        state = order.model_dump(exclude={"fills"})
+    state["fills"] = [fill.model_dump(mode="json") for fill in order.fills[fills_from:]]
+    return state
+
+
+class OrderJournal:
+    """Write-ahead journal of ManagedOrder state with group commit and snapshots."""
+
+    def __init__(
+        self,
+        directory: str,
+        flush_interval: float = 0.01,
+        snapshot_every: int = 10_000,
+        fsync: bool = True,
+    ):
+        """
+        Initialize journal.
+
+        Args:
+            directory: Directory for the snapshot and journal files
+            flush_interval: Seconds to gather changes before one write + fsync
+            snapshot_every: Journal lines before the book is snapshotted
+            fsync: Sync each flush to disk (disable only for tests/benchmarks)
+        """
+        self.directory = Path(directory)
+        self.flush_interval = flush_interval
+        self.snapshot_every = snapshot_every
+        self.fsync = fsync
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # Append to the generation on disk even before load() runs, so a later
+        # load() does not discard this session's lines as an older journal
+        self._generation = self._snapshot_generation()
+        self._file: Optional[Any] = None
+        self._lines = 0  # Lines in the current generation's journal
+        self._snapshot_source: Optional[SnapshotSource] = None
+
+        # client_order_id -> order (None once removed), in change order
+        self._dirty: Dict[str, Optional[ManagedOrder]] = {}
+        # client_order_id -> number of the order's fills already journaled
+        self._journaled_fills: Dict[str, int] = {}
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional["asyncio.Task[None]"] = None
+
+        # Statistics
+        self._flushes = 0
+        self._records = 0
+        self._snapshots = 0
+
+    def _journal_path(self, generation: int) -> Path:
+        return self.directory / f"journal.{generation}.jsonl"
+
+    def _snapshot_generation(self) -> int:
+        path = self.directory / SNAPSHOT_FILE
+        if not path.exists():
+            return 0
+        with open(path) as f:
+            return int(json.load(f)["generation"])
+
+    # =========================================================================
+    # Hot path (called by OrderBook with its lock held)
+    # =========================================================================
+
+    def mark_dirty(self, order: ManagedOrder) -> None:
+        """Queue the order's current state for the next group commit."""
+        key = order.client_order_id
+        self._dirty.pop(key, None)  # Keep dict order = order of last change
+        self._dirty[key] = order
+        self._schedule_flush()
+
+    def mark_removed(self, order: ManagedOrder) -> None:
+        """Queue the order's removal from the book."""
+        key = order.client_order_id
+        self._dirty.pop(key, None)
+        self._dirty[key] = None
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if self._flush_task is not None and not self._flush_task.done():
+            return
+        try:
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_later())
+        except RuntimeError:
+            pass  # No event loop: changes stay queued until flush()/close()
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"[OrderJournal] Flush failed: {e}")
+
+    # =========================================================================
+    # Group commit
+    # =========================================================================
+
+    def _encode_dirty(
+        self, dirty: Dict[str, Optional[ManagedOrder]]
+    ) -> Tuple[List[str], Dict[str, Optional[int]]]:
+        """
+        Serialize a dirty set.
+
+        Returns:
+            Journal lines, and the journaled fill count per order to commit
+            once they are on disk (None drops the order's count)
+        """
+        lines = []
+        fill_counts: Dict[str, Optional[int]] = {}
+        for key, order in dirty.items():
+            if order is None:
+                fill_counts[key] = None
+                lines.append(json.dumps({"k": key, "rm": True}))
+                continue
+            record = _encode(order, self._journaled_fills.get(key, 0))
+            fill_counts[key] = None if order.is_terminal else len(order.fills)
+            lines.append(json.dumps({"k": key, "o": record}, default=str))
+        return lines, fill_counts
+
+    def _requeue(self, dirty: Dict[str, Optional[ManagedOrder]]) -> None:
+        """Put a failed batch back ahead of later marks; a newer mark of an order wins."""
+        requeued = {key: order for key, order in dirty.items() if key not in self._dirty}
+        requeued.update(self._dirty)
+        self._dirty = requeued
+
+    def _append(self, data: bytes) -> None:
+        if self._file is None:
+            self._file = open(self._journal_path(self._generation), "ab")
+        position = self._file.tell()
+        try:
+            self._file.write(data)
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+        except OSError:
+            # Drop any partial batch so the retry does not replay it twice
+            self._file.truncate(position)
+            self._file.seek(position)
+            raise
+
+    async def flush(self) -> int:
+        """
+        Write every queued change with one write + fsync.
+
+        Concurrent callers share the in-flight commit; when this returns,
+        every change queued before the call is on disk.
+
+        Returns:
+            Number of journal lines written
+        """
+        async with self._flush_lock:
+            dirty, self._dirty = self._dirty, {}
+            lines, fill_counts = self._encode_dirty(dirty)
+            if lines:
+                data = ("\n".join(lines) + "\n").encode()
+                try:
+                    await asyncio.to_thread(self._append, data)
+                except BaseException:
+                    self._requeue(dirty)
+                    raise
+                for key, count in fill_counts.items():
+                    if count is None:
+                        self._journaled_fills.pop(key, None)
+                    else:
+                        self._journaled_fills[key] = count
+                self._lines += len(lines)
+                self._records += len(lines)
+                self._flushes += 1
+
+            if self._snapshot_source is not None and self._lines >= self.snapshot_every:
+                await self._snapshot()
+            return len(lines)
+
+    # =========================================================================
+    # Snapshots
+    # =========================================================================
+
+    def bind(self, source: SnapshotSource) -> None:
+        """Set the callback that captures the whole book (see OrderBook)."""
+        self._snapshot_source = source
+
+    def capture(self, orders: List[ManagedOrder]) -> Dict[str, Any]:
+        """
+        Build the next generation's snapshot from the book's orders.
+
+        Called by the snapshot source with the book locked, so no change can
+        slip between the captured state and the dirty set being cleared.
+        """
+        self._dirty.clear()
+        self._journaled_fills = {
+            order.client_order_id: len(order.fills) for order in orders if not order.is_terminal
+        }
+        return {
+            "generation": self._generation + 1,
+            "written_at": time.time(),
+            "orders": [_encode(order) for order in orders],
+        }
+
+    def _write_snapshot(self, snapshot: Dict[str, Any]) -> None:
+        path = self.directory / SNAPSHOT_FILE
+        tmp = path.with_suffix(".tmp")
+        data = json.dumps(snapshot, default=str)
+        with open(tmp, "w") as f:
+            f.write(data)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+        # The new snapshot supersedes the old journal
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        old = self._journal_path(self._generation)
+        self._generation = snapshot["generation"]
+        old.unlink(missing_ok=True)
+
+    async def _snapshot(self) -> None:
+        """Write the book to a new snapshot and start the next journal generation."""
+        assert self._snapshot_source is not None
+        snapshot = await self._snapshot_source()
+        await asyncio.to_thread(self._write_snapshot, snapshot)
+        self._lines = 0
+        self._snapshots += 1
+        logger.debug(
+            f"[OrderJournal] Snapshot of {len(snapshot['orders'])} orders "
+            f"(generation {self._generation})"
+        )
+
+    async def snapshot(self) -> None:
+        """Force a snapshot now (e.g. after recovery or before shutdown)."""
+        async with self._flush_lock:
+            await self._snapshot()
+
+    # =========================================================================
+    # Recovery
+    # =========================================================================
+
+    def load(self) -> Tuple[List[ManagedOrder], Dict[str, Any]]:
+        """
+        Rebuild orders from the snapshot plus the tail of its journal.
+
+        A torn last line (crash mid-write) is skipped. Journaling continues
+        in the loaded generation.
+
+        Returns:
+            Orders in the order they last changed, and replay statistics
+        """
+        start = time.perf_counter()
+        orders: Dict[str, Dict[str, Any]] = {}
+        generation = 0
+
+        snapshot_path = self.directory / SNAPSHOT_FILE
+        if snapshot_path.exists():
+            with open(snapshot_path) as f:
+                snapshot = json.load(f)
+            generation = snapshot["generation"]
+            for state in snapshot["orders"]:
+                orders[state["client_order_id"]] = state
+
+        replayed = skipped = 0
+        journal_path = self._journal_path(generation)
+        if journal_path.exists():
+            with open(journal_path, "rb") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        key = record["k"]
+                    except (ValueError, KeyError):
+                        skipped += 1
+                        continue
+                    replayed += 1
+                    previous = orders.pop(key, None)
+                    if record.get("rm"):
+                        continue
+                    state = record["o"]
+                    if previous is not None:
+                        state["fills"] = previous["fills"] + state["fills"]
+                    orders[key] = state
+        if skipped:
+            logger.warning(f"[OrderJournal] Skipped {skipped} unreadable journal line(s)")
+
+        restored = []
+        for state in orders.values():
+            try:
+                restored.append(ManagedOrder.model_validate(state))
+            except ValueError as e:
+                logger.warning(f"[OrderJournal] Dropping unreadable order record: {e}")
+
+        # Journals of older generations are already covered by the snapshot
+        for path in self.directory.glob("journal.*.jsonl"):
+            if path != journal_path:
+                path.unlink(missing_ok=True)
+
+        self._generation = generation
+        self._lines = replayed
+        self._journaled_fills = {
+            order.client_order_id: len(order.fills) for order in restored if not order.is_terminal
+        }
+        stats = {
+            "orders": len(restored),
+            "replayed": replayed,
+            "skipped": skipped,
+            "generation": generation,
+            "seconds": time.perf_counter() - start,
+        }
+        return restored, stats
+
+    async def close(self) -> None:
+        """Flush queued changes and close the journal file."""
+        await self.flush()
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Get journal statistics."""
+        return {
+            "generation": self._generation,
+            "pending": len(self._dirty),
+            "journal_lines": self._lines,
+            "records": self._records,
+            "flushes": self._flushes,
+            "snapshots": self._snapshots,
+        }
@@ -9,11 +9,13 @@ Provides comprehensive order lifecycle management:
 """
 
 import asyncio
-from collections import OrderedDict
+import heapq
+import itertools
+from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, Optional, Tuple
 
 from loguru import logger
 from pydantic import BaseModel, Field
@@ -26,8 +28,13 @@ from probablyprofit.api.exceptions import (
     PartialFillError,
     ValidationException,
 )
+from probablyprofit.api.order_events import OrderEventBus
 from probablyprofit.config import get_config
 
+if TYPE_CHECKING:
+    from probablyprofit.api.order_journal import OrderJournal
+    from probablyprofit.api.order_stream import OrderEventStream
+
 
 class OrderStatus(str, Enum):
     """Order lifecycle states."""
@@ -60,6 +67,10 @@ class OrderType(str, Enum):
     GTC = "GTC"  # Good Till Cancelled
 
 
+# Keeps client order IDs unique when many orders are created in the same millisecond
+_client_order_seq = itertools.count()
+
+
 class Fill(BaseModel):
     """Represents a single fill (partial execution)."""
 
@@ -84,7 +95,9 @@ class ManagedOrder(BaseModel):
     # Core order fields
     order_id: Optional[str] = None
     client_order_id: str = Field(
-        default_factory=lambda: f"pp_{int(datetime.now().timestamp() * 1000)}"
+        default_factory=lambda: (
+            f"pp_{int(datetime.now().timestamp() * 1000)}_{next(_client_order_seq)}"
+        )
     )
     market_id: str
     outcome: str
@@ -241,18 +254,31 @@ class OrderBook:
     """
     In-memory order book for tracking active orders.
 
-    Thread-safe with LRU eviction for completed orders.
+    Active orders are indexed by market and by status, and partially filled
+    orders by last fill time, so per-market, per-status and partial-fill
+    timeout queries cost O(matches) (plus O(log n) per timed-out order)
+    rather than a scan of every active order. Completed orders are kept in a
+    fixed-size ring buffer.
+
+    Orders are mutated by their owner and then passed to update(), which
+    re-indexes them; the book remembers what each order was indexed under.
+    With a journal attached, every add/update/remove is also queued for the
+    journal's next group commit.
     """
 
-    def __init__(self, max_history: int = 1000):
+    def __init__(self, max_history: int = 1000, journal: Optional["OrderJournal"] = None):
         """
         Initialize order book.
 
         Args:
             max_history: Maximum number of completed orders to keep
+            journal: Optional OrderJournal to persist changes to
         """
         self.max_history = max_history
         self._lock = asyncio.Lock()
+        self.journal = journal
+        if journal is not None:
+            journal.bind(self._capture_snapshot)
 
         # Active orders by order_id
         self._active: Dict[str, ManagedOrder] = {}
@@ -260,107 +286,202 @@ class OrderBook:
         # Client order ID to exchange order ID mapping
         self._client_to_exchange: Dict[str, str] = {}
 
-        # Completed orders (LRU cache)
-        self._history: OrderedDict[str, ManagedOrder] = OrderedDict()
+        # Completed orders: ring buffer of keys (oldest evicted) plus lookup by key
+        self._history_keys: Deque[str] = deque(maxlen=max_history)
+        self._history: Dict[str, ManagedOrder] = {}
+
+        # Secondary indexes over active orders (dicts as insertion-ordered sets)
+        self._by_market: Dict[str, Dict[str, None]] = {}
+        self._by_status: Dict[OrderStatus, Dict[str, None]] = {}
+        self._indexed_status: Dict[str, OrderStatus] = {}
+
+        # Min-heap of (last fill time, key) for partially filled orders;
+        # entries superseded by a later fill or status change are skipped lazily
+        self._fill_times: List[Tuple[datetime, str]] = []
+        self._indexed_fill_time: Dict[str, datetime] = {}
+
+    # =========================================================================
+    # Index maintenance (caller holds the lock)
+    # =========================================================================
+
+    def _index(self, key: str, order: ManagedOrder) -> None:
+        """Add or refresh an active order's index entries."""
+        self._active[key] = order
+        self._by_market.setdefault(order.market_id, {})[key] = None
+
+        status = self._indexed_status.get(key)
+        if status != order.status:
+            if status is not None:
+                self._discard(self._by_status, status, key)
+            self._by_status.setdefault(order.status, {})[key] = None
+            self._indexed_status[key] = order.status
+
+        if order.status == OrderStatus.PARTIALLY_FILLED and order.fills:
+            last_fill = max(f.timestamp for f in order.fills)
+            if self._indexed_fill_time.get(key) != last_fill:
+                self._indexed_fill_time[key] = last_fill
+                heapq.heappush(self._fill_times, (last_fill, key))
+        else:
+            self._indexed_fill_time.pop(key, None)
+
+    def _unindex(self, key: str, market_id: str) -> Optional[ManagedOrder]:
+        """Drop an active order from every index."""
+        order = self._active.pop(key, None)
+        self._discard(self._by_market, market_id, key)
+        status = self._indexed_status.pop(key, None)
+        if status is not None:
+            self._discard(self._by_status, status, key)
+        self._indexed_fill_time.pop(key, None)
+        return order
+
+    @staticmethod
+    def _discard(index: Dict[Any, Dict[str, None]], bucket: Any, key: str) -> None:
+        keys = index.get(bucket)
+        if keys is not None:
+            keys.pop(key, None)
+            if not keys:
+                del index[bucket]
+
+    def _archive(self, key: str, order: ManagedOrder) -> None:
+        """Put a terminal order in the history ring, evicting the oldest if full."""
+        if key in self._history:
+            self._history[key] = order
+            return
+        if len(self._history_keys) == self._history_keys.maxlen:
+            evicted = self._history.pop(self._history_keys[0], None)
+            if evicted is not None and evicted.client_order_id:
+                self._client_to_exchange.pop(evicted.client_order_id, None)
+        self._history_keys.append(key)
+        self._history[key] = order
 
-        # Orders by market
-        self._by_market: Dict[str, Set[str]] = {}
+    # =========================================================================
+    # Mutations
+    # =========================================================================
 
     async def add(self, order: ManagedOrder) -> None:
         """Add an order to the book."""
         async with self._lock:
             key = order.order_id or order.client_order_id
-            self._active[key] = order
 
             # Track client to exchange mapping
             if order.order_id and order.client_order_id:
                 self._client_to_exchange[order.client_order_id] = order.order_id
 
-            # Index by market
-            if order.market_id not in self._by_market:
-                self._by_market[order.market_id] = set()
-            self._by_market[order.market_id].add(key)
+            self._index(key, order)
+            if self.journal is not None:
+                self.journal.mark_dirty(order)
 
             logger.debug(f"Added order {key} to book (active: {len(self._active)})")
 
-    async def get(self, order_id: str) -> Optional[ManagedOrder]:
-        """Get order by ID (checks both exchange and client IDs)."""
-        async with self._lock:
-            # Try direct lookup
-            if order_id in self._active:
-                return self._active[order_id]
-
-            # Try client ID mapping
-            if order_id in self._client_to_exchange:
-                exchange_id = self._client_to_exchange[order_id]
-                return self._active.get(exchange_id)
-
-            # Check history
-            if order_id in self._history:
-                return self._history[order_id]
-
-            return None
-
     async def update(self, order: ManagedOrder) -> None:
         """Update an order in the book."""
         async with self._lock:
             key = order.order_id or order.client_order_id
 
-            # If order was stored by client_order_id but now has order_id, clean up old entry
+            # If order was stored by client_order_id but now has order_id, re-key it
             if order.order_id and order.client_order_id and order.client_order_id in self._active:
-                del self._active[order.client_order_id]
-                # Update market index
-                if order.market_id in self._by_market:
-                    self._by_market[order.market_id].discard(order.client_order_id)
-                    self._by_market[order.market_id].add(key)
+                self._unindex(order.client_order_id, order.market_id)
+                self._client_to_exchange[order.client_order_id] = order.order_id
 
             if order.is_terminal:
                 # Move to history
-                if key in self._active:
-                    del self._active[key]
-
-                self._history[key] = order
-                self._history.move_to_end(key)
-
-                # Evict oldest if over limit
-                while len(self._history) > self.max_history:
-                    self._history.popitem(last=False)
-
-                # Remove from market index
-                if order.market_id in self._by_market:
-                    self._by_market[order.market_id].discard(key)
+                self._unindex(key, order.market_id)
+                self._archive(key, order)
             else:
-                self._active[key] = order
+                self._index(key, order)
+            if self.journal is not None:
+                self.journal.mark_dirty(order)
 
     async def remove(self, order_id: str) -> Optional[ManagedOrder]:
         """Remove an order from the book."""
         async with self._lock:
-            order = self._active.pop(order_id, None)
+            order = self._active.get(order_id)
             if order:
-                if order.market_id in self._by_market:
-                    self._by_market[order.market_id].discard(order_id)
+                self._unindex(order_id, order.market_id)
+                if self.journal is not None:
+                    self.journal.mark_removed(order)
             return order
 
+    async def restore(self, orders: List[ManagedOrder]) -> None:
+        """
+        Load orders recovered from a journal (oldest change first).
+
+        Active orders are re-indexed, including their partial-fill timers;
+        terminal ones go to history. Nothing is journaled again.
+        """
+        async with self._lock:
+            for order in orders:
+                key = order.order_id or order.client_order_id
+                if order.order_id and order.client_order_id:
+                    self._client_to_exchange[order.client_order_id] = order.order_id
+                if order.is_terminal:
+                    self._archive(key, order)
+                else:
+                    self._index(key, order)
+
+    async def _capture_snapshot(self) -> Dict[str, Any]:
+        """Journal snapshot of history (oldest first) and active orders."""
+        assert self.journal is not None
+        async with self._lock:
+            orders = [self._history[key] for key in self._history_keys]
+            orders.extend(self._active.values())
+            return self.journal.capture(orders)
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    async def get(self, order_id: str) -> Optional[ManagedOrder]:
+        """Get order by ID (checks both exchange and client IDs)."""
+        async with self._lock:
+            key = self._client_to_exchange.get(order_id, order_id)
+            order = self._active.get(order_id) or self._active.get(key)
+            if order is not None:
+                return order
+
+            # Check history
+            return self._history.get(order_id) or self._history.get(key)
+
     async def get_active(self) -> List[ManagedOrder]:
         """Get all active orders."""
         async with self._lock:
             return list(self._active.values())
 
     async def get_by_market(self, market_id: str) -> List[ManagedOrder]:
-        """Get all orders for a specific market."""
+        """Get all active orders for a specific market."""
         async with self._lock:
-            order_ids = self._by_market.get(market_id, set())
-            orders = []
-            for oid in order_ids:
-                if oid in self._active:
-                    orders.append(self._active[oid])
-            return orders
+            return [self._active[key] for key in self._by_market.get(market_id, ())]
+
+    async def get_by_status(self, *statuses: OrderStatus) -> List[ManagedOrder]:
+        """Get active orders in any of the given statuses."""
+        async with self._lock:
+            return [
+                self._active[key] for status in statuses for key in self._by_status.get(status, ())
+            ]
+
+    async def get_partial_fills_before(self, cutoff: datetime) -> List[ManagedOrder]:
+        """
+        Get partially filled orders whose last fill is at or before `cutoff`.
+
+        Oldest first. Orders stay indexed until their status changes, so one
+        whose cancellation fails is returned again by the next call.
+        """
+        async with self._lock:
+            heap = self._fill_times
+            due: Dict[str, datetime] = {}
+            while heap and heap[0][0] <= cutoff:
+                fill_time, key = heapq.heappop(heap)
+                if self._indexed_fill_time.get(key) == fill_time:
+                    due[key] = fill_time
+            for key, fill_time in due.items():
+                heapq.heappush(heap, (fill_time, key))
+            return [self._active[key] for key in due]
 
     async def get_history(self, limit: int = 100) -> List[ManagedOrder]:
-        """Get recent order history."""
+        """Get recent order history, newest first."""
         async with self._lock:
-            items = list(self._history.values())[-limit:]
-            return list(reversed(items))
+            keys = itertools.islice(reversed(self._history_keys), limit)
+            return [self._history[key] for key in keys]
 
     @property
     def active_count(self) -> int:
@@ -372,6 +493,10 @@ class OrderBook:
         """Number of orders in history."""
         return len(self._history)
 
+    def count_by_status(self) -> Dict[OrderStatus, int]:
+        """Number of active orders per status."""
+        return {status: len(keys) for status, keys in self._by_status.items()}
+
 
 # Callback types
 OrderCallback = Callable[[ManagedOrder], None]
@@ -395,6 +520,7 @@ class OrderManager:
         client: Any = None,
         platform: str = "polymarket",
         partial_fill_timeout: float = 300.0,  # 5 minutes default
+        journal: Optional["OrderJournal"] = None,
     ):
         """
         Initialize order manager.
@@ -403,38 +529,54 @@ class OrderManager:
             client: API client (PolymarketClient)
             platform: Platform name
             partial_fill_timeout: Seconds to wait before auto-canceling partial fills
+            journal: OrderJournal to persist order state to (defaults to config)
         """
         self.client = client
         self.platform = platform
         self.partial_fill_timeout = partial_fill_timeout
-        self.order_book = OrderBook(max_history=get_config().api.positions_cache_max_size)
 
-        # Event callbacks
-        self._on_fill: List[FillCallback] = []
-        self._on_status_change: List[OrderCallback] = []
-        self._on_complete: List[OrderCallback] = []
-        self._on_partial_fill_timeout: List[OrderCallback] = []
+        api_cfg = get_config().api
+        if journal is None and api_cfg.order_journal:
+            from probablyprofit.api.order_journal import OrderJournal
+
+            journal = OrderJournal(
+                f"{api_cfg.order_journal_dir}/{platform}",
+                flush_interval=api_cfg.order_journal_flush_interval,
+                snapshot_every=api_cfg.order_journal_snapshot_every,
+            )
+        self.journal = journal
+        self._recovered = journal is None
+        self.order_book = OrderBook(max_history=api_cfg.positions_cache_max_size, journal=journal)
+
+        # Event callbacks, each fed from its own queue
+        self.events = OrderEventBus(
+            max_queue=api_cfg.order_event_queue_size, overflow=api_cfg.order_event_overflow
+        )
 
         # Polling state
         self._polling = False
         self._poll_task: Optional[asyncio.Task] = None
         self._poll_interval = 5.0  # seconds
+        self.event_stream: Optional["OrderEventStream"] = None
+
+    # Callbacks are delivered asynchronously from a per-callback queue (see
+    # OrderEventBus); inline=True runs them before the triggering call returns.
 
-    def on_fill(self, callback: FillCallback) -> None:
+    def on_fill(self, callback: FillCallback, inline: bool = False) -> None:
         """Register callback for fill events."""
-        self._on_fill.append(callback)
+        self.events.subscribe("fill", callback, inline=inline)
 
-    def on_status_change(self, callback: OrderCallback) -> None:
+    def on_status_change(self, callback: OrderCallback, inline: bool = False) -> None:
         """Register callback for status change events."""
-        self._on_status_change.append(callback)
+        self.events.subscribe("status", callback, inline=inline)
 
-    def on_complete(self, callback: OrderCallback) -> None:
+    def on_complete(self, callback: OrderCallback, inline: bool = False) -> None:
         """Register callback for order completion events."""
-        self._on_complete.append(callback)
+        self.events.subscribe("complete", callback, inline=inline)
 
-    def on_partial_fill_timeout(self, callback: OrderCallback) -> None:
+    def on_partial_fill_timeout(self, callback: OrderCallback, inline: bool = False) -> None:
         """Register callback for partial fill timeout events."""
-        self._on_partial_fill_timeout.append(callback)
+        self.events.subscribe("partial_fill_timeout", callback, inline=inline)
 
     async def check_partial_fill_timeouts(self) -> List[ManagedOrder]:
         """
@@ -444,17 +586,10 @@ class OrderManager:
             List of orders that were cancelled due to timeout
         """
         cancelled_orders = []
-        active_orders = await self.order_book.get_active()
         now = datetime.now()
+        cutoff = now - timedelta(seconds=self.partial_fill_timeout)
 
-        for order in active_orders:
-            if order.status != OrderStatus.PARTIALLY_FILLED:
-                continue
-
-            # Find the last fill time
-            if not order.fills:
-                continue
-
+        for order in await self.order_book.get_partial_fills_before(cutoff):
             last_fill_time = max(f.timestamp for f in order.fills)
             time_since_fill = (now - last_fill_time).total_seconds()
 
@@ -473,14 +608,7 @@ class OrderManager:
                     cancelled_orders.append(order)
 
                     # Notify listeners
-                    for callback in self._on_partial_fill_timeout:
-                        try:
-                            if asyncio.iscoroutinefunction(callback):
-                                await callback(order)
-                            else:
-                                callback(order)
-                        except Exception as e:
-                            logger.warning(f"Partial fill timeout callback error: {e}")
+                    await self.events.publish("partial_fill_timeout", self._snapshot(order))
 
                 except Exception as e:
                     logger.error(f"Failed to cancel timed-out order {order.order_id}: {e}")
@@ -576,6 +704,111 @@ class OrderManager:
             logger.error(f"Order submission failed: {e}")
             raise OrderException(f"Order submission failed: {e}")
 
+    async def submit_orders_batch(
+        self,
+        orders: List[Dict[str, Any]],
+    ) -> List[ManagedOrder]:
+        """
+        Submit many orders at once.
+
+        Uses the client's place_orders_batch so token resolution, signing and
+        submission are pipelined. Failed orders, including specs that fail
+        validation (which are not added to the book), are returned with
+        status FAILED instead of raising, so callers see every outcome.
+
+        Args:
+            orders: Order dicts with market_id, outcome, side, size, price and
+                optional order_type / metadata
+
+        Returns:
+            One ManagedOrder per input order, in input order
+        """
+        managed = [self._batch_order(spec) for spec in orders]
+        # Invalid specs are rejected locally: never submitted or tracked
+        valid = [o for o in managed if o.status != OrderStatus.FAILED]
+
+        # Add to book before submission
+        now = datetime.now()
+        for order in valid:
+            order.status = OrderStatus.SUBMITTED
+            order.submitted_at = now
+            await self.order_book.add(order)
+
+        if self.client and self.platform == "polymarket":
+            try:
+                results = await self.client.place_orders_batch(
+                    [
+                        {
+                            "market_id": o.market_id,
+                            "outcome": o.outcome,
+                            "side": o.side.value,
+                            "size": o.size,
+                            "price": o.price,
+                            "order_type": o.order_type.value,
+                        }
+                        for o in valid
+                    ]
+                )
+            except Exception as e:
+                logger.error(f"Batch order submission failed: {e}")
+                results = [None] * len(valid)
+                for order in valid:
+                    order.status_message = str(e)
+
+            for order, result in zip(valid, results):
+                if result is not None and result.success and result.order.order_id:
+                    order.order_id = result.order.order_id
+                    order.status = OrderStatus.OPEN
+                else:
+                    order.status = OrderStatus.FAILED
+                    if result is not None:
+                        order.status_message = result.error or "No order ID returned"
+        elif self.client:
+            # No batch endpoint for this platform: fail rather than leave SUBMITTED forever
+            for order in valid:
+                order.status = OrderStatus.FAILED
+                order.status_message = f"Batch submission not supported on {self.platform}"
+            logger.error(f"Batch submission not supported on {self.platform}")
+        else:
+            # Dry run / simulation mode
+            for order in valid:
+                order.order_id = f"sim_{order.client_order_id}"
+                order.status = OrderStatus.OPEN
+            logger.info(f"[DRY RUN] {len(valid)} order(s) simulated")
+
+        for order in valid:
+            order.updated_at = datetime.now()
+            await self.order_book.update(order)
+            await self._notify_status_change(order)
+
+        opened = sum(1 for o in managed if o.status == OrderStatus.OPEN)
+        logger.info(f"Batch submitted: {opened}/{len(managed)} order(s) open")
+        return managed
+
+    def _batch_order(self, spec: Dict[str, Any]) -> ManagedOrder:
+        """Build a batch order, or a FAILED placeholder if the spec is invalid."""
+        try:
+            return ManagedOrder(
+                market_id=spec["market_id"],
+                outcome=spec["outcome"],
+                side=OrderSide(str(spec["side"]).upper()),
+                order_type=OrderType(spec.get("order_type", OrderType.LIMIT)),
+                size=spec["size"],
+                price=spec["price"],
+                platform=self.platform,
+                metadata=spec.get("metadata") or {},
+            )
+        except (KeyError, ValueError) as e:
+            logger.warning(f"Invalid batch order {spec}: {e}")
+            # Unvalidated copy of the spec so the caller can see what was rejected
+            return ManagedOrder.model_construct(
+                **{k: spec.get(k) for k in ("market_id", "outcome", "side", "size", "price")},
+                platform=self.platform,
+                metadata=spec.get("metadata") or {},
+                status=OrderStatus.FAILED,
+                status_message=f"Invalid order: {e}",
+            )
+
     async def cancel_order(self, order_id: str, reason: str = "User cancelled") -> bool:
         """
         Cancel an active order.
@@ -605,12 +838,7 @@ class OrderManager:
                 if not success:
                     raise OrderCancelError("Exchange rejected cancellation")
 
-            order.cancel(reason)
-            await self.order_book.update(order)
-
-            # Notify listeners
-            await self._notify_status_change(order)
-            await self._notify_complete(order)
+            await self._mark_cancelled(order, reason)
 
             logger.info(f"Order cancelled: {order_id} ({reason})")
             return True
@@ -621,10 +849,23 @@ class OrderManager:
             logger.error(f"Cancel failed for {order_id}: {e}")
             raise OrderCancelError(f"Cancellation failed: {e}")
 
+    async def _mark_cancelled(self, order: ManagedOrder, reason: str) -> None:
+        """Record a confirmed cancellation locally and notify listeners."""
+        order.cancel(reason)
+        await self.order_book.update(order)
+
+        # Notify listeners
+        await self._notify_status_change(order)
+        await self._notify_complete(order)
+
     async def cancel_all(self, market_id: Optional[str] = None) -> int:
         """
         Cancel all active orders, optionally filtered by market.
 
+        Exchange orders are cancelled in one client.cancel_orders_bulk call
+        (server-side bulk cancel, or concurrent cancels as a fallback);
+        orders not yet on the exchange are cancelled locally.
+
         Args:
             market_id: Optional market to filter by
 
@@ -635,17 +876,33 @@ class OrderManager:
             orders = await self.order_book.get_by_market(market_id)
         else:
             orders = await self.order_book.get_active()
+        orders = [order for order in orders if order.is_active]
+
+        outcomes: Dict[str, Optional[str]] = {}
+        exchange_ids = [order.order_id for order in orders if order.order_id]
+        if self.client and exchange_ids:
+            if hasattr(self.client, "cancel_orders_bulk"):
+                result = await self.client.cancel_orders_bulk(order_ids=exchange_ids)
+                outcomes = result.outcomes
+            else:
+                ok = await asyncio.gather(
+                    *(self.client.cancel_order(order_id) for order_id in exchange_ids),
+                    return_exceptions=True,
+                )
+                outcomes = {
+                    order_id: None if success is True else str(success or "cancel failed")
+                    for order_id, success in zip(exchange_ids, ok)
+                }
 
         cancelled = 0
         for order in orders:
-            if order.is_active:
-                try:
-                    await self.cancel_order(
-                        order.order_id or order.client_order_id, reason="Bulk cancel"
-                    )
-                    cancelled += 1
-                except Exception as e:
-                    logger.warning(f"Failed to cancel {order.order_id}: {e}")
+            if self.client and order.order_id:
+                error = outcomes.get(order.order_id, "no response from exchange")
+                if error is not None:
+                    logger.warning(f"Failed to cancel {order.order_id}: {error}")
+                    continue
+            await self._mark_cancelled(order, "Bulk cancel")
+            cancelled += 1
 
         logger.info(f"Cancelled {cancelled} orders")
         return cancelled
@@ -722,7 +979,8 @@ class OrderManager:
             order_id: Order that received the fill
             fill_size: Size filled
             fill_price: Fill price
-            fill_id: Optional fill identifier
+            fill_id: Optional fill identifier; a fill already applied to the
+                order under the same ID is ignored
             fee: Trading fee
 
         Returns:
@@ -735,6 +993,10 @@ class OrderManager:
         if not order:
             raise OrderNotFoundError(f"Order {order_id} not found")
 
+        if fill_id is not None and any(f.fill_id == fill_id for f in order.fills):
+            logger.debug(f"[OrderManager] Duplicate fill {fill_id} for {order_id} ignored")
+            return order
+
         fill = Fill(
             fill_id=fill_id or f"fill_{int(datetime.now().timestamp() * 1000)}",
             order_id=order_id,
@@ -774,11 +1036,77 @@ class OrderManager:
         """Get recent order history."""
         return await self.order_book.get_history(limit)
 
+    async def apply_exchange_update(
+        self, order_id: str, exchange_data: Dict[str, Any]
+    ) -> Optional[ManagedOrder]:
+        """
+        Apply an exchange-reported status to a tracked order.
+
+        Args:
+            order_id: Exchange or client order ID
+            exchange_data: Order payload with at least a "status" field
+
+        Returns:
+            The order, or None if it is not tracked
+        """
+        order = await self.order_book.get(order_id)
+        if order is not None and not order.is_terminal:
+            await self._update_from_exchange(order, exchange_data)
+        return order
+
+    async def recover(self) -> Dict[str, Any]:
+        """
+        Rebuild the order book from the journal, then reconcile the delta.
+
+        Replays the snapshot plus journal tail, so client-side state (fills,
+        partial-fill timers, metadata) survives a crash. Only orders that were
+        live at the time are then checked against the exchange. Orders that
+        never got an exchange ID cannot be looked up and are marked failed.
+
+        Returns:
+            Replay statistics and the reconciliation results
+        """
+        if self.journal is None:
+            return {"status": "skipped", "reason": "no_journal"}
+        self._recovered = True
+
+        # Anything this session already journaled is on disk before replay;
+        # orders the book already holds are kept as they are
+        await self.journal.flush()
+        orders, stats = await asyncio.to_thread(self.journal.load)
+        orders = [o for o in orders if await self.order_book.get(o.client_order_id) is None]
+        in_doubt = 0
+        for order in orders:
+            if order.is_active and not order.order_id:
+                order.status = OrderStatus.FAILED
+                order.status_message = "Submission outcome unknown after restart"
+                order.updated_at = datetime.now()
+                in_doubt += 1
+        await self.order_book.restore(orders)
+
+        logger.info(
+            f"Recovered {self.order_book.active_count} active and "
+            f"{self.order_book.history_count} completed orders from journal "
+            f"({stats['replayed']} records replayed in {stats['seconds'] * 1000:.1f}ms)"
+        )
+        if in_doubt:
+            logger.warning(f"{in_doubt} order(s) were mid-submission at shutdown; check exchange")
+
+        # Start the next generation from the recovered state
+        await self.journal.snapshot()
+
+        results: Dict[str, Any] = dict(stats, active=self.order_book.active_count)
+        results["in_doubt"] = in_doubt
+        results["reconcile"] = await self.reconcile()
+        return results
+
     async def reconcile(self) -> Dict[str, Any]:
         """
         Reconcile local order book with exchange.
 
-        Fetches current order status from exchange and updates local state.
+        Fetches each live order's status from the exchange (one request per
+        order) and updates local state. Background tracking uses the cheaper
+        OrderEventStream instead; see start_polling.
 
         Returns:
             Reconciliation results
@@ -794,7 +1122,10 @@ class OrderManager:
             "errors": [],
         }
 
-        active_orders = await self.order_book.get_active()
+        # Only orders the exchange knows about can change there
+        active_orders = await self.order_book.get_by_status(
+            OrderStatus.SUBMITTED, OrderStatus.OPEN, OrderStatus.PARTIALLY_FILLED
+        )
 
         for order in active_orders:
             if not order.order_id:
@@ -818,39 +1149,64 @@ class OrderManager:
         logger.info(f"Reconciliation complete: {results}")
         return results
 
-    async def start_polling(self, interval: float = 5.0) -> None:
+    async def start_polling(
+        self, interval: float = 5.0, use_user_channel: Optional[bool] = None
+    ) -> None:
         """
-        Start background polling for order updates.
+        Start background order tracking.
+
+        Fills and status changes arrive through an OrderEventStream: pushed
+        over the user channel when available, otherwise from one bulk sync
+        per interval. Partial fill timeouts are checked every interval.
+        With a journal that has not been recovered yet, recover() runs first.
 
         Args:
-            interval: Polling interval in seconds
+            interval: Bulk sync and timeout check interval in seconds
+            use_user_channel: Try the user channel (defaults to config)
         """
         if self._polling:
             return
+        if not self._recovered:
+            await self.recover()
 
         self._polling = True
         self._poll_interval = interval
+        if self.client and self.platform == "polymarket":
+            from probablyprofit.api.order_stream import OrderEventStream
+
+            self.event_stream = OrderEventStream(
+                self, self.client, sync_interval=interval, use_user_channel=use_user_channel
+            )
+            await self.event_stream.start()
         self._poll_task = asyncio.create_task(self._poll_loop())
         logger.info(f"Order polling started (interval: {interval}s)")
 
     async def stop_polling(self) -> None:
         """Stop background polling."""
         self._polling = False
+        if self.event_stream:
+            await self.event_stream.stop()
+            self.event_stream = None
         if self._poll_task:
             self._poll_task.cancel()
             try:
                 await self._poll_task
             except asyncio.CancelledError:
                 pass
+            self._poll_task = None
+        await self.events.close()
         logger.info("Order polling stopped")
 
+    async def close(self) -> None:
+        """Stop polling, deliver or discard pending order events and flush the journal."""
+        await self.stop_polling()
+        if self.journal is not None:
+            await self.journal.close()
+
     async def _poll_loop(self) -> None:
-        """Background polling loop."""
+        """Background partial fill timeout checks (order updates come from event_stream)."""
         while self._polling:
             try:
-                # Reconcile order status with exchange
-                await self.reconcile()
-
                 # Check for partial fill timeouts
                 timed_out = await self.check_partial_fill_timeouts()
                 if timed_out:
@@ -875,7 +1231,9 @@ class OrderManager:
             # Map exchange status to our status
             status_map = {
                 "open": OrderStatus.OPEN,
+                "live": OrderStatus.OPEN,
                 "filled": OrderStatus.FILLED,
+                "matched": OrderStatus.FILLED,
                 "canceled": OrderStatus.CANCELLED,
                 "cancelled": OrderStatus.CANCELLED,
                 "expired": OrderStatus.EXPIRED,
@@ -900,38 +1258,24 @@ class OrderManager:
             if order.is_terminal:
                 await self._notify_complete(order)
 
+    @staticmethod
+    def _snapshot(order: ManagedOrder) -> ManagedOrder:
+        """Copy of an order for event subscribers, unaffected by later updates."""
+        return order.model_copy(
+            update={"fills": list(order.fills), "metadata": dict(order.metadata)}
+        )
+
     async def _notify_fill(self, order: ManagedOrder, fill: Fill) -> None:
         """Notify fill callbacks."""
-        for callback in self._on_fill:
-            try:
-                if asyncio.iscoroutinefunction(callback):
-                    await callback(order, fill)
-                else:
-                    callback(order, fill)
-            except Exception as e:
-                logger.warning(f"Fill callback error: {e}")
+        await self.events.publish("fill", self._snapshot(order), fill)
 
     async def _notify_status_change(self, order: ManagedOrder) -> None:
         """Notify status change callbacks."""
-        for callback in self._on_status_change:
-            try:
-                if asyncio.iscoroutinefunction(callback):
-                    await callback(order)
-                else:
-                    callback(order)
-            except Exception as e:
-                logger.warning(f"Status callback error: {e}")
+        await self.events.publish("status", self._snapshot(order))
 
     async def _notify_complete(self, order: ManagedOrder) -> None:
         """Notify completion callbacks."""
-        for callback in self._on_complete:
-            try:
-                if asyncio.iscoroutinefunction(callback):
-                    await callback(order)
-                else:
-                    callback(order)
-            except Exception as e:
-                logger.warning(f"Complete callback error: {e}")
+        await self.events.publish("complete", self._snapshot(order))
 
 
 # Singleton order managers per platform
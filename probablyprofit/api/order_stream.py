@@ -0,0 +1,377 @@
+"""
+Push-Based Order Event Stream
+
+Feeds fills and order status changes into an OrderManager without polling
+each order. Two sources, both deduplicated by trade ID:
+
+- The authenticated CLOB user channel pushes trade and order events as they
+  happen. It reconnects with exponential backoff and triggers a catch-up
+  sync on every (re)connect.
+- A bulk sync fetches fills since a cursor plus one list of open orders.
+  Only sync results advance that cursor: a pushed trade says nothing about
+  fills the channel may have missed before it, so it must not move the
+  window the catch-up sync reads.
+  Orders we track as open that the exchange no longer lists are then looked
+  up individually, so request volume follows state changes, not order count.
+  The sync runs every order_sync_interval while the channel is down and every
+  order_resync_interval as a safety net while it is up.
+
+Fills go through OrderManager.process_fill, so its on_fill listeners (e.g.
+PortfolioState) see them. Delay from exchange match to local processing is
+exported as the fill_push / fill_sync stages of pp_latency_seconds.
+
+Usage:
+    stream = OrderEventStream(order_manager, client)
+    await stream.start()
+    ...
+    await stream.stop()
+"""
+
+import asyncio
+import json
+import random
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from loguru import logger
+
+from probablyprofit.api.order_manager import OrderStatus
+from probablyprofit.config import get_config
+from probablyprofit.utils.metrics import record_latency
+
+try:
+    import websockets
+    import websockets.exceptions
+
+    WEBSOCKETS_AVAILABLE = True
+except ImportError:
+    WEBSOCKETS_AVAILABLE = False
+    websockets = None  # type: ignore[assignment]
+
+# Fills are re-requested this many seconds before the cursor (dedup absorbs overlap)
+_CURSOR_OVERLAP = 5
+# Max fills fetched per sync
+_SYNC_FILL_LIMIT = 1000
+# Orders younger than this may not be listed yet; don't treat them as gone
+_VANISH_GRACE = 10.0
+# Max individual order lookups per sync (the rest wait for the next one)
+_MAX_VANISHED_CHECKS = 20
+# Trade legs remembered for deduplication
+_SEEN_TRADES = 10_000
+
+
+class OrderEventStream:
+    """User-channel push with bulk-sync fallback for one OrderManager."""
+
+    USER_WS_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/user"
+
+    def __init__(
+        self,
+        order_manager: Any,
+        client: Any,
+        sync_interval: Optional[float] = None,
+        resync_interval: Optional[float] = None,
+        use_user_channel: Optional[bool] = None,
+        url: Optional[str] = None,
+        reconnect_interval: float = 1.0,
+    ):
+        """
+        Initialize stream.
+
+        Args:
+            order_manager: OrderManager whose orders receive the events
+            client: PolymarketClient (bulk sync and user-channel credentials)
+            sync_interval: Seconds between bulk syncs while push is unavailable
+            resync_interval: Seconds between safety-net syncs while push is live
+            use_user_channel: Try the user channel (defaults to config)
+            url: User channel URL
+            reconnect_interval: Initial reconnect backoff in seconds
+        """
+        api_cfg = get_config().api
+        self.order_manager = order_manager
+        self.client = client
+        self.sync_interval = (
+            sync_interval if sync_interval is not None else api_cfg.order_sync_interval
+        )
+        self.resync_interval = (
+            resync_interval if resync_interval is not None else api_cfg.order_resync_interval
+        )
+        self.use_user_channel = (
+            use_user_channel if use_user_channel is not None else api_cfg.order_user_channel
+        )
+        self.url = url or self.USER_WS_URL
+        self.reconnect_interval = reconnect_interval
+
+        self._running = False
+        self._push_task: Optional["asyncio.Task[None]"] = None
+        self._sync_task: Optional["asyncio.Task[None]"] = None
+        self._push_connected = False
+        self._wake = asyncio.Event()
+
+        self._sync_cursor = 0.0  # Unix time of the newest fill returned by a sync
+        self._seen: "OrderedDict[str, None]" = OrderedDict()
+
+        # Statistics
+        self._push_events = 0
+        self._push_errors = 0
+        self._fills: Dict[str, int] = {"push": 0, "sync": 0}
+        self._syncs = 0
+        self._order_lookups = 0
+        self._reconnects = 0
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    async def start(self) -> None:
+        """Start the user channel (if usable) and the bulk sync loop."""
+        if self._running:
+            return
+        self._running = True
+        self._sync_cursor = time.time()
+
+        if self.use_user_channel:
+            if not WEBSOCKETS_AVAILABLE:
+                logger.info("[OrderStream] websockets not installed - using bulk sync only")
+            elif not getattr(self.client, "api_creds", None):
+                logger.info("[OrderStream] No API credentials for user channel - bulk sync only")
+            else:
+                self._push_task = asyncio.create_task(self._run_user_channel())
+
+        self._sync_task = asyncio.create_task(self._sync_loop())
+        logger.info(
+            f"[OrderStream] Started (push: {self._push_task is not None}, "
+            f"sync every {self.sync_interval:g}s)"
+        )
+
+    async def stop(self) -> None:
+        """Stop both sources."""
+        self._running = False
+        for task in (self._push_task, self._sync_task):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._push_task = self._sync_task = None
+        self._push_connected = False
+
+    @property
+    def push_connected(self) -> bool:
+        """True while the user channel is connected."""
+        return self._push_connected
+
+    # =========================================================================
+    # User channel
+    # =========================================================================
+
+    def _auth_message(self) -> Dict[str, Any]:
+        creds = self.client.api_creds
+        return {
+            "type": "user",
+            "auth": {
+                "apiKey": creds.api_key,
+                "secret": creds.api_secret,
+                "passphrase": creds.api_passphrase,
+            },
+            "markets": [],
+        }
+
+    async def _run_user_channel(self) -> None:
+        """Connect, authenticate and consume events; reconnect with backoff."""
+        attempt = 0
+        while self._running:
+            try:
+                async with websockets.connect(self.url, ping_interval=30, ping_timeout=10) as ws:
+                    await ws.send(json.dumps(self._auth_message()))
+                    self._push_connected = True
+                    attempt = 0
+                    self._wake.set()  # Catch up on anything missed while disconnected
+                    logger.info("[OrderStream] User channel connected")
+                    async for message in ws:
+                        await self.handle_message(message)
+            except asyncio.CancelledError:
+                raise
+            except (OSError, asyncio.TimeoutError, websockets.exceptions.WebSocketException) as e:
+                logger.warning(f"[OrderStream] User channel error: {e}")
+            finally:
+                if self._push_connected:
+                    self._push_connected = False
+                    self._wake.set()  # Resume fast bulk sync right away
+
+            if not self._running:
+                break
+            attempt += 1
+            self._reconnects += 1
+            wait = min(self.reconnect_interval * (2 ** (attempt - 1)), 60.0)
+            await asyncio.sleep(wait + random.uniform(0, wait * 0.25))
+
+    async def handle_message(self, message: str) -> None:
+        """Apply one user-channel frame (an event or a JSON array of events)."""
+        try:
+            data = json.loads(message)
+        except json.JSONDecodeError:
+            return  # PONG and other non-JSON control frames
+        for event in data if isinstance(data, list) else (data,):
+            if not isinstance(event, dict):
+                continue
+            self._push_events += 1
+            event_type = str(event.get("event_type") or event.get("type") or "").lower()
+            # One bad event must not end the user channel's receive loop
+            try:
+                if event_type == "trade":
+                    await self._apply_trade(event, "push")
+                elif event_type == "order":
+                    await self._apply_order_event(event)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._push_errors += 1
+                logger.warning(f"[OrderStream] Failed to apply {event_type} event: {e!r}")
+
+    async def _apply_order_event(self, event: Dict[str, Any]) -> None:
+        if str(event.get("type", "")).upper() == "CANCELLATION" and event.get("id"):
+            await self.order_manager.apply_exchange_update(event["id"], {"status": "canceled"})
+
+    # =========================================================================
+    # Bulk sync
+    # =========================================================================
+
+    async def _sync_loop(self) -> None:
+        while self._running:
+            self._wake.clear()
+            try:
+                await self.sync()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"[OrderStream] Sync failed: {e}")
+
+            interval = self.resync_interval if self._push_connected else self.sync_interval
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def sync(self) -> Dict[str, int]:
+        """
+        One bulk sync: fills since the cursor, then open orders.
+
+        Returns:
+            Fills applied and orders found closed
+        """
+        self._syncs += 1
+        result = {"fills": 0, "closed": 0}
+
+        since = int(self._sync_cursor) - _CURSOR_OVERLAP
+        for trade in await self.client.get_fills(since=since, limit=_SYNC_FILL_LIMIT):
+            result["fills"] += await self._apply_trade(trade, "sync")
+            matched_at = self._trade_time(trade)
+            if matched_at is not None:
+                self._sync_cursor = max(self._sync_cursor, matched_at)
+
+        tracked = await self.order_manager.order_book.get_by_status(
+            OrderStatus.OPEN, OrderStatus.PARTIALLY_FILLED
+        )
+        if not tracked:
+            return result
+
+        open_ids = {o.get("id") or o.get("order_id") for o in await self.client.get_open_orders()}
+        settled = datetime.now() - timedelta(seconds=_VANISH_GRACE)
+        gone = [
+            order
+            for order in tracked
+            if order.order_id
+            and order.order_id not in open_ids
+            and (order.submitted_at is None or order.submitted_at <= settled)
+        ]
+
+        # No longer open on the exchange: ask for the final status of each
+        for order in gone[:_MAX_VANISHED_CHECKS]:
+            self._order_lookups += 1
+            data = await self.client.get_order(order.order_id)
+            if data:
+                await self.order_manager.apply_exchange_update(order.order_id, data)
+                if order.is_terminal:
+                    result["closed"] += 1
+        return result
+
+    # =========================================================================
+    # Trades
+    # =========================================================================
+
+    @staticmethod
+    def _trade_legs(trade: Dict[str, Any]) -> Iterable[Tuple[Any, Any, Any]]:
+        """(order_id, size, price) for the taker and each maker order in a trade."""
+        taker = trade.get("taker_order_id") or trade.get("order_id")
+        if taker:
+            yield taker, trade.get("size"), trade.get("price")
+        for maker in trade.get("maker_orders") or []:
+            if isinstance(maker, dict):
+                yield maker.get("order_id"), maker.get("matched_amount"), maker.get("price")
+
+    async def _apply_trade(self, trade: Dict[str, Any], source: str) -> int:
+        """Apply the legs of a trade that belong to our active orders; returns fills applied."""
+        if str(trade.get("status", "")).upper() == "FAILED":
+            logger.warning(f"[OrderStream] Trade {trade.get('id')} failed on-chain")
+            return 0
+
+        matched_at = self._trade_time(trade)
+        trade_id = str(trade.get("id") or trade.get("trade_id") or "")
+        applied = 0
+        for order_id, size, price in self._trade_legs(trade):
+            key = f"{trade_id or matched_at}:{order_id}:{size}"
+            if not order_id or key in self._seen:
+                continue
+            # Claim the leg before awaiting, so a push and a sync delivering
+            # the same trade concurrently cannot both apply it
+            self._remember(key)
+            order = await self.order_manager.get_order(order_id)
+            if order is None or not order.is_active:
+                self._seen.pop(key, None)  # Not ours (yet): a later sync may apply it
+                continue
+            try:
+                fill_size, fill_price = float(size), float(price)
+            except (TypeError, ValueError):
+                logger.debug(f"[OrderStream] Unparseable fill for {order_id}: {size}@{price}")
+                continue
+
+            await self.order_manager.process_fill(
+                order_id, fill_size, fill_price, fill_id=trade_id or None
+            )
+            applied += 1
+            self._fills[source] += 1
+            if matched_at is not None:
+                record_latency(f"fill_{source}", max(0.0, time.time() - matched_at))
+        return applied
+
+    @staticmethod
+    def _trade_time(trade: Dict[str, Any]) -> Optional[float]:
+        raw = trade.get("match_time") or trade.get("timestamp") or trade.get("last_update")
+        try:
+            ts = float(raw)
+        except (TypeError, ValueError):
+            return None
+        return ts / 1000 if ts > 1e12 else ts
+
+    def _remember(self, key: str) -> None:
+        self._seen[key] = None
+        if len(self._seen) > _SEEN_TRADES:
+            self._seen.popitem(last=False)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Get stream statistics."""
+        return {
+            "push_connected": self._push_connected,
+            "push_events": self._push_events,
+            "push_errors": self._push_errors,
+            "fills_push": self._fills["push"],
+            "fills_sync": self._fills["sync"],
+            "syncs": self._syncs,
+            "order_lookups": self._order_lookups,
+            "reconnects": self._reconnects,
+        }
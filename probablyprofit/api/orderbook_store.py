@@ -0,0 +1,329 @@
+"""
+Local L2 Orderbook Replica
+
+Maintains an in-process copy of each subscribed orderbook from WebSocket
+OrderbookUpdate messages, so pricing and execution code can read the book
+without a REST round trip. Books that stop receiving updates are treated as
+stale and re-synced from REST on the next read.
+"""
+
+import time
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from loguru import logger
+
+from probablyprofit.config import get_config
+
+BookKey = Tuple[str, str]  # (market_id, outcome)
+
+
+class BookSide:
+    """
+    One side of an L2 book: price levels kept sorted by price.
+
+    Prices are stored ascending; `descending=True` (bids) makes the highest
+    price the best level. Best level lookups and size-at-price are O(1), and
+    so are size updates at an existing level. Adding or removing a level is
+    O(n), since the sorted price list shifts; n is small here, as prices sit
+    on a 0.01 tick. Cumulative-size and price-for-size queries are O(log n)
+    against prefix sums, which are rebuilt in O(n) on the first query after
+    the side changes.
+    """
+
+    def __init__(self, descending: bool):
+        self.descending = descending
+        self._prices: List[float] = []
+        self._sizes: Dict[float, float] = {}
+        self._prefix: Optional[List[float]] = None  # _prefix[i] = sum of sizes below index i
+
+    def replace(self, levels: Iterable[Tuple[float, float]]) -> None:
+        """Replace every level with a full snapshot."""
+        self._sizes = {price: size for price, size in levels if size > 0}
+        self._prices = sorted(self._sizes)
+        self._prefix = None
+
+    def apply(self, price: float, size: float) -> None:
+        """Set the size at a price level (size <= 0 removes the level)."""
+        if size <= 0:
+            if self._sizes.pop(price, None) is not None:
+                del self._prices[bisect_left(self._prices, price)]
+        else:
+            if price not in self._sizes:
+                insort(self._prices, price)
+            self._sizes[price] = size
+        self._prefix = None
+
+    def _prefix_sums(self) -> List[float]:
+        if self._prefix is None:
+            prefix = [0.0]
+            total = 0.0
+            for price in self._prices:
+                total += self._sizes[price]
+                prefix.append(total)
+            self._prefix = prefix
+        return self._prefix
+
+    @property
+    def best(self) -> Optional[Tuple[float, float]]:
+        """Best (price, size), or None if the side is empty."""
+        if not self._prices:
+            return None
+        price = self._prices[-1] if self.descending else self._prices[0]
+        return price, self._sizes[price]
+
+    def size_at(self, price: float) -> float:
+        """Resting size at exactly this price."""
+        return self._sizes.get(price, 0.0)
+
+    def cumulative_size(self, limit_price: float) -> float:
+        """Total size at prices at or better than limit_price."""
+        prefix = self._prefix_sums()
+        if self.descending:
+            return prefix[-1] - prefix[bisect_left(self._prices, limit_price)]
+        return prefix[bisect_right(self._prices, limit_price)]
+
+    def price_for_size(self, size: float) -> Optional[float]:
+        """Worst price reached when taking `size` from the best level inward."""
+        prefix = self._prefix_sums()
+        total = prefix[-1]
+        if size <= 0 or size > total:
+            return None
+        if self.descending:
+            return self._prices[bisect_right(prefix, total - size) - 1]
+        return self._prices[bisect_left(prefix, size) - 1]
+
+    def levels(self, depth: Optional[int] = None) -> List[Tuple[float, float]]:
+        """Levels best-first, optionally truncated to `depth`."""
+        prices = reversed(self._prices) if self.descending else iter(self._prices)
+        result = []
+        for price in prices:
+            if depth is not None and len(result) >= depth:
+                break
+            result.append((price, self._sizes[price]))
+        return result
+
+    @property
+    def total_size(self) -> float:
+        """Total resting size on this side."""
+        return self._prefix_sums()[-1]
+
+    def __len__(self) -> int:
+        return len(self._prices)
+
+
+class LocalOrderBook:
+    """L2 book for a single market outcome."""
+
+    def __init__(self, market_id: str, outcome: str):
+        self.market_id = market_id
+        self.outcome = outcome
+        self.bids = BookSide(descending=True)
+        self.asks = BookSide(descending=False)
+        self.updated_at = 0.0  # time.monotonic() of the last snapshot or delta
+        self.updates = 0
+        self.invalidated = False
+
+    def replace(
+        self,
+        bids: Iterable[Tuple[float, float]],
+        asks: Iterable[Tuple[float, float]],
+    ) -> None:
+        """Replace the whole book with a snapshot."""
+        self.bids.replace(bids)
+        self.asks.replace(asks)
+        self._touch()
+
+    def apply(self, side: str, price: float, size: float) -> None:
+        """Apply a single level change ("BUY"/"bid" or "SELL"/"ask")."""
+        book_side = self.bids if side.upper() in ("BUY", "BID", "BIDS") else self.asks
+        book_side.apply(price, size)
+        self._touch()
+
+    def _touch(self) -> None:
+        self.updated_at = time.monotonic()
+        self.updates += 1
+        self.invalidated = False
+
+    def age(self) -> float:
+        """Seconds since the last update."""
+        return time.monotonic() - self.updated_at
+
+    @property
+    def best_bid(self) -> Optional[float]:
+        best = self.bids.best
+        return best[0] if best else None
+
+    @property
+    def best_ask(self) -> Optional[float]:
+        best = self.asks.best
+        return best[0] if best else None
+
+    @property
+    def spread(self) -> Optional[float]:
+        """Best ask minus best bid, or None if either side is empty."""
+        bid, ask = self.best_bid, self.best_ask
+        if bid is None or ask is None:
+            return None
+        return ask - bid
+
+    @property
+    def mid(self) -> Optional[float]:
+        bid, ask = self.best_bid, self.best_ask
+        if bid is None or ask is None:
+            return None
+        return (bid + ask) / 2
+
+    def to_dict(self, depth: Optional[int] = None) -> Dict[str, Any]:
+        """Book in the same shape as the REST orderbook response."""
+        return {
+            "bids": [{"price": str(p), "size": str(s)} for p, s in self.bids.levels(depth)],
+            "asks": [{"price": str(p), "size": str(s)} for p, s in self.asks.levels(depth)],
+        }
+
+
+def _parse_levels(levels: Iterable[Any]) -> List[Tuple[float, float]]:
+    """Parse REST/WebSocket levels given as dicts or (price, size) pairs."""
+    parsed = []
+    for level in levels or []:
+        if isinstance(level, dict):
+            parsed.append((float(level["price"]), float(level["size"])))
+        else:
+            price, size = level[0], level[1]
+            parsed.append((float(price), float(size)))
+    return parsed
+
+
+class OrderbookStore:
+    """
+    In-process store of L2 books fed by the WebSocket orderbook channel.
+
+    A book is fresh while it has been updated within `max_age` seconds and
+    the feed has not disconnected since. Stale books are re-synced from REST
+    through the attached PolymarketClient.
+
+    Usage:
+        store = OrderbookStore(max_age=5.0)
+        store.attach(ws)
+        client.attach_orderbook_store(store)
+
+        book = await client.get_orderbook(market_id, "Yes")  # served locally when fresh
+    """
+
+    def __init__(self, client: Any = None, max_age: Optional[float] = None):
+        """
+        Initialize store.
+
+        Args:
+            client: Optional PolymarketClient used for REST resyncs
+            max_age: Seconds without an update before a book is stale (defaults to config)
+        """
+        self.client = client
+        self.max_age = max_age if max_age is not None else get_config().api.orderbook_max_age
+        self._books: Dict[BookKey, LocalOrderBook] = {}
+
+        # Statistics
+        self._hits = 0
+        self._misses = 0
+        self._ws_updates = 0
+        self._resyncs = 0
+
+    def attach(self, ws: Any) -> None:
+        """Feed the store from a WebSocketClient's orderbook updates."""
+        ws.on_orderbook_update(self.apply_update)
+        ws.on_disconnect(self.invalidate_all)
+
+    def apply_update(self, update: Any) -> LocalOrderBook:
+        """Apply a WebSocket OrderbookUpdate as a full snapshot."""
+        book = self._book(update.market_id, update.outcome)
+        book.replace(update.bids, update.asks)
+        self._ws_updates += 1
+        return book
+
+    def load_snapshot(self, market_id: str, outcome: str, data: Dict[str, Any]) -> LocalOrderBook:
+        """Load a REST orderbook response into the store."""
+        book = self._book(market_id, outcome)
+        book.replace(_parse_levels(data.get("bids", [])), _parse_levels(data.get("asks", [])))
+        self._resyncs += 1
+        return book
+
+    def _book(self, market_id: str, outcome: str) -> LocalOrderBook:
+        key = (market_id, outcome)
+        book = self._books.get(key)
+        if book is None:
+            book = LocalOrderBook(market_id, outcome)
+            self._books[key] = book
+        return book
+
+    def is_fresh(self, book: LocalOrderBook) -> bool:
+        """True if the book can be served without a REST resync."""
+        return not book.invalidated and book.updates > 0 and book.age() <= self.max_age
+
+    def get(self, market_id: str, outcome: str) -> Optional[LocalOrderBook]:
+        """Get a book regardless of freshness."""
+        return self._books.get((market_id, outcome))
+
+    def get_fresh(self, market_id: str, outcome: str) -> Optional[LocalOrderBook]:
+        """Get a book only if it is fresh; counts as a replica hit or miss."""
+        book = self._books.get((market_id, outcome))
+        if book is not None and self.is_fresh(book):
+            self._hits += 1
+            return book
+        self._misses += 1
+        return None
+
+    def invalidate(self, market_id: str, outcome: str) -> None:
+        """Force the next read of this book to resync from REST."""
+        book = self._books.get((market_id, outcome))
+        if book is not None:
+            book.invalidated = True
+
+    def invalidate_all(self) -> None:
+        """Mark every book stale (e.g. after the feed disconnects)."""
+        for book in self._books.values():
+            book.invalidated = True
+        if self._books:
+            logger.debug(f"[OrderbookStore] Invalidated {len(self._books)} book(s)")
+
+    def stale_keys(self) -> List[BookKey]:
+        """Keys of every book that needs a resync."""
+        return [key for key, book in self._books.items() if not self.is_fresh(book)]
+
+    async def resync(self, market_id: str, outcome: str) -> Optional[LocalOrderBook]:
+        """Re-fetch one book from REST."""
+        if not self.client:
+            raise ValueError("OrderbookStore.resync() requires a client")
+        self.invalidate(market_id, outcome)
+        await self.client.get_orderbook(market_id, outcome)
+        return self.get(market_id, outcome)
+
+    async def resync_stale(self, concurrency: int = 5) -> int:
+        """Re-fetch every stale book from REST; returns the number re-fetched."""
+        if not self.client:
+            raise ValueError("OrderbookStore.resync_stale() requires a client")
+        stale = self.stale_keys()
+        if stale:
+            await self.client.get_orderbooks_batch(stale, concurrency=concurrency)
+        return len(stale)
+
+    def remove(self, market_id: str, outcome: str) -> None:
+        """Drop a book (e.g. after unsubscribing)."""
+        self._books.pop((market_id, outcome), None)
+
+    def __len__(self) -> int:
+        return len(self._books)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Get store statistics."""
+        reads = self._hits + self._misses
+        return {
+            "books": len(self._books),
+            "stale_books": len(self.stale_keys()),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / reads if reads > 0 else 0.0,
+            "ws_updates": self._ws_updates,
+            "resyncs": self._resyncs,
+            "max_age": self.max_age,
+        }
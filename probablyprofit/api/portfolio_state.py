@@ -0,0 +1,357 @@
+"""
+Write-Through Portfolio State
+
+Keeps positions and USDC balance in memory and applies fills locally, so
+get_positions()/get_balance() are served without a CLOB or Polygon RPC
+round trip. The exchange stays the source of truth: state is reconciled
+in the background on a slow interval, right after order events whose
+fills we cannot see, and sooner when local and exchange state drift.
+
+Fills are counted once by ID. Each reconcile also lists the exchange's
+recent fills: those are already in the fetched snapshot, so a local fill
+event for one arriving later is skipped, and local fills applied while the
+fetch was in flight are re-applied on top of it unless it included them.
+A reconcile that cannot read the exchange keeps the previous snapshot.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import httpx
+from loguru import logger
+
+from probablyprofit.api.client import Position
+from probablyprofit.api.exceptions import APIException
+from probablyprofit.config import get_config
+from probablyprofit.utils.cache import SingleFlight
+
+PositionKey = Tuple[str, str]  # (market_id, outcome)
+
+# Arguments of apply_fill after fill_id: market_id, outcome, side, size, price, fee
+FillArgs = Tuple[str, str, str, float, float, float]
+
+# Sizes below this are treated as a closed position
+_DUST = 1e-9
+# Seconds to serve the previous snapshot after a failed reconcile before retrying
+_RETRY_AFTER = 5.0
+# Exchange fills this many seconds older than a reconcile are checked against local fills
+_FILL_LOOKBACK = 60.0
+# Max exchange fills listed per reconcile
+_FILL_LIMIT = 500
+# Fill IDs remembered for deduplication
+_SEEN_FILLS = 10_000
+
+
+class PortfolioState:
+    """
+    In-process positions and balance, updated by fills.
+
+    Usage:
+        state = PortfolioState(client)
+        client.attach_portfolio_state(state)
+        state.attach(order_manager)  # Optional: apply OrderManager fills locally
+
+        positions = await client.get_positions()  # Served from memory once synced
+    """
+
+    def __init__(
+        self,
+        client: Any = None,
+        reconcile_interval: Optional[float] = None,
+        drift_tolerance: float = 0.01,
+    ):
+        """
+        Initialize state.
+
+        Args:
+            client: PolymarketClient used to reconcile with the exchange
+            reconcile_interval: Seconds between background reconciles (defaults to config)
+            drift_tolerance: Balance/size difference (USDC/shares) that counts as drift
+        """
+        self.client = client
+        self.reconcile_interval = (
+            reconcile_interval
+            if reconcile_interval is not None
+            else get_config().api.portfolio_reconcile_interval
+        )
+        self.drift_tolerance = drift_tolerance
+
+        self._positions: Dict[PositionKey, Position] = {}
+        self._balance = 0.0
+        self._synced = False
+        self._stale = False
+        self._next_reconcile = 0.0  # time.monotonic() deadline
+        self._retry_at = 0.0  # No blocking reconcile before this (after a failure)
+        self._flight = SingleFlight("portfolio")
+        self._background: Optional["asyncio.Task[None]"] = None
+        self._rerun = False  # Reconcile again once the in-flight background one ends
+
+        # Fill IDs counted in the current state
+        self._applied: "OrderedDict[str, None]" = OrderedDict()
+        # Fills applied while a reconcile fetch is in flight (None when idle)
+        self._in_flight: Optional[List[Tuple[Optional[str], FillArgs]]] = None
+
+        # Statistics
+        self._reads = 0
+        self._fills_applied = 0
+        self._fills_skipped = 0
+        self._reconciles = 0
+        self._reconcile_failures = 0
+        self._drifts = 0
+
+    def attach(self, order_manager: Any) -> None:
+        """Apply an OrderManager's fills to the local state (inline, before process_fill returns)."""
+        order_manager.on_fill(self._on_order_fill, inline=True)
+
+    def _on_order_fill(self, order: Any, fill: Any) -> None:
+        self.apply_fill(
+            order.market_id,
+            order.outcome,
+            order.side.value,
+            fill.size,
+            fill.price,
+            fill.fee,
+            fill_id=fill.fill_id,
+        )
+
+    # =========================================================================
+    # Local updates
+    # =========================================================================
+
+    def apply_fill(
+        self,
+        market_id: str,
+        outcome: str,
+        side: str,
+        size: float,
+        price: float,
+        fee: float = 0.0,
+        fill_id: Optional[str] = None,
+    ) -> Optional[Position]:
+        """
+        Apply a fill to positions and cash.
+
+        Args:
+            fill_id: Exchange fill/trade ID; a fill already counted (applied
+                before, or included in the last reconciled snapshot) is skipped
+
+        Returns:
+            Updated position, or None if the fill closed it
+        """
+        if fill_id is not None:
+            if fill_id in self._applied:
+                self._fills_skipped += 1
+                return self._positions.get((market_id, outcome))
+            self._remember(fill_id)
+        args: FillArgs = (market_id, outcome, side, size, price, fee)
+        if self._in_flight is not None:
+            self._in_flight.append((fill_id, args))
+        self._fills_applied += 1
+        return self._apply(*args)
+
+    def _apply(
+        self, market_id: str, outcome: str, side: str, size: float, price: float, fee: float
+    ) -> Optional[Position]:
+        key = (market_id, outcome)
+        position = self._positions.get(key)
+
+        if side.upper() == "BUY":
+            self._balance -= size * price + fee
+            if position is None:
+                position = Position(
+                    market_id=market_id,
+                    outcome=outcome,
+                    size=0.0,
+                    avg_price=price,
+                    current_price=price,
+                )
+                self._positions[key] = position
+            new_size = position.size + size
+            position.avg_price = (position.size * position.avg_price + size * price) / new_size
+            position.size = new_size
+        else:
+            self._balance += size * price - fee
+            if position is None or position.size + _DUST < size:
+                # Selling more than we hold: local state is missing something
+                logger.warning(
+                    f"[PortfolioState] SELL {size} of {market_id}:{outcome} exceeds "
+                    f"local position; reconciling"
+                )
+                self._stale = True
+                if position is None:
+                    return None
+            position.size -= size
+
+        position.current_price = price
+        position.pnl = position.size * (position.current_price - position.avg_price)
+
+        if position.size <= _DUST:
+            del self._positions[key]
+            return None
+        if self._balance < -self.drift_tolerance:
+            self._stale = True
+        return position
+
+    def update_price(self, market_id: str, outcome: str, price: float) -> None:
+        """Mark a position to a new price."""
+        position = self._positions.get((market_id, outcome))
+        if position is not None:
+            position.current_price = price
+            position.pnl = position.size * (price - position.avg_price)
+
+    def _remember(self, fill_id: str) -> None:
+        self._applied[fill_id] = None
+        if len(self._applied) > _SEEN_FILLS:
+            self._applied.popitem(last=False)
+
+    def mark_stale(self) -> None:
+        """
+        Reconcile in the background (e.g. after an order whose fills are unseen).
+
+        Reads keep being served from memory meanwhile. If a reconcile is
+        already running, another one follows it, since its fetch may predate
+        the order.
+        """
+        if self._background is not None and not self._background.done():
+            self._rerun = True
+            return
+        self._reconcile_in_background()
+
+    # =========================================================================
+    # Reads
+    # =========================================================================
+
+    async def _ensure_current(self) -> None:
+        self._reads += 1
+        now = time.monotonic()
+        if (not self._synced or self._stale) and now >= self._retry_at:
+            await self.reconcile()
+        elif now >= self._next_reconcile:
+            self._reconcile_in_background()
+
+    async def get_positions(self) -> List[Position]:
+        """Current positions (reconciles first only if never synced or inconsistent)."""
+        await self._ensure_current()
+        return [position.model_copy() for position in self._positions.values()]
+
+    async def get_balance(self) -> float:
+        """Current USDC balance (reconciles first only if never synced or inconsistent)."""
+        await self._ensure_current()
+        return self._balance
+
+    # =========================================================================
+    # Reconciliation
+    # =========================================================================
+
+    def _reconcile_in_background(self) -> None:
+        if self._background is not None and not self._background.done():
+            return
+        self._background = asyncio.ensure_future(self._reconcile_until_current())
+        self._background.add_done_callback(self._log_background_failure)
+
+    async def _reconcile_until_current(self) -> None:
+        while True:
+            self._rerun = False
+            await self.reconcile()
+            if not self._rerun:
+                return
+
+    @staticmethod
+    def _log_background_failure(task: "asyncio.Task[None]") -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"[PortfolioState] Background reconcile failed: {task.exception()}")
+
+    async def reconcile(self) -> None:
+        """Replace local state with the exchange's (concurrent calls share one fetch)."""
+        await self._flight.do("reconcile", self._reconcile)
+
+    async def _reconcile(self) -> None:
+        if not self.client:
+            raise ValueError("PortfolioState.reconcile() requires a client")
+
+        was_stale, self._stale = self._stale, False
+        started = time.time()
+        self._in_flight = []
+        try:
+            positions, balance, included = await asyncio.gather(
+                self.client.fetch_positions(strict=True),
+                self.client.fetch_balance(strict=True),
+                self._recent_fill_ids(started - _FILL_LOOKBACK),
+            )
+        except (APIException, httpx.HTTPError) as e:
+            self._stale = self._stale or was_stale
+            self._reconcile_failures += 1
+            self._retry_at = self._next_reconcile = time.monotonic() + _RETRY_AFTER
+            logger.warning(f"[PortfolioState] Reconcile failed, keeping previous snapshot: {e}")
+            return
+        finally:
+            in_flight, self._in_flight = self._in_flight, None
+
+        local_positions, local_balance = self._positions, self._balance
+        self._positions = {(p.market_id, p.outcome): p for p in positions}
+        self._balance = balance
+
+        # Local fills the snapshot may not reflect yet stay applied on top of it
+        for fill_id, args in in_flight:
+            if fill_id is not None and fill_id not in included:
+                self._apply(*args)
+        for fill_id in included:
+            self._remember(fill_id)
+
+        drifted = self._synced and self._drift(local_positions, local_balance)
+        if drifted:
+            self._drifts += 1
+
+        self._synced = True
+        self._reconciles += 1
+
+        # Drift means fills are reaching the exchange without reaching us; look again sooner
+        interval = self.reconcile_interval / 4 if drifted else self.reconcile_interval
+        self._next_reconcile = time.monotonic() + interval
+
+    async def _recent_fill_ids(self, since: float) -> Set[str]:
+        """IDs of the exchange's fills since `since` (already reflected in its positions)."""
+        get_fills = getattr(self.client, "get_fills", None)
+        if get_fills is None:
+            return set()
+        try:
+            fills = await get_fills(since=int(since), limit=_FILL_LIMIT)
+        except (APIException, httpx.HTTPError) as e:
+            logger.debug(f"[PortfolioState] Could not list recent fills: {e}")
+            return set()
+        return {
+            str(f.get("id") or f.get("trade_id")) for f in fills if f.get("id") or f.get("trade_id")
+        }
+
+    def _drift(self, local: Dict[PositionKey, Position], local_balance: float) -> bool:
+        """Compare the state before a reconcile with the reconciled state."""
+        reasons = []
+        remote, balance = self._positions, self._balance
+        if abs(balance - local_balance) > self.drift_tolerance:
+            reasons.append(f"balance {local_balance:.2f} vs {balance:.2f}")
+        for key in local.keys() | remote.keys():
+            local_size = local[key].size if key in local else 0.0
+            remote_size = remote[key].size if key in remote else 0.0
+            if abs(local_size - remote_size) > self.drift_tolerance:
+                reasons.append(f"{key[0]}:{key[1]} {local_size:g} vs {remote_size:g}")
+        if reasons:
+            logger.warning(f"[PortfolioState] Drift from exchange: {'; '.join(reasons[:5])}")
+        return bool(reasons)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Get state statistics."""
+        return {
+            "positions": len(self._positions),
+            "balance": self._balance,
+            "synced": self._synced,
+            "reads": self._reads,
+            "fills_applied": self._fills_applied,
+            "fills_skipped": self._fills_skipped,
+            "reconciles": self._reconciles,
+            "reconcile_failures": self._reconcile_failures,
+            "drifts": self._drifts,
+            "reconcile_interval": self.reconcile_interval,
+        }
@@ -13,6 +13,7 @@ Features automatic reconnection with exponential backoff and jitter.
 import asyncio
 import json
 import random
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -20,6 +21,10 @@ from typing import Any, Callable, Dict, List, Optional, Set
 
 from loguru import logger
 
+from probablyprofit.api.ws_dispatch import UpdateDispatcher
+from probablyprofit.config import get_config
+from probablyprofit.utils.metrics import record_latency
+
 
 class ConnectionState(Enum):
     """WebSocket connection states."""
@@ -42,6 +47,17 @@ except ImportError:
     websockets = None  # type: ignore[assignment]
     logger.warning("websockets package not installed. Real-time streaming disabled.")
 
+# Optional faster JSON backend for the lean parse path
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Converts time.monotonic() receipt stamps to wall-clock time on demand
+_WALL_CLOCK_OFFSET = time.time() - time.monotonic()
+
 
 @dataclass
 class PriceUpdate:
@@ -65,6 +81,118 @@ class OrderbookUpdate:
     asks: List[tuple]
     timestamp: datetime
 
+    @property
+    def best_bid(self) -> Optional[float]:
+        return max((level[0] for level in self.bids), default=None)
+
+    @property
+    def best_ask(self) -> Optional[float]:
+        return min((level[0] for level in self.asks), default=None)
+
+
+class PriceTick:
+    """
+    Compact price update produced by the lean parse path.
+
+    Same attributes as PriceUpdate, but slotted, stamped with time.monotonic()
+    at receipt, and holding the decoded payload only when keep_raw is set.
+    """
+
+    __slots__ = ("market_id", "outcome", "price", "volume", "received", "raw")
+
+    def __init__(
+        self,
+        market_id: str,
+        outcome: str,
+        price: float,
+        volume: float,
+        received: float,
+        raw: Optional[Dict[str, Any]] = None,
+    ):
+        self.market_id = market_id
+        self.outcome = outcome
+        self.price = price
+        self.volume = volume
+        self.received = received
+        self.raw = raw
+
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.fromtimestamp(_WALL_CLOCK_OFFSET + self.received)
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        return self.raw if self.raw is not None else {}
+
+    def __repr__(self) -> str:
+        return f"PriceTick({self.market_id}:{self.outcome} {self.price} vol={self.volume})"
+
+
+class BookTick:
+    """
+    Compact orderbook update produced by the lean parse path.
+
+    Levels are stored as flat price and size lists; `bids`/`asks` build
+    OrderbookUpdate-style (price, size) tuples only when accessed.
+    """
+
+    __slots__ = (
+        "market_id",
+        "outcome",
+        "bid_prices",
+        "bid_sizes",
+        "ask_prices",
+        "ask_sizes",
+        "received",
+        "raw",
+    )
+
+    def __init__(
+        self,
+        market_id: str,
+        outcome: str,
+        bid_prices: List[float],
+        bid_sizes: List[float],
+        ask_prices: List[float],
+        ask_sizes: List[float],
+        received: float,
+        raw: Optional[Dict[str, Any]] = None,
+    ):
+        self.market_id = market_id
+        self.outcome = outcome
+        self.bid_prices = bid_prices
+        self.bid_sizes = bid_sizes
+        self.ask_prices = ask_prices
+        self.ask_sizes = ask_sizes
+        self.received = received
+        self.raw = raw
+
+    @property
+    def bids(self) -> List[tuple]:
+        return list(zip(self.bid_prices, self.bid_sizes))
+
+    @property
+    def asks(self) -> List[tuple]:
+        return list(zip(self.ask_prices, self.ask_sizes))
+
+    @property
+    def best_bid(self) -> Optional[float]:
+        return max(self.bid_prices, default=None)
+
+    @property
+    def best_ask(self) -> Optional[float]:
+        return min(self.ask_prices, default=None)
+
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.fromtimestamp(_WALL_CLOCK_OFFSET + self.received)
+
+    def __repr__(self) -> str:
+        return (
+            f"BookTick({self.market_id}:{self.outcome} "
+            f"{len(self.bid_prices)} bids/{len(self.ask_prices)} asks)"
+        )
+
 
 class WebSocketClient:
     """
@@ -75,6 +203,9 @@ class WebSocketClient:
     - Subscription management
     - Price and orderbook streaming
     - Callback-based event handling
+    - Conflated dispatch: while connected, each callback runs on its own task
+      and sees only the latest update per market, so slow callbacks never
+      hold up the receive loop
 
     Usage:
         ws = WebSocketClient()
@@ -96,6 +227,13 @@ class WebSocketClient:
         reconnect: bool = True,
         reconnect_interval: float = 5.0,
         max_reconnect_attempts: int = 10,
+        conflate: Optional[bool] = None,
+        resubscribe_batch: Optional[int] = None,
+        resubscribe_stagger: Optional[float] = None,
+        lean_parse: Optional[bool] = None,
+        keep_raw: bool = False,
+        latency_tracing: Optional[bool] = None,
+        latency_sample_every: Optional[int] = None,
     ):
         """
         Initialize WebSocket client.
@@ -105,6 +243,17 @@ class WebSocketClient:
             reconnect: Auto-reconnect on disconnect
             reconnect_interval: Seconds between reconnect attempts
             max_reconnect_attempts: Max reconnection attempts
+            conflate: Dispatch through per-market conflating consumers (defaults
+                to config.api.websocket_conflate); False awaits callbacks inline
+            resubscribe_batch: Markets resubscribed per batch after a reconnect
+            resubscribe_stagger: Seconds between resubscription batches
+            lean_parse: Deliver compact PriceTick/BookTick objects instead of
+                PriceUpdate/OrderbookUpdate (defaults to config.api.websocket_lean_parse)
+            keep_raw: In lean mode, keep each event's decoded payload as `raw`
+            latency_tracing: Export per-message stage latencies to pp_latency_seconds
+                (defaults to config.api.websocket_latency_tracing)
+            latency_sample_every: Trace one frame (and one conflated delivery) in
+                this many (defaults to config.api.websocket_latency_sample_every)
         """
         if not WEBSOCKETS_AVAILABLE:
             raise ImportError("websockets package required. Install with: pip install websockets")
@@ -113,6 +262,22 @@ class WebSocketClient:
         self.reconnect = reconnect
         self.reconnect_interval = reconnect_interval
         self.max_reconnect_attempts = max_reconnect_attempts
+        api_cfg = get_config().api
+        self.conflate = conflate if conflate is not None else api_cfg.websocket_conflate
+        self.resubscribe_batch = resubscribe_batch or api_cfg.websocket_resubscribe_batch
+        self.lean_parse = lean_parse if lean_parse is not None else api_cfg.websocket_lean_parse
+        self.keep_raw = keep_raw
+        self.latency_tracing = (
+            latency_tracing if latency_tracing is not None else api_cfg.websocket_latency_tracing
+        )
+        self.latency_sample_every = max(
+            1, latency_sample_every or api_cfg.websocket_latency_sample_every
+        )
+        self.resubscribe_stagger = (
+            resubscribe_stagger
+            if resubscribe_stagger is not None
+            else api_cfg.websocket_resubscribe_stagger
+        )
 
         self._ws: Optional[WebSocketClientProtocol] = None
         self._subscriptions: Set[str] = set()
@@ -129,11 +294,21 @@ class WebSocketClient:
         self._connect_callbacks: List[Callable[[], Any]] = []
         self._disconnect_callbacks: List[Callable[[], Any]] = []
 
+        # Consumer tasks for conflated dispatch (live while connected)
+        self._dispatcher: Optional[UpdateDispatcher] = None
+
+        # Optional raw frame recorder (see ws_recorder.FrameRecorder)
+        self._recorder: Optional[Any] = None
+
         # Statistics
         self._messages_received = 0
         self._last_message_time: Optional[datetime] = None
         self._connected_at: Optional[datetime] = None
         self._total_reconnects = 0
+        self._message_rate = 0.0  # Messages/sec over the last completed window
+        self._rate_window_start = time.monotonic()
+        self._rate_window_count = 0
+        self._lag_avg: Optional[float] = None  # Exchange timestamp -> receipt, seconds
 
         # Heartbeat settings
         self._heartbeat_interval = 30.0  # seconds
@@ -162,6 +337,8 @@ class WebSocketClient:
 
             logger.info("[WebSocket] Connected")
 
+            self.start_dispatch()
+
             # Fire connect callbacks
             for callback in self._connect_callbacks:
                 try:
@@ -175,14 +352,14 @@ class WebSocketClient:
                 except RuntimeError as e:
                     logger.error(f"[WebSocket] Connect callback runtime error: {e}")
 
-            # Re-subscribe to previous subscriptions
-            if self._subscriptions:
-                await self._send_subscriptions(self._subscriptions)
-
             # Start message loop and heartbeat monitor
             self._task = asyncio.create_task(self._message_loop())
             self._heartbeat_task = asyncio.create_task(self._heartbeat_monitor())
 
+            # Re-subscribe to previous subscriptions
+            if self._subscriptions:
+                await self._resubscribe()
+
             return True
 
         except websockets.exceptions.InvalidURI as e:
@@ -228,6 +405,10 @@ class WebSocketClient:
             await self._ws.close()
             self._ws = None
 
+        await self.stop_dispatch()
+        if self._recorder:
+            self._recorder.flush()
+
         # Fire disconnect callbacks
         for callback in self._disconnect_callbacks:
             try:
@@ -285,6 +466,23 @@ class WebSocketClient:
 
         return True
 
+    async def _resubscribe(self) -> bool:
+        """
+        Re-send every subscription after (re)connecting, in batches spaced
+        resubscribe_stagger apart so a large set does not arrive as one burst.
+        """
+        market_ids = sorted(self._subscriptions)
+        ok = True
+        for start in range(0, len(market_ids), self.resubscribe_batch):
+            if start:
+                await asyncio.sleep(self.resubscribe_stagger)
+            ok = await self._send_subscriptions(
+                set(market_ids[start : start + self.resubscribe_batch])
+            )
+            if not ok:
+                break
+        return ok
+
     async def _send_subscriptions(self, market_ids: Set[str]) -> bool:
         """Send subscription messages."""
         if not self._ws:
@@ -347,10 +545,7 @@ class WebSocketClient:
         while self._running and self._ws:
             try:
                 message = await self._ws.recv()
-                self._messages_received += 1
-                self._last_message_time = datetime.now()
-
-                await self._handle_message(message)
+                await self._receive(message)
 
             except websockets.exceptions.ConnectionClosed as e:
                 logger.warning(f"[WebSocket] Connection closed: code={e.code}, reason={e.reason}")
@@ -376,45 +571,164 @@ class WebSocketClient:
                 await self._handle_disconnect()
                 break
 
-    async def _handle_message(self, message: str) -> None:
-        """Handle incoming WebSocket message."""
+    async def _receive(self, message: str) -> None:
+        """Account for, record and handle one received frame."""
+        received = time.monotonic()
+        self._messages_received += 1
+        self._last_message_time = datetime.now()
+        self._count_message()
+        if self._recorder:
+            self._recorder.record(message)
+
+        await self._handle_message(message, received)
+
+    def start_dispatch(self) -> bool:
+        """
+        Start conflated dispatch if enabled and not already running.
+
+        Returns:
+            True if this call created the dispatcher
+        """
+        if not self.conflate or self._dispatcher is not None:
+            return False
+        self._dispatcher = UpdateDispatcher(
+            get_config().api.websocket_max_pending,
+            trace_latency=self.latency_tracing,
+            sample_every=self.latency_sample_every,
+        )
+        return True
+
+    async def stop_dispatch(self) -> None:
+        """Stop conflated dispatch; callbacks are awaited inline until restarted."""
+        if self._dispatcher:
+            await self._dispatcher.close()
+            self._dispatcher = None
+
+    async def drain(self) -> None:
+        """Wait until conflated dispatch has delivered every pending update."""
+        if self._dispatcher:
+            await self._dispatcher.drain()
+
+    def attach_recorder(self, recorder: Any) -> None:
+        """Record every received frame (FrameRecorder); None detaches."""
+        self._recorder = recorder
+
+    async def _handle_message(
+        self, message: str, received: Optional[float] = None, live: bool = True
+    ) -> None:
+        """
+        Handle incoming WebSocket message (one event or a JSON array of events).
+
+        `received` is the frame's time.monotonic() receipt time (defaults to now);
+        latency stages are measured from it. `live=False` (replayed frames)
+        skips exchange-lag and latency accounting.
+        """
+        if received is None:
+            received = time.monotonic()
         try:
-            data = json.loads(message)
+            data = _json_loads(message) if self.lean_parse else json.loads(message)
+        except json.JSONDecodeError:
+            logger.warning(f"[WebSocket] Invalid JSON: {message[:100]}")
+            return
+
+        events = data if isinstance(data, list) else (data,)
+        # Sampled so histogram updates stay off most frames' path
+        trace = (
+            live
+            and self.latency_tracing
+            and self._messages_received % self.latency_sample_every == 0
+        )
+
+        for event in events:
+            if not isinstance(event, dict):
+                continue
+            if live:
+                self._observe_lag(event, trace)
 
-            msg_type = data.get("type", data.get("event", ""))
+            msg_type = event.get("type") or event.get("event") or ""
 
             if msg_type in ("price_change", "price", "tick"):
-                update = self._parse_price_update(data)
+                update = (
+                    self._parse_price_tick(event, received)
+                    if self.lean_parse
+                    else self._parse_price_update(event)
+                )
                 if update:
-                    for callback in self._price_callbacks:
-                        try:
-                            result = callback(update)
-                            if asyncio.iscoroutine(result):
-                                await result
-                        except (TypeError, AttributeError) as e:
-                            logger.error(f"[WebSocket] Price callback invocation error: {e}")
-                        except asyncio.CancelledError:
-                            raise  # Don't suppress cancellation
-                        except ValueError as e:
-                            logger.error(f"[WebSocket] Price callback value error: {e}")
+                    await self._deliver(self._price_callbacks, update, "Price", received, trace)
 
             elif msg_type in ("orderbook", "book"):
-                update = self._parse_orderbook_update(data)
+                update = (
+                    self._parse_book_tick(event, received)
+                    if self.lean_parse
+                    else self._parse_orderbook_update(event)
+                )
                 if update:
-                    for callback in self._orderbook_callbacks:
-                        try:
-                            result = callback(update)
-                            if asyncio.iscoroutine(result):
-                                await result
-                        except (TypeError, AttributeError) as e:
-                            logger.error(f"[WebSocket] Orderbook callback invocation error: {e}")
-                        except asyncio.CancelledError:
-                            raise  # Don't suppress cancellation
-                        except ValueError as e:
-                            logger.error(f"[WebSocket] Orderbook callback value error: {e}")
+                    await self._deliver(
+                        self._orderbook_callbacks, update, "Orderbook", received, trace
+                    )
 
-        except json.JSONDecodeError:
-            logger.warning(f"[WebSocket] Invalid JSON: {message[:100]}")
+    async def _deliver(
+        self,
+        callbacks: List[Callable[[Any], Any]],
+        update: Any,
+        kind: str,
+        received: float,
+        tracing: bool = False,
+    ) -> None:
+        """Hand an update to the conflating dispatcher, or await callbacks inline."""
+        if tracing:
+            record_latency("ws_parse", time.monotonic() - received)
+
+        if self._dispatcher:
+            self._dispatcher.publish(
+                callbacks, (update.market_id, update.outcome), update, received_at=received
+            )
+            return
+
+        for callback in callbacks:
+            try:
+                if tracing:
+                    start = time.monotonic()
+                    record_latency("ws_queue", start - received)
+                result = callback(update)
+                if asyncio.iscoroutine(result):
+                    await result
+                if tracing:
+                    record_latency("ws_callback", time.monotonic() - start)
+            except (TypeError, AttributeError) as e:
+                logger.error(f"[WebSocket] {kind} callback invocation error: {e}")
+            except asyncio.CancelledError:
+                raise  # Don't suppress cancellation
+            except ValueError as e:
+                logger.error(f"[WebSocket] {kind} callback value error: {e}")
+
+    def _count_message(self) -> None:
+        """Roll the once-per-second message rate window."""
+        self._rate_window_count += 1
+        now = time.monotonic()
+        elapsed = now - self._rate_window_start
+        if elapsed >= 1.0:
+            self._message_rate = self._rate_window_count / elapsed
+            self._rate_window_start = now
+            self._rate_window_count = 0
+
+    def _observe_lag(self, data: Any, trace: bool = False) -> None:
+        """Track delay between the exchange's message timestamp and receipt."""
+        if not isinstance(data, dict) or "timestamp" not in data:
+            return
+        try:
+            sent = float(data["timestamp"])
+        except (TypeError, ValueError):
+            return
+        if sent > 1e12:  # Milliseconds
+            sent /= 1000
+        lag = max(0.0, time.time() - sent)
+        if trace:
+            record_latency("ws_exchange_to_receive", lag)
+        if self._lag_avg is None:
+            self._lag_avg = lag
+        else:
+            self._lag_avg += 0.1 * (lag - self._lag_avg)
 
     def _parse_price_update(self, data: dict) -> Optional[PriceUpdate]:
         """Parse a price update from message data."""
@@ -434,6 +748,43 @@ class WebSocketClient:
             logger.debug(f"[WebSocket] Failed to parse price update - missing key: {e}")
             return None
 
+    def _parse_price_tick(self, data: dict, received: float) -> Optional["PriceTick"]:
+        """Lean parse: compact update, raw payload only if keep_raw is set."""
+        get = data.get
+        try:
+            price = get("price")
+            return PriceTick(
+                get("market") or get("condition_id") or "",
+                get("outcome") or get("asset") or "Yes",
+                float(price if price is not None else get("last_price") or 0),
+                float(get("volume") or 0),
+                received,
+                data if self.keep_raw else None,
+            )
+        except (ValueError, TypeError) as e:
+            logger.debug(f"[WebSocket] Failed to parse price update - invalid data: {e}")
+            return None
+
+    def _parse_book_tick(self, data: dict, received: float) -> Optional["BookTick"]:
+        """Lean parse: book levels kept as flat price/size lists, no per-level tuples."""
+        get = data.get
+        try:
+            bids = get("bids") or ()
+            asks = get("asks") or ()
+            return BookTick(
+                get("market") or get("condition_id") or "",
+                get("outcome") or "Yes",
+                [float(level["price"]) for level in bids],
+                [float(level["size"]) for level in bids],
+                [float(level["price"]) for level in asks],
+                [float(level["size"]) for level in asks],
+                received,
+                data if self.keep_raw else None,
+            )
+        except (ValueError, TypeError, KeyError) as e:
+            logger.debug(f"[WebSocket] Failed to parse orderbook update - invalid data: {e}")
+            return None
+
     def _parse_orderbook_update(self, data: dict) -> Optional[OrderbookUpdate]:
         """Parse an orderbook update from message data."""
         try:
@@ -602,6 +953,9 @@ class WebSocketClient:
             "uptime_seconds": uptime,
             "reconnect_attempts": self._reconnect_count,
             "total_reconnects": self._total_reconnects,
+            "message_rate": self._message_rate,
+            "lag_ms": self._lag_avg * 1000 if self._lag_avg is not None else None,
+            "consumers": self._dispatcher.stats if self._dispatcher else {},
         }
 
 
@@ -0,0 +1,220 @@
+"""
+Conflating WebSocket Update Dispatch
+
+Decouples the WebSocket receive loop from user callbacks. Each callback
+gets its own consumer task fed through per-market slots that hold only the
+latest update: while a callback is busy, newer prices or books for the same
+market replace the pending one instead of queueing behind it. A slow
+callback therefore lags only itself, never the socket or other callbacks,
+and its backlog is bounded by the number of markets rather than message rate.
+
+Conflated and dropped updates and per-consumer lag (time from receipt of
+the oldest update folded into a delivery until the callback is invoked)
+are published to the metrics registry; with latency tracing on, so are
+queue and callback durations (one delivery in sample_every) as
+pp_latency_seconds stages.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+from loguru import logger
+
+from probablyprofit.utils.metrics import (
+    record_latency,
+    record_ws_consumer_lag,
+    record_ws_update_discarded,
+)
+
+
+def callback_name(callback: Callable[..., Any]) -> str:
+    """Readable name for a callback, used to label its queue and metrics."""
+    return getattr(callback, "__qualname__", None) or type(callback).__name__
+
+
+class ConflatingConsumer:
+    """
+    One callback fed from latest-value slots, drained by its own task.
+
+    Slots are served in the order markets first became pending, so a busy
+    market cannot starve quiet ones.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[Any], Any],
+        max_pending: int = 1000,
+        trace_latency: bool = False,
+        sample_every: int = 1,
+    ):
+        """
+        Initialize consumer.
+
+        Args:
+            callback: Sync or async callable invoked with each delivered update
+            max_pending: Max markets with an undelivered update; the oldest is
+                dropped beyond this
+            trace_latency: Record ws_queue/ws_callback latency stages
+            sample_every: Trace one delivery in this many
+        """
+        self.callback = callback
+        self.name = callback_name(callback)
+        self.max_pending = max_pending
+        self.trace_latency = trace_latency
+        self.sample_every = max(1, sample_every)
+
+        # key -> (latest update, receipt time of the oldest update it replaced)
+        self._pending: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._ready = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._task: Optional["asyncio.Task[None]"] = None
+
+        # Statistics
+        self._delivered = 0
+        self._conflated = 0
+        self._dropped = 0
+        self._errors = 0
+        self._max_lag = 0.0
+
+    def offer(self, key: Hashable, update: Any, received_at: float) -> None:
+        """Make `update` the pending value for `key` (never blocks)."""
+        slot = self._pending.get(key)
+        if slot is not None:
+            self._pending[key] = (update, slot[1])
+            self._conflated += 1
+            record_ws_update_discarded(self.name, "conflated")
+        else:
+            if len(self._pending) >= self.max_pending:
+                self._pending.popitem(last=False)
+                self._dropped += 1
+                record_ws_update_discarded(self.name, "dropped")
+            self._pending[key] = (update, received_at)
+
+        self._ready.set()
+        self._idle.clear()
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await self._ready.wait()
+            while self._pending:
+                _, (update, received_at) = self._pending.popitem(last=False)
+                start = time.monotonic()
+                lag = start - received_at
+                self._max_lag = max(self._max_lag, lag)
+                record_ws_consumer_lag(self.name, lag)
+                await self._invoke(update)
+                if self.trace_latency and self._delivered % self.sample_every == 0:
+                    record_latency("ws_queue", lag)
+                    record_latency("ws_callback", time.monotonic() - start)
+            self._ready.clear()
+            self._idle.set()
+
+    async def join(self) -> None:
+        """Wait until every pending update has been delivered."""
+        await self._idle.wait()
+
+    async def _invoke(self, update: Any) -> None:
+        try:
+            result = self.callback(update)
+            if asyncio.iscoroutine(result):
+                await result
+            self._delivered += 1
+        except asyncio.CancelledError:
+            raise  # Don't suppress cancellation
+        except Exception as e:
+            self._errors += 1
+            logger.error(f"[WebSocket] Callback '{self.name}' failed: {e}")
+
+    async def close(self) -> None:
+        """Stop the consumer task, discarding undelivered updates."""
+        self._pending.clear()
+        self._idle.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Get consumer statistics."""
+        return {
+            "pending": len(self._pending),
+            "delivered": self._delivered,
+            "conflated": self._conflated,
+            "dropped": self._dropped,
+            "errors": self._errors,
+            "max_lag_ms": self._max_lag * 1000,
+        }
+
+
+class UpdateDispatcher:
+    """
+    Fans parsed updates out to one ConflatingConsumer per callback.
+
+    Usage:
+        dispatcher = UpdateDispatcher(max_pending=1000)
+        dispatcher.publish(price_callbacks, (update.market_id, update.outcome), update)
+        ...
+        await dispatcher.close()
+    """
+
+    def __init__(self, max_pending: int = 1000, trace_latency: bool = False, sample_every: int = 1):
+        """
+        Initialize dispatcher.
+
+        Args:
+            max_pending: Per-consumer bound on markets with an undelivered update
+            trace_latency: Record ws_queue/ws_callback latency stages
+            sample_every: Per consumer, trace one delivery in this many
+        """
+        self.max_pending = max_pending
+        self.trace_latency = trace_latency
+        self.sample_every = sample_every
+        self._consumers: Dict[int, ConflatingConsumer] = {}
+
+    def publish(
+        self,
+        callbacks: Iterable[Callable[[Any], Any]],
+        key: Hashable,
+        update: Any,
+        received_at: Optional[float] = None,
+    ) -> None:
+        """
+        Offer an update to each callback's consumer without waiting for any of them.
+
+        `received_at` is the time.monotonic() the update's frame arrived (defaults to now).
+        """
+        if received_at is None:
+            received_at = time.monotonic()
+        for callback in callbacks:
+            consumer = self._consumers.get(id(callback))
+            if consumer is None:
+                consumer = ConflatingConsumer(
+                    callback, self.max_pending, self.trace_latency, self.sample_every
+                )
+                self._consumers[id(callback)] = consumer
+            consumer.offer(key, update, received_at)
+
+    async def drain(self) -> None:
+        """Wait until every consumer has delivered its pending updates."""
+        for consumer in list(self._consumers.values()):
+            await consumer.join()
+
+    async def close(self) -> None:
+        """Stop every consumer."""
+        for consumer in self._consumers.values():
+            await consumer.close()
+        self._consumers.clear()
+
+    @property
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Statistics per consumer, keyed by callback name."""
+        return {consumer.name: consumer.stats for consumer in self._consumers.values()}
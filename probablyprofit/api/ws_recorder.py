@@ -0,0 +1,223 @@
+"""
+WebSocket Session Recording and Replay
+
+FrameRecorder appends every raw frame a WebSocketClient receives, with
+its wall-clock receive time, to an append-only file of gzip chunks. Each
+chunk is an independent gzip member, so a file can be appended to across
+sessions and a crash loses at most the chunk being buffered. Compression
+and writes run on one background thread (in chunk order), so recording
+never blocks the receive loop on gzip or disk I/O.
+
+FrameReplayer feeds a recording back through WebSocketClient's own
+parse and callback path (without touching its live receive statistics), at recorded speed (or a multiple of it)
+or as fast as possible. Use it to reproduce live sessions, load-test
+callbacks such as PositionMonitor, or drive backtests from real ticks.
+
+Usage:
+    recorder = FrameRecorder("session.ndjson.gz")
+    ws.attach_recorder(recorder)
+    ...
+    recorder.close()
+
+    replayer = FrameReplayer("session.ndjson.gz")
+    await replayer.replay(ws, speed=None)  # As fast as possible
+"""
+
+import asyncio
+import gzip
+import json
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from loguru import logger
+
+
+class FrameRecorder:
+    """Buffers raw frames and appends them as compressed chunks."""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        chunk_frames: int = 1000,
+        flush_interval: float = 5.0,
+        compresslevel: int = 6,
+    ):
+        """
+        Initialize recorder.
+
+        Args:
+            path: Recording file (appended to if it exists)
+            chunk_frames: Frames per compressed chunk
+            flush_interval: Max seconds a frame stays buffered
+            compresslevel: gzip level per chunk (1 = fastest)
+        """
+        self.path = Path(path)
+        self.chunk_frames = chunk_frames
+        self.flush_interval = flush_interval
+        self.compresslevel = compresslevel
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "ab")
+        self._buffer: List[str] = []
+        self._last_flush = time.monotonic()
+        # Single worker: chunks are compressed and appended in submission order
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="frame-recorder")
+
+        # Statistics
+        self._frames = 0
+        self._chunks = 0
+        self._bytes_written = 0
+
+    def record(self, frame: Union[str, bytes], received_at: Optional[float] = None) -> None:
+        """Buffer a frame with its receive time (time.time())."""
+        if self._file.closed:
+            return
+        if isinstance(frame, bytes):
+            frame = frame.decode("utf-8", errors="replace")
+        ts = received_at if received_at is not None else time.time()
+        self._buffer.append(json.dumps([ts, frame]))
+        self._frames += 1
+
+        if (
+            len(self._buffer) >= self.chunk_frames
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Hand buffered frames to the writer thread as one gzip chunk."""
+        self._last_flush = time.monotonic()
+        if not self._buffer or self._file.closed:
+            return
+        data = ("\n".join(self._buffer) + "\n").encode()
+        self._buffer.clear()
+        self._writer.submit(self._write_chunk, data)
+
+    def _write_chunk(self, data: bytes) -> None:
+        """Compress and append one chunk (writer thread)."""
+        try:
+            chunk = gzip.compress(data, compresslevel=self.compresslevel)
+            self._file.write(chunk)
+            self._file.flush()
+        except (OSError, ValueError) as e:
+            logger.error(f"[FrameRecorder] Failed to write chunk to {self.path}: {e}")
+            return
+        self._chunks += 1
+        self._bytes_written += len(chunk)
+
+    def close(self) -> None:
+        """Flush, wait for pending chunk writes and close the file."""
+        if not self._file.closed:
+            self.flush()
+            self._writer.shutdown(wait=True)
+            self._file.close()
+            logger.info(
+                f"[FrameRecorder] Recorded {self._frames} frames in {self._chunks} chunks "
+                f"to {self.path}"
+            )
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Get recorder statistics."""
+        return {
+            "path": str(self.path),
+            "frames": self._frames,
+            "buffered": len(self._buffer),
+            "chunks": self._chunks,
+            "bytes_written": self._bytes_written,
+        }
+
+
+class FrameReplayer:
+    """Reads a FrameRecorder file and replays it into a WebSocketClient."""
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Initialize replayer.
+
+        Args:
+            path: Recording written by FrameRecorder
+        """
+        self.path = Path(path)
+
+    def frames(self) -> Iterator[Tuple[float, str]]:
+        """
+        Yield (receive_time, frame) in recorded order.
+
+        A truncated trailing chunk (e.g. from a crash mid-write) ends the
+        iteration instead of raising.
+        """
+        decompressor = zlib.decompressobj(wbits=31)
+        chunk = b""
+        with open(self.path, "rb") as f:
+            while block := f.read(1 << 16):
+                while block:
+                    try:
+                        chunk += decompressor.decompress(block)
+                    except zlib.error as e:
+                        logger.warning(f"[FrameReplayer] Corrupt chunk in {self.path}: {e}")
+                        return
+                    block = decompressor.unused_data
+                    if not decompressor.eof:
+                        break
+
+                    # Chunk complete and CRC-checked
+                    for line in chunk.split(b"\n"):
+                        if line:
+                            ts, frame = json.loads(line)
+                            yield ts, frame
+                    decompressor = zlib.decompressobj(wbits=31)
+                    chunk = b""
+
+        if chunk or decompressor.unconsumed_tail:
+            logger.warning(f"[FrameReplayer] Ignoring truncated final chunk in {self.path}")
+
+    async def replay(self, client: Any, speed: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Feed every recorded frame through client's parse and callback path.
+
+        Frames bypass the live receive accounting (message count and rate,
+        exchange lag, recorder), so replaying into a connected client does
+        not distort its statistics.
+
+        Args:
+            client: WebSocketClient whose callbacks should see the frames
+            speed: 1.0 replays at recorded pace, 2.0 twice as fast; None
+                replays as fast as possible
+
+        Returns:
+            Replay statistics (frames, duration, frames per second)
+        """
+        owns_dispatcher = client.start_dispatch()
+        frames = 0
+        first_ts: Optional[float] = None
+        start = time.monotonic()
+
+        try:
+            for ts, frame in self.frames():
+                if speed:
+                    if first_ts is None:
+                        first_ts = ts
+                    delay = (ts - first_ts) / speed - (time.monotonic() - start)
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                elif frames % 1000 == 0:
+                    await asyncio.sleep(0)  # Let consumer tasks run
+                await client._handle_message(frame, live=False)
+                frames += 1
+
+            await client.drain()
+        finally:
+            if owns_dispatcher:
+                await client.stop_dispatch()
+
+        elapsed = time.monotonic() - start
+        logger.info(f"[FrameReplayer] Replayed {frames} frames in {elapsed:.2f}s")
+        return {
+            "frames": frames,
+            "elapsed_seconds": elapsed,
+            "frames_per_second": frames / elapsed if elapsed > 0 else 0.0,
+        }
@@ -0,0 +1,264 @@
+"""
+Sharded WebSocket Connections
+
+Spreads market subscriptions over several WebSocketClient connections so
+per-socket throughput no longer caps how many markets can be watched, and
+a dropped connection only has to resubscribe its own share.
+
+Markets are assigned to shards on a consistent-hash ring (with virtual
+nodes), so changing the shard count moves only about 1/N of them. Each
+shard reconnects on its own with the client's backoff and batched
+resubscription; initial connects are staggered so shards do not handshake
+and subscribe in the same instant. A shard whose initial connect fails keeps
+retrying in the background with exponential backoff; its markets stay
+registered and are subscribed as soon as it comes up.
+"""
+
+import asyncio
+import hashlib
+import random
+from bisect import bisect
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from loguru import logger
+
+from probablyprofit.api.websocket import OrderbookUpdate, PriceUpdate, WebSocketClient
+from probablyprofit.config import get_config
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """Consistent-hash ring mapping keys to shard indexes."""
+
+    def __init__(self, shards: int, virtual_nodes: int = 64):
+        """
+        Initialize ring.
+
+        Args:
+            shards: Number of shards
+            virtual_nodes: Ring points per shard (more = more even spread)
+        """
+        points: List[Tuple[int, int]] = sorted(
+            (_hash(f"shard-{shard}-{node}"), shard)
+            for shard in range(shards)
+            for node in range(virtual_nodes)
+        )
+        self._hashes = [h for h, _ in points]
+        self._shards = [s for _, s in points]
+
+    def shard_for(self, key: str) -> int:
+        """Shard index owning `key`."""
+        index = bisect(self._hashes, _hash(key)) % len(self._hashes)
+        return self._shards[index]
+
+
+class ShardedWebSocketClient:
+    """
+    Drop-in WebSocketClient replacement that shards subscriptions.
+
+    Callbacks are registered on every shard, so price and orderbook updates
+    from all connections arrive through one interface.
+
+    Usage:
+        ws = ShardedWebSocketClient(shards=8)
+
+        @ws.on_price_update
+        async def handle_price(update: PriceUpdate):
+            ...
+
+        await ws.connect()
+        await ws.subscribe(thousands_of_market_ids)
+    """
+
+    def __init__(
+        self,
+        shards: Optional[int] = None,
+        url: Optional[str] = None,
+        connect_stagger: float = 0.25,
+        retry_interval: float = 1.0,
+        virtual_nodes: int = 64,
+        client_factory: Optional[Callable[[], Any]] = None,
+        **client_kwargs: Any,
+    ):
+        """
+        Initialize shards.
+
+        Args:
+            shards: Number of connections (defaults to config.api.websocket_shards)
+            url: WebSocket URL (uses the client default if None)
+            connect_stagger: Seconds between successive shard connects
+            retry_interval: Initial backoff for retrying a shard that failed to connect
+            virtual_nodes: Hash ring points per shard
+            client_factory: Builds each shard client (defaults to WebSocketClient)
+            **client_kwargs: Passed to WebSocketClient (reconnect, conflate, ...)
+        """
+        count = shards or get_config().api.websocket_shards
+        if count < 1:
+            raise ValueError(f"shards must be >= 1, got {count}")
+
+        factory = client_factory or (lambda: WebSocketClient(url=url, **client_kwargs))
+        self.shards: List[Any] = [factory() for _ in range(count)]
+        self.connect_stagger = connect_stagger
+        self.retry_interval = retry_interval
+        self._ring = HashRing(count, virtual_nodes)
+        self._retries: Dict[int, "asyncio.Task[None]"] = {}
+
+    def shard_for(self, market_id: str) -> int:
+        """Index of the shard that carries `market_id`."""
+        return self._ring.shard_for(market_id)
+
+    def _partition(self, market_ids: Iterable[str]) -> Dict[int, List[str]]:
+        groups: Dict[int, List[str]] = defaultdict(list)
+        for market_id in market_ids:
+            groups[self.shard_for(market_id)].append(market_id)
+        return groups
+
+    # =========================================================================
+    # Connection
+    # =========================================================================
+
+    async def connect(self) -> bool:
+        """
+        Connect every shard, staggered by connect_stagger.
+
+        Shards that fail are retried in the background until they connect
+        or disconnect() is called.
+
+        Returns:
+            True if all shards connected
+        """
+
+        async def connect_shard(index: int, shard: Any) -> bool:
+            await asyncio.sleep(index * self.connect_stagger)
+            return await shard.connect()
+
+        results = await asyncio.gather(
+            *(connect_shard(i, shard) for i, shard in enumerate(self.shards))
+        )
+        connected = sum(1 for ok in results if ok)
+        if connected < len(self.shards):
+            logger.warning(
+                f"[ShardedWebSocket] {connected}/{len(self.shards)} shards connected; "
+                "retrying the rest in the background"
+            )
+            for index, ok in enumerate(results):
+                retry = self._retries.get(index)
+                if not ok and (retry is None or retry.done()):
+                    self._retries[index] = asyncio.create_task(self._retry_shard(index))
+        else:
+            logger.info(f"[ShardedWebSocket] {connected} shards connected")
+        return connected == len(self.shards)
+
+    async def _retry_shard(self, index: int) -> None:
+        """Reconnect a shard whose connect failed, with exponential backoff and jitter."""
+        shard = self.shards[index]
+        attempt = 0
+        while not shard.is_connected:
+            attempt += 1
+            wait = min(self.retry_interval * (2 ** (attempt - 1)), 60.0)
+            await asyncio.sleep(wait + random.uniform(0, wait * 0.25))
+            if await shard.connect():
+                logger.info(f"[ShardedWebSocket] Shard {index} connected after {attempt} retries")
+                return
+
+    async def disconnect(self) -> None:
+        """Stop connect retries and disconnect every shard."""
+        retries, self._retries = list(self._retries.values()), {}
+        for task in retries:
+            task.cancel()
+        await asyncio.gather(*retries, return_exceptions=True)
+        await asyncio.gather(*(shard.disconnect() for shard in self.shards))
+
+    async def subscribe(self, market_ids: List[str]) -> bool:
+        """Subscribe each market on its shard."""
+        groups = self._partition(market_ids)
+        results = await asyncio.gather(
+            *(self.shards[index].subscribe(ids) for index, ids in groups.items())
+        )
+        return all(results)
+
+    async def unsubscribe(self, market_ids: List[str]) -> bool:
+        """Unsubscribe each market from its shard."""
+        groups = self._partition(market_ids)
+        results = await asyncio.gather(
+            *(self.shards[index].unsubscribe(ids) for index, ids in groups.items())
+        )
+        return all(results)
+
+    # =========================================================================
+    # Callbacks (registered on every shard)
+    # =========================================================================
+
+    def on_price_update(
+        self, callback: Callable[[PriceUpdate], Any]
+    ) -> Callable[[PriceUpdate], Any]:
+        """Register a price update callback."""
+        for shard in self.shards:
+            shard.on_price_update(callback)
+        return callback
+
+    def on_orderbook_update(
+        self, callback: Callable[[OrderbookUpdate], Any]
+    ) -> Callable[[OrderbookUpdate], Any]:
+        """Register an orderbook update callback."""
+        for shard in self.shards:
+            shard.on_orderbook_update(callback)
+        return callback
+
+    def on_error(self, callback: Callable[[Exception], Any]) -> Callable[[Exception], Any]:
+        """Register an error callback."""
+        for shard in self.shards:
+            shard.on_error(callback)
+        return callback
+
+    def on_connect(self, callback: Callable[[], Any]) -> Callable[[], Any]:
+        """Register a connect callback (fires once per shard)."""
+        for shard in self.shards:
+            shard.on_connect(callback)
+        return callback
+
+    def on_disconnect(self, callback: Callable[[], Any]) -> Callable[[], Any]:
+        """Register a disconnect callback (fires once per shard)."""
+        for shard in self.shards:
+            shard.on_disconnect(callback)
+        return callback
+
+    # =========================================================================
+    # State
+    # =========================================================================
+
+    @property
+    def is_connected(self) -> bool:
+        """Check if any shard is connected."""
+        return any(shard.is_connected for shard in self.shards)
+
+    @property
+    def all_connected(self) -> bool:
+        """Check if every shard is connected."""
+        return all(shard.is_connected for shard in self.shards)
+
+    @property
+    def subscriptions(self) -> Set[str]:
+        """Get current subscriptions across shards."""
+        return set().union(*(shard.subscriptions for shard in self.shards))
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Merged statistics, with each shard's WebSocketClient.stats under 'shards'."""
+        shard_stats = [shard.stats for shard in self.shards]
+        lags = [s["lag_ms"] for s in shard_stats if s.get("lag_ms") is not None]
+        return {
+            "connected": self.is_connected,
+            "connected_shards": sum(1 for s in shard_stats if s.get("connected")),
+            "retrying_shards": sum(1 for task in self._retries.values() if not task.done()),
+            "subscriptions": sum(s.get("subscriptions", 0) for s in shard_stats),
+            "messages_received": sum(s.get("messages_received", 0) for s in shard_stats),
+            "message_rate": sum(s.get("message_rate", 0.0) for s in shard_stats),
+            "max_lag_ms": max(lags) if lags else None,
+            "total_reconnects": sum(s.get("total_reconnects", 0) for s in shard_stats),
+            "shards": shard_stats,
+        }
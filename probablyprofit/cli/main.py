@@ -334,6 +334,11 @@ def setup(reconfigure: bool = False):
 )
 @click.option("--news", is_flag=True, help="Enable news context (requires Perplexity API)")
 @click.option("--once", is_flag=True, help="Run once and exit (don't loop)")
+@click.option(
+    "--event-driven",
+    is_flag=True,
+    help="Run cycles on WebSocket price moves instead of every --interval",
+)
 @click.option("--stream", is_flag=True, default=True, help="Stream AI thinking in real-time")
 @click.option("--no-stream", is_flag=True, help="Disable streaming output")
 @click.option("--kelly", is_flag=True, help="Enable Kelly criterion position sizing")
@@ -356,6 +361,7 @@ def run(
     paper_capital: float,
     news: bool,
     once: bool,
+    event_driven: bool,
     stream: bool,
     no_stream: bool,
     kelly: bool,
@@ -511,7 +517,7 @@ def run(
     table.add_column("Value")
     table.add_row("Mode", mode_str)
     table.add_row("Agent", f"{selected_agent} ({model})")
-    table.add_row("Interval", f"{interval}s")
+    table.add_row("Interval", "event-driven" if event_driven and not once else f"{interval}s")
     if config.has_wallet() and not is_dry_run and not paper:
         table.add_row("Wallet", "[green]Connected[/green]")
     table.add_row("News", "[green]Enabled[/green]" if news else "[dim]Disabled[/dim]")
@@ -542,6 +548,18 @@ def run(
         # Initialize client
         client = PolymarketClient(private_key=config.private_key)
 
+        # Pre-connect so the first observation and trade skip TCP/TLS setup
+        if config.api.http_warm_up:
+            await client.warm_up()
+
+        # Serve positions/balance from memory, reconciling in the background. Opt-in:
+        # the agent places orders directly, so there is no OrderManager to attach
+        # and fills only show up on the reconcile that follows each order.
+        if config.api.portfolio_cache and config.private_key:
+            from probablyprofit.api.portfolio_state import PortfolioState
+
+            client.attach_portfolio_state(PortfolioState())
+
         # Initialize risk manager
         risk = RiskManager(initial_capital=config.initial_capital)
 
@@ -657,12 +675,39 @@ def run(
                     if not is_dry_run and not paper:
                         console.print("[green]Trade executed![/green]")
             else:
+                ws_client = None
+                if event_driven:
+                    from probablyprofit.agent.triggers import MarketTrigger
+                    from probablyprofit.api.websocket import WebSocketClient
+                    from probablyprofit.api.ws_shards import ShardedWebSocketClient
+
+                    if config.api.websocket_shards > 1:
+                        ws_client = ShardedWebSocketClient()
+                    else:
+                        ws_client = WebSocketClient()
+                    # A sharded client retries failed shards in the background,
+                    # so one connected shard is enough to start event-driven
+                    if await ws_client.connect() or ws_client.is_connected:
+                        agent_instance.enable_event_driven(MarketTrigger(ws_client))
+                    else:
+                        console.print(
+                            "[yellow]WebSocket unavailable; falling back to interval loop[/yellow]"
+                        )
+                        ws_client = None
+
                 # Continuous loop
-                await agent_instance.run_loop()
+                try:
+                    await agent_instance.run_loop()
+                finally:
+                    if ws_client is not None:
+                        await ws_client.disconnect()
         except KeyboardInterrupt:
             console.print("\n[yellow]Stopped by user.[/yellow]")
         finally:
+            from probablyprofit.utils.http_pool import close_http_pools
+
             await client.close()
+            await close_http_pools()
 
     asyncio.run(_run())
 
@@ -1066,12 +1111,18 @@ def completion(shell: str):
 
 @cli.command(name="emergency-stop")
 @click.option("--reason", "-r", default="Manual emergency stop", help="Reason for stop")
-def emergency_stop(reason: str):
+@click.option(
+    "--cancel-orders/--no-cancel-orders",
+    default=True,
+    help="Also cancel all open orders on the exchange",
+)
+def emergency_stop(reason: str, cancel_orders: bool):
     """
     Activate emergency kill switch to halt all trading.
 
-    This immediately stops all trading activity. Use when you need
-    to halt trading due to market conditions, bugs, or emergencies.
+    This immediately stops all trading activity and cancels every open
+    order. Use when you need to halt trading due to market conditions,
+    bugs, or emergencies.
 
     Example:
 
@@ -1098,6 +1149,43 @@ def emergency_stop(reason: str):
     except ImportError:
         console.print("[red]Kill switch module not available.[/red]")
 
+    if cancel_orders:
+        asyncio.run(_cancel_open_orders())
+
+
+async def _cancel_open_orders():
+    """Cancel every open order and report per-order outcomes and time to flat."""
+    config = load_config()
+
+    if not config.has_wallet():
+        console.print("\n[yellow]No wallet configured - no orders to cancel.[/yellow]")
+        return
+
+    from probablyprofit.api.client import PolymarketClient
+
+    client = PolymarketClient(private_key=config.private_key)
+
+    try:
+        with console.status("[bold]Cancelling open orders...[/bold]"):
+            result = await client.cancel_orders_bulk()
+
+        console.print(
+            f"\nCancelled {len(result.cancelled)} order(s) via {result.method} "
+            f"in {result.seconds * 1000:.0f}ms"
+        )
+        for order_id, error in result.outcomes.items():
+            if error is not None:
+                console.print(f"  [red]✗[/red] {order_id}: {error}")
+        if result.failed:
+            console.print(
+                f"[bold red]{len(result.failed)} order(s) may still be open - "
+                "check the exchange.[/bold red]"
+            )
+    except Exception as e:
+        console.print(f"[red]Failed to cancel orders: {e}[/red]")
+    finally:
+        await client.close()
+
 
 @cli.command(name="resume-trading")
 def resume_trading():
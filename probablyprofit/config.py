@@ -48,10 +48,38 @@ class APIConfig:
     # Timeouts (seconds)
     http_timeout: float = 30.0
     websocket_timeout: float = 60.0
+    # Opt-in: WebSocket callbacks run on their own tasks fed with only the latest
+    # update per market, so intermediate trades and volume are skipped; at most
+    # websocket_max_pending markets wait per callback
+    websocket_conflate: bool = False
+    websocket_max_pending: int = 1000
+    # Reconnects resubscribe in batches; with websocket_shards > 1,
+    # ShardedWebSocketClient spreads subscriptions over that many connections
+    # (one connection handles typical subscription counts)
+    websocket_resubscribe_batch: int = 50
+    websocket_resubscribe_stagger: float = 0.1
+    websocket_shards: int = 1
+    # Slotted PriceTick/BookTick updates with monotonic receipt stamps and no
+    # retained payload (orjson when installed)
+    websocket_lean_parse: bool = False
+    # Per-message latency histograms (exchange -> receive, parse, queue, callback),
+    # recorded for one frame/delivery in websocket_latency_sample_every
+    websocket_latency_tracing: bool = False
+    websocket_latency_sample_every: int = 100
 
     # Rate limiting
     polymarket_rate_limit_calls: int = 8
     polymarket_rate_limit_period: float = 1.0
+    # Adaptive mode: separate AIMD buckets for gamma reads, CLOB reads and CLOB
+    # writes, starting at the rate above and tuned by 429s, Retry-After and latency
+    adaptive_rate_limit: bool = False
+    rate_limit_max_multiplier: float = 4.0  # Ceiling as a multiple of the starting rate
+    rate_limit_latency_threshold: float = 2.0  # Back off above baseline latency * this
+    # Queued requests older than this are served before higher-priority ones
+    request_starvation_timeout: float = 5.0
+    # Hedged reads: resend market/orderbook/order reads that outlive their p95
+    hedged_reads: bool = False
+    hedge_budget: float = 0.05  # Max extra requests as a fraction of reads
 
     # Circuit breaker
     circuit_breaker_threshold: int = 5
@@ -68,6 +96,54 @@ class APIConfig:
     price_cache_ttl: float = 10.0
     positions_cache_max_size: int = 200
 
+    # Market universe scan (iter_markets)
+    market_scan_page_size: int = 100
+    market_scan_prefetch: int = 3
+
+    # Fast-path Gamma decoding (orjson when installed, no per-market validation)
+    fast_market_decode: bool = False
+
+    # In-memory positions/balance, reconciled with the exchange on this interval.
+    # Off by default: without an OrderManager's fill events (PortfolioState.attach)
+    # reads only catch up with fills on the next reconcile.
+    portfolio_cache: bool = False
+    portfolio_reconcile_interval: float = 120.0
+
+    # Shared connection pool for Polymarket hosts (CLOB, Gamma, RPC)
+    http2: bool = True  # Requires the h2 package (pip install probablyprofit[http2])
+    http_max_connections: int = 100
+    http_max_keepalive: int = 20
+    http_keepalive_expiry: float = 120.0
+    http_warm_up: bool = True  # Pre-connect at startup
+
+    # Use the native async CLOB client for order endpoints (falls back to py-clob-client)
+    native_clob: bool = True
+
+    # Local orderbook replica (seconds without an update before REST resync)
+    orderbook_max_age: float = 5.0
+
+    # Order tracking (OrderManager.start_polling): fills and status changes are
+    # pushed over the authenticated user channel when available; otherwise one
+    # bulk open-orders + fills-since-cursor sync runs every order_sync_interval.
+    # While the channel is up the bulk sync still runs every order_resync_interval.
+    order_user_channel: bool = True
+    order_sync_interval: float = 5.0
+    order_resync_interval: float = 60.0
+    # Order journal: OrderBook changes are group-committed (one write + fsync per
+    # order_journal_flush_interval) under order_journal_dir/<platform>, and
+    # OrderManager.recover() (run by start_polling if not called earlier)
+    # replays snapshot + journal after a restart
+    order_journal: bool = False
+    order_journal_dir: str = ".probablyprofit/orders"
+    order_journal_flush_interval: float = 0.01
+    order_journal_snapshot_every: int = 10_000
+    # Order event bus: each on_fill/on_status_change/... subscriber has its own
+    # queue. Status queues hold this many events and then apply
+    # order_event_overflow (drop_oldest, drop_newest or block). Fill/complete/
+    # timeout queues are unbounded and raise a backlog alarm past this size
+    order_event_queue_size: int = 1000
+    order_event_overflow: str = "drop_oldest"
+
 
 @dataclass
 class AgentConfig:
@@ -88,6 +164,40 @@ class AgentConfig:
     checkpoint_interval: int = 5  # loops
     risk_save_interval: int = 3  # loops (reduced from 10 for production safety)
 
+    # Market delta feed (minimum absolute price move reported as "repriced")
+    market_delta_threshold: float = 0.01
+
+    # observe() stage timeouts (seconds); a slow or failed stage falls back to
+    # its last good value when that is no older than the stage's max age
+    observe_markets_timeout: float = 20.0
+    observe_positions_timeout: float = 10.0
+    observe_balance_timeout: float = 5.0
+    observe_markets_max_age: float = 300.0
+    observe_positions_max_age: float = 60.0
+    observe_balance_max_age: float = 60.0
+
+    # Pipelined loop: observe iteration N+1 while iteration N decides/acts.
+    # Trades decided on observations older than observation_max_age are
+    # re-priced first and dropped if the price moved more than max_price_drift.
+    pipelined_loop: bool = False
+    observation_max_age: float = 10.0
+    max_price_drift: float = 0.02
+
+    # Event-driven loop (BaseAgent.enable_event_driven): cycles start when a
+    # watched market's price or spread moves, volume spikes, or after
+    # trigger_max_idle seconds; bursts are debounced and cycle starts are at
+    # least trigger_min_interval apart.
+    trigger_price_move: float = 0.02
+    trigger_spread_change: float = 0.02
+    trigger_volume_spike: float = 3.0
+    trigger_max_idle: float = 300.0
+    trigger_debounce: float = 1.0
+    trigger_min_interval: float = 15.0
+
+    # Log each iteration's latency breakdown (data age, observe, LLM, order ack)
+    # at DEBUG; the stages are exported as pp_latency_seconds either way
+    log_latency_breakdown: bool = True
+
 
 @dataclass
 class RiskConfig:
@@ -413,12 +523,52 @@ def load_config() -> Config:
             config.api.websocket_timeout = api.get(
                 "websocket_timeout", config.api.websocket_timeout
             )
+            config.api.websocket_conflate = api.get(
+                "websocket_conflate", config.api.websocket_conflate
+            )
+            config.api.websocket_max_pending = api.get(
+                "websocket_max_pending", config.api.websocket_max_pending
+            )
+            config.api.websocket_resubscribe_batch = api.get(
+                "websocket_resubscribe_batch", config.api.websocket_resubscribe_batch
+            )
+            config.api.websocket_resubscribe_stagger = api.get(
+                "websocket_resubscribe_stagger", config.api.websocket_resubscribe_stagger
+            )
+            config.api.websocket_shards = api.get("websocket_shards", config.api.websocket_shards)
+            config.api.websocket_lean_parse = api.get(
+                "websocket_lean_parse", config.api.websocket_lean_parse
+            )
+            config.api.websocket_latency_tracing = api.get(
+                "websocket_latency_tracing", config.api.websocket_latency_tracing
+            )
+            config.api.websocket_latency_sample_every = api.get(
+                "websocket_latency_sample_every", config.api.websocket_latency_sample_every
+            )
             config.api.polymarket_rate_limit_calls = api.get(
                 "rate_limit_calls", config.api.polymarket_rate_limit_calls
             )
             config.api.polymarket_rate_limit_period = api.get(
                 "rate_limit_period", config.api.polymarket_rate_limit_period
             )
+            config.api.adaptive_rate_limit = api.get(
+                "adaptive_rate_limit", config.api.adaptive_rate_limit
+            )
+            config.api.rate_limit_max_multiplier = api.get(
+                "rate_limit_max_multiplier", config.api.rate_limit_max_multiplier
+            )
+            config.api.rate_limit_latency_threshold = api.get(
+                "rate_limit_latency_threshold", config.api.rate_limit_latency_threshold
+            )
+            config.api.request_starvation_timeout = api.get(
+                "request_starvation_timeout", config.api.request_starvation_timeout
+            )
+            config.api.hedged_reads = api.get("hedged_reads", config.api.hedged_reads)
+            config.api.hedge_budget = api.get("hedge_budget", config.api.hedge_budget)
+            config.api.portfolio_cache = api.get("portfolio_cache", config.api.portfolio_cache)
+            config.api.portfolio_reconcile_interval = api.get(
+                "portfolio_reconcile_interval", config.api.portfolio_reconcile_interval
+            )
             config.api.circuit_breaker_threshold = api.get(
                 "circuit_breaker_threshold", config.api.circuit_breaker_threshold
             )
@@ -438,6 +588,55 @@ def load_config() -> Config:
             config.api.positions_cache_max_size = api.get(
                 "positions_cache_max_size", config.api.positions_cache_max_size
             )
+            config.api.market_scan_page_size = api.get(
+                "market_scan_page_size", config.api.market_scan_page_size
+            )
+            config.api.market_scan_prefetch = api.get(
+                "market_scan_prefetch", config.api.market_scan_prefetch
+            )
+            config.api.fast_market_decode = api.get(
+                "fast_market_decode", config.api.fast_market_decode
+            )
+            config.api.http2 = api.get("http2", config.api.http2)
+            config.api.http_max_connections = api.get(
+                "http_max_connections", config.api.http_max_connections
+            )
+            config.api.http_max_keepalive = api.get(
+                "http_max_keepalive", config.api.http_max_keepalive
+            )
+            config.api.http_keepalive_expiry = api.get(
+                "http_keepalive_expiry", config.api.http_keepalive_expiry
+            )
+            config.api.http_warm_up = api.get("http_warm_up", config.api.http_warm_up)
+            config.api.native_clob = api.get("native_clob", config.api.native_clob)
+            config.api.orderbook_max_age = api.get(
+                "orderbook_max_age", config.api.orderbook_max_age
+            )
+            config.api.order_user_channel = api.get(
+                "order_user_channel", config.api.order_user_channel
+            )
+            config.api.order_sync_interval = api.get(
+                "order_sync_interval", config.api.order_sync_interval
+            )
+            config.api.order_resync_interval = api.get(
+                "order_resync_interval", config.api.order_resync_interval
+            )
+            config.api.order_journal = api.get("order_journal", config.api.order_journal)
+            config.api.order_journal_dir = api.get(
+                "order_journal_dir", config.api.order_journal_dir
+            )
+            config.api.order_journal_flush_interval = api.get(
+                "order_journal_flush_interval", config.api.order_journal_flush_interval
+            )
+            config.api.order_journal_snapshot_every = api.get(
+                "order_journal_snapshot_every", config.api.order_journal_snapshot_every
+            )
+            config.api.order_event_queue_size = api.get(
+                "order_event_queue_size", config.api.order_event_queue_size
+            )
+            config.api.order_event_overflow = api.get(
+                "order_event_overflow", config.api.order_event_overflow
+            )
 
             # Agent settings
             agent = data.get("agent", {})
@@ -464,6 +663,55 @@ def load_config() -> Config:
             config.agent.risk_save_interval = agent.get(
                 "risk_save_interval", config.agent.risk_save_interval
             )
+            config.agent.observe_markets_timeout = agent.get(
+                "observe_markets_timeout", config.agent.observe_markets_timeout
+            )
+            config.agent.observe_positions_timeout = agent.get(
+                "observe_positions_timeout", config.agent.observe_positions_timeout
+            )
+            config.agent.observe_balance_timeout = agent.get(
+                "observe_balance_timeout", config.agent.observe_balance_timeout
+            )
+            config.agent.observe_markets_max_age = agent.get(
+                "observe_markets_max_age", config.agent.observe_markets_max_age
+            )
+            config.agent.observe_positions_max_age = agent.get(
+                "observe_positions_max_age", config.agent.observe_positions_max_age
+            )
+            config.agent.observe_balance_max_age = agent.get(
+                "observe_balance_max_age", config.agent.observe_balance_max_age
+            )
+            config.agent.pipelined_loop = agent.get("pipelined_loop", config.agent.pipelined_loop)
+            config.agent.observation_max_age = agent.get(
+                "observation_max_age", config.agent.observation_max_age
+            )
+            config.agent.max_price_drift = agent.get(
+                "max_price_drift", config.agent.max_price_drift
+            )
+            config.agent.trigger_price_move = agent.get(
+                "trigger_price_move", config.agent.trigger_price_move
+            )
+            config.agent.trigger_spread_change = agent.get(
+                "trigger_spread_change", config.agent.trigger_spread_change
+            )
+            config.agent.trigger_volume_spike = agent.get(
+                "trigger_volume_spike", config.agent.trigger_volume_spike
+            )
+            config.agent.trigger_max_idle = agent.get(
+                "trigger_max_idle", config.agent.trigger_max_idle
+            )
+            config.agent.trigger_debounce = agent.get(
+                "trigger_debounce", config.agent.trigger_debounce
+            )
+            config.agent.trigger_min_interval = agent.get(
+                "trigger_min_interval", config.agent.trigger_min_interval
+            )
+            config.agent.log_latency_breakdown = agent.get(
+                "log_latency_breakdown", config.agent.log_latency_breakdown
+            )
+            config.agent.market_delta_threshold = agent.get(
+                "market_delta_threshold", config.agent.market_delta_threshold
+            )
 
         except Exception:
             pass
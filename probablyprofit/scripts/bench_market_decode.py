@@ -0,0 +1,85 @@
+"""
+Micro-benchmark for Gamma market decoding.
+
+Compares the validated decoder (json + pydantic per row) against the
+fast path (orjson when installed + trusted model construction) on a synthetic
+Gamma /markets payload and prints markets/second for each.
+
+Usage:
+    python probablyprofit/scripts/bench_market_decode.py [num_markets] [rounds]
+"""
+
+import json
+import os
+import sys
+import time
+
+# Add project root to path
+# scripts/ is at <root>/probablyprofit/scripts/
+# We want to add <root> so we can import probablyprofit
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from probablyprofit.api import client as client_module
+from probablyprofit.api.client import PolymarketClient
+
+
+def build_payload(num_markets: int) -> bytes:
+    """Build a raw Gamma /markets response body."""
+    rows = []
+    for i in range(num_markets):
+        rows.append(
+            {
+                "conditionId": f"0x{i:064x}",
+                "question": f"Will benchmark market {i} resolve YES?",
+                "description": "Synthetic market used for decoder benchmarking. " * 4,
+                "endDate": "2030-01-01T00:00:00Z",
+                "outcomes": '["Yes", "No"]',
+                "outcomePrices": f'["{(i % 100) / 100:.2f}", "{1 - (i % 100) / 100:.2f}"]',
+                "clobTokenIds": f'["{i:077d}", "{i + 1:077d}"]',
+                "volumeNum": 1000 + i,
+                "liquidityNum": 500 + i,
+                "active": True,
+                "closed": False,
+            }
+        )
+    return json.dumps(rows).encode()
+
+
+def bench(client: PolymarketClient, payload: bytes, fast: bool, rounds: int) -> float:
+    """Decode the payload `rounds` times and return markets/second."""
+    client.fast_decode = fast
+    loads = client_module._fast_json_loads if fast else json.loads
+    decode = client._decode_markets
+
+    decoded = 0
+    start = time.perf_counter()
+    for _ in range(rounds):
+        decoded += len(decode(loads(payload)))
+    elapsed = time.perf_counter() - start
+    return decoded / elapsed
+
+
+def main() -> None:
+    num_markets = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    client = PolymarketClient()
+    payload = build_payload(num_markets)
+    backend = "orjson" if client_module.orjson_avail else "json (orjson not installed)"
+
+    print(f"🧪 Decoding {num_markets} markets x {rounds} rounds ({len(payload) / 1e6:.1f} MB)")
+
+    # Warm up both paths once
+    bench(client, payload, fast=False, rounds=1)
+    bench(client, payload, fast=True, rounds=1)
+
+    validated = bench(client, payload, fast=False, rounds=rounds)
+    fast = bench(client, payload, fast=True, rounds=rounds)
+
+    print(f"Validated decoder (json + pydantic):  {validated:>12,.0f} markets/s")
+    print(f"Fast decoder ({backend}): {fast:>12,.0f} markets/s")
+    print(f"Speedup: {fast / validated:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
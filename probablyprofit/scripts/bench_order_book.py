@@ -0,0 +1,143 @@
+"""
+Benchmark for the indexed OrderBook.
+
+Fills an OrderBook with N resting orders spread over M markets (a share of
+them partially filled) and times the hot queries: per-market and per-status
+lookups, the partial-fill timeout scan and recent history. Each indexed
+query is compared with the equivalent filter over get_active(), which is
+what those paths cost before the indexes existed.
+
+Usage:
+    python probablyprofit/scripts/bench_order_book.py [num_orders] [num_markets]
+"""
+
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable
+
+# Add project root to path
+# scripts/ is at <root>/probablyprofit/scripts/
+# We want to add <root> so we can import probablyprofit
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from probablyprofit.api.order_manager import (
+    Fill,
+    ManagedOrder,
+    OrderBook,
+    OrderSide,
+    OrderStatus,
+)
+
+
+async def build_book(num_orders: int, num_markets: int) -> OrderBook:
+    """Open orders across markets; every 10th partially filled, every 100th long ago."""
+    book = OrderBook(max_history=num_orders)
+    now = datetime.now()
+    for i in range(num_orders):
+        order = ManagedOrder(
+            order_id=f"order_{i}",
+            market_id=f"0x{i % num_markets:064x}",
+            outcome="Yes",
+            side=OrderSide.BUY,
+            size=100.0,
+            price=0.5,
+            status=OrderStatus.OPEN,
+        )
+        await book.add(order)
+        if i % 10 == 0:
+            age = timedelta(hours=1) if i % 100 == 0 else timedelta(seconds=i % 60)
+            order.add_fill(
+                Fill(
+                    fill_id=f"f{i}",
+                    order_id=order.order_id,
+                    size=10,
+                    price=0.5,
+                    timestamp=now - age,
+                )
+            )
+            await book.update(order)
+
+    # Some history to page through
+    for i in range(num_orders, num_orders + 1000):
+        done = ManagedOrder(
+            order_id=f"order_{i}",
+            market_id="0x0",
+            outcome="Yes",
+            side=OrderSide.BUY,
+            size=1.0,
+            price=0.5,
+            status=OrderStatus.FILLED,
+        )
+        await book.update(done)
+    return book
+
+
+async def rate(fn: Callable[[], Awaitable[object]], seconds: float = 0.5) -> float:
+    """Calls per second of `fn` over roughly `seconds`."""
+    calls = 0
+    start = time.perf_counter()
+    while (elapsed := time.perf_counter() - start) < seconds:
+        for _ in range(10):
+            await fn()
+        calls += 10
+    return calls / elapsed
+
+
+async def run(num_orders: int, num_markets: int) -> None:
+    start = time.perf_counter()
+    book = await build_book(num_orders, num_markets)
+    build = time.perf_counter() - start
+    print(f"  Built in {build:.2f}s ({num_orders / build:,.0f} add+update/s)")
+
+    market = f"0x{7:064x}"
+    cutoff = datetime.now() - timedelta(minutes=5)
+
+    async def scan_market():
+        return [o for o in await book.get_active() if o.market_id == market]
+
+    async def scan_status():
+        return [o for o in await book.get_active() if o.status == OrderStatus.PARTIALLY_FILLED]
+
+    async def scan_timeouts():
+        return [
+            o
+            for o in await book.get_active()
+            if o.status == OrderStatus.PARTIALLY_FILLED
+            and o.fills
+            and max(f.timestamp for f in o.fills) <= cutoff
+        ]
+
+    cases = [
+        ("get_by_market", lambda: book.get_by_market(market), scan_market),
+        (
+            "get_by_status(PARTIAL)",
+            lambda: book.get_by_status(OrderStatus.PARTIALLY_FILLED),
+            scan_status,
+        ),
+        ("partial-fill timeouts", lambda: book.get_partial_fills_before(cutoff), scan_timeouts),
+    ]
+    for label, indexed, scan in cases:
+        fast = await rate(indexed)
+        slow = await rate(scan)
+        print(
+            f"  {label:<24} {fast:>12,.0f}/s indexed  {slow:>10,.0f}/s scan  "
+            f"({fast / slow:,.0f}x)"
+        )
+
+    history = await rate(lambda: book.get_history(100))
+    print(f"  {'get_history(100)':<24} {history:>12,.0f}/s")
+
+
+def main() -> None:
+    num_orders = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    num_markets = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+
+    print(f"📚 OrderBook with {num_orders:,} active orders over {num_markets:,} markets")
+    asyncio.run(run(num_orders, num_markets))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Benchmark for the order journal.
+
+Journals N orders receiving fills through an OrderBook, comparing the cost
+of the hot path (book update + dirty mark) with a plain OrderBook, then
+measures group-commit flushes and how long recovery takes from a snapshot
+plus journal tail.
+
+Usage:
+    python probablyprofit/scripts/bench_order_journal.py [num_orders] [fills_per_order]
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+# Add project root to path
+# scripts/ is at <root>/probablyprofit/scripts/
+# We want to add <root> so we can import probablyprofit
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from probablyprofit.api.order_journal import OrderJournal
+from probablyprofit.api.order_manager import (
+    Fill,
+    ManagedOrder,
+    OrderBook,
+    OrderSide,
+    OrderStatus,
+)
+
+
+async def drive(book: OrderBook, num_orders: int, fills_per_order: int) -> float:
+    """Add orders and apply fills; returns seconds spent in book calls."""
+    start = time.perf_counter()
+    orders = []
+    for i in range(num_orders):
+        order = ManagedOrder(
+            order_id=f"order_{i}",
+            market_id=f"0x{i % 200:064x}",
+            outcome="Yes",
+            side=OrderSide.BUY,
+            size=100.0,
+            price=0.5,
+            status=OrderStatus.OPEN,
+        )
+        await book.add(order)
+        orders.append(order)
+    for n in range(fills_per_order):
+        for order in orders:
+            order.add_fill(
+                Fill(fill_id=f"{order.order_id}_{n}", order_id=order.order_id, size=1, price=0.5)
+            )
+            await book.update(order)
+    return time.perf_counter() - start
+
+
+async def run(num_orders: int, fills_per_order: int) -> None:
+    updates = num_orders * (1 + fills_per_order)
+    plain = await drive(OrderBook(max_history=num_orders), num_orders, fills_per_order)
+
+    with tempfile.TemporaryDirectory() as directory:
+        journal = OrderJournal(directory, flush_interval=3600, snapshot_every=updates * 10)
+        book = OrderBook(max_history=num_orders, journal=journal)
+        journaled = await drive(book, num_orders, fills_per_order)
+        print(
+            f"  Hot path:   {plain / updates * 1e6:6.1f}us/update plain, "
+            f"{journaled / updates * 1e6:6.1f}us/update journaled"
+        )
+
+        start = time.perf_counter()
+        lines = await journal.flush()
+        flush = time.perf_counter() - start
+        print(
+            f"  Commit:     {updates:,} updates -> {lines:,} lines, one fsync, {flush * 1000:.1f}ms"
+        )
+
+        start = time.perf_counter()
+        await journal.snapshot()
+        print(
+            f"  Snapshot:   {num_orders:,} orders in {(time.perf_counter() - start) * 1000:.1f}ms"
+        )
+
+        # Journal tail after the snapshot
+        for order in list(await book.get_active())[: num_orders // 10]:
+            order.add_fill(
+                Fill(fill_id=f"{order.order_id}_tail", order_id=order.order_id, size=1, price=0.5)
+            )
+            await book.update(order)
+        await journal.flush()
+        stats = journal.stats
+        await journal.close()
+
+        restarted = OrderJournal(directory)
+        orders, replay = restarted.load()
+        print(
+            f"  Recovery:   {len(orders):,} orders (snapshot generation {stats['generation']} "
+            f"+ {replay['replayed']:,} journal lines) in {replay['seconds'] * 1000:.1f}ms"
+        )
+
+
+def main() -> None:
+    num_orders = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    fills_per_order = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+
+    print(f"📒 Order journal with {num_orders:,} orders x {fills_per_order} fills")
+    asyncio.run(run(num_orders, fills_per_order))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Micro-benchmark for WebSocket message parsing.
+
+Runs synthetic price ticks and orderbook snapshots through
+WebSocketClient._handle_message with the standard parser (PriceUpdate /
+OrderbookUpdate, full payload kept) and the lean parser (PriceTick /
+BookTick, orjson when installed), both one event per frame and batched.
+Everything runs on one thread, so the rates printed are messages/second
+per core. Garbage-collector runs are reported alongside as a proxy for
+allocation churn.
+
+Usage:
+    python probablyprofit/scripts/bench_ws_parse.py [num_messages] [batch_size]
+"""
+
+import asyncio
+import gc
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List
+
+# Add project root to path
+# scripts/ is at <root>/probablyprofit/scripts/
+# We want to add <root> so we can import probablyprofit
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from probablyprofit.api import websocket as websocket_module
+from probablyprofit.api.websocket import WebSocketClient
+
+
+def build_events(num_messages: int) -> List[Dict[str, Any]]:
+    """Build a 9:1 mix of price ticks and 10-level orderbook snapshots."""
+    events: List[Dict[str, Any]] = []
+    for i in range(num_messages):
+        market = f"0x{i % 500:064x}"
+        if i % 10:
+            events.append(
+                {
+                    "type": "price_change",
+                    "market": market,
+                    "outcome": "Yes",
+                    "price": f"{(i % 100) / 100:.2f}",
+                    "volume": str(i % 37),
+                    "timestamp": "1700000000000",
+                }
+            )
+        else:
+            events.append(
+                {
+                    "type": "book",
+                    "market": market,
+                    "outcome": "Yes",
+                    "bids": [{"price": f"0.{40 - n:02d}", "size": "100"} for n in range(10)],
+                    "asks": [{"price": f"0.{41 + n:02d}", "size": "100"} for n in range(10)],
+                    "timestamp": "1700000000000",
+                }
+            )
+    return events
+
+
+def build_frames(events: List[dict], batch_size: int) -> List[str]:
+    """Encode events as frames of `batch_size` events (1 = one object per frame)."""
+    if batch_size <= 1:
+        return [json.dumps(event) for event in events]
+    return [json.dumps(events[i : i + batch_size]) for i in range(0, len(events), batch_size)]
+
+
+def bench(frames: List[str], num_messages: int, lean: bool) -> tuple:
+    """Parse and deliver every frame; return (messages/second, GC runs)."""
+    client = WebSocketClient(reconnect=False, conflate=False, lean_parse=lean)
+    received = []
+    client.on_price_update(received.append)
+    client.on_orderbook_update(received.append)
+    handle = client._handle_message
+
+    async def run() -> float:
+        start = time.perf_counter()
+        for frame in frames:
+            await handle(frame)
+        return time.perf_counter() - start
+
+    gc.collect()
+    collections = sum(stat["collections"] for stat in gc.get_stats())
+    elapsed = asyncio.run(run())
+    gc_runs = sum(stat["collections"] for stat in gc.get_stats()) - collections
+
+    assert len(received) == num_messages
+    return num_messages / elapsed, gc_runs
+
+
+def main() -> None:
+    num_messages = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    events = build_events(num_messages)
+    single = build_frames(events, 1)
+    batched = build_frames(events, batch_size)
+    backend = "orjson" if websocket_module._json_loads is not json.loads else "json"
+
+    print(f"🧪 Parsing {num_messages:,} messages (lean JSON backend: {backend})")
+
+    # Warm up both paths once
+    bench(single[:1000], 1000, lean=False)
+    bench(single[:1000], 1000, lean=True)
+
+    for label, frames in (("1 event/frame", single), (f"{batch_size} events/frame", batched)):
+        standard, standard_gc = bench(frames, num_messages, lean=False)
+        lean, lean_gc = bench(frames, num_messages, lean=True)
+        print(f"\n{label}")
+        print(f"  Standard parse: {standard:>12,.0f} msg/s/core  ({standard_gc} GC runs)")
+        print(f"  Lean parse:     {lean:>12,.0f} msg/s/core  ({lean_gc} GC runs)")
+        print(f"  Speedup: {lean / standard:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
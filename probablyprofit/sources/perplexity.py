@@ -13,6 +13,8 @@ import httpx
 from loguru import logger
 from pydantic import BaseModel
 
+from probablyprofit.utils.http_pool import get_http_pool
+
 
 class NewsItem(BaseModel):
     """A single news item."""
@@ -90,7 +92,7 @@ class PerplexityClient:
         self.api_key = api_key
         self.model = model
         self.timeout = timeout
-        self._client = httpx.AsyncClient(
+        self._client = get_http_pool("external").client(
             base_url=self.BASE_URL,
             timeout=timeout,
             headers={
@@ -14,6 +14,8 @@ import httpx
 from loguru import logger
 from pydantic import BaseModel
 
+from probablyprofit.utils.http_pool import get_http_pool
+
 
 class RedditPost(BaseModel):
     """A Reddit post or comment."""
@@ -211,7 +213,7 @@ class RedditClient:
             user_agent: User agent string
         """
         self.timeout = timeout
-        self._client = httpx.AsyncClient(
+        self._client = get_http_pool("external").client(
             timeout=timeout,
             headers={"User-Agent": user_agent},
             follow_redirects=True,
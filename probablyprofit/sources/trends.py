@@ -9,10 +9,11 @@ import asyncio
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
-import httpx
 from loguru import logger
 from pydantic import BaseModel
 
+from probablyprofit.utils.http_pool import get_http_pool
+
 
 class TrendData(BaseModel):
     """Trend data for a keyword."""
@@ -98,7 +99,7 @@ class GoogleTrendsClient:
     def __init__(self, timeout: float = 30.0):
         """Initialize Google Trends client."""
         self.timeout = timeout
-        self._client = httpx.AsyncClient(
+        self._client = get_http_pool("external").client(
             timeout=timeout,
             headers={
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
@@ -15,6 +15,8 @@ import httpx
 from loguru import logger
 from pydantic import BaseModel
 
+from probablyprofit.utils.http_pool import get_http_pool
+
 
 class Tweet(BaseModel):
     """A single tweet."""
@@ -221,7 +223,7 @@ class TwitterClient:
         if bearer_token:
             headers["Authorization"] = f"Bearer {bearer_token}"
 
-        self._client = httpx.AsyncClient(
+        self._client = get_http_pool("external").client(
             timeout=timeout,
             headers=headers,
             follow_redirects=True,
@@ -9,6 +9,7 @@ Simulates exchange behavior for integration testing:
 """
 
 import asyncio
+import json
 import random
 import uuid
 from dataclasses import dataclass, field
@@ -16,6 +17,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional
 
+import httpx
 from loguru import logger
 
 
@@ -315,3 +317,143 @@ class MockExchangeClient:
 def create_mock_client(**kwargs) -> MockExchangeClient:
     """Create a mock exchange client."""
     return MockExchangeClient(**kwargs)
+
+
+class MockClobServer:
+    """
+    In-process stand-in for the Polymarket CLOB REST API.
+
+    Serves the endpoints used by AsyncClobClient through an httpx
+    MockTransport and rejects requests whose L2 HMAC signature does not
+    match the configured credentials.
+
+    Usage:
+        server = MockClobServer(creds)
+        http_client = httpx.AsyncClient(base_url="https://clob.test", transport=server.transport)
+    """
+
+    def __init__(self, creds: Any, page_size: int = 2, latency_ms: int = 0):
+        self.creds = creds
+        self.page_size = page_size
+        self.latency_ms = latency_ms
+
+        # State
+        self.orders: Dict[str, Dict[str, Any]] = {}
+        self.trades: List[Dict[str, Any]] = []
+        self.requests: List[str] = []
+        self.reject_prices_above: Optional[float] = None
+        self.bulk_cancel_enabled = True
+
+    @property
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    def _authorized(self, request: httpx.Request) -> bool:
+        from py_clob_client.signing.hmac import build_hmac_signature
+
+        headers = request.headers
+        if headers.get("POLY_API_KEY") != self.creds.api_key:
+            return False
+        body = request.content.decode() or None
+        expected = build_hmac_signature(
+            self.creds.api_secret,
+            headers.get("POLY_TIMESTAMP", ""),
+            request.method,
+            request.url.path,
+            body,
+        )
+        return headers.get("POLY_SIGNATURE") == expected
+
+    def _page(self, rows: List[Dict[str, Any]], cursor: str) -> Dict[str, Any]:
+        start = 0 if cursor == "MA==" else int(cursor)
+        end = start + self.page_size
+        next_cursor = str(end) if end < len(rows) else "LTE="
+        return {"data": rows[start:end], "next_cursor": next_cursor}
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        if self.latency_ms > 0:
+            await asyncio.sleep(self.latency_ms / 1000.0)
+
+        path = request.url.path
+        params = request.url.params
+        self.requests.append(f"{request.method} {path}")
+
+        # Public market parameters
+        if path == "/tick-size":
+            return httpx.Response(200, json={"minimum_tick_size": 0.01})
+        if path == "/neg-risk":
+            return httpx.Response(200, json={"neg_risk": False})
+        if path == "/fee-rate":
+            return httpx.Response(200, json={"base_fee": 0})
+
+        if not self._authorized(request):
+            return httpx.Response(401, json={"error": "Unauthorized/Invalid api key"})
+
+        if request.method == "POST" and path == "/order":
+            payload = json.loads(request.content)
+            order = payload["order"]
+            price = int(order["makerAmount"]) / int(order["takerAmount"])
+            if order["side"] == "SELL":
+                price = int(order["takerAmount"]) / int(order["makerAmount"])
+            if self.reject_prices_above is not None and price > self.reject_prices_above:
+                return httpx.Response(200, json={"success": False, "errorMsg": "price rejected"})
+            order_id = f"0x{uuid.uuid4().hex}"
+            self.orders[order_id] = {
+                "id": order_id,
+                "status": "LIVE",
+                "asset_id": order["tokenId"],
+                "side": order["side"],
+                "price": f"{price:.2f}",
+                "order_type": payload["orderType"],
+                "owner": payload["owner"],
+                "created_at": 0,
+            }
+            return httpx.Response(
+                200, json={"success": True, "orderID": order_id, "status": "live"}
+            )
+
+        if request.method == "DELETE" and path in ("/order", "/orders"):
+            if path == "/orders" and not self.bulk_cancel_enabled:
+                return httpx.Response(404, json={"error": "not found"})
+            payload = json.loads(request.content)
+            ids = [payload["orderID"]] if path == "/order" else payload
+            canceled = [oid for oid in ids if oid in self.orders]
+            for oid in canceled:
+                self.orders[oid]["status"] = "CANCELED"
+            not_canceled = {oid: "order not found" for oid in ids if oid not in self.orders}
+            return httpx.Response(200, json={"canceled": canceled, "not_canceled": not_canceled})
+
+        if request.method == "DELETE" and path in ("/cancel-all", "/cancel-market-orders"):
+            if not self.bulk_cancel_enabled:
+                return httpx.Response(404, json={"error": "not found"})
+            payload = json.loads(request.content) if request.content else {}
+            canceled = [
+                oid
+                for oid, o in self.orders.items()
+                if o["status"] == "LIVE"
+                and (path == "/cancel-all" or payload.get("asset_id") in ("", o["asset_id"]))
+            ]
+            for oid in canceled:
+                self.orders[oid]["status"] = "CANCELED"
+            return httpx.Response(200, json={"canceled": canceled, "not_canceled": {}})
+
+        if request.method == "GET" and path == "/data/orders":
+            live = [o for o in self.orders.values() if o["status"] == "LIVE"]
+            return httpx.Response(200, json=self._page(live, params.get("next_cursor", "MA==")))
+
+        if request.method == "GET" and path.startswith("/data/order/"):
+            order = self.orders.get(path.rsplit("/", 1)[-1])
+            return httpx.Response(200, json=order or {})
+
+        if request.method == "GET" and path == "/data/trades":
+            trades = [
+                t
+                for t in self.trades
+                if all(
+                    params.get(key) in (None, t.get(key)) for key in ("id", "market", "asset_id")
+                )
+                and int(t.get("match_time", 0)) > int(params.get("after", -1))
+            ]
+            return httpx.Response(200, json=self._page(trades, params.get("next_cursor", "MA==")))
+
+        return httpx.Response(404, json={"error": "not found"})
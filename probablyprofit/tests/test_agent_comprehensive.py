@@ -3,14 +3,16 @@ Comprehensive tests for the Agent framework.
 """
 
 import asyncio
-from datetime import datetime
+from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from probablyprofit.agent.base import AgentMemory, BaseAgent, Decision, Observation
 from probablyprofit.api.client import Market, Order, Position
+from probablyprofit.api.exceptions import NetworkException
 from probablyprofit.risk.manager import RiskManager
+from probablyprofit.tests.conftest import create_mock_position
 
 
 class TestObservation:
@@ -144,6 +146,68 @@ class TestBaseAgent:
         mock_client.get_positions.assert_called_once()
         mock_client.get_balance.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_observe_records_stage_timings(self, mock_agent):
+        observation = await mock_agent.observe()
+
+        assert set(observation.metadata["stage_timings_ms"]) == {"markets", "positions", "balance"}
+        assert observation.metadata["stale_stages"] == []
+
+    @pytest.mark.asyncio
+    async def test_observe_uses_last_balance_when_slow(self, mock_agent, mock_client, monkeypatch):
+        from probablyprofit.config import get_config
+
+        await mock_agent.observe()
+
+        async def slow_balance():
+            await asyncio.sleep(1.0)
+            return 0.0
+
+        monkeypatch.setattr(get_config().agent, "observe_balance_timeout", 0.05)
+        mock_client.get_balance.side_effect = slow_balance
+        mock_client.get_positions.side_effect = NetworkException("positions down")
+
+        observation = await mock_agent.observe()
+
+        assert observation.balance == 1000.0
+        assert sorted(observation.metadata["stale_stages"]) == ["balance", "positions"]
+
+    @pytest.mark.asyncio
+    async def test_observe_without_fallback_raises(self, mock_agent, mock_client):
+        mock_client.get_markets.side_effect = NetworkException("gamma down")
+
+        with pytest.raises(NetworkException):
+            await mock_agent.observe()
+
+    @pytest.mark.asyncio
+    async def test_observe_failure_cancels_sibling_stages(self, mock_agent, mock_client):
+        cancelled = asyncio.Event()
+
+        async def slow_balance():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        mock_client.get_balance.side_effect = slow_balance
+        mock_client.get_markets.side_effect = NetworkException("gamma down")
+
+        with pytest.raises(NetworkException):
+            await mock_agent.observe()
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_observe_fallback_expires(self, mock_agent, mock_client, monkeypatch):
+        from probablyprofit.config import get_config
+
+        await mock_agent.observe()
+        monkeypatch.setattr(get_config().agent, "observe_positions_max_age", 0.0)
+        mock_client.get_positions.side_effect = NetworkException("positions down")
+
+        with pytest.raises(NetworkException):
+            await mock_agent.observe()
+
     @pytest.mark.asyncio
     async def test_act_hold(self, mock_agent):
         decision = Decision(action="hold", reasoning="No opportunities")
@@ -398,3 +462,99 @@ class TestAgentLoop:
         assert mock_agent.running is False
         # Should have accumulated errors
         assert error_count[0] >= max_errors
+
+
+class TestPipelinedLoop:
+    """Tests for the pipelined observe/decide/act loop."""
+
+    @pytest.mark.asyncio
+    async def test_next_observation_overlaps_decision(self, mock_agent, monkeypatch):
+        from probablyprofit.config import get_config
+
+        monkeypatch.setattr(get_config().agent, "pipelined_loop", True)
+        mock_agent.risk_manager.save_state = AsyncMock()
+        mock_agent.loop_interval = 0
+        events = []
+
+        original_observe = mock_agent.observe
+
+        async def observe():
+            events.append("observe")
+            return await original_observe()
+
+        async def slow_decide(obs):
+            await asyncio.sleep(0.05)
+            events.append("decided")
+            if events.count("decided") == 2:
+                mock_agent.stop()
+            return Decision(action="hold", reasoning="Test")
+
+        mock_agent.observe = observe
+        mock_agent.decide = slow_decide
+
+        await mock_agent.run_loop()
+
+        # Iteration 2's observation is fetched while iteration 1 is still deciding
+        assert events[:3] == ["observe", "observe", "decided"]
+
+    @pytest.mark.asyncio
+    async def test_prefetch_keeps_positions_traded_after_its_read(self, mock_agent, mock_client):
+        """A positions read that predates act() does not undo what act() traded."""
+        mock_agent.dry_run = False
+        mock_agent._record_position("0x002", "No")
+        release = asyncio.Event()
+        stale = [create_mock_position("0x002", "No", 25.0, 0.45, 0.48)]
+
+        async def slow_positions():
+            await release.wait()
+            return stale
+
+        mock_client.get_positions.side_effect = slow_positions
+        prefetch = asyncio.create_task(mock_agent.observe())
+        await asyncio.sleep(0)
+
+        # act(N) trades while the prefetched read is in flight
+        mock_agent._record_position("0x001", "Yes")
+        mock_agent._forget_position("0x002", "No")
+        release.set()
+        await prefetch
+
+        assert mock_agent._has_position("0x001", "Yes")
+        assert not mock_agent._has_position("0x002", "No")
+
+        # The next read is newer than the trades and is taken as-is
+        mock_client.get_positions.side_effect = None
+        mock_client.get_positions.return_value = stale
+        await mock_agent.observe()
+        assert mock_agent._open_positions == {"0x002:No"}
+
+    @pytest.mark.asyncio
+    async def test_stale_trade_dropped_when_price_moved(self, mock_agent, mock_client):
+        observation = await mock_agent.observe()
+        observation.timestamp = datetime.now() - timedelta(seconds=60)
+        mock_client.get_orderbook.return_value = {
+            "bids": [{"price": "0.44", "size": "10"}],
+            "asks": [{"price": "0.46", "size": "10"}],
+        }
+        decision = Decision(action="buy", market_id="0x001", outcome="Yes", size=10, price=0.35)
+
+        revalidated = await mock_agent._revalidate_decision(decision, observation)
+        assert revalidated.action == "hold"
+
+        # Price within tolerance: trade goes ahead
+        mock_client.get_orderbook.return_value = {
+            "bids": [{"price": "0.34", "size": "10"}],
+            "asks": [{"price": "0.36", "size": "10"}],
+        }
+        assert await mock_agent._revalidate_decision(decision, observation) is decision
+
+    @pytest.mark.asyncio
+    async def test_stale_trade_dropped_when_repricing_fails(self, mock_agent, mock_client):
+        observation = await mock_agent.observe()
+        observation.timestamp = datetime.now() - timedelta(seconds=60)
+        mock_client.get_orderbook.side_effect = NetworkException("timeout")
+        decision = Decision(action="buy", market_id="0x001", outcome="Yes", size=10, price=0.35)
+
+        revalidated = await mock_agent._revalidate_decision(decision, observation)
+        assert revalidated.action == "hold"
+        assert "timeout" in revalidated.reasoning
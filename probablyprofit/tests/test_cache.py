@@ -7,7 +7,7 @@ import time
 
 import pytest
 
-from probablyprofit.utils.cache import AsyncTTLCache, TTLCache, cached
+from probablyprofit.utils.cache import AsyncTTLCache, SingleFlight, TTLCache, cached
 
 
 class TestTTLCache:
@@ -185,3 +185,60 @@ class TestCachedDecorator:
         # Access cache stats
         assert hasattr(add, "cache")
         assert add.cache.size == 1
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight request coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_request(self):
+        flight = SingleFlight("test")
+        call_count = [0]
+
+        async def fetch():
+            call_count[0] += 1
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(*(flight.do("key1", fetch) for _ in range(5)))
+
+        assert results == ["value"] * 5
+        assert call_count[0] == 1
+        assert flight.stats["leaders"] == 1
+        assert flight.stats["coalesced"] == 4
+        assert flight.in_flight == 0
+
+        # Completed calls are not cached
+        await flight.do("key1", fetch)
+        assert call_count[0] == 2
+
+    @pytest.mark.asyncio
+    async def test_exception_is_shared(self):
+        flight = SingleFlight("test")
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            flight.do("key1", fail), flight.do("key1", fail), return_exceptions=True
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert flight.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_followers(self):
+        flight = SingleFlight("test")
+
+        async def fetch():
+            await asyncio.sleep(0.02)
+            return "value"
+
+        leader = asyncio.create_task(flight.do("key1", fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("key1", fetch))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        assert await follower == "value"
@@ -5,6 +5,7 @@ Tests for the Polymarket API client.
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
 from probablyprofit.api.client import Market, Order, PolymarketClient, Position
@@ -88,3 +89,267 @@ class TestValidation:
 
         with pytest.raises(ValidationException):
             validate_side("HOLD")
+
+
+def _gamma_row(idx: int) -> dict:
+    """Build a raw Gamma /markets row."""
+    return {
+        "conditionId": f"0x{idx:04x}",
+        "question": f"Market {idx}?",
+        "endDate": "2030-01-01T00:00:00Z",
+        "outcomes": '["Yes", "No"]',
+        "outcomePrices": '["0.4", "0.6"]',
+        "clobTokenIds": f'["yes_{idx}", "no_{idx}"]',
+        "volumeNum": 5000,
+        "liquidityNum": 1000,
+        "active": True,
+        "closed": False,
+    }
+
+
+def _gamma_transport(total: int, requests: list) -> httpx.MockTransport:
+    """Mock Gamma transport serving `total` rows with limit/offset paging."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        limit = int(request.url.params["limit"])
+        offset = int(request.url.params["offset"])
+        requests.append(offset)
+        rows = [_gamma_row(i) for i in range(offset, min(offset + limit, total))]
+        return httpx.Response(200, json=rows)
+
+    return httpx.MockTransport(handler)
+
+
+class TestIterMarkets:
+    @pytest.mark.asyncio
+    async def test_streams_every_page(self, client):
+        requests: list = []
+        client.gamma_client = httpx.AsyncClient(
+            base_url="https://gamma-api.polymarket.com",
+            transport=_gamma_transport(total=25, requests=requests),
+        )
+
+        markets = [m async for m in client.iter_markets(page_size=10, prefetch=2)]
+
+        assert [m.condition_id for m in markets] == [f"0x{i:04x}" for i in range(25)]
+        assert sorted(requests)[:3] == [0, 10, 20]
+        # Token IDs are warmed as pages are parsed
+        assert client._token_id_cache.get("0x0000:Yes") == "yes_0"
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_early_exit_cancels_prefetch(self, client):
+        requests: list = []
+        client.gamma_client = httpx.AsyncClient(
+            base_url="https://gamma-api.polymarket.com",
+            transport=_gamma_transport(total=1000, requests=requests),
+        )
+
+        seen = []
+        stream = client.iter_markets(page_size=10, prefetch=3)
+        async for market in stream:
+            seen.append(market)
+            if len(seen) == 5:
+                break
+        await stream.aclose()
+
+        assert len(seen) == 5
+        # Only the prefetch window was ever requested
+        assert len(requests) <= 3
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_http_error_raises_network_exception(self, client):
+        from probablyprofit.api.exceptions import NetworkException
+
+        client.gamma_client = httpx.AsyncClient(
+            base_url="https://gamma-api.polymarket.com",
+            transport=httpx.MockTransport(lambda request: httpx.Response(500)),
+        )
+
+        with pytest.raises(NetworkException):
+            async for _ in client.iter_markets(page_size=10, prefetch=2):
+                pass
+        await client.close()
+
+
+class TestFastMarketDecode:
+    def test_fast_decoder_matches_validated_decoder(self, client):
+        rows = [_gamma_row(i) for i in range(5)]
+        rows.append({**_gamma_row(5), "volumeNum": 10})  # Filtered: low volume
+        rows.append({**_gamma_row(6), "closed": True})  # Filtered: closed
+        rows.append({**_gamma_row(7), "outcomePrices": '["bad", "0.5"]'})  # Parse failure
+        # Rejected by validation, so the fast decoder must reject them too
+        rows.append({**_gamma_row(8), "conditionId": None})
+        rows.append({**_gamma_row(9), "question": None})
+        rows.append({**_gamma_row(10), "active": None})
+
+        validated = client._parse_gamma_markets(rows)
+        client._token_id_cache.clear()
+        fast = client._parse_gamma_markets_fast(rows)
+
+        assert len(fast) == len(validated) == 5
+        for fast_market, market in zip(fast, validated):
+            assert fast_market.model_dump() == market.model_dump()
+        assert client._token_id_cache.get("0x0004:No") == "no_4"
+
+    @pytest.mark.asyncio
+    async def test_get_markets_uses_fast_decoder(self, client):
+        requests: list = []
+        client.fast_decode = True
+        client.gamma_client = httpx.AsyncClient(
+            base_url="https://gamma-api.polymarket.com",
+            transport=_gamma_transport(total=3, requests=requests),
+        )
+
+        markets = await client.get_markets(limit=10)
+
+        assert [m.condition_id for m in markets] == ["0x0000", "0x0001", "0x0002"]
+        assert markets[0].outcome_prices == [0.4, 0.6]
+        await client.close()
+
+
+class TestRequestCoalescing:
+    @pytest.mark.asyncio
+    async def test_concurrent_get_market_is_coalesced(self, client):
+        import asyncio
+
+        requests: list = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request.url.path)
+            await asyncio.sleep(0.01)
+            return httpx.Response(
+                200,
+                json={
+                    "condition_id": "0xabc",
+                    "question": "Coalesced?",
+                    "end_date": "2030-01-01T00:00:00",
+                    "outcomes": ["Yes", "No"],
+                    "clobTokenIds": ["yes_token", "no_token"],
+                },
+            )
+
+        client.http_client = httpx.AsyncClient(
+            base_url="https://clob.polymarket.com", transport=httpx.MockTransport(handler)
+        )
+
+        markets = await asyncio.gather(*(client.get_market("0xabc") for _ in range(5)))
+
+        assert requests == ["/markets/0xabc"]
+        assert all(m is markets[0] for m in markets)
+        assert client._market_flight.stats["coalesced"] == 4
+
+        # Concurrent token-id lookups resolve from the now cached market
+        token_ids = await asyncio.gather(
+            *(client._resolve_token_id("0xabc", "No") for _ in range(3))
+        )
+        assert token_ids == ["no_token"] * 3
+        assert len(requests) == 1
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_get_orderbook_is_coalesced(self, client):
+        import asyncio
+
+        requests: list = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request.url.path)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"bids": [], "asks": [{"price": "0.5"}]})
+
+        client.http_client = httpx.AsyncClient(
+            base_url="https://clob.polymarket.com", transport=httpx.MockTransport(handler)
+        )
+
+        books = await asyncio.gather(
+            client.get_orderbook("0xabc", "Yes"),
+            client.get_orderbook("0xabc", "Yes"),
+            client.get_orderbook("0xabc", "No"),
+        )
+
+        assert sorted(requests) == ["/orderbook/0xabc/No", "/orderbook/0xabc/Yes"]
+        assert books[0] == books[1] == {"bids": [], "asks": [{"price": "0.5"}]}
+        await client.close()
+
+
+class _FakeClob:
+    """Stand-in for the sync py-clob client: signs and posts orders."""
+
+    def __init__(self):
+        self.posted = []
+
+    def create_order(self, order_args):
+        return {"signed": order_args.token_id, "price": order_args.price}
+
+    def post_order(self, signed, order_type):
+        if signed["price"] > 0.9:
+            return {"success": False, "errorMsg": "price too high"}
+        self.posted.append((signed["signed"], order_type))
+        return {"success": True, "orderID": f"order_{len(self.posted)}"}
+
+
+class TestPlaceOrdersBatch:
+    @pytest.mark.asyncio
+    async def test_batch_returns_per_order_results(self, client):
+        fake = _FakeClob()
+        client.client = fake
+        client._token_id_cache.set("0xabc:Yes", "yes_token")
+        client._token_id_cache.set("0xabc:No", "no_token")
+
+        results = await client.place_orders_batch(
+            [
+                {"market_id": "0xabc", "outcome": "Yes", "side": "BUY", "size": 10, "price": 0.4},
+                {"market_id": "0xabc", "outcome": "No", "side": "BUY", "size": 10, "price": 0.95},
+                {"market_id": "0xabc", "outcome": "Yes", "side": "HOLD", "size": 10, "price": 0.4},
+                {"market_id": "0xabc", "outcome": "No", "side": "SELL", "size": 5, "price": 0.5},
+            ]
+        )
+
+        assert [r.index for r in results] == [0, 1, 2, 3]
+        assert [r.success for r in results] == [True, False, False, True]
+        assert results[1].error == "price too high"
+        assert "Invalid order parameters" in results[2].error
+        assert sorted(token for token, _ in fake.posted) == ["no_token", "yes_token"]
+        assert {r.order.order_id for r in results if r.success} == {"order_1", "order_2"}
+
+    @pytest.mark.asyncio
+    async def test_batch_requires_credentials(self, client):
+        from probablyprofit.api.exceptions import OrderException
+
+        with pytest.raises(OrderException):
+            await client.place_orders_batch([])
+
+
+class TestAdaptiveRateLimit:
+    @pytest.mark.asyncio
+    async def test_responses_feed_per_endpoint_limiters(self, monkeypatch):
+        from probablyprofit.api import client as client_module
+        from probablyprofit.config import get_config
+
+        monkeypatch.setattr(get_config().api, "adaptive_rate_limit", True)
+        monkeypatch.setattr(client_module, "_endpoint_rate_limiters", {})
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "POST":
+                return httpx.Response(429, headers={"Retry-After": "1"})
+            return httpx.Response(200, json={})
+
+        http = httpx.AsyncClient(
+            base_url="https://clob.polymarket.com",
+            transport=httpx.MockTransport(handler),
+            event_hooks=client_module.RATE_LIMIT_HOOKS,
+        )
+        reads = client_module.get_rate_limiter("clob_read")
+        writes = client_module.get_rate_limiter("clob_write")
+        read_rate, write_rate = reads.rate, writes.rate
+
+        await http.get("/book")
+        await http.post("/order")
+
+        assert reads.rate > read_rate
+        assert writes.rate == write_rate / 2
+        assert writes.stats["paused"] is True
+        assert client_module.get_rate_limiter("gamma").stats["throttles"] == 0
+        await http.aclose()
@@ -0,0 +1,298 @@
+"""
+Tests for the native async CLOB client against a local stand-in server.
+"""
+
+import asyncio
+import base64
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+import pytest
+
+pytest.importorskip("py_clob_client")
+
+from py_clob_client.client import ClobClient
+from py_clob_client.clob_types import ApiCreds, OrderArgs
+from py_clob_client.exceptions import PolyApiException
+from py_clob_client.signing.hmac import build_hmac_signature
+
+from probablyprofit.api.client import PolymarketClient
+from probablyprofit.api.clob_async import AsyncClobClient
+from probablyprofit.api.exceptions import AuthenticationException, RateLimitException
+from probablyprofit.tests.mock_exchange import MockClobServer
+
+TEST_KEY = "0x" + "11" * 32
+CREDS = ApiCreds(
+    api_key="test-key",
+    api_secret=base64.urlsafe_b64encode(b"s" * 32).decode(),
+    api_passphrase="test-pass",
+)
+
+
+@pytest.fixture
+def server():
+    return MockClobServer(CREDS)
+
+
+@pytest.fixture
+def sync_clob():
+    return ClobClient("https://clob.test", chain_id=137, key=TEST_KEY, creds=CREDS)
+
+
+@pytest.fixture
+async def clob(server, sync_clob):
+    http_client = httpx.AsyncClient(base_url="https://clob.test", transport=server.transport)
+    yield AsyncClobClient.from_sync(sync_clob, http_client)
+    await http_client.aclose()
+
+
+class TestAsyncClobClient:
+    @pytest.mark.asyncio
+    async def test_order_lifecycle(self, clob, server):
+        resp = await clob.create_and_post_order(
+            OrderArgs(token_id="123", price=0.45, size=10, side="BUY")
+        )
+        assert resp["success"] is True
+        order_id = resp["orderID"]
+        assert server.orders[order_id]["price"] == "0.45"
+
+        status = await clob.get_order(order_id)
+        assert status["status"] == "LIVE"
+
+        cancel = await clob.cancel(order_id)
+        assert cancel["canceled"] == [order_id]
+        assert (await clob.get_order(order_id))["status"] == "CANCELED"
+
+    @pytest.mark.asyncio
+    async def test_market_parameters_are_cached(self, clob, server):
+        await asyncio.gather(
+            *(
+                clob.create_and_post_order(OrderArgs(token_id="123", price=0.5, size=1, side="BUY"))
+                for _ in range(3)
+            )
+        )
+        await clob.create_and_post_order(OrderArgs(token_id="123", price=0.5, size=1, side="BUY"))
+
+        assert server.requests.count("POST /order") == 4
+        # Concurrent first orders share one lookup per parameter
+        assert server.requests.count("GET /tick-size") == 1
+        assert server.requests.count("GET /neg-risk") == 1
+        assert clob.stats["cached_tick_sizes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_open_orders_follow_cursor(self, clob, server):
+        for _ in range(5):
+            await clob.create_and_post_order(
+                OrderArgs(token_id="123", price=0.3, size=5, side="BUY")
+            )
+
+        orders = await clob.get_orders()
+
+        assert len(orders) == 5
+        assert server.requests.count("GET /data/orders") == 3  # page_size=2
+
+    @pytest.mark.asyncio
+    async def test_signs_with_older_request_args(self, clob, server, monkeypatch):
+        @dataclass
+        class LegacyRequestArgs:  # py-clob-client releases without serialized_body
+            method: str
+            request_path: str
+            body: Any = None
+
+        def legacy_headers(signer, creds, request_args):
+            timestamp = str(int(time.time()))
+            signature = build_hmac_signature(
+                creds.api_secret,
+                timestamp,
+                request_args.method,
+                request_args.request_path,
+                request_args.body,
+            )
+            return {
+                "POLY_ADDRESS": signer.address(),
+                "POLY_SIGNATURE": signature,
+                "POLY_TIMESTAMP": timestamp,
+                "POLY_API_KEY": creds.api_key,
+                "POLY_PASSPHRASE": creds.api_passphrase,
+            }
+
+        monkeypatch.setattr("probablyprofit.api.clob_async.RequestArgs", LegacyRequestArgs)
+        monkeypatch.setattr("probablyprofit.api.clob_async.create_level_2_headers", legacy_headers)
+
+        resp = await clob.create_and_post_order(
+            OrderArgs(token_id="123", price=0.45, size=10, side="BUY")
+        )
+        assert (await clob.cancel(resp["orderID"]))["canceled"] == [resp["orderID"]]
+
+    @pytest.mark.asyncio
+    async def test_bad_credentials_rejected(self, server, sync_clob):
+        sync_clob.creds = ApiCreds("test-key", base64.urlsafe_b64encode(b"x" * 32).decode(), "p")
+        http_client = httpx.AsyncClient(base_url="https://clob.test", transport=server.transport)
+        clob = AsyncClobClient.from_sync(sync_clob, http_client)
+
+        with pytest.raises(AuthenticationException):
+            await clob.get_orders()
+        await http_client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_maps_to_exception(self, sync_clob):
+        http_client = httpx.AsyncClient(
+            base_url="https://clob.test",
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(429, headers={"Retry-After": "2"})
+            ),
+        )
+        clob = AsyncClobClient.from_sync(sync_clob, http_client)
+
+        with pytest.raises(RateLimitException):
+            await clob.cancel("0xabc")
+        await http_client.aclose()
+
+
+class TestPolymarketClientNativeClob:
+    @pytest.mark.asyncio
+    async def test_client_routes_orders_through_native_clob(self, server, sync_clob):
+        client = PolymarketClient()
+        client.http_client = httpx.AsyncClient(
+            base_url="https://clob.test", transport=server.transport
+        )
+        client.client = sync_clob
+        client._native_clob = client._build_native_clob()
+        client._token_id_cache.set("0xabc:Yes", "123")
+
+        order = await client.place_order("0xabc", "Yes", "BUY", size=10, price=0.4)
+        assert order.order_id in server.orders
+
+        results = await client.place_orders_batch(
+            [
+                {"market_id": "0xabc", "outcome": "Yes", "side": "BUY", "size": 5, "price": 0.35},
+                {"market_id": "0xabc", "outcome": "Yes", "side": "BUY", "size": 5, "price": 0.36},
+            ]
+        )
+        assert all(r.success for r in results)
+
+        open_orders = await client.get_open_orders()
+        assert len(open_orders) == 3
+
+        assert await client.cancel_order(order.order_id) is True
+        assert (await client.get_order(order.order_id))["status"] == "CANCELED"
+        await client.close()
+
+    @staticmethod
+    async def _client_with_orders(server, sync_clob, count):
+        client = PolymarketClient()
+        client.http_client = httpx.AsyncClient(
+            base_url="https://clob.test", transport=server.transport
+        )
+        client.client = sync_clob
+        client._native_clob = client._build_native_clob()
+        client._token_id_cache.set("0xabc:Yes", "123")
+        ids = [
+            (await client.place_order("0xabc", "Yes", "BUY", size=5, price=0.3)).order_id
+            for _ in range(count)
+        ]
+        server.requests.clear()
+        return client, ids
+
+    @pytest.mark.asyncio
+    async def test_order_fills_are_filtered_server_side(self, server, sync_clob):
+        client, (order_id,) = await self._client_with_orders(server, sync_clob, 1)
+        other_token = [
+            {"id": f"x{i}", "asset_id": "999", "taker_order_id": "0xother", "match_time": "5"}
+            for i in range(6)
+        ]
+        ours = [
+            {"id": f"t{i}", "asset_id": "123", "taker_order_id": order_id, "match_time": "5"}
+            for i in range(5)
+        ]
+        server.trades = other_token + ours
+
+        fills = await client.get_fills(order_id=order_id, limit=3)
+
+        assert [f["id"] for f in fills] == ["t0", "t1", "t2"]
+        # Order lookup, then two pages of the order's token only (page size 2)
+        assert server.requests == ["GET /data/order/" + order_id] + ["GET /data/trades"] * 2
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_cancel_order_checks_not_canceled(self, server, sync_clob):
+        client, _ = await self._client_with_orders(server, sync_clob, 0)
+
+        assert await client.cancel_order("0xmissing") is False
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_bulk_cancel_uses_cancel_all_endpoint(self, server, sync_clob):
+        client, ids = await self._client_with_orders(server, sync_clob, 4)
+
+        result = await client.cancel_orders_bulk()
+
+        assert result.method == "cancel_all"
+        assert sorted(result.cancelled) == sorted(ids)
+        assert server.requests == ["DELETE /cancel-all"]
+        assert result.seconds > 0
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_bulk_cancel_falls_back_to_concurrent_cancels(self, server, sync_clob):
+        client, ids = await self._client_with_orders(server, sync_clob, 3)
+        server.bulk_cancel_enabled = False
+
+        result = await client.cancel_orders_bulk(market_id="0xabc")
+
+        assert result.method == "concurrent"
+        assert sorted(result.cancelled) == sorted(ids)
+        assert server.requests.count("DELETE /order") == 3
+        assert all(o["status"] == "CANCELED" for o in server.orders.values())
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_fallback_reports_not_canceled_reasons(self, server, sync_clob):
+        client, ids = await self._client_with_orders(server, sync_clob, 2)
+        server.bulk_cancel_enabled = False
+
+        result = await client.cancel_orders_bulk(order_ids=ids + ["0xmissing"])
+
+        assert result.method == "concurrent"
+        assert sorted(result.cancelled) == sorted(ids)
+        assert result.failed == {"0xmissing": "order not found"}
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_bulk_cancel_reports_per_order_outcomes(self, server, sync_clob):
+        client, ids = await self._client_with_orders(server, sync_clob, 2)
+
+        result = await client.cancel_orders_bulk(order_ids=ids + ["0xmissing"])
+
+        assert result.method == "cancel_batch"
+        assert sorted(result.cancelled) == sorted(ids)
+        assert result.failed == {"0xmissing": "order not found"}
+        assert (await client.cancel_orders_bulk(order_ids=[])).outcomes == {}
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_sync_client_errors_fall_back_and_report(self):
+        """py-clob-client's own exceptions fall back to, and stay inside, per-order cancels."""
+
+        class FailingSyncClob:
+            def cancel_orders(self, order_ids):
+                raise PolyApiException(error_msg="batch cancel unavailable")
+
+            def cancel(self, order_id):
+                if order_id == "0xbad":
+                    raise PolyApiException(error_msg="order not found")
+                return {"canceled": [order_id], "not_canceled": {}}
+
+        client = PolymarketClient()
+        client.client = FailingSyncClob()
+        client._async_clob = None
+        client._native_clob = None
+
+        result = await client.cancel_orders_bulk(order_ids=["0xgood", "0xbad"])
+
+        assert result.method == "concurrent"
+        assert result.cancelled == ["0xgood"]
+        assert "order not found" in result.failed["0xbad"]
+        await client.close()
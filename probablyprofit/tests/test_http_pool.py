@@ -0,0 +1,113 @@
+"""
+Tests for shared HTTP connection pools.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from probablyprofit.utils import http_pool
+from probablyprofit.utils.http_pool import HTTPPool, get_http_pool
+
+
+def _mock_pool(requests: list, status: int = 200) -> HTTPPool:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append((request.method, str(request.url)))
+        return httpx.Response(status, json={"ok": True})
+
+    return HTTPPool(name="test", transport=httpx.MockTransport(handler))
+
+
+class TestHTTPPool:
+    @pytest.mark.asyncio
+    async def test_closing_client_keeps_pool_usable(self):
+        requests: list = []
+        pool = _mock_pool(requests)
+
+        first = pool.client(base_url="https://clob.test")
+        second = pool.client(base_url="https://gamma.test")
+        await first.get("/markets")
+        await first.aclose()
+
+        response = await second.get("/events")
+        assert response.json() == {"ok": True}
+        assert pool.stats["requests"] == 2
+        assert pool.stats["in_flight"] == 0
+        await second.aclose()
+
+    @pytest.mark.asyncio
+    async def test_warm_up_dedupes_origins(self):
+        requests: list = []
+        pool = _mock_pool(requests, status=404)
+
+        results = await pool.warm_up(
+            ["https://clob.test/a", "https://clob.test/b", "https://gamma.test"],
+            connections_per_host=2,
+        )
+
+        assert set(results) == {"https://clob.test", "https://gamma.test"}
+        assert all(elapsed is not None for elapsed in results.values())  # Any response is warm
+        assert all(method == "HEAD" for method, _ in requests)
+
+    @pytest.mark.asyncio
+    async def test_warm_up_reports_unreachable_hosts(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("connection refused", request=request)
+
+        pool = HTTPPool(name="test", transport=httpx.MockTransport(handler))
+        results = await pool.warm_up(["https://down.test"])
+
+        assert results == {"https://down.test": None}
+
+    def test_transport_recreated_per_event_loop(self):
+        pool = HTTPPool(name="test", http2=False)
+
+        async def current():
+            return pool._current_transport()
+
+        first = asyncio.run(current())
+        second = asyncio.run(current())
+
+        assert first is not second
+        assert pool.stats["http2"] is False
+
+    def test_stale_transport_is_closed(self, monkeypatch):
+        pool = HTTPPool(name="test", http2=False)
+        transports = []
+
+        def make_transport():
+            transports.append(AsyncMock(spec=httpx.AsyncBaseTransport))
+            return transports[-1]
+
+        monkeypatch.setattr(pool, "_make_transport", make_transport)
+
+        async def current():
+            transport = pool._current_transport()
+            await asyncio.gather(*pool._closing)
+            return transport
+
+        asyncio.run(current())
+        asyncio.run(current())
+
+        transports[0].aclose.assert_awaited_once()
+        transports[1].aclose.assert_not_awaited()
+
+
+class TestSharedPools:
+    @pytest.fixture(autouse=True)
+    def isolated_pools(self, monkeypatch):
+        monkeypatch.setattr(http_pool, "_pools", {})
+
+    def test_pools_are_keyed_by_settings(self):
+        default = get_http_pool("external")
+
+        assert get_http_pool("external") is default
+        assert get_http_pool("external", verify=True) is default  # Same as the default
+
+        insecure = get_http_pool("external", verify=False)
+        assert insecure is not default
+        assert insecure.verify is False
+        assert insecure.name == "external:verify=False"
+        assert set(http_pool.get_pool_stats()) == {"external", "external:verify=False"}
@@ -0,0 +1,180 @@
+"""
+Tests for end-to-end latency tracing.
+"""
+
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from probablyprofit.agent.base import Decision
+from probablyprofit.utils.latency import LatencyTrace, current_trace, mark_stage
+from probablyprofit.utils.metrics import get_trading_metrics
+
+
+def _latency_count(stage: str) -> int:
+    return get_trading_metrics()["latency"]._count[f"stage={stage}"]
+
+
+class TestLatencyTrace:
+    def test_breakdown_spans(self):
+        trace = LatencyTrace()
+        trace.mark("data_received", 10.0)
+        trace.mark("observe_start", 10.5)
+        trace.mark("observe_end", 11.0)
+        trace.mark("llm_request", 11.1)
+        trace.mark("llm_response", 13.1)
+        trace.mark("decide_end", 13.2)
+        trace.mark("order_submit", 13.3)
+        trace.mark("order_ack", 13.5)
+
+        breakdown = trace.breakdown()
+
+        assert breakdown["data_wait"] == pytest.approx(0.5)
+        assert breakdown["observe"] == pytest.approx(0.5)
+        assert breakdown["llm"] == pytest.approx(2.0)
+        assert breakdown["order"] == pytest.approx(0.2)
+        assert breakdown["data_age"] == pytest.approx(3.2)
+        assert breakdown["total"] == pytest.approx(3.5)
+        assert "llm=2.00s" in trace.format()
+
+    def test_unreached_stages_are_omitted(self):
+        trace = LatencyTrace()
+        trace.mark("observe_start", 1.0)
+        trace.mark("observe_end", 1.2)
+        trace.mark("decide_end", 1.3)
+
+        breakdown = trace.breakdown()
+
+        assert "order" not in breakdown and "llm" not in breakdown
+        # Without a trigger, data age is measured from the end of observe()
+        assert breakdown["data_age"] == pytest.approx(0.1)
+
+    def test_mark_stage_writes_to_active_trace_only(self):
+        trace = LatencyTrace()
+        mark_stage("llm_request")  # No active trace: no-op
+
+        with trace.activate():
+            assert current_trace() is trace
+            mark_stage("llm_request")
+            first = trace.marks["llm_request"]
+            mark_stage("llm_request")  # Retries keep the first mark
+
+        assert current_trace() is None
+        assert trace.marks == {"llm_request": first}
+
+    @pytest.mark.asyncio
+    async def test_marks_follow_tasks_started_inside_trace(self):
+        trace = LatencyTrace()
+
+        async def call_llm():
+            mark_stage("llm_request")
+            await asyncio.sleep(0)
+            mark_stage("llm_response")
+
+        with trace.activate():
+            await asyncio.create_task(call_llm())
+
+        assert trace.span("llm_request", "llm_response") is not None
+
+    def test_record_exports_histogram(self):
+        before = _latency_count("observe")
+        trace = LatencyTrace()
+        trace.mark("observe_start", 1.0)
+        trace.mark("observe_end", 1.25)
+
+        trace.record()
+
+        assert _latency_count("observe") == before + 1
+
+
+class TestWebSocketLatency:
+    @pytest.mark.asyncio
+    async def test_inline_delivery_records_message_stages(self):
+        pytest.importorskip("websockets")
+        from probablyprofit.api.websocket import WebSocketClient
+
+        client = WebSocketClient(conflate=False, latency_tracing=True, latency_sample_every=1)
+        client.on_price_update(lambda update: None)
+        before = {
+            stage: _latency_count(stage)
+            for stage in ("ws_exchange_to_receive", "ws_parse", "ws_queue", "ws_callback")
+        }
+
+        frame = {"type": "price", "market": "0x1", "price": "0.5", "timestamp": time.time()}
+        await client._receive(json.dumps(frame))
+
+        for stage, count in before.items():
+            assert _latency_count(stage) == count + 1, stage
+
+    @pytest.mark.asyncio
+    async def test_conflated_delivery_records_queue_and_callback(self):
+        pytest.importorskip("websockets")
+        from probablyprofit.api.websocket import WebSocketClient
+
+        client = WebSocketClient(conflate=True, latency_tracing=True, latency_sample_every=1)
+        client.on_price_update(lambda update: None)
+        client.start_dispatch()
+        before = _latency_count("ws_callback")
+
+        await client._receive(json.dumps({"type": "price", "market": "0x1", "price": "0.5"}))
+        await client.drain()
+        await client.stop_dispatch()
+
+        assert _latency_count("ws_callback") == before + 1
+
+    @pytest.mark.asyncio
+    async def test_tracing_is_sampled(self):
+        pytest.importorskip("websockets")
+        from probablyprofit.api.websocket import WebSocketClient
+
+        client = WebSocketClient(conflate=False, latency_tracing=True, latency_sample_every=10)
+        client.on_price_update(lambda update: None)
+        before = _latency_count("ws_parse")
+
+        for _ in range(30):
+            await client._receive(json.dumps({"type": "price", "market": "0x1", "price": "0.5"}))
+
+        assert _latency_count("ws_parse") == before + 3
+
+    def test_metric_handles_are_cached(self):
+        assert get_trading_metrics() is get_trading_metrics()
+
+    @pytest.mark.asyncio
+    async def test_tracing_can_be_disabled(self):
+        pytest.importorskip("websockets")
+        from probablyprofit.api.websocket import WebSocketClient
+
+        client = WebSocketClient(conflate=False, latency_tracing=False)
+        client.on_price_update(lambda update: None)
+        before = _latency_count("ws_parse")
+
+        await client._receive(json.dumps({"type": "price", "market": "0x1", "price": "0.5"}))
+
+        assert _latency_count("ws_parse") == before
+
+
+class TestAgentLoopLatency:
+    @pytest.mark.asyncio
+    async def test_iteration_breakdown_is_recorded(self, mock_agent):
+        mock_agent.risk_manager.save_state = AsyncMock()
+        traces = []
+
+        async def decide(observation):
+            mark_stage("llm_request")
+            mark_stage("llm_response")
+            traces.append(current_trace())
+            mock_agent.stop()
+            return Decision(action="hold", reasoning="Test")
+
+        mock_agent.decide = decide
+        before = _latency_count("llm")
+
+        await asyncio.wait_for(mock_agent.run_loop(), timeout=5)
+
+        assert len(traces) == 1
+        breakdown = traces[0].breakdown()
+        assert {"observe", "llm", "data_age", "total"} <= set(breakdown)
+        assert _latency_count("llm") == before + 1
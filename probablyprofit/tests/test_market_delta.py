@@ -0,0 +1,117 @@
+"""
+Tests for the incremental market delta feed.
+"""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from probablyprofit.agent.base import Observation
+from probablyprofit.agent.formatters import ObservationFormatter
+from probablyprofit.api.market_delta import MarketDeltaTracker
+from probablyprofit.tests.conftest import create_mock_market
+
+
+class TestMarketDeltaTracker:
+    def test_first_update_reports_everything_added(self):
+        tracker = MarketDeltaTracker(price_threshold=0.01)
+        markets = [create_mock_market(condition_id=f"0x{i}") for i in range(3)]
+
+        delta = tracker.update(markets)
+
+        assert [m.condition_id for m in delta.added] == ["0x0", "0x1", "0x2"]
+        assert not delta.removed
+        assert not delta.repriced
+        assert delta.has_changes
+
+    def test_unchanged_markets_are_not_reported(self):
+        tracker = MarketDeltaTracker(price_threshold=0.01)
+        tracker.update([create_mock_market(condition_id="0xa", yes_price=0.5)])
+
+        delta = tracker.update([create_mock_market(condition_id="0xa", yes_price=0.505)])
+
+        assert not delta.has_changes
+        assert delta.unchanged == 1
+
+    def test_repriced_past_threshold(self):
+        tracker = MarketDeltaTracker(price_threshold=0.01)
+        tracker.update([create_mock_market(condition_id="0xa", yes_price=0.5)])
+
+        delta = tracker.update([create_mock_market(condition_id="0xa", yes_price=0.55)])
+
+        assert [m.condition_id for m in delta.repriced] == ["0xa"]
+        assert delta.price_moves["0xa"] == pytest.approx(0.05)
+
+    def test_small_moves_accumulate(self):
+        tracker = MarketDeltaTracker(price_threshold=0.01)
+        tracker.update([create_mock_market(condition_id="0xa", yes_price=0.500)])
+
+        assert not tracker.update(
+            [create_mock_market(condition_id="0xa", yes_price=0.506)]
+        ).repriced
+        delta = tracker.update([create_mock_market(condition_id="0xa", yes_price=0.512)])
+
+        assert delta.price_moves["0xa"] == pytest.approx(0.012)
+
+    def test_removed_markets(self):
+        tracker = MarketDeltaTracker(price_threshold=0.01)
+        tracker.update(
+            [create_mock_market(condition_id="0xa"), create_mock_market(condition_id="0xb")]
+        )
+
+        delta = tracker.update([create_mock_market(condition_id="0xa")])
+
+        assert [m.condition_id for m in delta.removed] == ["0xb"]
+        assert "0xb" not in tracker.markets
+
+    def test_to_dict_summary(self):
+        tracker = MarketDeltaTracker(price_threshold=0.01)
+        tracker.update([create_mock_market(condition_id="0xa", yes_price=0.5)])
+
+        summary = tracker.update([create_mock_market(condition_id="0xa", yes_price=0.4)]).to_dict()
+
+        assert summary["added"] == []
+        assert summary["repriced"] == {"0xa": pytest.approx(-0.1)}
+
+    @pytest.mark.asyncio
+    async def test_refresh_uses_client(self):
+        client = MagicMock()
+        client.get_markets = AsyncMock(return_value=[create_mock_market(condition_id="0xa")])
+        tracker = MarketDeltaTracker(client, price_threshold=0.01)
+
+        delta = await tracker.refresh(limit=10)
+
+        client.get_markets.assert_awaited_once_with(active=True, limit=10)
+        assert len(delta.added) == 1
+
+
+class TestFormatMarketChanges:
+    @staticmethod
+    def _observation(tracker, markets):
+        delta = tracker.update(markets)
+        return Observation(
+            timestamp=datetime.now(),
+            markets=markets,
+            positions=[],
+            balance=0.0,
+            metadata={"market_changes": delta.to_dict()},
+        )
+
+    def test_first_observation_has_no_changes(self):
+        tracker = MarketDeltaTracker(price_threshold=0.01)
+        observation = self._observation(tracker, [create_mock_market(condition_id="0xa")])
+
+        assert ObservationFormatter.format_market_changes(observation) == ""
+
+    def test_full_replacement_is_reported(self):
+        tracker = MarketDeltaTracker(price_threshold=0.01)
+        tracker.update([create_mock_market(condition_id=f"0xa{i}") for i in range(2)])
+
+        observation = self._observation(
+            tracker, [create_mock_market(condition_id=f"0xb{i}") for i in range(3)]
+        )
+        summary = ObservationFormatter.format_market_changes(observation)
+
+        assert summary.startswith("3 new, 2 removed, 0 repriced, 0 unchanged")
+        assert "replaced" in summary
@@ -0,0 +1,165 @@
+"""
+Tests for the order event bus.
+"""
+
+import asyncio
+
+import pytest
+
+from probablyprofit.api.order_events import OrderEventBus
+from probablyprofit.api.order_manager import OrderManager
+from probablyprofit.utils.metrics import get_trading_metrics
+
+
+class TestOrderEventBus:
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_does_not_block_fills(self):
+        manager = OrderManager(client=None)
+        release = asyncio.Event()
+        seen = []
+
+        async def slow_alert(order, fill):
+            await release.wait()
+            seen.append(fill.fill_id)
+
+        manager.on_fill(slow_alert)
+        order = await manager.submit_order("0x1", "Yes", "BUY", size=100.0, price=0.5)
+
+        for i in range(3):
+            await asyncio.wait_for(
+                manager.process_fill(order.order_id, 10, 0.5, fill_id=f"f{i}"), timeout=1
+            )
+        assert order.filled_size == 30 and seen == []
+
+        release.set()
+        await manager.events.drain()
+        assert seen == ["f0", "f1", "f2"]  # Publish order preserved
+
+    @pytest.mark.asyncio
+    async def test_inline_subscribers_run_before_publish_returns(self):
+        bus = OrderEventBus()
+        seen = []
+        bus.subscribe("status", seen.append, inline=True)
+
+        await bus.publish("status", "order")
+
+        assert seen == ["order"]
+        assert bus.stats == {}
+
+    @pytest.mark.asyncio
+    async def test_drop_policies(self):
+        bus = OrderEventBus(max_queue=2)
+        oldest, newest = [], []
+        blocker = asyncio.Event()
+
+        async def keep_oldest(order):
+            await blocker.wait()
+            oldest.append(order)
+
+        async def keep_newest(order):
+            await blocker.wait()
+            newest.append(order)
+
+        bus.subscribe("status", keep_newest, overflow="drop_oldest")
+        bus.subscribe("status", keep_oldest, overflow="drop_newest")
+        dropped = get_trading_metrics()["order_events_dropped"]
+        before = sum(dropped._values.values())
+
+        await bus.publish("status", 0)
+        await asyncio.sleep(0)  # Both subscribers now hold event 0 in their callback
+        for i in range(1, 5):
+            await bus.publish("status", i)
+        blocker.set()
+        await bus.drain()
+
+        assert newest == [0, 3, 4]
+        assert oldest == [0, 1, 2]
+        assert sum(dropped._values.values()) == before + 4
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_fills_are_never_dropped(self):
+        bus = OrderEventBus(max_queue=1, overflow="drop_oldest")
+        release = asyncio.Event()
+        seen = []
+
+        async def slow_fill(order, fill):
+            await release.wait()
+            seen.append(fill)
+
+        fills = bus.subscribe("fill", slow_fill)
+        for i in range(3):
+            await asyncio.wait_for(bus.publish("fill", "order", i), timeout=1)
+        assert fills.stats["backlog_alarms"] == 1  # Publisher was never held up
+
+        release.set()
+        await bus.drain()
+        assert seen == [0, 1, 2]
+        assert fills.stats["dropped"] == 0
+
+    def test_overflow_policy_rejected_for_lossless_kinds(self):
+        bus = OrderEventBus(overflow="block")
+        assert bus.subscribe("complete", print).overflow is None
+        with pytest.raises(ValueError):
+            bus.subscribe("fill", print, overflow="drop_oldest")
+
+    @pytest.mark.asyncio
+    async def test_subscribers_get_order_snapshots(self):
+        manager = OrderManager(client=None)
+        seen = []
+        manager.on_fill(lambda order, fill: seen.append((order.filled_size, len(order.fills))))
+        order = await manager.submit_order("0x1", "Yes", "BUY", size=100.0, price=0.5)
+
+        await manager.process_fill(order.order_id, 10, 0.5, fill_id="f0")
+        await manager.process_fill(order.order_id, 10, 0.5, fill_id="f1")
+        await manager.events.drain()
+
+        assert seen == [(10, 1), (20, 2)]
+
+    @pytest.mark.asyncio
+    async def test_stop_polling_delivers_and_closes(self):
+        manager = OrderManager(client=None)
+        seen = []
+        subscriber = manager.events.subscribe("status", seen.append)
+        await manager.events.publish("status", "order")
+
+        await manager.stop_polling()
+
+        assert seen == ["order"]
+        assert subscriber._task is None
+
+    @pytest.mark.asyncio
+    async def test_block_policy_applies_back_pressure(self):
+        bus = OrderEventBus(max_queue=1, overflow="block")
+        seen = []
+        bus.subscribe("complete", seen.append)
+
+        await bus.publish("complete", 1)
+        await bus.publish("complete", 2)  # Waits for the subscriber to take event 1
+        await bus.drain()
+
+        assert seen == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_failing_subscriber_is_isolated(self):
+        bus = OrderEventBus()
+        seen = []
+
+        def broken(order):
+            raise RuntimeError("boom")
+
+        failing = bus.subscribe("status", broken)
+        bus.subscribe("status", seen.append)
+        await bus.publish("status", "a")
+        await bus.publish("status", "b")
+        await bus.drain()
+
+        assert seen == ["a", "b"]
+        assert failing.stats["errors"] == 2
+
+    def test_unknown_kind_and_policy(self):
+        bus = OrderEventBus()
+        with pytest.raises(ValueError):
+            bus.subscribe("trade", print)
+        with pytest.raises(ValueError):
+            OrderEventBus(overflow="spill")
@@ -0,0 +1,197 @@
+"""
+Tests for the order journal and crash recovery.
+"""
+
+import json
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from probablyprofit.api.order_journal import OrderJournal
+from probablyprofit.api.order_manager import OrderManager, OrderStatus
+
+
+def _journal(tmp_path, **kwargs) -> OrderJournal:
+    kwargs.setdefault("fsync", False)
+    return OrderJournal(str(tmp_path), flush_interval=60, **kwargs)
+
+
+async def _crash_and_recover(tmp_path, manager: OrderManager, **kwargs) -> OrderManager:
+    """Flush without closing (as if the process died), then recover a new manager."""
+    await manager.journal.flush()
+    restarted = OrderManager(client=None, journal=_journal(tmp_path, **kwargs))
+    await restarted.recover()
+    return restarted
+
+
+class TestOrderJournal:
+    @pytest.mark.asyncio
+    async def test_changes_are_group_committed(self, tmp_path):
+        manager = OrderManager(client=None, journal=_journal(tmp_path))
+        order = await manager.submit_order("0x1", "Yes", "BUY", size=100.0, price=0.5)
+        for i in range(5):
+            await manager.process_fill(order.order_id, 10, 0.5, fill_id=f"f{i}")
+        await manager.submit_order("0x2", "No", "SELL", size=10.0, price=0.4)
+
+        assert await manager.journal.flush() == 2  # One line per dirty order
+        assert manager.journal.stats["flushes"] == 1
+
+        lines = (tmp_path / "journal.0.jsonl").read_text().splitlines()
+        assert len(lines) == 2
+        assert len(json.loads(lines[0])["o"]["fills"]) == 5
+
+        # Later lines carry only the new fills
+        await manager.process_fill(order.order_id, 10, 0.5, fill_id="f5")
+        await manager.journal.flush()
+        last = json.loads((tmp_path / "journal.0.jsonl").read_text().splitlines()[-1])
+        assert [f["fill_id"] for f in last["o"]["fills"]] == ["f5"]
+
+    @pytest.mark.asyncio
+    async def test_recovery_restores_orders_and_fill_timers(self, tmp_path):
+        manager = OrderManager(client=None, journal=_journal(tmp_path), partial_fill_timeout=60)
+        partial = await manager.submit_order(
+            "0x1", "Yes", "BUY", size=100.0, price=0.5, metadata={"strategy": "momentum"}
+        )
+        await manager.process_fill(partial.order_id, 40, 0.48, fill_id="f1")
+        partial.fills[0].timestamp = datetime.now() - timedelta(minutes=5)
+        await manager.order_book.update(partial)
+        done = await manager.submit_order("0x2", "No", "SELL", size=10.0, price=0.4)
+        await manager.cancel_order(done.order_id)
+
+        restarted = await _crash_and_recover(tmp_path, manager)
+
+        recovered = await restarted.get_order(partial.order_id)
+        assert recovered.status == OrderStatus.PARTIALLY_FILLED
+        assert recovered.filled_size == 40
+        assert recovered.avg_fill_price == pytest.approx(0.48)
+        assert recovered.metadata == {"strategy": "momentum"}
+        assert (await restarted.get_order(partial.client_order_id)) is recovered
+        assert [o.order_id for o in await restarted.get_order_history()] == [done.order_id]
+
+        # The partial-fill timer survived the restart
+        timed_out = await restarted.check_partial_fill_timeouts()
+        assert [o.order_id for o in timed_out] == [partial.order_id]
+
+    @pytest.mark.asyncio
+    async def test_snapshot_rotates_journal(self, tmp_path):
+        manager = OrderManager(client=None, journal=_journal(tmp_path, snapshot_every=3))
+        orders = [
+            await manager.submit_order(f"0x{i}", "Yes", "BUY", size=10.0, price=0.5)
+            for i in range(4)
+        ]
+        await manager.journal.flush()  # 4 lines >= 3: snapshot, generation 1
+        await manager.process_fill(orders[0].order_id, 10, 0.5, fill_id="f1")
+        await manager.journal.flush()
+
+        assert not (tmp_path / "journal.0.jsonl").exists()
+        assert len((tmp_path / "journal.1.jsonl").read_text().splitlines()) == 1
+
+        restarted = await _crash_and_recover(tmp_path, manager, snapshot_every=3)
+
+        assert restarted.order_book.active_count == 3
+        recovered = await restarted.get_order(orders[0].order_id)
+        assert recovered.status == OrderStatus.FILLED
+        assert len(recovered.fills) == 1
+
+    @pytest.mark.asyncio
+    async def test_torn_tail_and_in_flight_submissions(self, tmp_path):
+        manager = OrderManager(client=None, journal=_journal(tmp_path))
+        order = await manager.submit_order("0x1", "Yes", "BUY", size=10.0, price=0.5)
+        order.order_id = None  # Crashed before the exchange acknowledged it
+        order.status = OrderStatus.SUBMITTED
+        await manager.order_book.update(order)
+        await manager.journal.flush()
+        with open(tmp_path / "journal.0.jsonl", "a") as f:
+            f.write('{"k": "pp_1", "o": {"mar')
+
+        restarted = OrderManager(client=None, journal=_journal(tmp_path))
+        result = await restarted.recover()
+
+        assert result["skipped"] == 1
+        assert result["in_doubt"] == 1
+        recovered = await restarted.get_order(order.client_order_id)
+        assert recovered.status == OrderStatus.FAILED
+
+    @pytest.mark.asyncio
+    async def test_only_live_orders_are_reconciled(self, tmp_path):
+        manager = OrderManager(client=None, journal=_journal(tmp_path))
+        live = await manager.submit_order("0x1", "Yes", "BUY", size=10.0, price=0.5)
+        filled = await manager.submit_order("0x2", "Yes", "BUY", size=10.0, price=0.5)
+        await manager.process_fill(filled.order_id, 10, 0.5)
+        await manager.journal.flush()
+
+        client = MagicMock()
+        client.get_order = AsyncMock(return_value={"status": "CANCELED"})
+        restarted = OrderManager(client=client, journal=_journal(tmp_path))
+        result = await restarted.recover()
+
+        client.get_order.assert_awaited_once_with(live.order_id)
+        assert result["reconcile"]["checked"] == 1
+        assert (await restarted.get_order(live.order_id)).status == OrderStatus.CANCELLED
+
+    @pytest.mark.asyncio
+    async def test_session_without_recover_is_kept(self, tmp_path):
+        """Orders journaled before recover() runs survive the next load."""
+        first = OrderManager(client=None, journal=_journal(tmp_path, snapshot_every=1))
+        kept = await first.submit_order("0x1", "Yes", "BUY", size=10.0, price=0.5)
+        await first.journal.flush()  # Snapshot: generation 1
+
+        second = OrderManager(client=None, journal=_journal(tmp_path))
+        new = await second.submit_order("0x2", "Yes", "BUY", size=10.0, price=0.5)
+        await second.journal.flush()
+
+        assert (tmp_path / "journal.1.jsonl").exists()
+        restarted = await _crash_and_recover(tmp_path, second)
+        assert await restarted.get_order(kept.order_id) is not None
+        assert await restarted.get_order(new.order_id) is not None
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_is_retried(self, tmp_path, monkeypatch):
+        """A failed write requeues its batch without advancing journaled fills."""
+        manager = OrderManager(client=None, journal=_journal(tmp_path))
+        order = await manager.submit_order("0x1", "Yes", "BUY", size=100.0, price=0.5)
+        await manager.process_fill(order.order_id, 10, 0.5, fill_id="f0")
+
+        append = manager.journal._append
+
+        def no_space(data):
+            raise OSError(28, "No space left on device")
+
+        monkeypatch.setattr(manager.journal, "_append", no_space)
+        with pytest.raises(OSError):
+            await manager.journal.flush()
+        assert manager.journal.stats["pending"] == 1
+
+        monkeypatch.setattr(manager.journal, "_append", append)
+        await manager.process_fill(order.order_id, 10, 0.5, fill_id="f1")
+        restarted = await _crash_and_recover(tmp_path, manager)
+
+        recovered = await restarted.get_order(order.order_id)
+        assert [f.fill_id for f in recovered.fills] == ["f0", "f1"]
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_journal(self, tmp_path):
+        """OrderManager.close() writes the last unflushed batch."""
+        manager = OrderManager(client=None, journal=_journal(tmp_path))
+        order = await manager.submit_order("0x1", "Yes", "BUY", size=10.0, price=0.5)
+
+        await manager.close()
+
+        restarted = OrderManager(client=None, journal=_journal(tmp_path))
+        await restarted.recover()
+        assert await restarted.get_order(order.order_id) is not None
+
+    @pytest.mark.asyncio
+    async def test_start_polling_recovers(self, tmp_path):
+        """start_polling() replays the journal when recover() was not called."""
+        manager = OrderManager(client=None, journal=_journal(tmp_path))
+        order = await manager.submit_order("0x1", "Yes", "BUY", size=10.0, price=0.5)
+        await manager.journal.flush()
+
+        restarted = OrderManager(client=None, journal=_journal(tmp_path))
+        await restarted.start_polling(interval=60)
+        try:
+            assert await restarted.get_order(order.order_id) is not None
+        finally:
+            await restarted.close()
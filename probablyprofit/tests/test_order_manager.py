@@ -2,7 +2,7 @@
 Tests for the Order Management System.
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -303,6 +303,104 @@ class TestOrderBook:
         market_b_orders = await book.get_by_market("market_B")
         assert len(market_b_orders) == 1
 
+    @pytest.mark.asyncio
+    async def test_status_index_follows_updates(self):
+        """Test that the status index tracks status changes made before update()."""
+        book = OrderBook()
+        order = ManagedOrder(
+            client_order_id="client1",
+            market_id="0x123",
+            outcome="Yes",
+            side=OrderSide.BUY,
+            size=100.0,
+            price=0.5,
+        )
+        await book.add(order)
+        assert [o.client_order_id for o in await book.get_by_status(OrderStatus.PENDING)] == [
+            "client1"
+        ]
+
+        # Exchange assigns an ID: order is re-keyed, still found by client ID
+        order.order_id = "order1"
+        order.status = OrderStatus.OPEN
+        await book.update(order)
+
+        assert await book.get_by_status(OrderStatus.PENDING) == []
+        assert await book.get_by_status(OrderStatus.OPEN) == [order]
+        assert await book.get("client1") is order
+        assert await book.get_by_market("0x123") == [order]
+        assert book.count_by_status() == {OrderStatus.OPEN: 1}
+
+        order.status = OrderStatus.CANCELLED
+        await book.update(order)
+
+        assert book.count_by_status() == {}
+        assert await book.get_by_market("0x123") == []
+        assert await book.get("client1") is order  # From history
+
+    @pytest.mark.asyncio
+    async def test_partial_fills_before_cutoff(self):
+        """Test the last-fill-time index used for partial fill timeouts."""
+        book = OrderBook()
+        now = datetime.now()
+        orders = []
+        for i, age in enumerate([600, 30, 900]):
+            order = ManagedOrder(
+                order_id=f"order{i}",
+                market_id="0x123",
+                outcome="Yes",
+                side=OrderSide.BUY,
+                size=100.0,
+                price=0.5,
+            )
+            await book.add(order)
+            order.add_fill(
+                Fill(
+                    fill_id=f"f{i}",
+                    order_id=order.order_id,
+                    size=10,
+                    price=0.5,
+                    timestamp=now - timedelta(seconds=age),
+                )
+            )
+            await book.update(order)
+            orders.append(order)
+
+        cutoff = now - timedelta(seconds=300)
+        assert await book.get_partial_fills_before(cutoff) == [orders[2], orders[0]]
+        # Not consumed: still due until the order changes
+        assert await book.get_partial_fills_before(cutoff) == [orders[2], orders[0]]
+
+        # A new fill moves order0 out of the window
+        orders[0].add_fill(Fill(fill_id="f3", order_id="order0", size=10, price=0.5))
+        await book.update(orders[0])
+        # Cancelling order2 drops it
+        orders[2].cancel()
+        await book.update(orders[2])
+
+        assert await book.get_partial_fills_before(cutoff) == []
+
+    @pytest.mark.asyncio
+    async def test_history_ring_buffer(self):
+        """Test that history keeps the newest max_history orders, newest first."""
+        book = OrderBook(max_history=3)
+        for i in range(5):
+            order = ManagedOrder(
+                order_id=f"order{i}",
+                market_id="0x123",
+                outcome="Yes",
+                side=OrderSide.BUY,
+                size=100.0,
+                price=0.5,
+                status=OrderStatus.FILLED,
+            )
+            await book.update(order)
+
+        assert book.history_count == 3
+        assert [o.order_id for o in await book.get_history(limit=2)] == ["order4", "order3"]
+        assert await book.get("order1") is None
+        assert await book.get("order2") is not None
+
 
 class TestOrderManager:
     """Tests for OrderManager."""
@@ -346,6 +444,82 @@ class TestOrderManager:
         assert order.price == 0.5
         assert order.status in (OrderStatus.OPEN, OrderStatus.SUBMITTED)
 
+    @pytest.mark.asyncio
+    async def test_submit_orders_batch(self, order_manager, mock_client):
+        """Batch submission returns every outcome, including failures."""
+        from probablyprofit.api.client import BatchOrderResult, Order
+
+        async def place_orders_batch(specs):
+            return [
+                BatchOrderResult(
+                    index=0,
+                    order=Order(
+                        order_id="ex_1",
+                        market_id="0x1",
+                        outcome="Yes",
+                        side="BUY",
+                        size=10.0,
+                        price=0.4,
+                    ),
+                ),
+                BatchOrderResult(index=1, error="insufficient balance"),
+            ]
+
+        mock_client.place_orders_batch = AsyncMock(side_effect=place_orders_batch)
+
+        orders = await order_manager.submit_orders_batch(
+            [
+                {"market_id": "0x1", "outcome": "Yes", "side": "BUY", "size": 10.0, "price": 0.4},
+                {"market_id": "0x2", "outcome": "No", "side": "sell", "size": 5.0, "price": 0.6},
+            ]
+        )
+
+        assert [o.status for o in orders] == [OrderStatus.OPEN, OrderStatus.FAILED]
+        assert orders[0].order_id == "ex_1"
+        assert orders[1].status_message == "insufficient balance"
+        assert orders[0].client_order_id != orders[1].client_order_id
+        assert len(await order_manager.get_active_orders()) == 1
+
+    @pytest.mark.asyncio
+    async def test_submit_orders_batch_rejects_invalid_spec_only(self, order_manager, mock_client):
+        """An invalid order fails on its own; the rest of the batch is submitted."""
+        from probablyprofit.api.client import BatchOrderResult, Order
+
+        async def place_orders_batch(specs):
+            return [
+                BatchOrderResult(
+                    index=i,
+                    order=Order(order_id=f"ex_{i}", **spec),
+                )
+                for i, spec in enumerate(specs)
+            ]
+
+        mock_client.place_orders_batch = AsyncMock(side_effect=place_orders_batch)
+
+        orders = await order_manager.submit_orders_batch(
+            [
+                {"market_id": "0x1", "outcome": "Yes", "side": "BUY", "size": 10.0, "price": 0.4},
+                {"market_id": "0x2", "outcome": "No", "side": "HOLD", "size": 5.0, "price": 0.6},
+            ]
+        )
+
+        assert [o.status for o in orders] == [OrderStatus.OPEN, OrderStatus.FAILED]
+        assert "Invalid order" in orders[1].status_message
+        assert len(mock_client.place_orders_batch.await_args.args[0]) == 1
+        assert await order_manager.get_order(orders[1].client_order_id) is None
+
+    @pytest.mark.asyncio
+    async def test_submit_orders_batch_unsupported_platform(self, mock_client):
+        """Orders on a platform without batch placement fail instead of staying SUBMITTED."""
+        manager = OrderManager(client=mock_client, platform="kalshi")
+
+        orders = await manager.submit_orders_batch(
+            [{"market_id": "0x1", "outcome": "Yes", "side": "BUY", "size": 10.0, "price": 0.4}]
+        )
+
+        assert orders[0].status == OrderStatus.FAILED
+        assert "not supported" in orders[0].status_message
+
     @pytest.mark.asyncio
     async def test_cancel_order(self, order_manager):
         """Test cancelling an order."""
@@ -409,6 +583,24 @@ class TestOrderManager:
         assert updated.remaining_size == 0.0
         assert updated.status == OrderStatus.FILLED
 
+    @pytest.mark.asyncio
+    async def test_process_fill_ignores_duplicate_fill_id(self, order_manager):
+        """Test a redelivered fill is not counted twice."""
+        order = await order_manager.submit_order(
+            market_id="0x123",
+            outcome="Yes",
+            side="BUY",
+            size=100.0,
+            price=0.5,
+        )
+        order_id = order.order_id or order.client_order_id
+
+        await order_manager.process_fill(order_id, 30.0, 0.48, fill_id="trade_1")
+        updated = await order_manager.process_fill(order_id, 30.0, 0.48, fill_id="trade_1")
+
+        assert updated.filled_size == 30.0
+        assert len(updated.fills) == 1
+
     @pytest.mark.asyncio
     async def test_get_active_orders(self, order_manager):
         """Test getting active orders."""
@@ -450,6 +642,9 @@ class TestOrderManager:
             price=0.5,
         )
 
+        # Callbacks run from their own queues
+        await order_manager.events.drain()
+
         # Should have status change callback
         assert len(status_events) >= 1
 
@@ -460,6 +655,7 @@ class TestOrderManager:
             fill_size=100.0,
             fill_price=0.5,
         )
+        await order_manager.events.drain()
 
         # Should have fill and complete callbacks
         assert len(fill_events) == 1
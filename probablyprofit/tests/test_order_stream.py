@@ -0,0 +1,219 @@
+"""
+Tests for the push-based order event stream.
+"""
+
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from probablyprofit.api.order_manager import OrderManager, OrderStatus
+from probablyprofit.api.order_stream import OrderEventStream
+from probablyprofit.api.portfolio_state import PortfolioState
+
+
+@pytest.fixture
+def client():
+    """Mock Polymarket client without user-channel credentials and no orders or fills."""
+    client = MagicMock()
+    client.api_creds = None
+    client.get_open_orders = AsyncMock(return_value=[])
+    client.get_fills = AsyncMock(return_value=[])
+    client.get_order = AsyncMock(return_value=None)
+    return client
+
+
+@pytest.fixture
+def manager():
+    """Dry-run order manager."""
+    return OrderManager(client=None)
+
+
+async def _open_orders(manager: OrderManager, count: int, age: float = 60.0):
+    """Dry-run orders, backdated so they count as settled on the exchange."""
+    orders = []
+    for i in range(count):
+        order = await manager.submit_order(f"0x{i}", "Yes", "BUY", size=100.0, price=0.5)
+        order.submitted_at = datetime.now() - timedelta(seconds=age)
+        orders.append(order)
+    return orders
+
+
+def _trade(trade_id: str, taker: str, size: float, price: float = 0.5, **extra) -> dict:
+    return {
+        "id": trade_id,
+        "taker_order_id": taker,
+        "size": str(size),
+        "price": str(price),
+        "status": "MATCHED",
+        "match_time": str(int(time.time())),
+        **extra,
+    }
+
+
+class TestBulkSync:
+    """Tests for the periodic REST catch-up sync."""
+
+    @pytest.mark.asyncio
+    async def test_sync_applies_fills_once(self, manager, client):
+        """Taker and maker fills are applied, and re-listed trades are not applied again."""
+        orders = await _open_orders(manager, 2)
+        ids = [o.order_id for o in orders]
+        client.get_open_orders.return_value = [{"id": order_id} for order_id in ids]
+        client.get_fills.return_value = [
+            _trade("t1", ids[0], 40),
+            _trade(
+                "t2",
+                "someone_else",
+                10,
+                maker_orders=[{"order_id": ids[1], "matched_amount": "100", "price": "0.49"}],
+            ),
+        ]
+        stream = OrderEventStream(manager, client)
+
+        assert await stream.sync() == {"fills": 2, "closed": 0}
+        # Overlapping window returns the same trades: not applied twice
+        assert await stream.sync() == {"fills": 0, "closed": 0}
+
+        assert orders[0].filled_size == 40
+        assert orders[0].status == OrderStatus.PARTIALLY_FILLED
+        assert orders[1].status == OrderStatus.FILLED
+        assert orders[1].avg_fill_price == pytest.approx(0.49)
+
+    @pytest.mark.asyncio
+    async def test_requests_do_not_scale_with_order_count(self, manager, client):
+        """One listing and one fills request cover every open order."""
+        orders = await _open_orders(manager, 50)
+        client.get_open_orders.return_value = [{"id": o.order_id} for o in orders]
+        stream = OrderEventStream(manager, client)
+
+        await stream.sync()
+
+        client.get_fills.assert_awaited_once()
+        client.get_open_orders.assert_awaited_once()
+        client.get_order.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_vanished_orders_are_looked_up(self, manager, client):
+        """Settled orders missing from the open listing are looked up and closed."""
+        old, gone = await _open_orders(manager, 2)
+        (fresh,) = await _open_orders(manager, 1, age=0)
+        client.get_open_orders.return_value = [{"id": old.order_id}]
+        client.get_order.return_value = {"status": "CANCELED"}
+        stream = OrderEventStream(manager, client)
+
+        result = await stream.sync()
+
+        # Only the settled order missing from the listing costs a request
+        client.get_order.assert_awaited_once_with(gone.order_id)
+        assert result["closed"] == 1
+        assert gone.status == OrderStatus.CANCELLED
+        assert fresh.status == OrderStatus.OPEN
+
+    @pytest.mark.asyncio
+    async def test_cursor_advances_with_fills(self, manager, client):
+        """The next sync reads fills from just before the newest one seen."""
+        (order,) = await _open_orders(manager, 1)
+        matched = int(time.time()) + 100
+        client.get_fills.return_value = [_trade("t1", order.order_id, 10, match_time=str(matched))]
+        stream = OrderEventStream(manager, client)
+
+        await stream.sync()
+        await stream.sync()
+
+        assert client.get_fills.await_args.kwargs["since"] == matched - 5
+
+    @pytest.mark.asyncio
+    async def test_pushed_fills_do_not_move_sync_cursor(self, manager, client):
+        """Fills pushed on the user channel leave the REST sync cursor alone."""
+        (order,) = await _open_orders(manager, 1)
+        stream = OrderEventStream(manager, client)
+        since = int(stream._sync_cursor) - 5
+
+        pushed = _trade("t9", order.order_id, 5, match_time=str(int(time.time()) + 100))
+        await stream.handle_message(json.dumps(dict(pushed, event_type="trade")))
+        await stream.sync()
+
+        # A catch-up sync still reads fills the channel may have missed
+        assert client.get_fills.await_args.kwargs["since"] == since
+
+    @pytest.mark.asyncio
+    async def test_concurrent_push_and_sync_apply_once(self, manager, client):
+        """A fill seen by both the push and a concurrent sync is applied once."""
+        (order,) = await _open_orders(manager, 1)
+        trade = _trade("t1", order.order_id, 30)
+        client.get_fills.return_value = [trade]
+        stream = OrderEventStream(manager, client)
+
+        await asyncio.gather(
+            stream.handle_message(json.dumps(dict(trade, event_type="trade"))), stream.sync()
+        )
+
+        assert order.filled_size == 30
+        assert len(order.fills) == 1
+
+
+class TestUserChannel:
+    """Tests for events pushed on the user channel."""
+
+    @pytest.mark.asyncio
+    async def test_pushed_fill_reaches_portfolio_state(self, manager, client):
+        """A pushed fill updates the order and portfolio once, despite redelivery."""
+        state = PortfolioState()
+        state.attach(manager)
+        (order,) = await _open_orders(manager, 1)
+        stream = OrderEventStream(manager, client)
+
+        frame = dict(_trade("t1", order.order_id, 25), event_type="trade")
+        await stream.handle_message(json.dumps([frame]))
+        await stream.handle_message(json.dumps(frame))  # Redelivery (e.g. MINED status)
+
+        assert order.filled_size == 25
+        assert state.stats["fills_applied"] == 1
+        assert stream.stats["fills_push"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancellation_event(self, manager, client):
+        """A CANCELLATION order event cancels the order; PONG frames are ignored."""
+        (order,) = await _open_orders(manager, 1)
+        stream = OrderEventStream(manager, client)
+
+        await stream.handle_message(
+            json.dumps({"event_type": "order", "type": "CANCELLATION", "id": order.order_id})
+        )
+        await stream.handle_message("PONG")
+
+        assert order.status == OrderStatus.CANCELLED
+
+    @pytest.mark.asyncio
+    async def test_bad_event_does_not_stop_the_frame(self, manager, client):
+        """A failing event is logged and counted; the rest of the frame is applied."""
+        (order,) = await _open_orders(manager, 1)
+        manager.apply_exchange_update = AsyncMock(side_effect=RuntimeError("boom"))
+        stream = OrderEventStream(manager, client)
+
+        junk_maker = dict(_trade("t0", "someone_else", 5), maker_orders=["junk"])
+        frame = [
+            {"event_type": "order", "type": "CANCELLATION", "id": order.order_id},
+            dict(junk_maker, event_type="trade"),
+            dict(_trade("t1", order.order_id, 25), event_type="trade"),
+        ]
+        await stream.handle_message(json.dumps(frame))
+
+        assert order.filled_size == 25
+        assert stream.stats["push_errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_sync_without_credentials(self, manager, client):
+        """Without API credentials only the REST sync runs."""
+        stream = OrderEventStream(manager, client, sync_interval=60)
+
+        await stream.start()
+        try:
+            assert stream._push_task is None
+            assert not stream.push_connected
+        finally:
+            await stream.stop()
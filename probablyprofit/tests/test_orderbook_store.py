@@ -0,0 +1,129 @@
+"""
+Tests for the local L2 orderbook replica.
+"""
+
+from datetime import datetime
+
+import httpx
+import pytest
+
+from probablyprofit.api.client import PolymarketClient
+from probablyprofit.api.orderbook_store import BookSide, OrderbookStore
+from probablyprofit.api.websocket import OrderbookUpdate
+
+
+@pytest.fixture
+def store():
+    """Orderbook replica that treats books older than 5s as stale."""
+    return OrderbookStore(max_age=5.0)
+
+
+def _update(market_id="0xabc", outcome="Yes", bids=None, asks=None) -> OrderbookUpdate:
+    """WebSocket snapshot of a three-level book."""
+    return OrderbookUpdate(
+        market_id=market_id,
+        outcome=outcome,
+        bids=bids if bids is not None else [(0.48, 100.0), (0.50, 50.0), (0.45, 200.0)],
+        asks=asks if asks is not None else [(0.55, 80.0), (0.52, 40.0), (0.60, 300.0)],
+        timestamp=datetime.now(),
+    )
+
+
+class TestBookSide:
+    """Tests for BookSide."""
+
+    def test_bids_best_and_cumulative(self):
+        """Bids sort best-first and accumulate size down to a price."""
+        bids = BookSide(descending=True)
+        bids.replace([(0.48, 100.0), (0.50, 50.0), (0.45, 200.0)])
+
+        assert bids.best == (0.50, 50.0)
+        assert bids.levels() == [(0.50, 50.0), (0.48, 100.0), (0.45, 200.0)]
+        assert bids.cumulative_size(0.48) == 150.0
+        assert bids.cumulative_size(0.40) == 350.0
+        assert bids.price_for_size(120.0) == 0.48
+        assert bids.price_for_size(1000.0) is None
+
+    def test_asks_deltas(self):
+        """Level deltas update asks, and a zero size removes the level."""
+        asks = BookSide(descending=False)
+        asks.replace([(0.55, 80.0), (0.52, 40.0)])
+
+        assert asks.cumulative_size(0.55) == 120.0
+        asks.apply(0.53, 10.0)
+        asks.apply(0.52, 0.0)  # Level removed
+
+        assert asks.best == (0.53, 10.0)
+        assert asks.size_at(0.52) == 0.0
+        assert asks.cumulative_size(0.55) == 90.0
+        assert asks.price_for_size(50.0) == 0.55
+
+
+class TestOrderbookStore:
+    """Tests for OrderbookStore."""
+
+    def test_apply_update(self, store):
+        """A snapshot update builds the book, its top of book and REST-shaped dict."""
+        book = store.apply_update(_update())
+
+        assert book.best_bid == 0.50
+        assert book.best_ask == 0.52
+        assert book.spread == pytest.approx(0.02)
+        assert store.get_fresh("0xabc", "Yes") is book
+        assert book.to_dict(depth=1) == {
+            "bids": [{"price": "0.5", "size": "50.0"}],
+            "asks": [{"price": "0.52", "size": "40.0"}],
+        }
+
+    def test_staleness(self, store):
+        """Books go stale with age or when all are invalidated."""
+        book = store.apply_update(_update())
+
+        book.updated_at -= 10.0
+        assert store.get_fresh("0xabc", "Yes") is None
+        assert store.stale_keys() == [("0xabc", "Yes")]
+
+        store.apply_update(_update())
+        store.invalidate_all()  # e.g. WebSocket disconnected
+        assert store.get_fresh("0xabc", "Yes") is None
+
+
+class TestClientReplica:
+    """Tests for PolymarketClient reads through an attached OrderbookStore."""
+
+    @pytest.mark.asyncio
+    async def test_get_orderbook_serves_fresh_books_locally(self, store):
+        """Fresh books are served locally; stale or missing ones are re-synced over REST."""
+        requests: list = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request.url.path)
+            return httpx.Response(
+                200,
+                json={
+                    "bids": [{"price": "0.40", "size": "10"}],
+                    "asks": [{"price": "0.45", "size": "5"}],
+                },
+            )
+
+        client = PolymarketClient()
+        client.http_client = httpx.AsyncClient(
+            base_url="https://clob.polymarket.com", transport=httpx.MockTransport(handler)
+        )
+        client.attach_orderbook_store(store)
+        store.apply_update(_update())
+
+        book = await client.get_orderbook("0xabc", "Yes")
+        assert book["bids"][0] == {"price": "0.5", "size": "50.0"}
+        assert requests == []
+
+        # Stale book is re-synced from REST and served locally afterwards
+        store.get("0xabc", "Yes").updated_at -= 10.0
+        books = await client.get_orderbooks_batch([("0xabc", "Yes"), ("0xabc", "No")])
+        assert sorted(requests) == ["/orderbook/0xabc/No", "/orderbook/0xabc/Yes"]
+        assert books[0]["bids"] == [{"price": "0.40", "size": "10"}]
+        assert store.get_fresh("0xabc", "Yes").best_bid == 0.40
+
+        await client.get_orderbook("0xabc", "No")
+        assert len(requests) == 2
+        await client.close()
@@ -0,0 +1,167 @@
+"""
+Tests for the write-through portfolio state.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from probablyprofit.api.client import PolymarketClient, Position
+from probablyprofit.api.exceptions import APIException
+from probablyprofit.api.order_manager import OrderManager
+from probablyprofit.api.portfolio_state import PortfolioState
+
+
+@pytest.fixture
+def client():
+    """Mock Polymarket client with no positions and a $1000 balance."""
+    client = MagicMock()
+    client.fetch_positions = AsyncMock(return_value=[])
+    client.fetch_balance = AsyncMock(return_value=1000.0)
+    client.get_fills = AsyncMock(return_value=[])
+    return client
+
+
+class TestPortfolioState:
+    """Tests for PortfolioState."""
+
+    @pytest.mark.asyncio
+    async def test_reads_served_from_memory_after_first_sync(self, client):
+        """Only the first read goes to the exchange."""
+        state = PortfolioState(client, reconcile_interval=60.0)
+
+        assert await state.get_balance() == 1000.0
+        await state.get_positions()
+        await state.get_balance()
+
+        assert client.fetch_balance.await_count == 1
+        assert client.fetch_positions.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_fills_update_positions_and_cash(self, client):
+        """Fills move position size, average price and cash, including fees."""
+        state = PortfolioState(client, reconcile_interval=60.0)
+        await state.reconcile()
+
+        state.apply_fill("0xabc", "Yes", "BUY", 100, 0.40, fee=0.5)
+        state.apply_fill("0xabc", "Yes", "BUY", 100, 0.60)
+        state.apply_fill("0xabc", "Yes", "SELL", 50, 0.70)
+
+        [position] = await state.get_positions()
+        assert position.size == 150
+        assert position.avg_price == pytest.approx(0.50)
+        assert await state.get_balance() == pytest.approx(1000 - 40.5 - 60 + 35)
+
+        state.apply_fill("0xabc", "Yes", "SELL", 150, 0.70)
+        assert await state.get_positions() == []
+
+    @pytest.mark.asyncio
+    async def test_oversell_forces_reconcile_and_counts_drift(self, client):
+        """Selling more than is held re-reads the exchange and counts a drift."""
+        held = Position(market_id="0xabc", outcome="No", size=10, avg_price=0.3, current_price=0.3)
+        state = PortfolioState(client, reconcile_interval=60.0)
+        await state.reconcile()
+
+        client.fetch_positions.return_value = [held]
+        state.apply_fill("0xabc", "No", "SELL", 5, 0.35)  # Never saw the buy
+
+        positions = await state.get_positions()
+        assert positions[0].size == 10
+        assert client.fetch_positions.await_count == 2
+        assert state.stats["drifts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_order_manager_fills_and_client_routing(self):
+        """Order manager fills reach the state, and client reads are served from it."""
+        client = PolymarketClient()
+        client.fetch_positions = AsyncMock(return_value=[])
+        client.fetch_balance = AsyncMock(return_value=500.0)
+        state = PortfolioState(reconcile_interval=60.0)
+        client.attach_portfolio_state(state)
+
+        manager = OrderManager(client=None)
+        state.attach(manager)
+        order = await manager.submit_order("0xabc", "Yes", "BUY", size=10, price=0.5)
+        await client.get_balance()
+        await manager.process_fill(order.order_id, 10, 0.5)
+
+        assert await client.get_balance() == pytest.approx(495.0)
+        assert (await client.get_positions())[0].size == 10
+        assert client.fetch_balance.await_count == 1
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_reconcile_keeps_previous_snapshot(self, client):
+        """A reconcile that fails leaves the last good snapshot in place."""
+        held = Position(market_id="0xabc", outcome="Yes", size=10, avg_price=0.4, current_price=0.4)
+        client.fetch_positions.return_value = [held]
+        state = PortfolioState(client, reconcile_interval=60.0)
+        await state.reconcile()
+
+        client.fetch_balance.side_effect = APIException("Could not fetch balance from any source")
+        await state.reconcile()
+
+        assert await state.get_balance() == 1000.0
+        assert (await state.get_positions())[0].size == 10
+        assert state.stats["reconcile_failures"] == 1
+
+    @pytest.mark.asyncio
+    async def test_mark_stale_reconciles_in_background(self, client):
+        """mark_stale() refreshes in the background while reads keep being served."""
+        state = PortfolioState(client, reconcile_interval=60.0)
+        await state.reconcile()
+        release = asyncio.Event()
+
+        async def slow_balance(strict=False):
+            await release.wait()
+            return 900.0
+
+        client.fetch_balance.side_effect = slow_balance
+        state.mark_stale()
+
+        # Reads do not wait for the exchange
+        assert await asyncio.wait_for(state.get_balance(), timeout=1) == 1000.0
+        release.set()
+        await state._background
+        assert await state.get_balance() == 900.0
+
+    @pytest.mark.asyncio
+    async def test_fill_included_by_reconcile_is_not_counted_twice(self, client):
+        """A fill already reflected in the reconciled snapshot is skipped."""
+        held = Position(market_id="0xabc", outcome="Yes", size=10, avg_price=0.5, current_price=0.5)
+        client.fetch_positions.return_value = [held]
+        client.fetch_balance.return_value = 995.0
+        client.get_fills.return_value = [{"id": "t1"}]
+        state = PortfolioState(client, reconcile_interval=60.0)
+        await state.reconcile()
+
+        # The fill event arrives after the snapshot that already contains it
+        state.apply_fill("0xabc", "Yes", "BUY", 10, 0.5, fill_id="t1")
+        state.apply_fill("0xabc", "Yes", "BUY", 10, 0.5, fill_id="t1")
+
+        assert (await state.get_positions())[0].size == 10
+        assert await state.get_balance() == 995.0
+        assert state.stats["fills_skipped"] == 2
+
+    @pytest.mark.asyncio
+    async def test_fill_during_reconcile_survives_older_snapshot(self, client):
+        """A fill applied while a reconcile is in flight is kept when the reconcile lands."""
+        state = PortfolioState(client, reconcile_interval=60.0)
+        await state.reconcile()
+        fetching, release = asyncio.Event(), asyncio.Event()
+
+        async def slow_positions(strict=False):
+            fetching.set()
+            await release.wait()
+            return []
+
+        client.fetch_positions.side_effect = slow_positions
+        reconcile = asyncio.ensure_future(state.reconcile())
+        await fetching.wait()
+        state.apply_fill("0xabc", "Yes", "BUY", 10, 0.5, fill_id="t2")
+        release.set()
+        await reconcile
+
+        assert (await state.get_positions())[0].size == 10
+        assert await state.get_balance() == pytest.approx(995.0)
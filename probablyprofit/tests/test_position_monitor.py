@@ -210,6 +210,38 @@ class TestPositionMonitor:
         assert len(alerts) == 0
         assert "0x123:Yes" in monitor.positions
 
+    @pytest.mark.asyncio
+    async def test_concurrent_ticks_exit_once(self, mock_client, risk_manager):
+        monitor = PositionMonitor(client=mock_client, risk_manager=risk_manager, dry_run=False)
+        monitor.add_position("0x123", "Yes", entry_price=0.5, size=100.0, stop_loss_price=0.4)
+
+        async def slow_order(**kwargs):
+            await asyncio.sleep(0.01)
+            return MagicMock(order_id="order_123")
+
+        mock_client.place_order.side_effect = slow_order
+        tick = MagicMock(market_id="0x123", outcome="Yes", price=0.35)
+
+        alerts = await asyncio.gather(monitor.on_price_update(tick), monitor.on_price_update(tick))
+
+        assert alerts.count(None) == 1
+        assert mock_client.place_order.await_count == 1
+        assert monitor.stats["stop_losses_triggered"] == 1
+        assert "0x123:Yes" not in monitor.positions
+
+    @pytest.mark.asyncio
+    async def test_failed_exit_resumes_monitoring(self, mock_client, risk_manager):
+        monitor = PositionMonitor(client=mock_client, risk_manager=risk_manager, dry_run=False)
+        monitor.add_position("0x123", "Yes", entry_price=0.5, size=100.0, stop_loss_price=0.4)
+        mock_client.place_order.side_effect = Exception("rejected")
+
+        alert = await monitor.on_price_update(
+            MagicMock(market_id="0x123", outcome="Yes", price=0.35)
+        )
+
+        assert alert is not None and not alert.executed
+        assert "0x123:Yes" in monitor.positions
+
     @pytest.mark.asyncio
     async def test_trailing_stop(self, monitor, mock_client):
         monitor.add_position(
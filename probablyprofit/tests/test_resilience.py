@@ -8,10 +8,13 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from probablyprofit.api.exceptions import NetworkException, RateLimitException
+from probablyprofit.utils.metrics import get_trading_metrics
 from probablyprofit.utils.resilience import (
+    AdaptiveRateLimiter,
     CircuitBreaker,
     CircuitState,
     RateLimiter,
+    RequestHedger,
     RetryConfig,
     calculate_delay,
     get_resilience_status,
@@ -210,6 +213,158 @@ class TestRateLimiter:
         assert wait3 > 0
 
 
+class TestAdaptiveRateLimiter:
+    """Tests for the AIMD rate limiter."""
+
+    def test_success_increases_rate_up_to_ceiling(self):
+        """Sustained successes raise the rate additively, bounded by max_rate."""
+        limiter = AdaptiveRateLimiter("test-arl-1", calls=4, period=1.0, max_rate=6.0)
+
+        for _ in range(4):
+            limiter.record_success()
+        assert limiter.rate == pytest.approx(5.0, abs=0.1)
+
+        for _ in range(100):
+            limiter.record_success()
+        assert limiter.rate == 6.0
+
+    @pytest.mark.asyncio
+    async def test_429_halves_rate_and_honours_retry_after(self):
+        """A 429 cuts the rate once per cooldown and pauses for Retry-After."""
+        limiter = AdaptiveRateLimiter("test-arl-2", calls=8, period=1.0)
+
+        limiter.record_rate_limit_error(retry_after=2.0)
+        limiter.record_rate_limit_error()  # Same congestion event, within cooldown
+
+        assert limiter.rate == 4.0
+        assert limiter.stats["throttles"] == 2
+        assert limiter.stats["paused"] is True
+        assert await limiter.acquire() == pytest.approx(2.0, abs=0.1)
+
+    def test_high_latency_backs_off(self):
+        """Latency far above baseline lowers the rate before any 429."""
+        limiter = AdaptiveRateLimiter(
+            "test-arl-3", calls=10, period=1.0, latency_threshold=2.0, cooldown=0.0
+        )
+
+        for _ in range(5):
+            limiter.record_success(latency=0.05)
+        rate_before = limiter.rate
+
+        for _ in range(10):
+            limiter.record_success(latency=0.5)
+
+        assert limiter.rate < rate_before
+        assert limiter.stats["latency_backoffs"] > 0
+
+    def test_rate_never_below_floor(self):
+        """Repeated 429s cannot drive the rate below min_rate."""
+        limiter = AdaptiveRateLimiter("test-arl-4", calls=10, period=1.0, cooldown=0.0)
+
+        for _ in range(20):
+            limiter.record_rate_limit_error()
+
+        assert limiter.rate == limiter.min_rate == 1.0
+
+
+class TestRequestHedger:
+    """Tests for hedged reads."""
+
+    @staticmethod
+    def _warm(hedger: RequestHedger, endpoint: str, latency: float, samples: int = 20) -> None:
+        for _ in range(samples):
+            hedger._observe(endpoint, latency)
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_until_enough_samples(self):
+        """Endpoints without latency history are never hedged."""
+        hedger = RequestHedger("test-hedge-1", budget=1.0)
+        calls = []
+
+        async def read():
+            calls.append(1)
+            await asyncio.sleep(0.02)
+            return "ok"
+
+        assert await hedger.run("market", read) == "ok"
+        assert len(calls) == 1
+        assert hedger.hedge_delay("market") is None
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged(self):
+        """A read outliving the p95 is re-sent and the faster attempt wins."""
+        hedger = RequestHedger("test-hedge-2", budget=1.0)
+        self._warm(hedger, "orderbook", 0.01)
+        attempts = []
+
+        async def read():
+            attempts.append(len(attempts))
+            await asyncio.sleep(1.0 if len(attempts) == 1 else 0.01)
+            return f"attempt-{len(attempts)}"
+
+        result = await asyncio.wait_for(hedger.run("orderbook", read), timeout=0.5)
+
+        assert result == "attempt-2"
+        assert hedger.stats["hedges"] == 1
+        assert hedger.stats["win_rate"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_hedges_limited_by_budget(self):
+        """With a 10% budget, slow reads are mostly left unhedged."""
+        hedger = RequestHedger("test-hedge-3", budget=0.1, max_burst=1.0)
+        self._warm(hedger, "order", 0.001)
+
+        async def read():
+            await asyncio.sleep(0.01)
+            return "ok"
+
+        for _ in range(10):
+            await hedger.run("order", read)
+
+        assert hedger.stats["hedges"] <= 2
+        assert hedger.stats["hedge_rate"] <= 0.2
+
+    @pytest.mark.asyncio
+    async def test_hedge_acquires_token(self):
+        """The hedge is only sent once its rate-limit token is granted."""
+        hedger = RequestHedger("test-hedge-4", budget=1.0)
+        self._warm(hedger, "orderbook", 0.01)
+        events = []
+
+        async def acquire():
+            events.append("acquire")
+
+        async def read():
+            events.append("read")
+            await asyncio.sleep(1.0 if events.count("read") == 1 else 0.01)
+            return "ok"
+
+        await asyncio.wait_for(hedger.run("orderbook", read, acquire=acquire), timeout=0.5)
+
+        assert events == ["read", "acquire", "read"]
+
+    @pytest.mark.asyncio
+    async def test_both_attempts_failing_is_recorded(self):
+        """When primary and hedge both fail, the primary's error is raised."""
+        hedger = RequestHedger("test-hedge-5", budget=1.0)
+        self._warm(hedger, "market", 0.01)
+        counter = get_trading_metrics()["hedged_reads"]
+        labels = {"endpoint": "market", "result": "both_failed"}
+        before = counter.get(labels)
+        attempts = []
+
+        async def read():
+            attempt = len(attempts) + 1
+            attempts.append(attempt)
+            await asyncio.sleep(0.05)
+            raise NetworkException(f"attempt-{attempt}")
+
+        with pytest.raises(NetworkException, match="attempt-1"):
+            await hedger.run("market", read)
+
+        assert counter.get(labels) == before + 1
+
+
 class TestHelperFunctions:
     """Tests for helper functions."""
 
@@ -0,0 +1,111 @@
+"""
+Tests for priority request scheduling.
+"""
+
+import asyncio
+
+import pytest
+
+from probablyprofit.utils.resilience import RateLimiter
+from probablyprofit.utils.scheduler import PriorityScheduler, RequestPriority, request_priority
+
+
+@pytest.fixture
+def scheduler():
+    """One token every 20ms, no burst: every request after the first has to queue."""
+    return PriorityScheduler(RateLimiter("test-sched", calls=1, period=0.02))
+
+
+class TestPriorityScheduler:
+    """Tests for PriorityScheduler."""
+
+    @pytest.mark.asyncio
+    async def test_critical_requests_preempt_queued_background(self, scheduler):
+        """A critical request is served ahead of queued background ones."""
+        order: list = []
+
+        async def request(label: str, priority: RequestPriority):
+            await scheduler.acquire(priority)
+            order.append(label)
+
+        await scheduler.acquire()  # Drain the bucket
+        tasks = [
+            asyncio.create_task(request(f"scan-{i}", RequestPriority.BACKGROUND)) for i in range(3)
+        ]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(request("stop-loss", RequestPriority.CRITICAL)))
+        await asyncio.gather(*tasks)
+
+        assert order[0] == "stop-loss"
+        assert order[1:] == ["scan-0", "scan-1", "scan-2"]
+        assert scheduler.stats["granted"]["critical"] == 1
+
+    @pytest.mark.asyncio
+    async def test_context_priority_overrides_default(self, scheduler):
+        """request_priority() overrides the priority passed to acquire()."""
+        order: list = []
+
+        async def request(label: str):
+            await scheduler.acquire(RequestPriority.BACKGROUND)
+            order.append(label)
+
+        async def critical_request():
+            with request_priority(RequestPriority.CRITICAL):
+                await request("cancel")
+
+        await scheduler.acquire()
+        tasks = [asyncio.create_task(request("scan")), asyncio.create_task(critical_request())]
+        await asyncio.gather(*tasks)
+
+        assert order == ["cancel", "scan"]
+
+    @pytest.mark.asyncio
+    async def test_starved_requests_are_promoted(self, scheduler):
+        """A request queued past starvation_timeout jumps higher classes."""
+        scheduler.starvation_timeout = 0.03
+        order: list = []
+
+        async def request(label: str, priority: RequestPriority):
+            await scheduler.acquire(priority)
+            order.append(label)
+
+        await scheduler.acquire()
+        tasks = [asyncio.create_task(request("scan", RequestPriority.BACKGROUND))]
+        await asyncio.sleep(0)
+        tasks += [
+            asyncio.create_task(request(f"trade-{i}", RequestPriority.NORMAL)) for i in range(4)
+        ]
+        await asyncio.gather(*tasks)
+
+        # The scan waits at most ~starvation_timeout before jumping the normal queue
+        assert order.index("scan") < 4
+        assert scheduler.stats["starvation_promotions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_is_skipped(self, scheduler):
+        """A waiter cancelled while queued is dropped from its queue."""
+
+        await scheduler.acquire()
+        cancelled = asyncio.create_task(scheduler.acquire(RequestPriority.CRITICAL))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        await asyncio.wait_for(scheduler.acquire(RequestPriority.BACKGROUND), timeout=1.0)
+        assert scheduler.stats["queued"] == {"critical": 0, "normal": 0, "background": 0}
+
+    @pytest.mark.asyncio
+    async def test_granted_then_cancelled_waiter_returns_token(self, scheduler):
+        """A token granted to a waiter cancelled before it resumes is returned."""
+
+        await scheduler.acquire()
+        task = asyncio.create_task(scheduler.acquire())
+        await asyncio.sleep(0)
+        (waiter,) = scheduler._queues[RequestPriority.NORMAL]
+
+        # The token is handed over, but the request is cancelled before it resumes
+        waiter.future.set_result(None)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert await scheduler.limiter.acquire() == 0
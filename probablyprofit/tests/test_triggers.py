@@ -0,0 +1,172 @@
+"""
+Tests for event-driven agent triggers.
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from probablyprofit.agent.base import Decision
+from probablyprofit.agent.triggers import MarketTrigger
+from probablyprofit.api.websocket import OrderbookUpdate, PriceUpdate
+
+
+@pytest.fixture
+def ws():
+    """Mock WebSocket client whose subscribe/unsubscribe calls succeed."""
+    ws = MagicMock()
+    ws.subscribe = AsyncMock(return_value=True)
+    ws.unsubscribe = AsyncMock(return_value=True)
+    return ws
+
+
+def _price(market_id: str, price: float, volume: float = 0.0) -> PriceUpdate:
+    return PriceUpdate(market_id, "Yes", price, datetime.now(), volume=volume)
+
+
+def _book(market_id: str, bid: float, ask: float) -> OrderbookUpdate:
+    return OrderbookUpdate(market_id, "Yes", [(bid, 10)], [(ask, 10)], datetime.now())
+
+
+def _trigger(ws: MagicMock, **kwargs) -> MarketTrigger:
+    settings = {
+        "price_move": 0.02,
+        "spread_change": 0.02,
+        "volume_spike": 3.0,
+        "max_idle": 60.0,
+        "debounce": 0.0,
+        "min_interval": 0.0,
+    }
+    settings.update(kwargs)
+    return MarketTrigger(ws, **settings)
+
+
+class TestMarketTrigger:
+    """Tests for MarketTrigger."""
+
+    @pytest.mark.asyncio
+    async def test_track_syncs_subscriptions(self, ws):
+        """Tracking a new market set subscribes the added and unsubscribes the dropped."""
+        trigger = _trigger(ws)
+
+        await trigger.track(["0x001", "0x002"])
+        await trigger.track(["0x002", "0x003"])
+
+        assert set(ws.subscribe.await_args_list[0].args[0]) == {"0x001", "0x002"}
+        assert ws.subscribe.await_args_list[1].args[0] == ["0x003"]
+        ws.unsubscribe.assert_awaited_once_with(["0x001"])
+
+    @pytest.mark.asyncio
+    async def test_price_move_fires_relative_to_last_cycle(self, ws):
+        """Price moves are measured from the price at the last cycle."""
+        trigger = _trigger(ws)
+        await trigger.track(["0x001"])
+
+        trigger.on_price_update(_price("0x001", 0.50))
+        trigger.on_price_update(_price("0x001", 0.51))
+        trigger.on_price_update(_price("0x999", 0.90))  # Not watched
+        assert trigger.stats["fires"]["price_move"] == 0
+
+        trigger.on_price_update(_price("0x001", 0.53))
+        assert trigger.stats["fires"]["price_move"] == 1
+
+        # After a cycle the new price is the reference
+        trigger.mark_cycle()
+        trigger.on_price_update(_price("0x001", 0.54))
+        assert trigger.stats["fires"]["price_move"] == 1
+
+    @pytest.mark.asyncio
+    async def test_spread_change_and_volume_spike(self, ws):
+        """Spread widening and a volume spike each fire."""
+        trigger = _trigger(ws)
+        await trigger.track(["0x001"])
+
+        trigger.on_orderbook_update(_book("0x001", 0.48, 0.50))
+        trigger.on_orderbook_update(_book("0x001", 0.45, 0.51))
+        assert trigger.stats["fires"]["spread_change"] == 1
+
+        for _ in range(5):
+            trigger.on_price_update(_price("0x001", 0.50, volume=10))
+        assert trigger.stats["fires"]["volume_spike"] == 0
+        trigger.on_price_update(_price("0x001", 0.50, volume=40))
+        assert trigger.stats["fires"]["volume_spike"] == 1
+
+    @pytest.mark.asyncio
+    async def test_wait_returns_reasons_after_debounce(self, ws):
+        """wait() returns the fire reasons once the debounce has passed."""
+        trigger = _trigger(ws, debounce=0.05)
+        await trigger.track(["0x001"])
+        trigger.on_price_update(_price("0x001", 0.50))
+
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.01, trigger.on_price_update, _price("0x001", 0.60))
+
+        start = time.monotonic()
+        reasons = await trigger.wait(asyncio.Event())
+
+        assert time.monotonic() - start >= 0.05
+        assert reasons and reasons[0].startswith("price_move")
+
+    @pytest.mark.asyncio
+    async def test_min_interval_spaces_cycles(self, ws):
+        """wait() holds a fired trigger until min_interval after the last cycle."""
+        trigger = _trigger(ws, min_interval=0.1)
+        await trigger.track(["0x001"])
+        trigger.mark_cycle()
+
+        trigger.on_price_update(_price("0x001", 0.50))
+        trigger.on_price_update(_price("0x001", 0.60))
+
+        start = time.monotonic()
+        await trigger.wait(asyncio.Event())
+        assert time.monotonic() - start >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_max_idle_and_stop(self, ws):
+        """wait() fires after max_idle without events and returns None on stop."""
+        trigger = _trigger(ws, max_idle=0.02)
+        trigger.mark_cycle()
+
+        assert await trigger.wait(asyncio.Event()) == ["max_idle 0.02s"]
+        assert trigger.stats["idle_cycles"] == 1
+
+        trigger = _trigger(ws, max_idle=60.0)
+        stop = asyncio.Event()
+        asyncio.get_running_loop().call_later(0.01, stop.set)
+        assert await trigger.wait(stop) is None
+
+
+class TestEventDrivenLoop:
+    """Tests for the agent loop driven by a MarketTrigger."""
+
+    @pytest.mark.asyncio
+    async def test_cycles_run_only_when_triggered(self, mock_agent, ws):
+        """The event-driven loop runs a cycle per trigger, not per loop_interval."""
+        mock_agent.risk_manager.save_state = AsyncMock()
+        mock_agent.loop_interval = 0  # Would spin if the timer were still used
+        trigger = _trigger(ws)
+        mock_agent.enable_event_driven(trigger)
+
+        decisions = []
+
+        async def decide(observation):
+            decisions.append(observation)
+            if len(decisions) == 1:
+                # Market moves while the first decision is in flight
+                trigger.on_price_update(_price("0x001", 0.35))
+                trigger.on_price_update(_price("0x001", 0.45))
+            else:
+                mock_agent.stop()
+            return Decision(action="hold", reasoning="Test")
+
+        mock_agent.decide = decide
+
+        await asyncio.wait_for(mock_agent.run_loop(), timeout=5)
+
+        assert len(decisions) == 2
+        subscribed = set(ws.subscribe.await_args_list[0].args[0])
+        assert subscribed == {m.condition_id for m in decisions[0].markets}
+        assert trigger.stats["cycles"] == 2
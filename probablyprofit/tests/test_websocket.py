@@ -335,3 +335,116 @@ class TestConnectionStats:
 
         # Should have a total_reconnects counter
         assert hasattr(client, "_total_reconnects")
+
+
+class TestConflatedDispatch:
+    """Tests for per-market conflating callback dispatch."""
+
+    @staticmethod
+    def _price(market: str, price: float) -> str:
+        return f'{{"type": "price", "market": "{market}", "outcome": "Yes", "price": "{price}"}}'
+
+    @pytest.mark.asyncio
+    async def test_slow_callback_sees_only_latest_update(self):
+        from probablyprofit.api.websocket import WebSocketClient
+        from probablyprofit.api.ws_dispatch import UpdateDispatcher
+
+        client = WebSocketClient(conflate=True)
+        client._dispatcher = UpdateDispatcher()
+        release = asyncio.Event()
+        slow_seen, fast_seen = [], []
+
+        @client.on_price_update
+        async def slow(update):
+            slow_seen.append(update.price)
+            await release.wait()
+
+        @client.on_price_update
+        def fast(update):
+            fast_seen.append(update.price)
+
+        await client._handle_message(self._price("0x1", 0.50))
+        await asyncio.sleep(0)  # Consumers pick up the first update
+        for price in (0.51, 0.52, 0.53):
+            await client._handle_message(self._price("0x1", price))
+        await asyncio.sleep(0.01)
+
+        # The blocked callback holds up neither the receive path nor the other callback
+        assert slow_seen == [0.50]
+        assert fast_seen == [0.50, 0.53]
+
+        release.set()
+        await asyncio.sleep(0.01)
+        assert slow_seen == [0.50, 0.53]
+        stats = {name.rsplit(".", 1)[-1]: s for name, s in client.stats["consumers"].items()}
+        assert stats["slow"]["conflated"] == 2
+
+        await client._dispatcher.close()
+
+    @pytest.mark.asyncio
+    async def test_pending_markets_are_bounded(self):
+        from probablyprofit.api.ws_dispatch import UpdateDispatcher
+
+        dispatcher = UpdateDispatcher(max_pending=2)
+        seen = []
+
+        def callback(update):
+            seen.append(update)
+
+        for market in ("a", "b", "c"):
+            dispatcher.publish([callback], (market, "Yes"), market)
+        await asyncio.sleep(0.01)
+
+        # Oldest pending market was evicted, the rest delivered in arrival order
+        assert seen == ["b", "c"]
+        (stats,) = dispatcher.stats.values()
+        assert stats["dropped"] == 1
+        assert stats["delivered"] == 2
+        await dispatcher.close()
+
+
+class TestLeanParse:
+    """Tests for the low-allocation parse path."""
+
+    @pytest.mark.asyncio
+    async def test_batched_frame_yields_compact_updates(self):
+        from probablyprofit.api.websocket import BookTick, PriceTick, WebSocketClient
+
+        client = WebSocketClient(conflate=False, lean_parse=True)
+        prices, books = [], []
+        client.on_price_update(prices.append)
+        client.on_orderbook_update(books.append)
+
+        frame = (
+            '[{"type": "price", "market": "0x1", "outcome": "Yes", "price": "0.61", "volume": "5"},'
+            ' {"event": "book", "market": "0x1", "outcome": "Yes",'
+            '  "bids": [{"price": "0.60", "size": "10"}, {"price": "0.59", "size": "4"}],'
+            '  "asks": [{"price": "0.62", "size": "7"}]}]'
+        )
+        await client._handle_message(frame)
+
+        (tick,) = prices
+        assert isinstance(tick, PriceTick)
+        assert (tick.market_id, tick.outcome, tick.price, tick.volume) == ("0x1", "Yes", 0.61, 5.0)
+        assert tick.raw is None and tick.metadata == {}
+        assert abs((datetime.now() - tick.timestamp).total_seconds()) < 5
+        assert not hasattr(tick, "__dict__")
+
+        (book,) = books
+        assert isinstance(book, BookTick)
+        assert book.bid_prices == [0.60, 0.59]
+        assert (book.best_bid, book.best_ask) == (0.60, 0.62)
+        assert book.bids == [(0.60, 10.0), (0.59, 4.0)]
+
+    @pytest.mark.asyncio
+    async def test_raw_payload_kept_on_request(self):
+        from probablyprofit.api.websocket import WebSocketClient
+
+        client = WebSocketClient(conflate=False, lean_parse=True, keep_raw=True)
+        prices = []
+        client.on_price_update(prices.append)
+
+        await client._handle_message('{"type": "tick", "market": "0x2", "price": "0.3"}')
+
+        assert prices[0].metadata["market"] == "0x2"
+        assert prices[0].outcome == "Yes"
@@ -0,0 +1,114 @@
+"""
+Tests for WebSocket session recording and replay.
+"""
+
+import json
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+pytest.importorskip("websockets")
+
+from probablyprofit.api.websocket import WebSocketClient
+from probablyprofit.api.ws_recorder import FrameRecorder, FrameReplayer
+from probablyprofit.risk.manager import RiskManager
+from probablyprofit.trading.position_monitor import PositionMonitor
+
+
+def _frame(market: str, price: float) -> str:
+    return json.dumps({"type": "price", "market": market, "outcome": "Yes", "price": str(price)})
+
+
+class TestFrameRecorder:
+    @pytest.mark.asyncio
+    async def test_client_frames_round_trip(self, tmp_path):
+        path = tmp_path / "session.ndjson.gz"
+        recorder = FrameRecorder(path, chunk_frames=3)
+        live = WebSocketClient(conflate=False)
+        live.attach_recorder(recorder)
+
+        frames = [_frame("0x1", 0.40 + i / 100) for i in range(7)]
+        for frame in frames:
+            await live._receive(frame)
+        recorder.close()
+
+        assert recorder.stats["chunks"] == 3  # 3 + 3 + 1
+        assert [frame for _, frame in FrameReplayer(path).frames()] == frames
+
+        # Appending a second session keeps the file readable
+        recorder = FrameRecorder(path)
+        recorder.record(_frame("0x2", 0.9))
+        recorder.close()
+        assert len(list(FrameReplayer(path).frames())) == 8
+
+    def test_truncated_chunk_is_ignored(self, tmp_path):
+        path = tmp_path / "crash.ndjson.gz"
+        recorder = FrameRecorder(path, chunk_frames=2)
+        for i in range(4):
+            recorder.record(_frame("0x1", i / 10))
+        recorder.close()
+
+        data = path.read_bytes()
+        path.write_bytes(data[:-10])
+
+        assert len(list(FrameReplayer(path).frames())) == 2
+
+
+class TestFrameReplayer:
+    @pytest.fixture
+    def recording(self, tmp_path):
+        path = tmp_path / "ticks.ndjson.gz"
+        recorder = FrameRecorder(path)
+        start = time.time()
+        for i, price in enumerate([0.50, 0.48, 0.44, 0.39, 0.41]):
+            recorder.record(_frame("0xabc", price), received_at=start + i * 0.5)
+        recorder.close()
+        return path
+
+    @pytest.mark.asyncio
+    async def test_replay_through_callbacks(self, recording):
+        client = WebSocketClient(conflate=False)
+        prices = []
+        client.on_price_update(lambda update: prices.append(update.price))
+
+        stats = await FrameReplayer(recording).replay(client)
+
+        assert prices == [0.50, 0.48, 0.44, 0.39, 0.41]
+        assert stats["frames"] == 5
+
+    @pytest.mark.asyncio
+    async def test_replay_skips_live_stats(self, tmp_path, recording):
+        client = WebSocketClient(conflate=False)
+        recorder = FrameRecorder(tmp_path / "live.ndjson.gz")
+        client.attach_recorder(recorder)
+
+        await FrameReplayer(recording).replay(client)
+        recorder.close()
+
+        assert client.stats["messages_received"] == 0
+        assert client.stats["lag_ms"] is None
+        assert recorder.stats["frames"] == 0
+
+    @pytest.mark.asyncio
+    async def test_replay_honours_recorded_pace(self, recording):
+        client = WebSocketClient(conflate=False)
+
+        stats = await FrameReplayer(recording).replay(client, speed=20.0)
+
+        # 2s of recorded time at 20x
+        assert stats["elapsed_seconds"] >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_replay_drives_position_monitor(self, recording):
+        client = WebSocketClient(conflate=True)
+        monitor = PositionMonitor(AsyncMock(), RiskManager(initial_capital=1000.0), dry_run=True)
+        monitor.add_position("0xabc", "Yes", entry_price=0.50, size=100, stop_loss_pct=0.20)
+        client.on_price_update(monitor.on_price_update)
+
+        # Paced replay: the consumer sees each tick, including the dip through the stop
+        await FrameReplayer(recording).replay(client, speed=50.0)
+
+        assert monitor.stats["stop_losses_triggered"] == 1
+        assert monitor.positions == {}
+        assert client._dispatcher is None  # Replay-owned dispatcher was stopped
@@ -0,0 +1,172 @@
+"""
+Tests for sharded WebSocket connections.
+"""
+
+import asyncio
+from collections import Counter
+from unittest.mock import AsyncMock
+
+import pytest
+
+pytest.importorskip("websockets")
+
+from probablyprofit.api.websocket import WebSocketClient
+from probablyprofit.api.ws_shards import HashRing, ShardedWebSocketClient
+
+
+class FakeShard:
+    """Stands in for a WebSocketClient without a network connection."""
+
+    def __init__(self):
+        self.subscribed = set()
+        self.price_callbacks = []
+        self.connects = 0
+
+    async def connect(self):
+        self.connects += 1
+        return True
+
+    async def disconnect(self):
+        pass
+
+    async def subscribe(self, market_ids):
+        self.subscribed.update(market_ids)
+        return True
+
+    async def unsubscribe(self, market_ids):
+        self.subscribed -= set(market_ids)
+        return True
+
+    def on_price_update(self, callback):
+        self.price_callbacks.append(callback)
+
+    is_connected = True
+
+    @property
+    def subscriptions(self):
+        return set(self.subscribed)
+
+    @property
+    def stats(self):
+        return {
+            "connected": True,
+            "subscriptions": len(self.subscribed),
+            "messages_received": 10,
+            "message_rate": 2.5,
+            "lag_ms": 40.0,
+            "total_reconnects": 0,
+        }
+
+
+MARKETS = [f"0x{i:04x}" for i in range(2000)]
+
+
+class TestHashRing:
+    def test_spread_is_roughly_even(self):
+        ring = HashRing(4)
+        counts = Counter(ring.shard_for(m) for m in MARKETS)
+
+        assert set(counts) == {0, 1, 2, 3}
+        assert max(counts.values()) < 2 * min(counts.values())
+
+    def test_adding_a_shard_moves_few_markets(self):
+        before = HashRing(4)
+        after = HashRing(5)
+
+        moved = sum(1 for m in MARKETS if before.shard_for(m) != after.shard_for(m))
+        # Ideal is 1/5 of markets; modulo hashing would move ~4/5
+        assert moved < len(MARKETS) * 0.35
+
+
+class TestShardedWebSocketClient:
+    @pytest.mark.asyncio
+    async def test_subscriptions_follow_the_ring(self):
+        ws = ShardedWebSocketClient(shards=3, connect_stagger=0, client_factory=FakeShard)
+        assert await ws.connect()
+
+        await ws.subscribe(MARKETS[:300])
+
+        assert ws.subscriptions == set(MARKETS[:300])
+        for index, shard in enumerate(ws.shards):
+            assert shard.connects == 1
+            assert all(ws.shard_for(m) == index for m in shard.subscribed)
+
+        await ws.unsubscribe(MARKETS[:100])
+        assert ws.subscriptions == set(MARKETS[100:300])
+
+    @pytest.mark.asyncio
+    async def test_callbacks_and_stats_are_merged(self):
+        ws = ShardedWebSocketClient(shards=2, client_factory=FakeShard)
+
+        @ws.on_price_update
+        def handle(update):
+            pass
+
+        assert all(shard.price_callbacks == [handle] for shard in ws.shards)
+
+        await ws.subscribe(MARKETS[:10])
+        stats = ws.stats
+        assert stats["subscriptions"] == 10
+        assert stats["message_rate"] == 5.0
+        assert stats["max_lag_ms"] == 40.0
+        assert len(stats["shards"]) == 2
+
+
+class FlakyShard(FakeShard):
+    """Fails its first `failures` connects."""
+
+    def __init__(self, failures=2):
+        super().__init__()
+        self.failures = failures
+        self.is_connected = False
+
+    async def connect(self):
+        self.connects += 1
+        self.is_connected = self.connects > self.failures
+        return self.is_connected
+
+
+class TestShardConnect:
+    @pytest.mark.asyncio
+    async def test_failed_shards_retry_in_background(self):
+        shards = iter([FakeShard(), FlakyShard(failures=2)])
+        ws = ShardedWebSocketClient(
+            shards=2, connect_stagger=0, retry_interval=0.01, client_factory=lambda: next(shards)
+        )
+
+        assert not await ws.connect()  # Partial connect is not success
+        assert ws.is_connected and not ws.all_connected
+
+        await asyncio.wait_for(asyncio.gather(*ws._retries.values()), timeout=1)
+        assert ws.all_connected
+        assert ws.shards[1].connects == 3
+
+    @pytest.mark.asyncio
+    async def test_disconnect_stops_retries(self):
+        ws = ShardedWebSocketClient(
+            shards=1, retry_interval=10, client_factory=lambda: FlakyShard(failures=100)
+        )
+        await ws.connect()
+        assert ws.stats["retrying_shards"] == 1
+
+        await ws.disconnect()
+        assert ws.stats["retrying_shards"] == 0
+
+
+class TestResubscription:
+    @pytest.mark.asyncio
+    async def test_resubscribe_is_batched(self, monkeypatch):
+        client = WebSocketClient(resubscribe_batch=2, resubscribe_stagger=0.5)
+        client._subscriptions = {"a", "b", "c", "d", "e"}
+        client._ws = AsyncMock()
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+        assert await client._resubscribe()
+
+        assert client._ws.send.await_count == 5
+        assert sleeps == [0.5, 0.5]  # Three batches: 2 + 2 + 1
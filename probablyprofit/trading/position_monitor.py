@@ -13,6 +13,7 @@ from loguru import logger
 
 from probablyprofit.api.client import PolymarketClient, Position
 from probablyprofit.risk.manager import RiskManager
+from probablyprofit.utils.scheduler import RequestPriority, request_priority
 
 
 @dataclass
@@ -103,6 +104,7 @@ class PositionMonitor:
 
         # Statistics
         self._checks = 0
+        self._price_updates = 0
         self._stop_losses_triggered = 0
         self._take_profits_triggered = 0
         self._alerts: List[PositionAlert] = []
@@ -236,27 +238,71 @@ class PositionMonitor:
             if current_price is None:
                 continue
 
-            # Update trailing stop high-water mark
-            if current_price > position.highest_price:
-                position.highest_price = current_price
+            alert = await self._evaluate(position, current_price)
+            if alert:
+                alerts.append(alert)
 
-                # Update trailing stop price
-                if position.trailing_stop_pct:
-                    position.stop_loss_price = current_price * (1 - position.trailing_stop_pct)
+        return alerts
 
-            # Check stop-loss
-            if position.stop_loss_price and current_price <= position.stop_loss_price:
-                alert = await self._trigger_stop_loss(position, current_price)
-                alerts.append(alert)
-                self._stop_losses_triggered += 1
+    async def _evaluate(
+        self, position: MonitoredPosition, current_price: float
+    ) -> Optional[PositionAlert]:
+        """Apply a new price to a position's trailing stop and exit thresholds."""
+        # Update trailing stop high-water mark
+        if current_price > position.highest_price:
+            position.highest_price = current_price
+
+            # Update trailing stop price
+            if position.trailing_stop_pct:
+                position.stop_loss_price = current_price * (1 - position.trailing_stop_pct)
+
+        # Check stop-loss
+        if position.stop_loss_price and current_price <= position.stop_loss_price:
+            if not self._claim_exit(position):
+                return None
+            self._stop_losses_triggered += 1
+            return await self._trigger_stop_loss(position, current_price)
+
+        # Check take-profit
+        if position.take_profit_price and current_price >= position.take_profit_price:
+            if not self._claim_exit(position):
+                return None
+            self._take_profits_triggered += 1
+            return await self._trigger_take_profit(position, current_price)
+
+        return None
+
+    def _claim_exit(self, position: MonitoredPosition) -> bool:
+        """
+        Stop monitoring a position before its exit order is sent.
 
-            # Check take-profit
-            elif position.take_profit_price and current_price >= position.take_profit_price:
-                alert = await self._trigger_take_profit(position, current_price)
-                alerts.append(alert)
-                self._take_profits_triggered += 1
+        The polling loop and streamed ticks evaluate positions concurrently;
+        only the first to claim a position places the exit. Returns False if
+        another check already claimed it.
+        """
+        position_id = f"{position.market_id}:{position.outcome}"
+        if self._positions.get(position_id) is not position:
+            return False
+        del self._positions[position_id]
+        return True
 
-        return alerts
+    def _release_exit(self, position: MonitoredPosition) -> None:
+        """Resume monitoring a position whose exit order failed."""
+        self._positions.setdefault(f"{position.market_id}:{position.outcome}", position)
+
+    async def on_price_update(self, update: Any) -> Optional[PositionAlert]:
+        """
+        Check a monitored position against a streamed price.
+
+        Register with a WebSocketClient (ws.on_price_update(monitor.on_price_update))
+        to react to ticks between polling checks, or feed it a FrameReplayer
+        recording to load-test exits offline.
+        """
+        position = self._positions.get(f"{update.market_id}:{update.outcome}")
+        if position is None:
+            return None
+        self._price_updates += 1
+        return await self._evaluate(position, update.price)
 
     async def _trigger_stop_loss(
         self,
@@ -288,24 +334,29 @@ class PositionMonitor:
 
         if not self.dry_run:
             try:
-                order = await self.client.place_order(
-                    market_id=position.market_id,
-                    outcome=position.outcome,
-                    side="SELL",
-                    size=position.size,
-                    price=current_price,
-                )
+                # Stop-loss exits jump ahead of queued market-data requests
+                with request_priority(RequestPriority.CRITICAL):
+                    order = await self.client.place_order(
+                        market_id=position.market_id,
+                        outcome=position.outcome,
+                        side="SELL",
+                        size=position.size,
+                        price=current_price,
+                    )
                 if order:
                     alert.executed = True
                     self.risk_manager.record_trade(-position.size, current_price, pnl)
-                    self.remove_position(position_id)
+                    logger.info(f"[PositionMonitor] Removed position {position_id}")
+                else:
+                    self._release_exit(position)
             except Exception as e:
                 logger.error(f"[PositionMonitor] Failed to execute stop-loss: {e}")
+                self._release_exit(position)
         else:
             logger.info(
                 f"[PositionMonitor] DRY RUN: Would sell {position.size} @ {current_price:.4f}"
             )
-            self.remove_position(position_id)
+            logger.info(f"[PositionMonitor] Removed position {position_id}")
 
         self._alerts.append(alert)
         position.alerts.append(alert)
@@ -355,14 +406,17 @@ class PositionMonitor:
                 if order:
                     alert.executed = True
                     self.risk_manager.record_trade(-position.size, current_price, pnl)
-                    self.remove_position(position_id)
+                    logger.info(f"[PositionMonitor] Removed position {position_id}")
+                else:
+                    self._release_exit(position)
             except Exception as e:
                 logger.error(f"[PositionMonitor] Failed to execute take-profit: {e}")
+                self._release_exit(position)
         else:
             logger.info(
                 f"[PositionMonitor] DRY RUN: Would sell {position.size} @ {current_price:.4f}"
             )
-            self.remove_position(position_id)
+            logger.info(f"[PositionMonitor] Removed position {position_id}")
 
         self._alerts.append(alert)
         position.alerts.append(alert)
@@ -420,6 +474,7 @@ class PositionMonitor:
             "running": self._running,
             "positions_monitored": len(self._positions),
             "total_checks": self._checks,
+            "price_updates": self._price_updates,
             "stop_losses_triggered": self._stop_losses_triggered,
             "take_profits_triggered": self._take_profits_triggered,
             "total_alerts": len(self._alerts),
@@ -46,6 +46,10 @@ def __getattr__(name):
         from probablyprofit.utils.resilience import RateLimiter
 
         return RateLimiter
+    if name == "AdaptiveRateLimiter":
+        from probablyprofit.utils.resilience import AdaptiveRateLimiter
+
+        return AdaptiveRateLimiter
     if name == "RetryConfig":
         from probablyprofit.utils.resilience import RetryConfig
 
@@ -90,6 +94,44 @@ def __getattr__(name):
         from probablyprofit.utils.cache import AsyncTTLCache
 
         return AsyncTTLCache
+    if name == "SingleFlight":
+        from probablyprofit.utils.cache import SingleFlight
+
+        return SingleFlight
+
+    # Request scheduling
+    if name == "PriorityScheduler":
+        from probablyprofit.utils.scheduler import PriorityScheduler
+
+        return PriorityScheduler
+    if name == "RequestPriority":
+        from probablyprofit.utils.scheduler import RequestPriority
+
+        return RequestPriority
+    if name == "request_priority":
+        from probablyprofit.utils.scheduler import request_priority
+
+        return request_priority
+
+    # HTTP connection pools
+    if name == "HTTPPool":
+        from probablyprofit.utils.http_pool import HTTPPool
+
+        return HTTPPool
+    if name == "get_http_pool":
+        from probablyprofit.utils.http_pool import get_http_pool
+
+        return get_http_pool
+
+    # Latency tracing
+    if name == "LatencyTrace":
+        from probablyprofit.utils.latency import LatencyTrace
+
+        return LatencyTrace
+    if name == "mark_stage":
+        from probablyprofit.utils.latency import mark_stage
+
+        return mark_stage
 
     # AI Rate Limiter
     if name == "AIRateLimiter":
@@ -135,6 +177,7 @@ __all__ = [
     "with_timeout",
     "CircuitBreaker",
     "RateLimiter",
+    "AdaptiveRateLimiter",
     "RetryConfig",
     "get_resilience_status",
     "reset_all_circuit_breakers",
@@ -147,6 +190,17 @@ __all__ = [
     # Cache
     "TTLCache",
     "AsyncTTLCache",
+    "SingleFlight",
+    # Request scheduling
+    "PriorityScheduler",
+    "RequestPriority",
+    "request_priority",
+    # HTTP connection pools
+    "HTTPPool",
+    "get_http_pool",
+    # Latency tracing
+    "LatencyTrace",
+    "mark_stage",
     # AI Rate Limiter
     "AIRateLimiter",
     # Secrets Management
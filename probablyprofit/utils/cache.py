@@ -15,10 +15,12 @@ import time
 from collections import OrderedDict
 from dataclasses import dataclass, field
 from functools import wraps
-from typing import Any, Callable, Dict, Generic, Optional, TypeVar
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, Optional, TypeVar
 
 from loguru import logger
 
+from probablyprofit.utils.metrics import record_coalesced_request
+
 T = TypeVar("T")
 
 
@@ -369,6 +371,87 @@ def cached(
     return decorator
 
 
+class SingleFlight:
+    """
+    Coalesces concurrent identical async reads into one in-flight call.
+
+    The first caller for a key (the leader) starts the call; callers that
+    arrive while it is still running await the same result instead of
+    issuing their own request. Nothing is cached once the call completes.
+
+    The call runs as its own task, so a cancelled caller never cancels the
+    request other callers are waiting on.
+
+    Usage:
+        flight = SingleFlight("market")
+        market = await flight.do(condition_id, lambda: fetch_market(condition_id))
+    """
+
+    def __init__(self, name: str = "singleflight"):
+        """
+        Initialize single-flight group.
+
+        Args:
+            name: Group name used for logging and metrics labels
+        """
+        self.name = name
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+        # Statistics
+        self._leaders = 0
+        self._coalesced = 0
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run factory() for key, or join the call already in flight for it.
+
+        Args:
+            key: Identity of the read (e.g. condition_id)
+            factory: Zero-argument coroutine function performing the read
+
+        Returns:
+            Result of the shared call (exceptions are shared too)
+        """
+        task = self._inflight.get(key)
+        coalesced = task is not None
+
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done, k=key: self._finish(k, done))
+            self._leaders += 1
+        else:
+            self._coalesced += 1
+
+        record_coalesced_request(self.name, coalesced)
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        """Drop a completed call so the next read starts a fresh one."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the exception as retrieved even if every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently in flight."""
+        return len(self._inflight)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Get coalescing statistics."""
+        total = self._leaders + self._coalesced
+        return {
+            "name": self.name,
+            "in_flight": self.in_flight,
+            "leaders": self._leaders,
+            "coalesced": self._coalesced,
+            "coalesce_rate": self._coalesced / total if total > 0 else 0.0,
+        }
+
+
 # =============================================================================
 # GLOBAL CACHES
 # =============================================================================
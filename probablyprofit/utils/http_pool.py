@@ -0,0 +1,332 @@
+"""
+Shared HTTP Connection Pools
+
+One httpx transport per pool is shared by every AsyncClient created from
+it, so components talking to the same hosts reuse warm keep-alive (and,
+when the h2 package is installed, HTTP/2) connections instead of each
+paying TCP + TLS setup on their own.
+
+Pools are split by host class so keep-alive can be tuned per class:
+"polymarket" carries CLOB, Gamma and RPC traffic and keeps connections
+alive for long periods, while "external" serves news/social sources and
+alerting with shorter expiry.
+
+Supports:
+- Warm-up (pre-connect + TLS handshake) during startup or preflight
+- Pool stats (active/idle connections, pool wait time) in the metrics registry
+"""
+
+import asyncio
+import inspect
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+from loguru import logger
+
+from probablyprofit.utils.metrics import get_metrics_registry
+
+try:
+    import h2  # noqa: F401
+
+    http2_avail = True
+except ImportError:
+    http2_avail = False
+
+
+class _SharedTransport(httpx.AsyncBaseTransport):
+    """
+    Non-owning view of a pool's transport handed to each AsyncClient.
+
+    Closing a client must not tear down connections other clients share,
+    so aclose() is a no-op; the pool itself owns the real transport.
+    """
+
+    def __init__(self, pool: "HTTPPool"):
+        self._pool = pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._pool._handle(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
+class HTTPPool:
+    """
+    Named connection pool shared by many httpx.AsyncClient instances.
+
+    Usage:
+        pool = get_http_pool("polymarket")
+        clob = pool.client(base_url="https://clob.polymarket.com", timeout=30.0)
+        gamma = pool.client(base_url="https://gamma-api.polymarket.com")
+
+        await pool.warm_up(["https://clob.polymarket.com", "https://gamma-api.polymarket.com"])
+    """
+
+    def __init__(
+        self,
+        name: str = "default",
+        http2: bool = True,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 5.0,
+        verify: bool = True,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Initialize pool.
+
+        Args:
+            name: Pool name (used in logs and metric labels)
+            http2: Negotiate HTTP/2 when the h2 package is installed
+            max_connections: Max open connections across all hosts
+            max_keepalive_connections: Max idle connections kept alive
+            keepalive_expiry: Seconds an idle connection is kept
+            verify: Verify TLS certificates
+            transport: Inner transport override (tests)
+        """
+        self.name = name
+        self.http2 = http2 and http2_avail
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.verify = verify
+
+        self._fixed_transport = transport
+        self._transport: Optional[httpx.AsyncBaseTransport] = transport
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closing: Set["asyncio.Task[None]"] = set()
+
+        # Statistics
+        self._requests = 0
+        self._in_flight = 0
+        self._connects = 0
+        self._wait_total = 0.0
+        self._wait_samples = 0
+
+        registry = get_metrics_registry()
+        self._connections_gauge = registry.gauge(
+            "pp_http_pool_connections", "Pooled HTTP connections by state"
+        )
+        self._wait_histogram = registry.histogram(
+            "pp_http_pool_wait_seconds", "Time from request start until headers are sent"
+        )
+        self._connects_counter = registry.counter(
+            "pp_http_pool_connects_total", "New TCP connections opened by the pool"
+        )
+
+    def _make_transport(self) -> httpx.AsyncBaseTransport:
+        return httpx.AsyncHTTPTransport(http2=self.http2, limits=self.limits, verify=self.verify)
+
+    def _current_transport(self) -> httpx.AsyncBaseTransport:
+        """Transport bound to the running event loop (connections cannot cross loops)."""
+        if self._fixed_transport is not None:
+            return self._fixed_transport
+        loop = asyncio.get_running_loop()
+        if self._transport is None or self._loop is not loop:
+            # Connections from a previous loop are unusable; start a fresh pool
+            stale, stale_loop = self._transport, self._loop
+            self._transport = self._make_transport()
+            self._loop = loop
+            if stale is not None:
+                self._close_stale(stale, stale_loop)
+        return self._transport
+
+    def _close_stale(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        loop: Optional[asyncio.AbstractEventLoop],
+    ) -> None:
+        """Close a transport left behind by another event loop."""
+        if loop is not None and loop.is_running():
+            # Still serving requests in another thread: close it there
+            asyncio.run_coroutine_threadsafe(transport.aclose(), loop)
+            return
+        task = asyncio.get_running_loop().create_task(self._aclose_quietly(transport))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _aclose_quietly(self, transport: httpx.AsyncBaseTransport) -> None:
+        try:
+            await transport.aclose()
+        except Exception as e:
+            # Sockets of a closed loop may refuse a clean shutdown
+            logger.debug(f"[HTTPPool:{self.name}] Closing stale transport: {e}")
+
+    def client(self, base_url: str = "", **kwargs: Any) -> httpx.AsyncClient:
+        """
+        Create an AsyncClient that uses this pool's connections.
+
+        Args:
+            base_url: Client base URL
+            **kwargs: Other AsyncClient options (timeout, headers, follow_redirects, ...)
+        """
+        return httpx.AsyncClient(base_url=base_url, transport=_SharedTransport(self), **kwargs)
+
+    async def _handle(self, request: httpx.Request) -> httpx.Response:
+        transport = self._current_transport()
+        start = time.perf_counter()
+        waited: List[float] = []
+
+        async def trace(event: str, _info: Dict[str, Any]) -> None:
+            if event.endswith("send_request_headers.started") and not waited:
+                waited.append(time.perf_counter() - start)
+            elif event == "connection.connect_tcp.complete":
+                self._connects += 1
+                self._connects_counter.inc(labels={"pool": self.name})
+
+        request.extensions = {**request.extensions, "trace": trace}
+
+        self._requests += 1
+        self._in_flight += 1
+        try:
+            return await transport.handle_async_request(request)
+        finally:
+            self._in_flight -= 1
+            if waited:
+                self._wait_total += waited[0]
+                self._wait_samples += 1
+                self._wait_histogram.observe(waited[0], labels={"pool": self.name})
+            self.update_metrics()
+
+    async def warm_up(
+        self,
+        urls: Iterable[str],
+        connections_per_host: int = 1,
+        timeout: float = 5.0,
+    ) -> Dict[str, Optional[float]]:
+        """
+        Open connections (TCP + TLS) to each host ahead of the first real request.
+
+        Any HTTP response counts as warm; only transport failures are reported.
+
+        Args:
+            urls: URLs whose origins should be pre-connected
+            connections_per_host: Parallel connections per origin (HTTP/1.1 only;
+                HTTP/2 multiplexes over one)
+            timeout: Per-request timeout
+
+        Returns:
+            Mapping of origin -> seconds taken, or None if unreachable
+        """
+        origins = list(dict.fromkeys(f"{p.scheme}://{p.netloc}" for p in map(urlsplit, urls)))
+        per_host = 1 if self.http2 else max(1, connections_per_host)
+        client = self.client(timeout=timeout)
+
+        async def connect(origin: str) -> Optional[float]:
+            start = time.perf_counter()
+            try:
+                await asyncio.gather(*(client.head(origin) for _ in range(per_host)))
+                return time.perf_counter() - start
+            except httpx.HTTPError as e:
+                logger.warning(f"[HTTPPool:{self.name}] Warm-up failed for {origin}: {e}")
+                return None
+
+        results = dict(zip(origins, await asyncio.gather(*(connect(o) for o in origins))))
+        warmed = sum(1 for r in results.values() if r is not None)
+        logger.info(f"[HTTPPool:{self.name}] Warmed {warmed}/{len(origins)} host(s)")
+        return results
+
+    def _connections(self) -> List[Any]:
+        inner = getattr(self._transport, "_pool", None)
+        return list(getattr(inner, "connections", []) or [])
+
+    def update_metrics(self) -> None:
+        """Publish connection counts to the metrics registry."""
+        connections = self._connections()
+        idle = sum(1 for c in connections if c.is_idle())
+        self._connections_gauge.set(
+            len(connections) - idle, labels={"pool": self.name, "state": "active"}
+        )
+        self._connections_gauge.set(idle, labels={"pool": self.name, "state": "idle"})
+
+    async def aclose(self) -> None:
+        """Close every pooled connection."""
+        if self._transport is not None:
+            await self._transport.aclose()
+        self._transport = self._fixed_transport
+        self._loop = None
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Get pool statistics."""
+        connections = self._connections()
+        idle = sum(1 for c in connections if c.is_idle())
+        return {
+            "name": self.name,
+            "http2": self.http2,
+            "connections": len(connections),
+            "active": len(connections) - idle,
+            "idle": idle,
+            "in_flight": self._in_flight,
+            "requests": self._requests,
+            "connects": self._connects,
+            "avg_wait_ms": (
+                self._wait_total / self._wait_samples * 1000 if self._wait_samples else 0.0
+            ),
+        }
+
+
+# =============================================================================
+# GLOBAL POOLS
+# =============================================================================
+
+# HTTPPool settings and their defaults (everything but name and the test transport)
+_POOL_DEFAULTS: Dict[str, Any] = {
+    key: param.default
+    for key, param in inspect.signature(HTTPPool.__init__).parameters.items()
+    if key not in ("self", "name", "transport")
+}
+
+# (name, sorted settings) -> pool
+_pools: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], HTTPPool] = {}
+
+
+def _base_settings(name: str) -> Dict[str, Any]:
+    settings = dict(_POOL_DEFAULTS)
+    if name == "polymarket":
+        from probablyprofit.config import get_config
+
+        cfg = get_config().api
+        settings.update(
+            http2=cfg.http2,
+            max_connections=cfg.http_max_connections,
+            max_keepalive_connections=cfg.http_max_keepalive,
+            keepalive_expiry=cfg.http_keepalive_expiry,
+        )
+    return settings
+
+
+def get_http_pool(name: str = "external", **kwargs: Any) -> HTTPPool:
+    """
+    Get (or create) a shared pool.
+
+    The "polymarket" pool takes its limits from config.api; other pools use
+    the HTTPPool defaults. kwargs override either. Pools are keyed by name
+    and settings, so a caller asking for different settings (e.g.
+    verify=False) gets its own pool, named like "polymarket:verify=False",
+    instead of silently sharing one configured differently.
+    """
+    base = _base_settings(name)
+    settings = {**base, **kwargs}
+    key = (name, tuple(sorted(settings.items())))
+    pool = _pools.get(key)
+    if pool is None:
+        overrides = [f"{k}={v}" for k, v in sorted(kwargs.items()) if base.get(k) != v]
+        pool = _pools[key] = HTTPPool(name=":".join([name, *overrides]), **settings)
+    return pool
+
+
+def get_pool_stats() -> Dict[str, Dict[str, Any]]:
+    """Stats for every shared pool, keyed by pool name."""
+    return {pool.name: pool.stats for pool in _pools.values()}
+
+
+async def close_http_pools() -> None:
+    """Close all shared pools (call on shutdown)."""
+    for pool in _pools.values():
+        await pool.aclose()
@@ -0,0 +1,118 @@
+"""
+End-to-End Latency Tracing
+
+Carries time.monotonic() marks through one observe -> decide -> act
+iteration so we can tell how old market data is by the time an order is
+acknowledged, and where that time went.
+
+The agent loop opens a LatencyTrace per iteration and makes it current;
+code further down the call stack (LLM calls, order submission) adds marks
+with mark_stage() without the trace being passed around. Marks that were
+not reached (e.g. no order placed) are simply missing from the breakdown.
+
+Per-message WebSocket stages (exchange -> receive, parse, queue, callback)
+are recorded directly with record_latency(), since they are not tied to an
+iteration.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from probablyprofit.utils.metrics import record_latency
+
+# Breakdown spans: (name, start mark, end mark)
+SPANS: List[Tuple[str, str, str]] = [
+    ("data_wait", "data_received", "observe_start"),
+    ("observe", "observe_start", "observe_end"),
+    ("decide_prep", "observe_end", "llm_request"),
+    ("llm", "llm_request", "llm_response"),
+    ("act_prep", "decide_end", "order_submit"),
+    ("order", "order_submit", "order_ack"),
+]
+
+_current_trace: ContextVar[Optional["LatencyTrace"]] = ContextVar("latency_trace", default=None)
+
+
+class LatencyTrace:
+    """
+    Monotonic stage marks for one agent iteration.
+
+    Usage:
+        trace = LatencyTrace()
+        with trace.activate():
+            trace.mark("observe_start")
+            ...
+            mark_stage("llm_request")  # From anywhere inside the block
+        trace.record()
+        logger.info(trace.format())
+    """
+
+    def __init__(self) -> None:
+        self.marks: Dict[str, float] = {}
+
+    def mark(self, stage: str, at: Optional[float] = None) -> None:
+        """Record `stage` at `at` (time.monotonic(), defaults to now); first mark wins."""
+        self.marks.setdefault(stage, at if at is not None else time.monotonic())
+
+    @contextmanager
+    def activate(self) -> Iterator["LatencyTrace"]:
+        """Make this the trace mark_stage() writes to within the block."""
+        token = _current_trace.set(self)
+        try:
+            yield self
+        finally:
+            _current_trace.reset(token)
+
+    def span(self, start: str, end: str) -> Optional[float]:
+        """Seconds between two marks, or None if either is missing."""
+        if start in self.marks and end in self.marks:
+            return max(0.0, self.marks[end] - self.marks[start])
+        return None
+
+    def breakdown(self) -> Dict[str, float]:
+        """Seconds per reached span, plus data_age and total."""
+        result = {}
+        for name, start, end in SPANS:
+            value = self.span(start, end)
+            if value is not None:
+                result[name] = value
+
+        if self.marks:
+            first = min(self.marks.values())
+            last = max(self.marks.values())
+            result["total"] = last - first
+            # How old the observed data was when the decision was made
+            decided = self.marks.get("decide_end")
+            data = self.marks.get("data_received", self.marks.get("observe_end"))
+            if decided is not None and data is not None:
+                result["data_age"] = max(0.0, decided - data)
+        return result
+
+    def record(self) -> Dict[str, float]:
+        """Publish the breakdown to the metrics registry and return it."""
+        breakdown = self.breakdown()
+        for name, seconds in breakdown.items():
+            record_latency(name, seconds)
+        return breakdown
+
+    def format(self) -> str:
+        """One-line breakdown for logs, e.g. 'observe=120ms llm=2.31s ...'."""
+        parts = []
+        for name, seconds in self.breakdown().items():
+            value = f"{seconds * 1000:.0f}ms" if seconds < 1 else f"{seconds:.2f}s"
+            parts.append(f"{name}={value}")
+        return " ".join(parts)
+
+
+def current_trace() -> Optional[LatencyTrace]:
+    """Trace of the enclosing activate() block, if any."""
+    return _current_trace.get()
+
+
+def mark_stage(stage: str, at: Optional[float] = None) -> None:
+    """Mark `stage` on the current trace (no-op outside a traced iteration)."""
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.mark(stage, at)
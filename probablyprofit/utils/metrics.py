@@ -16,7 +16,7 @@ from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from threading import Lock
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from loguru import logger
 
@@ -320,11 +320,21 @@ def get_metrics_registry() -> MetricsRegistry:
     return _registry
 
 
-# Pre-defined metrics for the trading bot
+# Pre-defined metric handles, built once per registry (record_* helpers run on
+# hot paths such as per-WebSocket-message latency, so they must not rebuild them)
+_trading_metrics: Optional[Tuple[MetricsRegistry, Dict[str, Any]]] = None
+
+
 def get_trading_metrics() -> Dict[str, Any]:
     """Get pre-defined trading metrics."""
+    global _trading_metrics
     registry = get_metrics_registry()
+    if _trading_metrics is None or _trading_metrics[0] is not registry:
+        _trading_metrics = (registry, _build_trading_metrics(registry))
+    return _trading_metrics[1]
 
+
+def _build_trading_metrics(registry: MetricsRegistry) -> Dict[str, Any]:
     return {
         # API metrics
         "api_requests": registry.counter("pp_api_requests_total", "Total API requests"),
@@ -346,11 +356,72 @@ def get_trading_metrics() -> Dict[str, Any]:
         # Agent metrics
         "agent_loops": registry.counter("pp_agent_loops_total", "Total agent loop iterations"),
         "agent_errors": registry.counter("pp_agent_errors_total", "Total agent errors"),
+        "observe_stage": registry.histogram(
+            "pp_observe_stage_seconds",
+            "Duration of each observe() stage by result (ok/timeout/error)",
+            buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0),
+        ),
         # WebSocket metrics
         "ws_messages": registry.counter("pp_websocket_messages_total", "Total WebSocket messages"),
         "ws_reconnects": registry.counter(
             "pp_websocket_reconnects_total", "WebSocket reconnections"
         ),
+        "ws_discarded": registry.counter(
+            "pp_websocket_updates_discarded_total",
+            "Updates never delivered to a consumer, by reason (conflated/dropped)",
+        ),
+        "ws_consumer_lag": registry.histogram(
+            "pp_websocket_consumer_lag_seconds",
+            "Time from receiving an update until its consumer callback runs",
+            buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0),
+        ),
+        # Order event bus metrics
+        "order_event_lag": registry.histogram(
+            "pp_order_event_lag_seconds",
+            "Time an order event waits in a subscriber's queue",
+            buckets=(0.0001, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0),
+        ),
+        "order_event_handler": registry.histogram(
+            "pp_order_event_handler_seconds",
+            "Time an order event subscriber spends handling one event",
+            buckets=(0.0001, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0),
+        ),
+        "order_events_dropped": registry.counter(
+            "pp_order_events_dropped_total",
+            "Order events discarded by a full subscriber queue, by overflow policy",
+        ),
+        "order_event_backlogs": registry.counter(
+            "pp_order_event_backlogs_total",
+            "Times an unbounded order event queue fell more than max_queue events behind",
+        ),
+        # Request coalescing metrics
+        "singleflight_requests": registry.counter(
+            "pp_singleflight_requests_total", "Reads by single-flight outcome (leader/coalesced)"
+        ),
+        # Adaptive rate limiter metrics
+        "rate_limit_rate": registry.gauge(
+            "pp_rate_limit_calls_per_second", "Current adaptive rate limit per limiter"
+        ),
+        "rate_limit_throttles": registry.counter(
+            "pp_rate_limit_throttles_total", "429 responses seen per limiter"
+        ),
+        # Hedged read metrics
+        "hedged_reads": registry.counter(
+            "pp_hedged_reads_total",
+            "Hedge-eligible reads by result (unhedged/primary_won/hedge_won/both_failed)",
+        ),
+        # Request scheduling metrics
+        "request_queue_wait": registry.histogram(
+            "pp_request_queue_wait_seconds",
+            "Time requests wait for rate-limit capacity, by priority class",
+            buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+        ),
+        # End-to-end latency metrics
+        "latency": registry.histogram(
+            "pp_latency_seconds",
+            "Market data to order latency, by pipeline stage",
+            buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+        ),
     }
 
 
@@ -370,6 +441,80 @@ def record_api_request(
     metrics["api_latency"].observe(duration, labels={"endpoint": endpoint})
 
 
+def record_coalesced_request(group: str, coalesced: bool) -> None:
+    """Record whether a read started a request or joined one already in flight."""
+    metrics = get_trading_metrics()
+    result = "coalesced" if coalesced else "leader"
+    metrics["singleflight_requests"].inc(labels={"group": group, "result": result})
+
+
+def record_rate_limit_state(limiter: str, rate: float, throttled: bool = False) -> None:
+    """Record an adaptive limiter's current rate (and a 429, if one caused the change)."""
+    metrics = get_trading_metrics()
+    labels = {"limiter": limiter}
+    metrics["rate_limit_rate"].set(rate, labels=labels)
+    if throttled:
+        metrics["rate_limit_throttles"].inc(labels=labels)
+
+
+def record_hedged_read(endpoint: str, result: str) -> None:
+    """Record whether a read was hedged and, if so, which attempt won."""
+    metrics = get_trading_metrics()
+    metrics["hedged_reads"].inc(labels={"endpoint": endpoint, "result": result})
+
+
+def record_observe_stage(stage: str, seconds: float, result: str) -> None:
+    """Record how long one observe() stage took and how it ended."""
+    metrics = get_trading_metrics()
+    metrics["observe_stage"].observe(seconds, labels={"stage": stage, "result": result})
+
+
+def record_ws_update_discarded(consumer: str, reason: str) -> None:
+    """Record a WebSocket update replaced by a newer one (conflated) or evicted (dropped)."""
+    metrics = get_trading_metrics()
+    metrics["ws_discarded"].inc(labels={"consumer": consumer, "reason": reason})
+
+
+def record_ws_consumer_lag(consumer: str, seconds: float) -> None:
+    """Record how long an update waited for its consumer callback."""
+    metrics = get_trading_metrics()
+    metrics["ws_consumer_lag"].observe(seconds, labels={"consumer": consumer})
+
+
+def record_order_event_handled(subscriber: str, lag: float, seconds: float) -> None:
+    """Record an order event's queue wait and handler time for one subscriber."""
+    metrics = get_trading_metrics()
+    labels = {"subscriber": subscriber}
+    metrics["order_event_lag"].observe(lag, labels=labels)
+    metrics["order_event_handler"].observe(seconds, labels=labels)
+
+
+def record_order_event_backlog(subscriber: str) -> None:
+    """Record an unbounded order event queue passing its backlog alarm threshold."""
+    metrics = get_trading_metrics()
+    metrics["order_event_backlogs"].inc(labels={"subscriber": subscriber})
+
+
+def record_order_event_dropped(subscriber: str, policy: str) -> None:
+    """Record an order event a full subscriber queue discarded."""
+    metrics = get_trading_metrics()
+    metrics["order_events_dropped"].inc(labels={"subscriber": subscriber, "policy": policy})
+
+
+def record_latency(stage: str, seconds: float) -> None:
+    """Record time spent in one stage of the market data -> order pipeline."""
+    metrics = get_trading_metrics()
+    metrics["latency"].observe(seconds, labels={"stage": stage})
+
+
+def record_queue_wait(scheduler: str, priority: str, seconds: float) -> None:
+    """Record how long a request queued for rate-limit capacity."""
+    metrics = get_trading_metrics()
+    metrics["request_queue_wait"].observe(
+        seconds, labels={"scheduler": scheduler, "priority": priority}
+    )
+
+
 def record_trade(
     side: str,
     size: float,
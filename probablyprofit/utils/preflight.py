@@ -107,6 +107,7 @@ class PreflightChecker:
     5. Kill switch not active
     6. Credentials valid (not placeholders)
     7. Private key not test key
+    8. Polymarket hosts reachable (warms the shared connection pool)
     """
 
     def __init__(self):
@@ -118,6 +119,7 @@ class PreflightChecker:
             self._check_database,
             self._check_ai_provider,
             self._check_telegram,
+            self._check_connectivity,
         ]
 
     async def run_all(self, dry_run: bool = True) -> PreflightReport:
@@ -404,6 +406,46 @@ class PreflightChecker:
                 message=f"Could not verify Telegram: {e}",
             )
 
+    async def _check_connectivity(self, dry_run: bool = True) -> CheckResult:
+        """Pre-connect to Polymarket hosts and report TCP/TLS setup latency."""
+        from probablyprofit.config import get_config
+        from probablyprofit.utils.http_pool import get_http_pool
+
+        if not get_config().api.http_warm_up:
+            return CheckResult(
+                name="Connectivity",
+                status=CheckStatus.SKIP,
+                message="Connection warm-up disabled (api.http_warm_up)",
+            )
+
+        pool = get_http_pool("polymarket")
+        results = await pool.warm_up(
+            ["https://clob.polymarket.com", "https://gamma-api.polymarket.com"],
+            connections_per_host=2,
+        )
+        details = {
+            origin: (round(elapsed * 1000, 1) if elapsed is not None else None)
+            for origin, elapsed in results.items()
+        }
+        unreachable = [origin for origin, elapsed in results.items() if elapsed is None]
+
+        if unreachable:
+            return CheckResult(
+                name="Connectivity",
+                status=CheckStatus.WARN if dry_run else CheckStatus.FAIL,
+                message=f"Unreachable: {', '.join(unreachable)}",
+                details=details,
+            )
+
+        slowest = max((ms for ms in details.values() if ms is not None), default=0.0)
+        return CheckResult(
+            name="Connectivity",
+            status=CheckStatus.PASS,
+            message=f"Polymarket hosts reachable (slowest {slowest:.0f}ms, "
+            f"{'HTTP/2' if pool.http2 else 'HTTP/1.1'})",
+            details=details,
+        )
+
 
 async def run_preflight_checks(dry_run: bool = True) -> PreflightReport:
     """
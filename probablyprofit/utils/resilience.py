@@ -8,14 +8,28 @@ to make the bot bulletproof against API failures.
 import asyncio
 import random
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 from functools import wraps
-from typing import Any, Awaitable, Callable, Optional, Set, Type, TypeVar, Union, cast
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Optional,
+    Set,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from loguru import logger
 
 from probablyprofit.api.exceptions import APIException, NetworkException, RateLimitException
+from probablyprofit.utils.metrics import record_hedged_read, record_rate_limit_state
 
 # Type variable for generic return types
 T = TypeVar("T")
@@ -409,6 +423,31 @@ class RateLimiter:
 
             return wait_time
 
+    def release(self, tokens: int = 1) -> None:
+        """Return tokens that were acquired but not used."""
+        self._tokens = min(self._max_tokens, self._tokens + tokens)
+
+    async def wait(self, tokens: int = 1) -> float:
+        """
+        Acquire tokens, sleeping until they are actually available.
+
+        Unlike acquire(), this never returns without consuming tokens, so
+        concurrent callers are spread out instead of bursting past the limit.
+
+        Args:
+            tokens: Number of tokens to acquire
+
+        Returns:
+            Total time spent waiting in seconds
+        """
+        waited = 0.0
+        wait_time = await self.acquire(tokens)
+        while wait_time > 0:
+            await asyncio.sleep(wait_time)
+            waited += wait_time
+            wait_time = await self.acquire(tokens)
+        return waited
+
     def __call__(self, func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
         """Decorator to wrap a function with rate limiting."""
 
@@ -427,6 +466,362 @@ class RateLimiter:
         return wrapper  # type: ignore[return-value]
 
 
+class AdaptiveRateLimiter(RateLimiter):
+    """
+    Token bucket whose rate adapts to server feedback (AIMD).
+
+    The configured calls/period is only the starting rate:
+    - Each success adds `increase` calls/s per period of sustained traffic
+    - A 429 multiplies the rate by `decrease` and pauses the bucket for Retry-After
+    - Latency well above its running baseline multiplies the rate by
+      `latency_decrease`, backing off before the server starts rejecting
+
+    Decreases are limited to one per `cooldown` seconds, so a burst of 429s
+    from requests already in flight only counts as one congestion signal.
+
+    Usage:
+        limiter = AdaptiveRateLimiter("clob-write", calls=8, period=1.0)
+
+        await limiter.wait()
+        response = await http.post(...)
+        if response.status_code == 429:
+            limiter.record_rate_limit_error(retry_after=2.0)
+        else:
+            limiter.record_success(latency=0.12)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        calls: int = 10,
+        period: float = 1.0,
+        burst: int = 0,
+        min_rate: Optional[float] = None,
+        max_rate: Optional[float] = None,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        latency_decrease: float = 0.9,
+        latency_threshold: float = 2.0,
+        cooldown: Optional[float] = None,
+    ):
+        """
+        Initialize limiter.
+
+        Args:
+            name: Limiter name (used in logs and metric labels)
+            calls: Starting number of calls per period
+            period: Time period in seconds
+            burst: Extra calls allowed in burst
+            min_rate: Floor in calls/s (default: 10% of the starting rate)
+            max_rate: Ceiling in calls/s (default: 4x the starting rate)
+            increase: Additive increase in calls/s per period of successes
+            decrease: Multiplicative decrease on 429
+            latency_decrease: Multiplicative decrease on high latency
+            latency_threshold: Latency above baseline * threshold counts as congestion
+            cooldown: Minimum seconds between decreases (default: one period)
+        """
+        super().__init__(name, calls=calls, period=period, burst=burst)
+        initial_rate = calls / period
+        self.min_rate = min_rate if min_rate is not None else max(initial_rate * 0.1, 0.1)
+        self.max_rate = max_rate if max_rate is not None else initial_rate * 4
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_decrease = latency_decrease
+        self.latency_threshold = latency_threshold
+        self.cooldown = cooldown if cooldown is not None else period
+
+        self._rate = initial_rate
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self._latency_ewma: Optional[float] = None
+        self._latency_baseline: Optional[float] = None
+
+        # Statistics
+        self._successes = 0
+        self._throttles = 0
+        self._latency_backoffs = 0
+
+        record_rate_limit_state(self.name, self._rate)
+
+    @property
+    def rate(self) -> float:
+        """Current rate in calls per second."""
+        return self._rate
+
+    def _set_rate(self, rate: float) -> None:
+        self._rate = min(self.max_rate, max(self.min_rate, rate))
+        self._max_tokens = max(1.0, self._rate * self.config.period) + self.config.burst
+        self._tokens = min(self._tokens, self._max_tokens)
+        record_rate_limit_state(self.name, self._rate)
+
+    async def acquire(self, tokens: int = 1) -> float:
+        """
+        Acquire tokens at the current adaptive rate.
+
+        Returns:
+            Wait time in seconds (0 if tokens were consumed)
+        """
+        async with self._lock:
+            now = time.time()
+            if now < self._paused_until:
+                return self._paused_until - now
+
+            elapsed = max(0.0, now - self._last_update)
+            self._tokens = min(self._max_tokens, self._tokens + elapsed * self._rate)
+            self._last_update = now
+
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+
+            return (tokens - self._tokens) / self._rate
+
+    def _can_decrease(self, now: float) -> bool:
+        if now - self._last_decrease < self.cooldown:
+            return False
+        self._last_decrease = now
+        return True
+
+    def record_success(self, latency: Optional[float] = None) -> None:
+        """
+        Record a successful (non-429) response.
+
+        Args:
+            latency: Request latency in seconds, if known
+        """
+        self._successes += 1
+
+        if latency is not None:
+            if self._latency_ewma is None:
+                self._latency_ewma = latency
+                self._latency_baseline = latency
+            else:
+                self._latency_ewma = 0.8 * self._latency_ewma + 0.2 * latency
+                # Baseline follows new minimums immediately and drifts up slowly,
+                # so a lasting change in network latency is eventually accepted
+                baseline = cast(float, self._latency_baseline)
+                self._latency_baseline = min(
+                    self._latency_ewma, baseline + (self._latency_ewma - baseline) * 0.01
+                )
+
+            baseline = cast(float, self._latency_baseline)
+            if self._latency_ewma > baseline * self.latency_threshold and self._can_decrease(
+                time.time()
+            ):
+                self._latency_backoffs += 1
+                self._set_rate(self._rate * self.latency_decrease)
+                logger.debug(
+                    f"[RateLimiter] '{self.name}' latency {self._latency_ewma * 1000:.0f}ms "
+                    f"(baseline {baseline * 1000:.0f}ms), rate -> {self._rate:.2f}/s"
+                )
+                return
+
+        self._set_rate(self._rate + self.increase / max(self._rate * self.config.period, 1.0))
+
+    def record_rate_limit_error(self, retry_after: Optional[float] = None) -> None:
+        """
+        Record a 429 response.
+
+        Args:
+            retry_after: Retry-After header value in seconds, if provided
+        """
+        self._throttles += 1
+        now = time.time()
+
+        if self._can_decrease(now):
+            self._set_rate(self._rate * self.decrease)
+
+        # Drain the bucket; hold every caller until the server's Retry-After
+        self._tokens = 0.0
+        if retry_after:
+            self._paused_until = max(self._paused_until, now + retry_after)
+        self._last_update = max(now, self._paused_until)
+
+        record_rate_limit_state(self.name, self._rate, throttled=True)
+        logger.warning(
+            f"[RateLimiter] '{self.name}' rate limited, rate -> {self._rate:.2f}/s"
+            + (f", paused {retry_after:.1f}s" if retry_after else "")
+        )
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Get limiter statistics."""
+        return {
+            "name": self.name,
+            "rate": self._rate,
+            "min_rate": self.min_rate,
+            "max_rate": self.max_rate,
+            "successes": self._successes,
+            "throttles": self._throttles,
+            "latency_backoffs": self._latency_backoffs,
+            "latency_ewma_ms": (self._latency_ewma or 0.0) * 1000,
+            "paused": time.time() < self._paused_until,
+        }
+
+
+# =============================================================================
+# HEDGED REQUESTS
+# =============================================================================
+
+
+class RequestHedger:
+    """
+    Hedged reads for idempotent requests.
+
+    If a request has not returned by its endpoint's rolling p95 latency, an
+    identical second request is sent and whichever finishes first wins; the
+    other is cancelled. Hedges are paid for out of a budget that grows by
+    `budget` per request, so at most that fraction of extra load is added.
+
+    Usage:
+        hedger = RequestHedger("polymarket", budget=0.05)
+
+        response = await hedger.run("orderbook", lambda: http.get(path))
+    """
+
+    def __init__(
+        self,
+        name: str,
+        budget: float = 0.05,
+        min_samples: int = 20,
+        window: int = 200,
+        min_delay: float = 0.01,
+        max_burst: float = 10.0,
+    ):
+        """
+        Initialize hedger.
+
+        Args:
+            name: Hedger name (used in logs)
+            budget: Max hedges as a fraction of requests
+            min_samples: Latency samples needed before an endpoint is hedged
+            window: Latency samples kept per endpoint
+            min_delay: Lower bound on the hedge delay in seconds
+            max_burst: Max hedges that can be saved up during quiet periods
+        """
+        self.name = name
+        self.budget = budget
+        self.min_samples = min_samples
+        self.window = window
+        self.min_delay = min_delay
+        self.max_burst = max_burst
+
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._p95: Dict[str, Optional[float]] = {}
+        self._tokens = 1.0
+
+        # Statistics
+        self._requests = 0
+        self._hedges = 0
+        self._hedge_wins = 0
+
+    def _observe(self, endpoint: str, latency: float) -> None:
+        samples = self._latencies.get(endpoint)
+        if samples is None:
+            samples = self._latencies[endpoint] = deque(maxlen=self.window)
+        samples.append(latency)
+        self._p95[endpoint] = None  # Recomputed lazily
+
+    def hedge_delay(self, endpoint: str) -> Optional[float]:
+        """Rolling p95 latency for an endpoint, or None until enough samples exist."""
+        samples = self._latencies.get(endpoint)
+        if samples is None or len(samples) < self.min_samples:
+            return None
+        p95 = self._p95.get(endpoint)
+        if p95 is None:
+            ordered = sorted(samples)
+            p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+            self._p95[endpoint] = p95
+        return max(p95, self.min_delay)
+
+    async def _timed(self, endpoint: str, factory: Callable[[], Awaitable[T]]) -> T:
+        start = time.perf_counter()
+        result = await factory()
+        self._observe(endpoint, time.perf_counter() - start)
+        return result
+
+    async def _hedge(
+        self,
+        endpoint: str,
+        factory: Callable[[], Awaitable[T]],
+        acquire: Optional[Callable[[], Awaitable[Any]]],
+    ) -> T:
+        if acquire is not None:
+            await acquire()
+        return await self._timed(endpoint, factory)
+
+    async def run(
+        self,
+        endpoint: str,
+        factory: Callable[[], Awaitable[T]],
+        acquire: Optional[Callable[[], Awaitable[Any]]] = None,
+    ) -> T:
+        """
+        Run a read, hedging it if it outlives the endpoint's p95.
+
+        Args:
+            endpoint: Latency bucket (e.g. "market", "orderbook")
+            factory: Callable creating a fresh request coroutine
+            acquire: Awaited before the hedge is sent (e.g. a rate-limit token)
+
+        Returns:
+            Result of whichever attempt succeeds first
+        """
+        self._requests += 1
+        self._tokens = min(self.max_burst, self._tokens + self.budget)
+
+        delay = self.hedge_delay(endpoint)
+        primary = asyncio.ensure_future(self._timed(endpoint, factory))
+        if delay is None:
+            record_hedged_read(endpoint, "unhedged")
+            return await primary
+
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+        except asyncio.CancelledError:
+            primary.cancel()
+            raise
+        if done or self._tokens < 1.0:
+            record_hedged_read(endpoint, "unhedged")
+            return await primary
+
+        self._tokens -= 1.0
+        self._hedges += 1
+        hedge = asyncio.ensure_future(self._hedge(endpoint, factory, acquire))
+        pending = {primary, hedge}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        won = task is hedge
+                        self._hedge_wins += won
+                        record_hedged_read(endpoint, "hedge_won" if won else "primary_won")
+                        return task.result()
+            # Both attempts failed: surface the primary's error
+            record_hedged_read(endpoint, "both_failed")
+            return primary.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Get hedging statistics."""
+        return {
+            "name": self.name,
+            "requests": self._requests,
+            "hedges": self._hedges,
+            "hedge_rate": self._hedges / self._requests if self._requests else 0.0,
+            "hedge_wins": self._hedge_wins,
+            "win_rate": self._hedge_wins / self._hedges if self._hedges else 0.0,
+            "hedge_delays_ms": {
+                endpoint: (delay * 1000 if delay is not None else None)
+                for endpoint, delay in ((e, self.hedge_delay(e)) for e in self._latencies)
+            },
+        }
+
+
 # =============================================================================
 # COMBINED RESILIENCE DECORATOR
 # =============================================================================
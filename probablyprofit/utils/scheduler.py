@@ -0,0 +1,221 @@
+"""
+Priority Request Scheduling
+
+Sits in front of a RateLimiter so that when rate-limit capacity is scarce,
+latency-critical requests (stop-loss exits, cancels) are released before
+normal trading traffic, which in turn goes before background market-data
+scans.
+
+Priority can be passed per call or set for a whole block of work with the
+request_priority() context manager; the context wins, so every request made
+while handling a stop-loss (token lookup, order post, ...) inherits it.
+
+Starvation protection: a request that has queued longer than
+`starvation_timeout` is served ahead of every class, oldest first.
+"""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Deque, Dict, Iterator, Optional, Tuple
+
+from loguru import logger
+
+from probablyprofit.utils.metrics import record_queue_wait
+
+
+class RequestPriority(IntEnum):
+    """Request classes, most urgent first."""
+
+    CRITICAL = 0  # Stop-loss exits, cancels
+    NORMAL = 1  # Order placement, account reads
+    BACKGROUND = 2  # Market-data scans
+
+
+_request_priority: ContextVar[Optional[RequestPriority]] = ContextVar(
+    "request_priority", default=None
+)
+
+
+@contextmanager
+def request_priority(priority: RequestPriority) -> Iterator[None]:
+    """
+    Run every scheduled request in this block at `priority`.
+
+    Usage:
+        with request_priority(RequestPriority.CRITICAL):
+            await client.place_order(...)
+    """
+    token = _request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _request_priority.reset(token)
+
+
+def current_request_priority() -> Optional[RequestPriority]:
+    """Priority set by an enclosing request_priority() block, if any."""
+    return _request_priority.get()
+
+
+@dataclass
+class _Waiter:
+    priority: RequestPriority
+    tokens: int
+    enqueued: float
+    future: "asyncio.Future[None]" = field(repr=False)
+
+
+class PriorityScheduler:
+    """
+    Priority queue in front of a rate limiter.
+
+    Uncontended requests take a token straight from the limiter. Once
+    requests have to wait, a single dispatcher hands out tokens as they
+    become available to the most urgent waiter, FIFO within a class.
+
+    Usage:
+        scheduler = PriorityScheduler(get_rate_limiter())
+
+        await scheduler.acquire(RequestPriority.BACKGROUND)
+        response = await http.get(...)
+    """
+
+    def __init__(self, limiter: Any, name: Optional[str] = None, starvation_timeout: float = 5.0):
+        """
+        Initialize scheduler.
+
+        Args:
+            limiter: RateLimiter (or subclass) whose tokens are scheduled
+            name: Scheduler name for logs and metric labels (defaults to limiter name)
+            starvation_timeout: Seconds after which any waiter is served first
+        """
+        self.limiter = limiter
+        self.name = name or limiter.name
+        self.starvation_timeout = starvation_timeout
+
+        self._queues: Dict[RequestPriority, Deque[_Waiter]] = {p: deque() for p in RequestPriority}
+        self._dispatcher: Optional["asyncio.Task[None]"] = None
+
+        # Statistics
+        self._granted: Dict[RequestPriority, int] = {p: 0 for p in RequestPriority}
+        self._wait_total: Dict[RequestPriority, float] = {p: 0.0 for p in RequestPriority}
+        self._promotions = 0
+
+    def _queued(self) -> int:
+        return sum(len(q) for q in self._queues.values())
+
+    async def acquire(
+        self, priority: RequestPriority = RequestPriority.NORMAL, tokens: int = 1
+    ) -> float:
+        """
+        Wait for rate-limit capacity.
+
+        Args:
+            priority: Priority used when no request_priority() block is active
+            tokens: Tokens to take from the limiter
+
+        Returns:
+            Time spent queued in seconds
+        """
+        context_priority = _request_priority.get()
+        if context_priority is not None:
+            priority = context_priority
+
+        start = time.monotonic()
+        if not self._queued() and await self.limiter.acquire(tokens) == 0:
+            self._record(priority, 0.0)
+            return 0.0
+
+        waiter = _Waiter(priority, tokens, start, asyncio.get_running_loop().create_future())
+        self._queues[priority].append(waiter)
+        self._ensure_dispatcher()
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            # Not yet granted: the dispatcher drops it. Granted: give the token back
+            if not waiter.future.cancel():
+                self.limiter.release(waiter.tokens)
+            raise
+
+        waited = time.monotonic() - start
+        self._record(priority, waited)
+        return waited
+
+    def _record(self, priority: RequestPriority, waited: float) -> None:
+        self._granted[priority] += 1
+        self._wait_total[priority] += waited
+        record_queue_wait(self.name, priority.name.lower(), waited)
+
+    def _ensure_dispatcher(self) -> None:
+        loop = asyncio.get_running_loop()
+        if (
+            self._dispatcher is None
+            or self._dispatcher.done()
+            or self._dispatcher.get_loop() is not loop
+        ):
+            self._dispatcher = loop.create_task(self._dispatch())
+
+    def _next_waiter(self) -> Optional[Tuple[_Waiter, bool]]:
+        """Most urgent live waiter, and whether it was picked for having starved."""
+        for queue in self._queues.values():
+            while queue and queue[0].future.done():
+                queue.popleft()
+
+        heads = [queue[0] for queue in self._queues.values() if queue]
+        if not heads:
+            return None
+
+        now = time.monotonic()
+        starved = [w for w in heads if now - w.enqueued >= self.starvation_timeout]
+        if starved:
+            oldest = min(starved, key=lambda w: w.enqueued)
+            return oldest, oldest is not heads[0]
+        return heads[0], False
+
+    async def _dispatch(self) -> None:
+        while True:
+            selected = self._next_waiter()
+            if selected is None:
+                break
+            waiter, promoted = selected
+
+            wait = await self.limiter.acquire(waiter.tokens)
+            if wait > 0:
+                # Re-select after sleeping: a more urgent request may have arrived
+                await asyncio.sleep(wait)
+                continue
+
+            queue = self._queues[waiter.priority]
+            if queue and queue[0] is waiter:
+                queue.popleft()
+            if waiter.future.done():
+                # Cancelled while the token was being taken
+                self.limiter.release(waiter.tokens)
+                continue
+            if promoted:
+                self._promotions += 1
+                logger.debug(
+                    f"[Scheduler] '{self.name}' promoted {waiter.priority.name} request "
+                    f"after {time.monotonic() - waiter.enqueued:.1f}s"
+                )
+            waiter.future.set_result(None)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Get scheduler statistics."""
+        return {
+            "name": self.name,
+            "queued": {p.name.lower(): len(q) for p, q in self._queues.items()},
+            "granted": {p.name.lower(): n for p, n in self._granted.items()},
+            "avg_wait_ms": {
+                p.name.lower(): (self._wait_total[p] / n * 1000 if n else 0.0)
+                for p, n in self._granted.items()
+            },
+            "starvation_promotions": self._promotions,
+        }